@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import os
 
+import asyncio
 import hashlib
 import hmac
 import json
@@ -26,14 +27,17 @@ import logging
 import re
 import time
 from pathlib import Path
-from typing import Callable, Iterator, Optional
+from typing import AsyncIterator, Callable, Iterator, Optional
 
 from fastapi import Body, FastAPI, File, HTTPException, Request, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
 from jsonschema.exceptions import ValidationError
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
+from control_plane import meeting_fold
 from control_plane import meeting_steering
+from control_plane import meeting_stream_hub as stream_hub_mod
 from control_plane import schedule_digest as schedule_digest_mod
 from control_plane import routines as routines_mod
 from control_plane.config_preflight import NOT_CONFIGURED, capability_state, missing_capability_keys
@@ -79,6 +83,9 @@ MEETING_STREAM_OUTPUT_REPLAY = 160
 # view_end marker hasn't arrived (the final beat is ~10s of LLM; a dead worker never marks) —
 # the bounded cap that replaces the old one-empty-poll guess (ADR 0027).
 MEETING_STREAM_ENDING_CAP_SEC = 45.0
+# The live-meeting SSE's shared redis.asyncio pool: one connection per viewer blocked in XREAD, so
+# this caps concurrent viewers per process before reads start queueing for a connection.
+MEETING_STREAM_REDIS_CONNECTIONS = int(os.environ.get("VEXA_MEETING_STREAM_REDIS_CONNECTIONS", "4096"))
 
 
 def _upload_filename(name: str | None) -> str:
@@ -519,18 +526,180 @@ def _decode_sse_cursor(raw: str | None) -> "tuple[str | None, str | None, str |
     return tuple(p if p and p != "-" else None for p in parts)  # type: ignore[return-value]
 
 
+def _sse_frame(item) -> str:
+    # ``None`` is the reader's idle tick → an SSE comment keepalive. Proxies (and the client's own
+    # idle-stall detector) cut a byte-silent stream in ~18-30s; a long agent think is byte-silent for
+    # minutes. The comment is invisible to EventSource parsing but keeps bytes flowing.
+    if item is None:
+        return ": keepalive\n\n"
+    # Each item is either a bare event dict, or (event, sse_id) — the id makes reconnects resumable.
+    ev, sid = item if isinstance(item, tuple) else (item, None)
+    prefix = f"id: {sid}\n" if sid else ""
+    return f"{prefix}data: {json.dumps(ev)}\n\n"
+
+
 def _sse(events) -> Iterator[str]:
     for item in events:
-        # ``None`` is the reader's idle tick → an SSE comment keepalive. Proxies (and the client's own
-        # idle-stall detector) cut a byte-silent stream in ~18-30s; a long agent think is byte-silent for
-        # minutes. The comment is invisible to EventSource parsing but keeps bytes flowing.
-        if item is None:
-            yield ": keepalive\n\n"
+        yield _sse_frame(item)
+
+
+async def _asse(events) -> AsyncIterator[str]:
+    """``_sse`` over an async event source (the live-meeting feed) — same framing, no threadpool."""
+    async for item in events:
+        yield _sse_frame(item)
+
+
+async def _meeting_stream_events(r, meeting_id: str, session_uid: str, resume: tuple, *,
+                                 on_end: Callable[[], None]):
+    """The live-meeting SSE feed: merge the transcript Stream (`tc:meeting:{id}`), the copilot's
+    output Stream (`unit:agent-meet-{sid}:out`) and its processed-notes Stream
+    (`proc:meeting:{id}`) into ``(event, cursor)`` items for ``_asse``.
+
+    ``r`` is the viewer's ``meeting_stream_hub.Subscription`` (the async xread/xrevrange/exists
+    surface of a ``redis.asyncio`` client): a viewer parked in its 15s XREAD BLOCK is a suspended
+    coroutine waiting on the meeting's shared tail, not a threadpool worker. ``resume`` is the
+    decoded Last-Event-ID (``_decode_sse_cursor``); ``on_end`` runs once when meeting-end is sent."""
+    resume_t, resume_o, resume_p = resume
+    # ADR 0027: the SSE tails the processed-notes stream (pkey) DIRECTLY (processed-notes.v1) —
+    # baseline cleaned notes reach the view seconds after a segment instead of waiting for
+    # an LLM beat on the out-stream, and the worker's `view_end` marker (not a quiet-poll
+    # guess) tells us processing is complete.
+    tkey, okey, pkey = stream_hub_mod.stream_keys(meeting_id, session_uid)
+    # Resume EXACTLY from the client's last-seen cursors when present (gapless reconnect);
+    # otherwise seed then live-tail (fresh connect). A missing proc cursor (old 2-part id)
+    # resumes from 0-0 — a full replay the client's upsert-by-id absorbs, never a gap.
+    last = {tkey: resume_t or "$", okey: resume_o or "$", pkey: resume_p or "0-0"}
+    idle = 0
+    ending = False        # transcript hit session_end — drain notes/cards before meeting-end
+    ending_at = 0.0       # when the drain started (monotonic) — bounds a markerless worker
+    view_end_seen = False  # the worker's completion marker arrived on the proc stream
+
+    def cursor():
+        return _encode_sse_cursor(last, tkey, okey, pkey)
+
+    def seg_events(payload):
+        for seg in payload.get("segments", []):
+            yield ({"type": "transcript", "speaker": seg.get("speaker"),
+                    "text": seg.get("text"), "t": seg.get("start"),
+                    "tsMs": seg.get("abs_start_ms"),
+                    "completed": seg.get("completed", True),
+                    "id": seg.get("segment_id")}, cursor())
+
+    def retract_event(payload):
+        """A `retract` marker (the collector withdrew superseded/over-extended pending drafts) →
+        a `retract` SSE event so the terminal drops those segment ids from the live view."""
+        ids = payload.get("segment_ids") or []
+        if ids:
+            yield ({"type": "retract", "segment_ids": ids}, cursor())
+
+    def note_events(entry_fields):
+        """One proc-stream entry → the SAME `note` SSE event the out-stream used to carry
+        (meetingLive.ts upserts by note.id). The `view_end` marker flips completion instead."""
+        nonlocal view_end_seen
+        if entry_fields.get("type") == "view_end":
+            view_end_seen = True
+            return
+        try:
+            note = json.loads(entry_fields.get("note") or "null")
+        except (json.JSONDecodeError, ValueError):
+            return
+        if isinstance(note, dict) and note.get("id") and note.get("text"):
+            yield ({"type": "note", "note": note}, cursor())
+
+    if resume_t is None:   # fresh connect → seed the bounded recent transcript tail
+        seed_rows = list(reversed(await r.xrevrange(tkey, count=MEETING_STREAM_TRANSCRIPT_REPLAY) or []))
+        for entry_id, fields in seed_rows:
+            last[tkey] = entry_id
+            payload = json.loads(fields.get("payload", "{}"))
+            if payload.get("type") == "session_end":
+                ending = True
+                ending_at = time.monotonic()
+                last.pop(tkey, None)
+                continue
+            if payload.get("type") == "retract":
+                for item in retract_event(payload):
+                    yield item
+                continue
+            for item in seg_events(payload):
+                yield item
+    if resume_o is None:   # fresh connect → seed the output (cards/agent-activity) replay
+        output_seed_rows = list(reversed(await r.xrevrange(okey, count=MEETING_STREAM_OUTPUT_REPLAY) or []))
+        for entry_id, fields in output_seed_rows:
+            last[okey] = entry_id
+            yield (json.loads(fields.get("event", "{}")), cursor())
+    # The proc stream needs no separate seed pass: the 0-0 resume cursor makes the first
+    # xread below deliver its ENTIRE history (bounded by the notes' 1:1 segment cardinality),
+    # so a mid-meeting connect renders the complete processed view.
+
+    while True:
+        # once the transcript ends, keep polling briefly — the copilot's FINAL beat is still
+        # running (~10s of LLM); its notes + the view_end marker arrive on the proc stream.
+        resp = await r.xread(last, count=500, block=1500 if ending else 15000)
+        if not resp:
+            if ending:
+                # End when processing is COMPLETE (view_end drained — evidence, P21), when no
+                # copilot ever wrote (empty proc stream — nothing to wait for), or at the
+                # bounded cap (a worker that died markerless must not hold the view open).
+                try:
+                    has_proc = bool(await r.exists(pkey))
+                except Exception:  # noqa: BLE001 — an unreadable stream must not wedge the close
+                    has_proc = False
+                if (view_end_seen or not has_proc
+                        or time.monotonic() - ending_at > MEETING_STREAM_ENDING_CAP_SEC):
+                    on_end()  # leaves the terminal's live-meetings feed
+                    yield ({"type": "meeting-end"}, cursor())
+                    return
+                continue  # the final beat is still writing — keep draining
+            idle += 15000
+            if idle >= 600000:
+                return
+            yield ({"type": "ping"}, cursor())
             continue
-        # Each item is either a bare event dict, or (event, sse_id) — the id makes reconnects resumable.
-        ev, sid = item if isinstance(item, tuple) else (item, None)
-        prefix = f"id: {sid}\n" if sid else ""
-        yield f"{prefix}data: {json.dumps(ev)}\n\n"
+        idle = 0
+        for stream, entries in resp:
+            for entry_id, fields in entries:
+                last[stream] = entry_id
+                if stream == tkey:
+                    payload = json.loads(fields.get("payload", "{}"))
+                    if payload.get("type") == "session_end":
+                        ending = True            # don't end yet — drain the final beat first
+                        ending_at = time.monotonic()
+                        last.pop(tkey, None)     # session_end is the last transcript entry
+                        break
+                    if payload.get("type") == "retract":
+                        for item in retract_event(payload):
+                            yield item
+                        continue
+                    for item in seg_events(payload):
+                        yield item
+                elif stream == pkey:
+                    for item in note_events(fields):
+                        yield item
+                else:
+                    yield (json.loads(fields.get("event", "{}")), cursor())
+
+
+async def _meeting_stream_feed(hubs: "stream_hub_mod.MeetingStreamHubs", meeting_id: str, session_uid: str,
+                               resume: tuple, *, on_end: Callable[[], None]):
+    """``_meeting_stream_events`` for one viewer, attached to the meeting's shared hub for as long as
+    the response streams (the last viewer out stops the meeting's reader)."""
+    sub = await hubs.subscribe(meeting_id, session_uid)
+    try:
+        async for item in _meeting_stream_events(sub, meeting_id, session_uid, resume, on_end=on_end):
+            yield item
+    finally:
+        sub.close()
+
+
+def _meeting_stream_pool(redis_url: str):
+    """The ONE ``redis.asyncio`` client the live-meeting hubs share. A hub holds a connection only
+    while its XREAD is in flight; past ``MEETING_STREAM_REDIS_CONNECTIONS`` a new read waits for a
+    free connection (BlockingConnectionPool, no timeout) instead of failing the viewer."""
+    import redis.asyncio as aredis
+
+    pool = aredis.BlockingConnectionPool.from_url(
+        redis_url, decode_responses=True, max_connections=MEETING_STREAM_REDIS_CONNECTIONS, timeout=None)
+    return aredis.Redis(connection_pool=pool)
 
 
 def _has_custom_model_endpoint(cfg: dict) -> bool:
@@ -553,86 +722,53 @@ def _model_creds_error_message() -> str:
 MEETING_CHAT_TRANSCRIPT_SEGMENTS = 400  # bound the live transcript folded into a meeting-chat prompt
 
 
+def _fold_lines(items: list) -> str:
+    lines: list[str] = []
+    for item in items:
+        text = (item.get("text") or "").strip()
+        if not text:
+            continue
+        speaker = (item.get("speaker") or "Speaker").strip()
+        lines.append(f"{speaker}: {text}")
+    return "\n".join(lines)
+
+
 def _fold_meeting_transcript(redis_url: "str | None", stream_key: str, *, limit: int) -> str:
     """Fold the live transcript Stream ``tc:meeting:{stream_key}`` — the SAME stream the meeting copilot
     tails (worker/meeting.py) and the terminal renders — into ordered ``speaker: text`` lines for chat
     grounding. ``stream_key`` is the meetings-domain ROW id (P0 cross-tenant leak fix: the carrier keys
     on the row id, never the native id which collides across tenants/re-sends). Refining live drafts are
     upserted by ``segment_id`` (latest text wins, no duplicate), arrival order preserved, bounded to the
-    last ``limit`` segments. Best-effort: returns "" when redis is unwired or the stream is empty."""
+    last ``limit`` segments. Read through the incremental ``meeting_fold.FOLDS`` view — a turn decodes
+    only the entries since the previous one. Best-effort: returns "" when redis is unwired or the
+    stream is empty."""
     if not redis_url:
         return ""
     try:
-        import redis
-
-        r = redis.from_url(redis_url, decode_responses=True)
-        rows = r.xrange(f"tc:meeting:{stream_key}")
+        segs = meeting_fold.FOLDS.tail(redis_url, f"tc:meeting:{stream_key}", meeting_fold.transcript_items,
+                                       limit=limit)
     except Exception as exc:  # noqa: BLE001 — grounding is best-effort; never fail the chat turn
         logger.warning("could not read transcript for %s: %s", stream_key, exc)
         return ""
-    order: list[str] = []
-    seg_by_id: dict[str, dict] = {}
-    for entry_id, fields in rows:
-        payload = json.loads(fields.get("payload", "{}"))
-        if payload.get("type") == "session_end":
-            continue
-        for i, seg in enumerate(payload.get("segments", [])):
-            sid = str(seg.get("segment_id") or f"{entry_id}:{i}")
-            if sid not in seg_by_id:
-                order.append(sid)
-            seg_by_id[sid] = seg
-    lines: list[str] = []
-    for sid in order[-limit:]:
-        seg = seg_by_id[sid]
-        text = (seg.get("text") or "").strip()
-        if not text:
-            continue
-        speaker = (seg.get("speaker") or "Speaker").strip()
-        lines.append(f"{speaker}: {text}")
-    return "\n".join(lines)
+    return _fold_lines(segs)
 
 
 def _fold_meeting_processed(redis_url: "str | None", stream_key: str, *, limit: int) -> str:
     """Fold the PROCESSED-notes Stream ``proc:meeting:{stream_key}`` (processed-notes.v1 — the copilot's
     cleaned transcript; single writer worker/meeting.py) into ordered ``speaker: text`` lines for
     post-meeting chat grounding. Notes upsert by id (a refining pass upgrades in place), the ``view_end``
-    terminal marker is skipped, order preserved, bounded to the last ``limit`` notes. Best-effort:
-    returns "" when redis is unwired, the stream is empty, or entries are malformed."""
+    terminal marker is skipped, order preserved, bounded to the last ``limit`` notes (incremental
+    ``meeting_fold.FOLDS`` view, as above). Best-effort: returns "" when redis is unwired, the stream is
+    empty, or entries are malformed."""
     if not redis_url:
         return ""
     try:
-        import redis
-
-        r = redis.from_url(redis_url, decode_responses=True)
-        rows = r.xrange(f"proc:meeting:{stream_key}")
+        notes = meeting_fold.FOLDS.tail(redis_url, f"proc:meeting:{stream_key}", meeting_fold.processed_items,
+                                        limit=limit)
     except Exception as exc:  # noqa: BLE001 — grounding is best-effort; never fail the chat turn
         logger.warning("could not read processed notes for %s: %s", stream_key, exc)
         return ""
-    order: list[str] = []
-    note_by_id: dict[str, dict] = {}
-    for entry_id, fields in rows:
-        if fields.get("type") == "view_end":
-            continue
-        raw = fields.get("note")
-        if not raw:
-            continue
-        try:
-            note = json.loads(raw)
-        except (TypeError, ValueError):
-            continue
-        nid = str(note.get("id") or entry_id)
-        if nid not in note_by_id:
-            order.append(nid)
-        note_by_id[nid] = note
-    lines: list[str] = []
-    for nid in order[-limit:]:
-        note = note_by_id[nid]
-        text = (note.get("text") or "").strip()
-        if not text:
-            continue
-        speaker = (note.get("speaker") or "Speaker").strip()
-        lines.append(f"{speaker}: {text}")
-    return "\n".join(lines)
+    return _fold_lines(notes)
 
 
 def _meeting_grounding(
@@ -916,6 +1052,7 @@ def create_app(
     membership_index: Optional[MembershipIndex] = None,
     meeting_owner_lookup: "Optional[object]" = None,
     schedule_source: "Optional[Callable[[str], list]]" = None,
+    meeting_stream_redis: "Optional[object]" = None,
 ) -> FastAPI:
     if sessions is not None:
         sess = sessions
@@ -941,6 +1078,35 @@ def create_app(
     # injectable for L2 tests, same seam style as meeting_owner_lookup.
     _schedule_source = schedule_source or schedule_digest_mod.digest_source(
         settings.meeting_api_url if settings is not None else "", mindex.list)
+    # The live-meeting SSE's redis: ONE shared redis.asyncio pool (``_meeting_stream_pool``) per
+    # process, built at startup on the serving loop (asyncio connections are loop-bound) and closed
+    # at shutdown after the hubs' readers have stopped;
+    # injectable (an async client) for L2 tests, same seam style as meeting_owner_lookup.
+    _stream_redis: dict = {}
+
+    def _meeting_stream_redis():
+        if meeting_stream_redis is not None:
+            return meeting_stream_redis
+        client = _stream_redis.get("client")
+        if client is None:
+            raise RuntimeError("meeting stream redis is not open (no redis_url, or the app never started)")
+        return client
+
+    # One reader per live meeting, fanned out to every viewer of it (meeting_stream_hub).
+    stream_hubs = stream_hub_mod.MeetingStreamHubs(_meeting_stream_redis)
+    app.state.meeting_stream_hubs = stream_hubs
+
+    @app.on_event("startup")
+    async def _open_meeting_stream_redis() -> None:
+        if meeting_stream_redis is None and redis_url:
+            _stream_redis["client"] = _meeting_stream_pool(redis_url)
+
+    @app.on_event("shutdown")
+    async def _close_meeting_stream_redis() -> None:
+        await stream_hubs.close()
+        client = _stream_redis.pop("client", None)
+        if client is not None:
+            await client.aclose(close_connection_pool=True)
 
     # TOPOLOGY BOUNDARY (Lane M vector 3): agent-api trusts X-User-Id / X-User-Email as ground truth.
     # That trust is only SOUND when the gateway is the SOLE ingress — the gateway strips any client-sent
@@ -1085,6 +1251,7 @@ def create_app(
                 overview["meetings_error"] = f"{type(e).__name__}: {e}"
         else:
             overview["meetings_error"] = "no redis_url configured"
+        overview["stream_hubs"] = stream_hubs.stats()  # live SSE fan-out: viewers + ring hit rate
         return overview
 
     @app.post("/api/admin/probe")
@@ -1791,7 +1958,7 @@ def create_app(
         return {"purpose": write_purpose(ws, body.purpose)}
 
     @app.get("/api/meeting/stream")
-    def meeting_stream(meeting_id: str, session_uid: str, request: Request):
+    async def meeting_stream(meeting_id: str, session_uid: str, request: Request):
         """SSE feed for a LIVE meeting — merges the transcript Stream (`tc:meeting:{id}`) and the
         copilot's output Stream (`unit:agent-meet-{sid}:out`) into one feed the terminal renders:
         transcript lines + proactive `card`s + the agent working (`message-delta`/`tool-call`).
@@ -1801,7 +1968,12 @@ def create_app(
         durable + id-addressable) instead of re-seeding only the last N entries. Without this, a transient
         disconnect (the 'Live stream disconnected — reconnecting' path) dropped every segment published in
         the gap beyond the bounded replay window from the LIVE view — the real-time transcript-loss bug
-        (the durable store kept them, so they only reappeared post-time)."""
+        (the durable store kept them, so they only reappeared post-time).
+
+        ASYNC end to end (``_meeting_stream_events`` over the shared ``redis.asyncio`` pool): a viewer
+        idling in its XREAD BLOCK no longer pins a threadpool worker + a private connection pool, so
+        one process holds thousands of concurrent viewers. Viewers of the SAME meeting share one
+        redis tail (``meeting_stream_hub``) instead of each issuing identical XREADs."""
         if not redis_url:
             raise HTTPException(status_code=501, detail="redis not wired")
 
@@ -1816,7 +1988,7 @@ def create_app(
         # OWNER-ONLY for now (matches the WS path today); a shared-workspace membership grant would extend
         # `_meeting_owner_lookup` — the clean seam — but is intentionally NOT honored here yet.
         subject = subject_of(request)  # 401 if no (gateway-injected) identity — fail closed
-        owned = _meeting_owner_lookup(subject, meeting_id)
+        owned = await run_in_threadpool(_meeting_owner_lookup, subject, meeting_id)  # blocking HTTP
         if owned is None:
             # Absent row, or a row owned by a DIFFERENT tenant → refuse (404-equivalent, no stream opened).
             raise HTTPException(status_code=403, detail="not authorized for this meeting")
@@ -1829,131 +2001,11 @@ def create_app(
         if session_uid not in (owned_native, str(meeting_id)):
             raise HTTPException(status_code=403, detail="session_uid does not match this meeting")
 
-        resume_t, resume_o, resume_p = _decode_sse_cursor(request.headers.get("last-event-id"))
-
-        def gen():
-            import time as _time
-
-            import redis
-
-            r = redis.from_url(redis_url, decode_responses=True)
-            tkey = f"tc:meeting:{meeting_id}"
-            okey = f"unit:agent-meet-{session_uid}:out"
-            # ADR 0027: the SSE tails the processed-notes stream DIRECTLY (processed-notes.v1) —
-            # baseline cleaned notes reach the view seconds after a segment instead of waiting for
-            # an LLM beat on the out-stream, and the worker's `view_end` marker (not a quiet-poll
-            # guess) tells us processing is complete.
-            pkey = f"proc:meeting:{meeting_id}"
-            # Resume EXACTLY from the client's last-seen cursors when present (gapless reconnect);
-            # otherwise seed then live-tail (fresh connect). A missing proc cursor (old 2-part id)
-            # resumes from 0-0 — a full replay the client's upsert-by-id absorbs, never a gap.
-            last = {tkey: resume_t or "$", okey: resume_o or "$", pkey: resume_p or "0-0"}
-            idle = 0
-            ending = False        # transcript hit session_end — drain notes/cards before meeting-end
-            ending_at = 0.0       # when the drain started (monotonic) — bounds a markerless worker
-            view_end_seen = False  # the worker's completion marker arrived on the proc stream
-
-            def cursor():
-                return _encode_sse_cursor(last, tkey, okey, pkey)
-
-            def seg_events(payload):
-                for seg in payload.get("segments", []):
-                    yield ({"type": "transcript", "speaker": seg.get("speaker"),
-                            "text": seg.get("text"), "t": seg.get("start"),
-                            "tsMs": seg.get("abs_start_ms"),
-                            "completed": seg.get("completed", True),
-                            "id": seg.get("segment_id")}, cursor())
-
-            def retract_event(payload):
-                """A `retract` marker (the collector withdrew superseded/over-extended pending drafts) →
-                a `retract` SSE event so the terminal drops those segment ids from the live view."""
-                ids = payload.get("segment_ids") or []
-                if ids:
-                    yield ({"type": "retract", "segment_ids": ids}, cursor())
-
-            def note_events(entry_fields):
-                """One proc-stream entry → the SAME `note` SSE event the out-stream used to carry
-                (meetingLive.ts upserts by note.id). The `view_end` marker flips completion instead."""
-                nonlocal view_end_seen
-                if entry_fields.get("type") == "view_end":
-                    view_end_seen = True
-                    return
-                try:
-                    note = json.loads(entry_fields.get("note") or "null")
-                except (json.JSONDecodeError, ValueError):
-                    return
-                if isinstance(note, dict) and note.get("id") and note.get("text"):
-                    yield ({"type": "note", "note": note}, cursor())
-
-            if resume_t is None:   # fresh connect → seed the bounded recent transcript tail
-                seed_rows = list(reversed(r.xrevrange(tkey, count=MEETING_STREAM_TRANSCRIPT_REPLAY) or []))
-                for entry_id, fields in seed_rows:
-                    last[tkey] = entry_id
-                    payload = json.loads(fields.get("payload", "{}"))
-                    if payload.get("type") == "session_end":
-                        ending = True
-                        ending_at = _time.monotonic()
-                        last.pop(tkey, None)
-                        continue
-                    if payload.get("type") == "retract":
-                        yield from retract_event(payload)
-                        continue
-                    yield from seg_events(payload)
-            if resume_o is None:   # fresh connect → seed the output (cards/agent-activity) replay
-                output_seed_rows = list(reversed(r.xrevrange(okey, count=MEETING_STREAM_OUTPUT_REPLAY) or []))
-                for entry_id, fields in output_seed_rows:
-                    last[okey] = entry_id
-                    yield (json.loads(fields.get("event", "{}")), cursor())
-            # The proc stream needs no separate seed pass: the 0-0 resume cursor makes the first
-            # xread below deliver its ENTIRE history (bounded by the notes' 1:1 segment cardinality),
-            # so a mid-meeting connect renders the complete processed view.
-
-            while True:
-                # once the transcript ends, keep polling briefly — the copilot's FINAL beat is still
-                # running (~10s of LLM); its notes + the view_end marker arrive on the proc stream.
-                resp = r.xread(last, count=500, block=1500 if ending else 15000)
-                if not resp:
-                    if ending:
-                        # End when processing is COMPLETE (view_end drained — evidence, P21), when no
-                        # copilot ever wrote (empty proc stream — nothing to wait for), or at the
-                        # bounded cap (a worker that died markerless must not hold the view open).
-                        try:
-                            has_proc = bool(r.exists(pkey))
-                        except Exception:  # noqa: BLE001 — an unreadable stream must not wedge the close
-                            has_proc = False
-                        if (view_end_seen or not has_proc
-                                or _time.monotonic() - ending_at > MEETING_STREAM_ENDING_CAP_SEC):
-                            live.drop(session_uid)  # leaves the terminal's live-meetings feed
-                            yield ({"type": "meeting-end"}, cursor())
-                            return
-                        continue  # the final beat is still writing — keep draining
-                    idle += 15000
-                    if idle >= 600000:
-                        return
-                    yield ({"type": "ping"}, cursor())
-                    continue
-                idle = 0
-                for stream, entries in resp:
-                    for entry_id, fields in entries:
-                        last[stream] = entry_id
-                        if stream == tkey:
-                            payload = json.loads(fields.get("payload", "{}"))
-                            if payload.get("type") == "session_end":
-                                ending = True            # don't end yet — drain the final beat first
-                                ending_at = _time.monotonic()
-                                last.pop(tkey, None)     # session_end is the last transcript entry
-                                break
-                            if payload.get("type") == "retract":
-                                yield from retract_event(payload)
-                                continue
-                            yield from seg_events(payload)
-                        elif stream == pkey:
-                            yield from note_events(fields)
-                        else:
-                            yield (json.loads(fields.get("event", "{}")), cursor())
-
+        resume = _decode_sse_cursor(request.headers.get("last-event-id"))
+        events = _meeting_stream_feed(stream_hubs, meeting_id, session_uid, resume,
+                                      on_end=lambda: live.drop(session_uid))
         return StreamingResponse(
-            _sse(gen()), media_type="text/event-stream",
+            _asse(events), media_type="text/event-stream",
             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
 
@@ -280,6 +280,7 @@ def build_unit_env(settings: Settings, invocation: dict, *, unit_id: str, token:
         row_id = meeting.get("numeric_meeting_id") or meeting["meeting_id"]
         env["VEXA_TRANSCRIPT_STREAM"] = f"tc:meeting:{row_id}"
         env["VEXA_IDLE_TIMEOUT_SEC"] = str(settings.meeting_idle_timeout_sec)
+        env["VEXA_MEETING_BEAT_CONCURRENCY"] = str(settings.meeting_beat_concurrency)
         # Carry the meeting facts the post-meeting WRITE turn stamps into the kg entity frontmatter.
         # VEXA_MEETING_ID is the human-readable NATIVE id (nuance #1: the readable kg doc name
         # ``kg/entities/meeting/{native}.md`` must survive even though the carriers key by row id).
@@ -0,0 +1,138 @@
+"""meeting_fold.py — incremental, cached folded views of a meeting's redis streams for chat grounding.
+
+Every chat turn that grounds on a meeting folds ``tc:meeting:{row}`` (live transcript) or
+``proc:meeting:{row}`` (processed notes) into its last N upserted items. Doing that from scratch
+meant a fresh redis client, an unbounded ``XRANGE`` and a JSON decode of EVERY entry per message —
+tens of thousands of entries for a long meeting, to keep the last 400.
+
+A ``FoldCache`` keeps one ``_View`` per stream: the upserted item map (latest wins, first-arrival
+order) and the last stream id folded. A cold view folds the whole stream ONCE, in ``XRANGE … COUNT``
+pages; every later turn costs one ``XRANGE key (last_id +`` and decodes only what arrived since. The
+result is the from-scratch fold: an item keeps its first-arrival position however late it is
+refined, so the view holds the newest ``limit`` positions plus the ids of the ``REFINE_HORIZON``
+positions that fell out of them most recently — a late refinement of one of those stays out of the
+tail, as it would in a full fold. Only an id refined after falling further behind than that (long
+past any transcript or note rewrite) would re-enter as new. Memory stays bounded by ``limit`` items
+plus ``REFINE_HORIZON`` ids per view however long the meeting runs. The streams are
+append-only (never MAXLEN-trimmed), so a view is never rebuilt under a live stream. Views are
+evicted LRU past ``VEXA_MEETING_FOLD_CACHE_SIZE``.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+#: Folded views kept (one per stream, LRU).
+CACHE_SIZE = int(os.environ.get("VEXA_MEETING_FOLD_CACHE_SIZE", "256"))
+#: Ids a view remembers after they leave its window (the most recent evictions; see the docstring).
+REFINE_HORIZON = 1000
+_PAGE = 500  # entries per XRANGE page
+
+
+def transcript_items(entry_id: str, fields: dict) -> list:
+    """One ``tc:meeting`` entry → its ``(segment_id, segment)`` upserts (``session_end`` → none)."""
+    payload = json.loads(fields.get("payload", "{}"))
+    if payload.get("type") == "session_end":
+        return []
+    return [(str(seg.get("segment_id") or f"{entry_id}:{i}"), seg)
+            for i, seg in enumerate(payload.get("segments", []))]
+
+
+def processed_items(entry_id: str, fields: dict) -> list:
+    """One ``proc:meeting`` entry → its ``(note_id, note)`` upsert (``view_end`` / malformed → none)."""
+    if fields.get("type") == "view_end":
+        return []
+    raw = fields.get("note")
+    if not raw:
+        return []
+    try:
+        note = json.loads(raw)
+    except (TypeError, ValueError):
+        return []
+    return [(str(note.get("id") or entry_id), note)]
+
+
+class _View:
+    """The folded state of one stream: its newest ``window`` items, upserted by id in first-arrival
+    order, and the ids of the last ``horizon`` positions to leave that window (their position is
+    older than any item kept)."""
+
+    def __init__(self, window: int, horizon: Optional[int] = None) -> None:
+        self.window = window
+        self.horizon = REFINE_HORIZON if horizon is None else horizon
+        self.lock = threading.Lock()
+        self.items: "OrderedDict[str, dict]" = OrderedDict()
+        self.evicted: "OrderedDict[str, None]" = OrderedDict()
+        self.last_id: Optional[str] = None
+
+    def fold(self, decoded) -> None:
+        """Apply ``(entry_id, [(item_id, item), …])`` pairs, oldest first."""
+        for entry_id, upserts in decoded:
+            for item_id, item in upserts:
+                if item_id not in self.evicted:
+                    self.items[item_id] = item  # an existing id keeps its position; latest text wins
+            self.last_id = entry_id
+            while len(self.items) > self.window:
+                self.evicted[self.items.popitem(last=False)[0]] = None
+            while len(self.evicted) > self.horizon:
+                self.evicted.popitem(last=False)
+
+    def tail(self, limit: int) -> list:
+        return list(self.items.values())[-limit:]
+
+
+class FoldCache:
+    """LRU of folded stream views, shared by every chat turn in the process."""
+
+    def __init__(self, maxsize: int = CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._clients: dict = {}
+        self._views: "OrderedDict[tuple, _View]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def client(self, redis_url: str):
+        """One redis client (and connection pool) per url, not one per chat turn."""
+        with self._lock:
+            r = self._clients.get(redis_url)
+            if r is None:
+                import redis
+
+                r = self._clients[redis_url] = redis.from_url(redis_url, decode_responses=True)
+            return r
+
+    def tail(self, redis_url: str, key: str, items: Callable[[str, dict], list], *, limit: int) -> list:
+        """The last ``limit`` folded items of stream ``key``, brought up to date incrementally."""
+        r = self.client(redis_url)
+        with self._lock:
+            view = self._views.get((redis_url, key))
+            if view is None or view.window < limit:
+                view = self._views[(redis_url, key)] = _View(limit)
+            self._views.move_to_end((redis_url, key))
+            while len(self._views) > self.maxsize:
+                self._views.popitem(last=False)
+        with view.lock:
+            self._advance(r, key, view, items)
+            return view.tail(limit)
+
+    @staticmethod
+    def _advance(r, key: str, view: _View, items) -> None:
+        """Fold every entry after ``view.last_id`` (the whole stream for a cold view), a page at a time
+        so a cold build of a long meeting never holds more than one page of raw entries."""
+        while True:
+            lo = "-" if view.last_id is None else f"({view.last_id}"
+            rows = r.xrange(key, min=lo, max="+", count=_PAGE)
+            view.fold((entry_id, items(entry_id, fields)) for entry_id, fields in rows)
+            if len(rows) < _PAGE:
+                return
+
+    def clear(self) -> None:
+        with self._lock:
+            self._views.clear()
+            self._clients.clear()
+
+
+#: The process-wide cache the agent-api chat grounding reads through.
+FOLDS = FoldCache()
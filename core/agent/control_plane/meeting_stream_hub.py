@@ -0,0 +1,243 @@
+"""meeting_stream_hub.py — one redis tail per live meeting, shared by every SSE viewer of it.
+
+Each ``/api/meeting/stream`` viewer used to XREAD BLOCK the meeting's three streams itself
+(``tc:meeting:{id}``, ``unit:agent-meet-{sid}:out``, ``proc:meeting:{id}``), so a 50-person watch
+party issued 50 identical blocking reads. ``MeetingStreamHubs`` keeps ONE hub per (meeting,
+session): a single reader task tails the three streams into bounded per-stream ring buffers and
+wakes its subscribers. A ``Subscription`` is a drop-in for the redis client the SSE engine
+(``api._meeting_stream_events``) already drives:
+
+* ``xread(last, count, block)`` is served from the rings when the viewer's cursor falls inside
+  them. A cursor OLDER than a ring (a reconnect after a long gap, the proc stream's ``0-0`` full
+  replay) falls back to a direct ``XRANGE`` for that stream, paged at ``count``;
+* ``xrevrange`` / ``exists`` (the once-per-connect seed and the end-of-meeting probe) pass through.
+
+The reader starts with a meeting's first subscriber and stops with its last, or when the process
+shuts down (``MeetingStreamHubs.close``). ``stats()`` reports
+per-meeting subscriber counts and the buffer hit rate (reads served from a ring vs XRANGE).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections import deque
+from typing import Callable
+
+logger = logging.getLogger("agent_api.meeting_stream_hub")
+
+#: Entries kept per stream per meeting; an older cursor is served by a direct XRANGE instead.
+BUFFER_SIZE = int(os.environ.get("VEXA_MEETING_STREAM_HUB_BUFFER", "1000"))
+_READ_COUNT = 500
+_READ_BLOCK_MS = 15000
+_RETRY_SEC = 1.0
+
+
+def stream_keys(meeting_id: str, session_uid: str) -> tuple[str, str, str]:
+    """(transcript, copilot output, processed notes) — the three streams a live view merges."""
+    return (f"tc:meeting:{meeting_id}", f"unit:agent-meet-{session_uid}:out", f"proc:meeting:{meeting_id}")
+
+
+def _order(entry_id: str) -> tuple[int, int]:
+    """A stream id as a sortable ``(ms, seq)``. Malformed → below everything, so a garbage cursor
+    takes the XRANGE path and redis rejects it exactly as a direct XREAD would have."""
+    ms, _, seq = str(entry_id).partition("-")
+    try:
+        return (int(ms), int(seq or 0))
+    except ValueError:
+        return (-1, -1)
+
+
+class _Ring:
+    """One stream's most recent entries. Holds EVERY entry with an id in ``(floor, tail]``."""
+
+    def __init__(self, start: str, size: int) -> None:
+        self.floor = start
+        self.tail = start
+        self.size = size
+        self.entries: deque = deque()
+
+    def extend(self, entries) -> None:
+        for entry_id, fields in entries:
+            if len(self.entries) >= self.size:
+                self.floor = self.entries.popleft()[0]
+            self.entries.append((entry_id, fields))
+            self.tail = entry_id
+
+    def covers(self, cursor: str) -> bool:
+        return _order(cursor) >= _order(self.floor)
+
+    def after(self, cursor: str, count: int) -> list:
+        """The (up to ``count``) oldest entries newer than ``cursor`` — scanned from the tail, since
+        a live viewer is at most a read or two behind."""
+        c = _order(cursor)
+        newer = []
+        for entry in reversed(self.entries):
+            if _order(entry[0]) <= c:
+                break
+            newer.append(entry)
+        newer.reverse()
+        return newer[:count]
+
+
+class _Hub:
+    """The shared tail of one live meeting's three streams."""
+
+    def __init__(self, r, keys: tuple, size: int) -> None:
+        self.r = r
+        self.keys = keys
+        self.size = size
+        self.rings: dict[str, _Ring] = {}
+        self.subscribers = 0
+        self.hits = 0
+        self.misses = 0
+        self.changed = asyncio.Event()
+        self._starting: "asyncio.Future | None" = None
+        self._task: "asyncio.Task | None" = None
+
+    async def started(self) -> None:
+        if self._starting is None:
+            self._starting = asyncio.ensure_future(self._start())
+        await asyncio.shield(self._starting)
+
+    async def _start(self) -> None:
+        # Each ring starts at its stream's CURRENT tail: anything older is history a subscriber
+        # reaches through the XRANGE fallback, never a gap.
+        for key in self.keys:
+            tail = await self.r.xrevrange(key, count=1)
+            self.rings[key] = _Ring(tail[0][0] if tail else "0-0", self.size)
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                resp = await self.r.xread({k: ring.tail for k, ring in self.rings.items()},
+                                          count=_READ_COUNT, block=_READ_BLOCK_MS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # noqa: BLE001 — a redis blip must not kill the meeting's tail
+                logger.warning("meeting stream hub read failed for %s: %s", self.keys[0], e)
+                await asyncio.sleep(_RETRY_SEC)
+                continue
+            if not resp:
+                continue
+            for stream, entries in resp:
+                self.rings[stream].extend(entries)
+            woken, self.changed = self.changed, asyncio.Event()
+            woken.set()
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        elif self._starting is not None:
+            self._starting.cancel()
+
+
+class Subscription:
+    """One viewer's handle on a hub — the redis surface ``_meeting_stream_events`` reads through."""
+
+    def __init__(self, hubs: "MeetingStreamHubs", key: tuple, hub: _Hub) -> None:
+        self._hubs = hubs
+        self._key = key
+        self._hub = hub
+        self._dollar: dict[str, str] = {}  # "$" pinned to the ring tail at this viewer's first read
+        self._closed = False
+
+    async def xrevrange(self, key: str, count: int = 1):
+        return await self._hub.r.xrevrange(key, count=count)
+
+    async def exists(self, key: str):
+        return await self._hub.r.exists(key)
+
+    async def xread(self, streams: dict, count: int = _READ_COUNT, block: int | None = None):
+        """XREAD semantics over the hub: entries newer than each cursor, waiting up to ``block`` ms
+        (``0`` = forever, ``None`` = don't wait) for the reader to land some."""
+        loop = asyncio.get_running_loop()
+        deadline = None if not block else loop.time() + block / 1000
+        while True:
+            changed = self._hub.changed  # captured BEFORE collecting — no lost wake-up
+            resp = await self._collect(streams, count)
+            if resp or block is None:
+                return resp
+            timeout = None if deadline is None else deadline - loop.time()
+            if timeout is not None and timeout <= 0:
+                return []
+            try:
+                await asyncio.wait_for(changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+
+    async def _collect(self, streams: dict, count: int) -> list:
+        hub = self._hub
+        out = []
+        for key, cursor in streams.items():
+            ring = hub.rings[key]
+            if cursor == "$":
+                cursor = self._dollar.setdefault(key, ring.tail)
+            if ring.covers(cursor):
+                entries = ring.after(cursor, count)
+                if entries:
+                    hub.hits += 1
+            else:
+                hub.misses += 1
+                entries = await hub.r.xrange(key, min=f"({cursor}", max=ring.floor, count=count)
+            if entries:
+                out.append((key, entries))
+        return out
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._hubs._release(self._key, self._hub)
+
+
+class MeetingStreamHubs:
+    """The per-process registry of live-meeting hubs. ``redis`` returns the (shared, async) client a
+    new hub reads through — called per hub so a rebuilt pool is picked up."""
+
+    def __init__(self, redis: Callable[[], object], *, buffer_size: int | None = None) -> None:
+        self._redis = redis
+        self._buffer_size = BUFFER_SIZE if buffer_size is None else buffer_size
+        self._hubs: dict[tuple, _Hub] = {}
+
+    async def subscribe(self, meeting_id: str, session_uid: str) -> Subscription:
+        key = (str(meeting_id), str(session_uid))
+        hub = self._hubs.get(key)
+        if hub is None:
+            hub = self._hubs[key] = _Hub(self._redis(), stream_keys(*key), self._buffer_size)
+        hub.subscribers += 1
+        try:
+            await hub.started()
+        except BaseException:
+            self._release(key, hub)
+            raise
+        return Subscription(self, key, hub)
+
+    def _release(self, key: tuple, hub: _Hub) -> None:
+        hub.subscribers -= 1
+        if hub.subscribers <= 0 and self._hubs.get(key) is hub:
+            del self._hubs[key]
+            hub.stop()
+
+    async def close(self) -> None:
+        """Stop every hub's reader and wait for it to unwind (process shutdown, before the shared
+        client is closed under it). A viewer still attached just sees no further entries."""
+        hubs, self._hubs = list(self._hubs.values()), {}
+        for hub in hubs:
+            hub.stop()
+        await asyncio.gather(*(t for hub in hubs for t in (hub._starting, hub._task) if t is not None),
+                             return_exceptions=True)
+
+    def stats(self) -> list[dict]:
+        """Per live meeting: subscriber count, buffered entries, and ring hits vs XRANGE fallbacks."""
+        rows = []
+        for (meeting_id, session_uid), hub in self._hubs.items():
+            served = hub.hits + hub.misses
+            rows.append({
+                "meeting_id": meeting_id, "session_uid": session_uid,
+                "subscribers": hub.subscribers,
+                "buffered": sum(len(ring.entries) for ring in hub.rings.values()),
+                "buffer_hits": hub.hits, "buffer_misses": hub.misses,
+                "buffer_hit_rate": round(hub.hits / served, 4) if served else None,
+            })
+        return rows
@@ -75,6 +75,9 @@ class Settings(BaseSettings):
     llm_model: str = ""         # deployment-default model (free string)
     model_allowlist: str = ""   # optional comma-separated gate on workspace-pinned models
     meeting_idle_timeout_sec: int = Field(default=4 * 60 * 60, ge=60)
+    # Copilot beats a live-meeting worker runs at once, off its ingest loop (0 = inline, the old
+    # serial loop). Each is one LLM call; a beat gated while all are busy coalesces into one queued.
+    meeting_beat_concurrency: int = Field(default=2, ge=0)
     # How long a CHAT worker serves its unit:<id>:in topic after the last turn before exiting
     # (TTL-on-idle). A live worker takes the thread's next message WARM (no container/CLI cold
     # start) — the window is the warm-hit budget; an idle worker costs only its parked memory.
@@ -43,6 +43,18 @@ def transcription_golden() -> dict:
     return _golden("Transcription.confirmed.json")
 
 
+@pytest.fixture(autouse=True)
+def _fresh_meeting_folds():
+    """Chat grounding folds through a process-wide cache of redis clients + folded stream views
+    (``meeting_fold.FOLDS``). Tests seed a fresh fakeredis behind the same url each time, so start
+    every test with an empty cache."""
+    from control_plane.meeting_fold import FOLDS
+
+    FOLDS.clear()
+    yield
+    FOLDS.clear()
+
+
 @pytest.fixture(autouse=True)
 def _default_subject(monkeypatch):
     """The HTTP tests exercise agent-api with no gateway in front, so set the single-user fallback
@@ -464,37 +464,23 @@ def test_meeting_process_off_freezes_cursor(monkeypatch):
 
 def test_meeting_stream_seeds_recent_tail_without_replaying_from_zero(monkeypatch):
     import json
-    import redis
-
-    class FakeRedis:
-        def __init__(self):
-            self.first_xread = None
-            self.calls = 0
-
-        def xrevrange(self, stream, count=1):
-            if stream == "tc:meeting:abc":
-                return [
-                    ("9-0", {"payload": json.dumps({"type": "transcription", "segments": [{"speaker": "Recent", "text": "tail", "start": 9, "segment_id": "recent"}]})}),
-                    ("8-0", {"payload": json.dumps({"type": "transcription", "segments": [{"speaker": "Older", "text": "still recent", "start": 8, "segment_id": "older"}]})}),
-                ]
-            if stream == "unit:agent-meet-abc:out":
-                return [
-                    ("4-0", {"event": json.dumps({"type": "note", "note": {"id": "n1", "text": "processed tail"}})}),
-                ]
-            return []
-
-        def xread(self, streams, count=500, block=15000):
-            self.calls += 1
-            if self.first_xread is None:
-                self.first_xread = dict(streams)
-                return [("tc:meeting:abc", [("10-0", {"payload": json.dumps({"type": "session_end"})})])]
-            return []
-
-    fake = FakeRedis()
-    monkeypatch.setattr(redis, "from_url", lambda *_args, **_kwargs: fake)
+    from control_plane import api
+
+    monkeypatch.setattr(api, "MEETING_STREAM_TRANSCRIPT_REPLAY", 3)
+    fake = _Streams({
+        "tc:meeting:abc": [
+            ("7-0", _seg("Ancient", "replayed from zero", "ancient")),
+            ("8-0", _seg("Older", "still recent", "older")),
+            ("9-0", _seg("Recent", "tail", "recent")),
+            ("10-0", {"payload": json.dumps({"type": "session_end"})}),
+        ],
+        "unit:agent-meet-abc:out": [
+            ("4-0", {"event": json.dumps({"type": "note", "note": {"id": "n1", "text": "processed tail"}})}),
+        ],
+    })
     c = TestClient(create_app(
         Dispatcher(load_settings(), _FakeRuntime(), _FakeIdentity()), redis_url="redis://test",
-        meeting_owner_lookup=_fake_owner_lookup({("u_owner", "abc"): "abc"}),
+        meeting_owner_lookup=_fake_owner_lookup({("u_owner", "abc"): "abc"}), meeting_stream_redis=fake,
     ))
 
     with c.stream("GET", "/api/meeting/stream", params={"meeting_id": "abc", "session_uid": "abc"},
@@ -506,11 +492,10 @@ def test_meeting_stream_seeds_recent_tail_without_replaying_from_zero(monkeypatc
     assert '"text": "tail"' in body
     assert '"processed tail"' in body
     assert '"meeting-end"' in body
-    # transcript/output resume from their seeded tails; the proc stream from 0-0 (full replay —
+    assert "replayed from zero" not in body   # only the bounded tail is seeded, never from 0-0
+    # the output stream resumes from its seeded tail; the proc stream from 0-0 (full replay —
     # notes upsert by id client-side, and the whole processed view must render on connect).
-    assert fake.first_xread == {
-        "tc:meeting:abc": "9-0", "unit:agent-meet-abc:out": "4-0", "proc:meeting:abc": "0-0",
-    }
+    assert "id: -|4-0|0-0" in body
 
 
 def test_meeting_stream_relays_proc_notes_and_closes_on_view_end(monkeypatch):
@@ -519,50 +504,38 @@ def test_meeting_stream_relays_proc_notes_and_closes_on_view_end(monkeypatch):
     marker (evidence of completion, P21), not on a quiet-poll guess. The final beat's post-
     session_end notes therefore reach the live view before meeting-end."""
     import json
-    import redis
+    import time
 
-    class FakeRedis:
-        def __init__(self):
-            self.calls = 0
-
-        def xrevrange(self, stream, count=1):
-            return []
-
-        def exists(self, key):
-            return 1  # the copilot wrote — the close must WAIT for view_end, not a quiet poll
-
-        def xread(self, streams, count=500, block=15000):
-            self.calls += 1
-            if self.calls == 1:
-                return [
-                    ("tc:meeting:42", [("5-0", {"payload": json.dumps({"type": "transcription", "segments": [{"speaker": "J", "text": "um hi", "start": 1, "segment_id": "s1"}]})})]),
-                    ("proc:meeting:42", [("6-0", {"note": json.dumps({"id": "s1", "text": "Hi.", "speaker": "J"})})]),
-                ]
-            if self.calls == 2:
-                return [("tc:meeting:42", [("7-0", {"payload": json.dumps({"type": "session_end"})})])]
-            if self.calls == 3:
-                # the final beat lands AFTER session_end — still relayed, then the marker
-                return [("proc:meeting:42", [
-                    ("8-0", {"note": json.dumps({"id": "s1", "text": "Hi, polished."})}),
-                    ("9-0", {"type": "view_end", "cursor": "7-0"}),
-                ])]
-            return []  # the empty poll after the marker closes the stream
+    from control_plane.api import MEETING_STREAM_ENDING_CAP_SEC
 
-    fake = FakeRedis()
-    monkeypatch.setattr(redis, "from_url", lambda *_args, **_kwargs: fake)
+    fake = _Streams({
+        "tc:meeting:42": [
+            ("5-0", _seg("J", "um hi", "s1")),
+            ("7-0", {"payload": json.dumps({"type": "session_end"})}),
+        ],
+        # the copilot wrote (the close must WAIT for view_end, not a quiet poll); the final beat
+        # lands AFTER session_end — still relayed, then the marker
+        "proc:meeting:42": [
+            ("6-0", {"note": json.dumps({"id": "s1", "text": "Hi.", "speaker": "J"})}),
+            ("8-0", {"note": json.dumps({"id": "s1", "text": "Hi, polished."})}),
+            ("9-0", {"type": "view_end", "cursor": "7-0"}),
+        ],
+    })
     c = TestClient(create_app(
         Dispatcher(load_settings(), _FakeRuntime(), _FakeIdentity()), redis_url="redis://test",
-        meeting_owner_lookup=_fake_owner_lookup({("u_owner", "42"): "42"}),
+        meeting_owner_lookup=_fake_owner_lookup({("u_owner", "42"): "42"}), meeting_stream_redis=fake,
     ))
 
+    started = time.monotonic()
     with c.stream("GET", "/api/meeting/stream", params={"meeting_id": "42", "session_uid": "42"},
                   headers={"X-User-Id": "u_owner"}) as r:
         body = "".join(r.iter_text())
 
     assert '"Hi."' in body                       # baseline note straight off the proc stream
     assert '"Hi, polished."' in body             # the final beat's note, AFTER session_end
-    assert '"meeting-end"' in body
-    assert fake.calls == 4                       # closed ON the marker — no 45s cap, no early cut
+    assert body.index('"Hi, polished."') < body.index('"meeting-end"')
+    # closed ON the marker (one empty drain poll) — no 45s cap, no early cut
+    assert time.monotonic() - started < MEETING_STREAM_ENDING_CAP_SEC / 4
 
 
 def test_workspace_read_and_traversal_guard(tmp_path):
@@ -807,87 +780,120 @@ def test_sse_cursor_encode_decode_roundtrip():
     assert _decode_sse_cursor("-|5-0") == (None, "5-0", None)      # only the output stream was read
 
 
-def _stream_client(fake_redis, monkeypatch):
-    import redis
-    monkeypatch.setattr(redis, "from_url", lambda *_a, **_k: fake_redis)
-    return TestClient(create_app(
-        Dispatcher(load_settings(), _FakeRuntime(), _FakeIdentity()), redis_url="redis://test",
-        meeting_owner_lookup=_fake_owner_lookup({("u_owner", "m1"): "m1"}),
-    ))
+class _Streams:
+    """An in-memory redis-streams fake with real XREAD cursor + BLOCK semantics, usable from any event
+    loop (TestClient runs each request on its own) and appendable from the test thread mid-stream."""
+    def __init__(self, streams=None):
+        self.streams = {k: list(v) for k, v in (streams or {}).items()}
+        self.xreads = 0
 
+    @staticmethod
+    def _order(entry_id):
+        ms, _, seq = entry_id.partition("-")
+        return (int(ms), int(seq or 0))
 
-class _StreamRedis:
-    """Records the xread resume cursor + which streams were seeded (xrevrange). Ends the SSE fast by
-    returning a session_end then draining empty."""
-    def __init__(self):
-        self.seeded = []
-        self.xread_last = None
-        self._reads = 0
+    def append(self, key, entry_id, fields):
+        self.streams.setdefault(key, []).append((entry_id, fields))
+
+    async def xrevrange(self, key, count=1):
+        return list(reversed(self.streams.get(key, [])))[:count]
+
+    async def xrange(self, key, min="-", max="+", count=None):
+        lo = (-1, -1) if min == "-" else self._order(min.lstrip("("))
+        hi = None if max == "+" else self._order(max)
+        rows = [(i, f) for i, f in self.streams.get(key, [])
+                if (self._order(i) > lo if min.startswith("(") else self._order(i) >= lo)
+                and (hi is None or self._order(i) <= hi)]
+        return rows[:count] if count else rows
+
+    async def exists(self, key):
+        return int(bool(self.streams.get(key)))
+
+    async def xread(self, streams, count=500, block=None):
+        import asyncio
+        self.xreads += 1
+        cursors = {k: (self.streams[k][-1][0] if c == "$" and self.streams.get(k) else
+                       "0-0" if c == "$" else c) for k, c in streams.items()}
+        deadline = asyncio.get_running_loop().time() + (block or 0) / 1000
+        while True:
+            out = []
+            for k, c in cursors.items():
+                rows = [(i, f) for i, f in self.streams.get(k, []) if self._order(i) > self._order(c)]
+                if rows:
+                    out.append((k, rows[:count]))
+            if out or asyncio.get_running_loop().time() >= deadline:
+                return out
+            await asyncio.sleep(0.01)
+
+
+def _seg(speaker, text, segment_id, start=1):
+    import json as _j
+    return {"payload": _j.dumps({"type": "transcription", "segments": [
+        {"speaker": speaker, "text": text, "start": start, "segment_id": segment_id}]})}
 
-    def xrevrange(self, key, count=1):
-        self.seeded.append(key)
-        return []
 
-    def xread(self, last, count=500, block=0):
-        self._reads += 1
-        if self.xread_last is None:
-            self.xread_last = dict(last)
-        if self._reads == 1:
-            import json as _j
-            return [("tc:meeting:m1", [("9-0", {"payload": _j.dumps({"type": "session_end"})})])]
-        return []   # drain → ending → meeting-end → return
+def _session_end():
+    import json as _j
+    return {"payload": _j.dumps({"type": "session_end"})}
+
+
+def _stream_client(fake_redis, monkeypatch):
+    return TestClient(create_app(
+        Dispatcher(load_settings(), _FakeRuntime(), _FakeIdentity()), redis_url="redis://test",
+        meeting_owner_lookup=_fake_owner_lookup({("u_owner", "m1"): "m1"}), meeting_stream_redis=fake_redis,
+    ))
 
 
 def test_sse_resumes_from_last_event_id_no_reseed(monkeypatch):
     """RECONNECT (the real-time transcript-loss fix): with a Last-Event-ID, the live feed resumes EXACTLY
     from the client's cursor and does NOT re-seed the bounded tail — so segments published in the gap are
     delivered, not skipped."""
-    fr = _StreamRedis()
+    import json as _j
+    fr = _Streams({
+        "tc:meeting:m1": [("5-0", _seg("A", "before the drop", "s5")), ("8-0", _seg("A", "in the gap", "s8")),
+                          ("9-0", _session_end())],
+        "unit:agent-meet-m1:out": [("2-0", {"event": _j.dumps({"type": "card", "id": "old-card"})}),
+                                   ("4-0", {"event": _j.dumps({"type": "card", "id": "gap-card"})})],
+    })
     c = _stream_client(fr, monkeypatch)
     with c.stream("GET", "/api/meeting/stream", params={"meeting_id": "m1", "session_uid": "m1"},
                   headers={"Last-Event-ID": "7-0|3-0", "X-User-Id": "u_owner"}) as r:
         assert r.status_code == 200
-        _ = r.read()
-    assert fr.xread_last["tc:meeting:m1"] == "7-0"          # resumed from the cursor, NOT "$"
-    assert fr.xread_last["unit:agent-meet-m1:out"] == "3-0"
-    assert "tc:meeting:m1" not in fr.seeded                 # transcript tail NOT re-seeded on resume
+        body = r.read().decode()
+    assert "in the gap" in body and "gap-card" in body      # resumed from the cursor, NOT "$"
+    assert "before the drop" not in body                    # transcript tail NOT re-seeded on resume
+    assert "old-card" not in body
 
 
 def test_sse_fresh_connect_seeds_and_tails(monkeypatch):
     """No Last-Event-ID (fresh connect): seed the bounded transcript tail, then live-tail from there."""
-    fr = _StreamRedis()
+    class _LiveAfterSeed(_Streams):
+        async def xrevrange(self, key, count=1):
+            rows = await super().xrevrange(key, count)
+            if key == "unit:agent-meet-m1:out":   # the seed pass is done → the meeting carries on live
+                self.append("tc:meeting:m1", "10-0", _seg("A", "live", "s10"))
+                self.append("tc:meeting:m1", "11-0", _session_end())
+            return rows
+
+    fr = _LiveAfterSeed({"tc:meeting:m1": [("9-0", _seg("A", "seeded", "s9"))]})
     c = _stream_client(fr, monkeypatch)
     with c.stream("GET", "/api/meeting/stream", params={"meeting_id": "m1", "session_uid": "m1"},
                   headers={"X-User-Id": "u_owner"}) as r:
         assert r.status_code == 200
-        _ = r.read()
-    assert "tc:meeting:m1" in fr.seeded                     # fresh connect DID seed the tail
-    assert fr.xread_last["tc:meeting:m1"] == "$"            # then tails live from now
-
-
-class _RetractRedis:
-    """The live tail delivers a segment then a `retract` marker (the collector withdrew a superseded
-    draft). The SSE must relay the marker as a `retract` event so the terminal drops that id."""
-    def __init__(self):
-        self._reads = 0
-
-    def xrevrange(self, key, count=1):
-        return []
-
-    def xread(self, last, count=500, block=0):
-        import json as _j
-        self._reads += 1
-        if self._reads == 1:
-            return [("tc:meeting:m1", [("1-0", {"payload": _j.dumps(
-                {"type": "transcription", "segments": [{"speaker": "A", "text": "hi", "start": 1, "segment_id": "turn:1:p0"}]})})])]
-        if self._reads == 2:
-            return [("tc:meeting:m1", [("2-0", {"payload": _j.dumps({"type": "retract", "segment_ids": ["turn:1:p0"]})})])]
-        return []
+        body = r.read().decode()
+    assert body.index('"seeded"') < body.index('"live"')    # fresh connect DID seed, then tailed live
+    assert '"meeting-end"' in body
 
 
 def test_sse_relays_retract_marker(monkeypatch):
-    """A `retract` marker on tc:meeting relays to the client as a `retract` SSE event carrying the ids."""
-    fr = _RetractRedis()
+    """A `retract` marker on tc:meeting relays to the client as a `retract` SSE event carrying the ids.
+    (The collector withdrew a superseded draft; the terminal drops that id.)"""
+    import json as _j
+    fr = _Streams({"tc:meeting:m1": [
+        ("1-0", _seg("A", "hi", "turn:1:p0")),
+        ("2-0", {"payload": _j.dumps({"type": "retract", "segment_ids": ["turn:1:p0"]})}),
+        ("3-0", _session_end()),
+    ]})
     c = _stream_client(fr, monkeypatch)
     with c.stream("GET", "/api/meeting/stream", params={"meeting_id": "m1", "session_uid": "m1"},
                   headers={"X-User-Id": "u_owner"}) as r:
@@ -906,27 +912,13 @@ def test_sse_relays_retract_marker(monkeypatch):
 def _xtenant_stream_client(monkeypatch):
     """A live-SSE client whose owner-lookup says: row "10" is owned by u_alice (native "aaa-bbb-ccc"),
     row "20" is owned by u_bob (native "xxx-yyy-zzz"). The redis fake ends every stream immediately."""
-    import redis
-
-    class _Redis:
-        def xrevrange(self, key, count=1):
-            return []
-
-        def xread(self, last, count=500, block=0):
-            import json as _j
-            # one session_end then drain → the SSE closes cleanly (so a REFUSAL is unambiguous: no body).
-            if not getattr(self, "_done", False):
-                self._done = True
-                return [(f"tc:meeting:{list(last)[0].split(':')[-1]}",
-                         [("9-0", {"payload": _j.dumps({"type": "session_end"})})])]
-            return []
-
-    fake = _Redis()
-    monkeypatch.setattr(redis, "from_url", lambda *_a, **_k: fake)
+    # session_end already at each transcript's tail → the SSE closes cleanly (so a REFUSAL is
+    # unambiguous: no body).
+    fake = _Streams({"tc:meeting:10": [("9-0", _session_end())], "tc:meeting:20": [("9-0", _session_end())]})
     owned = {("u_alice", "10"): "aaa-bbb-ccc", ("u_bob", "20"): "xxx-yyy-zzz"}
     return TestClient(create_app(
         Dispatcher(load_settings(), _FakeRuntime(), _FakeIdentity()), redis_url="redis://test",
-        meeting_owner_lookup=_fake_owner_lookup(owned),
+        meeting_owner_lookup=_fake_owner_lookup(owned), meeting_stream_redis=fake,
     ), raise_server_exceptions=True)
 
 
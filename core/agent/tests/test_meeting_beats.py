@@ -0,0 +1,289 @@
+"""serve_meeting with overlapping beats: a slow LLM no longer holds back ingest.
+
+With ``beat_concurrency`` = K the copilot beats run on a per-meeting pool. These drive the loop with
+scripted transcripts and gated ``card_turn``s (ordering is asserted with events, never wall-clock
+ratios) and check four things:
+
+* a segment arriving while a beat's LLM call is in flight gets its baseline note before that beat's
+  card (inline it waited behind the card); the segment → note / → card latencies over a clocked
+  transcript with a slow LLM are reported as test properties, not asserted;
+* each segment still gets exactly three rewrite passes, and ``view_end`` is the LAST proc entry;
+* gates that fire while K beats are busy coalesce into ONE queued beat, which takes the newest window;
+* a late note from an older beat never rolls back a newer beat's upgrade.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+from worker.worker import serve_meeting
+
+LLM_DELAY = 0.3
+
+
+def _entry(eid, sid, speaker="Jane"):
+    return (eid, {"payload": json.dumps({"type": "transcription", "segments": [
+        {"speaker": speaker, "text": f"line {sid}", "completed": True, "segment_id": sid}]})})
+
+
+def _end(eid):
+    return (eid, {"payload": json.dumps({"type": "session_end"})})
+
+
+class ClockedStream:
+    """Delivers each transcript entry at its scheduled offset (XREAD BLOCK semantics) and stamps
+    every XADD with the time it landed."""
+
+    def __init__(self, schedule):
+        self._schedule = list(schedule)   # [(offset_sec, entry), …]
+        self._t0 = None
+        self.arrived: dict[str, float] = {}
+        self.out: list[tuple[float, str, dict]] = []
+        self._lock = threading.Lock()
+
+    def xadd(self, name, fields):
+        with self._lock:
+            self.out.append((time.monotonic(), name, fields))
+            return f"{len(self.out)}-0"
+
+    def xread(self, streams, count=1, block=None):
+        if self._t0 is None:
+            self._t0 = time.monotonic()
+        tname = next(iter(streams))
+        deadline = time.monotonic() + (block or 0) / 1000
+        while True:
+            now = time.monotonic()
+            due = [(off, e) for off, e in self._schedule if self._t0 + off <= now]
+            if due:
+                self._schedule = self._schedule[len(due):]
+                for off, (eid, _) in due:
+                    self.arrived[eid] = self._t0 + off   # when it LANDED, not when it was read
+                return [(tname, [e for _, e in due])]
+            if not self._schedule or now >= deadline:
+                return []
+            time.sleep(min(0.005, max(0.0, deadline - now)))
+
+    def proc(self):
+        return [(t, f) for t, name, f in self.out if name == "proc"]
+
+    def events(self):
+        return [(t, json.loads(f["event"])) for t, name, f in self.out if name == "o"]
+
+
+def _slow_turn(segs):
+    time.sleep(LLM_DELAY)
+    for s in segs:
+        yield {"type": "note", "note": {"id": s["segment_id"], "speaker": "Jane",
+                                        "text": f"{s['segment_id']} pass {s['rewrite_pass']}"}}
+    newest = segs[-1]["segment_id"]
+    yield {"type": "card", "card": {"kind": "topic", "title": f"card {newest}", "body": ""}}
+
+
+def _latencies(s, eid_of):
+    """Per segment: arrival → first baseline proc note, and arrival → first card covering it."""
+    note_at, card_at = {}, {}
+    for t, f in s.proc():
+        if "note" in f:
+            note_at.setdefault(json.loads(f["note"])["id"], t)
+    covered: set = set()
+    for t, ev in s.events():
+        if ev["type"] == "card":
+            newest = ev["card"]["title"].split()[-1]
+            for sid in eid_of:
+                if sid <= newest and sid not in covered:
+                    covered.add(sid)
+                    card_at[sid] = t
+    notes = [note_at[sid] - s.arrived[eid] for sid, eid in eid_of.items()]
+    cards = [card_at[sid] - s.arrived[eid] for sid, eid in eid_of.items() if sid in card_at]
+    return notes, cards
+
+
+def _run(k):
+    # a segment every 50ms, a beat gate every 2 — beats (300ms each) fire far faster than they finish
+    eid_of = {f"s{i:02d}": f"{i + 1}-0" for i in range(12)}
+    schedule = [(0.05 * i, _entry(eid, sid)) for i, (sid, eid) in enumerate(eid_of.items())]
+    schedule.append((0.05 * 12 + 0.05, _end("99-0")))
+    s = ClockedStream(schedule)
+    serve_meeting(s, transcript_stream="tc:m1", out_topic="o", card_turn=_slow_turn, idle_ms=2000,
+                  beat_segments=2, proc_stream="proc", beat_concurrency=k)
+    return s, _latencies(s, eid_of)
+
+
+def _order(out):
+    """Baseline-note ids and ``"card"`` markers, in the order they were written (the first
+    occurrence of an id is its baseline note)."""
+    seq = []
+    for name, f in out:
+        if name == "proc" and "note" in f:
+            seq.append(json.loads(f["note"])["id"])
+        elif name == "o" and json.loads(f["event"])["type"] == "card":
+            seq.append("card")
+    return seq
+
+
+def _carded_turn(in_flight, release):
+    """A card_turn whose LLM call reports it is in flight, then holds until ``release``."""
+
+    def turn(segs):
+        in_flight.set()
+        release.wait(5)
+        yield {"type": "card", "card": {"kind": "topic", "title": f"card {segs[-1]['segment_id']}",
+                                        "body": ""}}
+    return turn
+
+
+def test_slow_llm_no_longer_delays_baseline_notes():
+    # inline: the beat runs on the loop, so the segment behind it waits for the card (released at once)
+    in_flight, release = threading.Event(), threading.Event()
+    release.set()
+    inline = _Scripted([(None, [_entry("1-0", "a")]), (None, [_entry("2-0", "b")]),
+                        (None, [_end("3-0")])])
+    serve_meeting(inline, transcript_stream="tc:m1", out_topic="o", idle_ms=10, beat_segments=10,
+                  card_turn=_carded_turn(in_flight, release), proc_stream="proc", beat_concurrency=0)
+    seq = _order(inline.out)
+    assert seq.index("a") < seq.index("card") < seq.index("b")
+
+    # pooled: "b" arrives while the beat's LLM call is provably in flight, and is only released
+    # after the loop has read past it — its baseline note lands before the card
+    in_flight, release = threading.Event(), threading.Event()
+    pooled = _Scripted([
+        (None, [_entry("1-0", "a")]),
+        (lambda: in_flight.wait(5), [_entry("2-0", "b")]),
+        (release.set, [_end("3-0")]),
+    ])
+    serve_meeting(pooled, transcript_stream="tc:m1", out_topic="o", idle_ms=10, beat_segments=10,
+                  card_turn=_carded_turn(in_flight, release), proc_stream="proc", beat_concurrency=2)
+    seq = _order(pooled.out)
+    assert seq.index("a") < seq.index("b") < seq.index("card")
+    # the processed view still closes on view_end, AFTER every note
+    for s in (inline, pooled):
+        assert [f for name, f in s.out if name == "proc"][-1]["type"] == "view_end"
+
+
+def test_reports_note_and_card_latency_under_a_slow_llm(record_property):
+    """The measurement behind the ordering test: segment → baseline note and segment → card over a
+    clocked transcript (a segment every 50ms, a 300ms LLM). Recorded, not asserted — wall-clock
+    ratios are CI-noise."""
+    for k in (0, 2):
+        s, (notes, cards) = _run(k)
+        record_property(f"k{k}_note_latency_max_s", round(max(notes), 3))
+        record_property(f"k{k}_card_latency_min_s", round(min(cards), 3) if cards else None)
+        assert s.proc()[-1][1]["type"] == "view_end"
+
+
+class _Gated:
+    """A card_turn whose first beat blocks until released; every call records its window."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.windows: list[list[tuple[str, int]]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, segs):
+        with self._lock:
+            self.windows.append([(s["segment_id"], s["rewrite_pass"]) for s in segs])
+            first = len(self.windows) == 1
+        if first:
+            self.started.set()
+            self.release.wait(5)
+        return iter(())
+
+
+class _Scripted:
+    """One XREAD batch per step; a step may first wait on an event (block semantics stay intact)."""
+
+    def __init__(self, steps):
+        self._steps = list(steps)
+        self.out = []
+        self._lock = threading.Lock()
+
+    def xadd(self, name, fields):
+        with self._lock:
+            self.out.append((name, fields))
+        return str(len(self.out))
+
+    def xread(self, streams, count=1, block=None):
+        if not self._steps:
+            return []
+        before, entries = self._steps.pop(0)
+        if before is not None:
+            before()
+        return [(next(iter(streams)), entries)]
+
+
+def test_gates_during_busy_beats_coalesce_into_one_queued_beat():
+    turn = _Gated()
+
+    def after_first_beat_started():
+        turn.started.wait(5)
+
+    s = _Scripted([
+        (None, [_entry("1-0", "a")]),                              # new speaker → beat1 (blocks)
+        (after_first_beat_started, [_entry("2-0", "b", "Raj")]),   # gate → queued
+        (None, [_entry("3-0", "c", "Ann")]),                       # gate → coalesces into it
+        (None, [_entry("4-0", "d", "Bo")]),                        # gate → coalesces into it
+        (turn.release.set, []),                                    # beat1 lands → queued one launches
+    ])
+    serve_meeting(s, transcript_stream="tc:m1", out_topic="o", card_turn=turn, idle_ms=10,
+                  beat_segments=10, beat_concurrency=1)
+
+    assert turn.windows == [
+        [("a", 1)],
+        [("a", 2), ("b", 1), ("c", 1), ("d", 1)],   # ONE beat over the newest window, not three
+    ]
+
+
+def test_overlapping_beats_keep_three_passes_and_view_end_last():
+    seen: list[tuple[str, int]] = []
+    lock = threading.Lock()
+
+    def turn(segs):
+        with lock:
+            seen.extend((s["segment_id"], s["rewrite_pass"]) for s in segs)
+        time.sleep(0.02)
+        for s in segs:
+            yield {"type": "note", "note": {"id": s["segment_id"], "speaker": "Jane", "text": "x"}}
+
+    steps = [(None, [_entry(f"{i}-0", f"s{i}", speaker=f"p{i}")]) for i in range(1, 9)]
+    steps.append((None, [_end("9-0")]))
+    s = _Scripted(steps)
+    serve_meeting(s, transcript_stream="tc:m1", out_topic="o", card_turn=turn, idle_ms=10,
+                  beat_segments=1, proc_stream="proc", beat_concurrency=3)
+
+    for i in range(1, 9):
+        passes = sorted(p for sid, p in seen if sid == f"s{i}")
+        assert passes == sorted(set(passes)) and set(passes) <= {1, 2, 3}  # never the same pass twice
+    assert sorted(p for sid, p in seen if sid == "s1") == [1, 2, 3]
+    proc = [f for name, f in s.out if name == "proc"]
+    assert proc[-1] == {"type": "view_end", "cursor": "9-0"}
+
+
+def test_late_note_from_an_older_beat_does_not_roll_back_a_newer_one():
+    first_started, second_done = threading.Event(), threading.Event()
+
+    def turn(segs):
+        newest = segs[-1]["segment_id"]
+        if newest == "a":          # beat1: stalls until beat2 has upgraded "a"
+            first_started.set()
+            second_done.wait(5)
+        text = f"from beat over {newest}"
+        yield {"type": "note", "note": {"id": "a", "speaker": "Jane", "text": text}}
+        if newest == "b":
+            second_done.set()
+
+    notes: dict = {}
+    s = _Scripted([
+        (None, [_entry("1-0", "a")]),
+        (lambda: first_started.wait(5), [_entry("2-0", "b", "Raj")]),
+        (lambda: second_done.wait(5), []),
+    ])
+    serve_meeting(s, transcript_stream="tc:m1", out_topic="o", card_turn=turn, idle_ms=10,
+                  beat_segments=10, proc_stream="proc", beat_concurrency=2,
+                  on_envelope=lambda env: notes.update({n["id"]: n["text"] for n in env["notes"]}))
+
+    upgrades = [json.loads(f["note"])["text"] for name, f in s.out
+                if name == "proc" and json.loads(f["note"]).get("text", "").startswith("from beat")]
+    assert upgrades == ["from beat over b"]          # beat1's stale note never hit the stream
+    assert notes["a"] == "from beat over b"
@@ -0,0 +1,120 @@
+"""meeting_fold: chat grounding folds a meeting stream incrementally instead of re-reading it per turn.
+
+The folded result must equal a from-scratch fold (``_full_fold`` below is the pre-cache algorithm). What
+changes is the work per turn: a cold view decodes each entry once, in pages, and a warm view only the
+entries appended since the last turn.
+"""
+from __future__ import annotations
+
+import json
+
+import fakeredis
+import pytest
+
+from control_plane import meeting_fold
+from control_plane.meeting_fold import FoldCache
+
+KEY = "tc:meeting:7"
+
+
+@pytest.fixture
+def r(monkeypatch):
+    import redis
+
+    fake = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis, "from_url", lambda *a, **k: fake)
+    return fake
+
+
+class _CountingItems:
+    """``transcript_items`` that counts the entries it decodes."""
+
+    def __init__(self):
+        self.decoded = 0
+
+    def __call__(self, entry_id, fields):
+        self.decoded += 1
+        return meeting_fold.transcript_items(entry_id, fields)
+
+
+def _add(r, sid, text, key=KEY):
+    r.xadd(key, {"payload": json.dumps({"type": "transcription", "segments": [
+        {"segment_id": sid, "speaker": "Jane", "text": text}]})})
+
+
+def _texts(items):
+    return [i["text"] for i in items]
+
+
+def _full_fold(r, key, limit):
+    """The fold every chat turn used to do: one XRANGE of the whole stream, first-arrival order."""
+    order, by_id = [], {}
+    for entry_id, fields in r.xrange(key):
+        for sid, seg in meeting_fold.transcript_items(entry_id, fields):
+            if sid not in by_id:
+                order.append(sid)
+            by_id[sid] = seg
+    return [by_id[sid] for sid in order[-limit:]]
+
+
+def test_warm_view_decodes_only_new_entries_and_matches_a_full_fold(r):
+    for n in range(20):
+        _add(r, f"s{n}", f"draft {n}")
+    cache, items = FoldCache(), _CountingItems()
+    assert _texts(cache.tail("redis://x", KEY, items, limit=5)) == [f"draft {n}" for n in range(15, 20)]
+
+    before = items.decoded
+    _add(r, "s19", "final 19")          # a refining draft upserts in place …
+    _add(r, "s20", "new 20")            # … and a new segment appends
+    got = cache.tail("redis://x", KEY, items, limit=5)
+    assert items.decoded - before == 2  # only what arrived since the last turn
+    assert got == FoldCache().tail("redis://x", KEY, meeting_fold.transcript_items, limit=5)
+    assert _texts(got) == ["draft 16", "draft 17", "draft 18", "final 19", "new 20"]
+
+
+def test_cold_view_decodes_each_entry_once_in_pages(r):
+    for n in range(1200):
+        _add(r, f"s{n}", f"line {n}")
+    items = _CountingItems()
+    got = FoldCache().tail("redis://x", KEY, items, limit=10)
+    assert _texts(got) == [f"line {n}" for n in range(1190, 1200)]
+    assert items.decoded == 1200       # three XRANGE pages, every entry decoded exactly once
+
+
+def test_matches_a_full_fold_when_an_early_segment_is_refined_late(r):
+    """A segment keeps its FIRST-arrival position however late it is refined — whether the view is
+    cold, warm, or had already evicted it from its window."""
+    for n in range(12):
+        _add(r, f"s{n}", f"draft {n}")
+    cache = FoldCache()
+    assert cache.tail("redis://x", KEY, meeting_fold.transcript_items, limit=5) == _full_fold(r, KEY, 5)
+    _add(r, "s0", "final 0")           # evicted from the warm view's window: stays out of the tail
+    _add(r, "s10", "final 10")         # inside it: refined in place
+    _add(r, "s12", "new 12")
+    assert cache.tail("redis://x", KEY, meeting_fold.transcript_items, limit=5) == _full_fold(r, KEY, 5)
+    cold = FoldCache().tail("redis://x", KEY, meeting_fold.transcript_items, limit=5)
+    assert cold == _full_fold(r, KEY, 5)
+    assert _texts(cold) == ["draft 8", "draft 9", "final 10", "draft 11", "new 12"]
+
+
+
+def test_evicted_ids_are_bounded_by_the_refine_horizon(r, monkeypatch):
+    """A view remembers only the ids of the last REFINE_HORIZON positions to leave its window — its
+    memory is bounded however many distinct segments the meeting has had."""
+    monkeypatch.setattr(meeting_fold, "REFINE_HORIZON", 50)
+    for n in range(1200):
+        _add(r, f"s{n}", f"line {n}")
+    cache = FoldCache()
+    assert _texts(cache.tail("redis://x", KEY, meeting_fold.transcript_items, limit=5)) == [
+        f"line {n}" for n in range(1195, 1200)]
+    [view] = cache._views.values()
+    assert list(view.evicted) == [f"s{n}" for n in range(1145, 1195)]
+    _add(r, "s1150", "final 1150")     # still inside the horizon: stays out of the tail
+    assert cache.tail("redis://x", KEY, meeting_fold.transcript_items, limit=5) == _full_fold(r, KEY, 5)
+
+def test_views_are_evicted_lru(r):
+    cache = FoldCache(maxsize=2)
+    for key in ("tc:meeting:1", "tc:meeting:2", "tc:meeting:1", "tc:meeting:3"):
+        _add(r, "s", "hi", key=key)
+        cache.tail("redis://x", key, meeting_fold.transcript_items, limit=5)
+    assert [k for _, k in cache._views] == ["tc:meeting:1", "tc:meeting:3"]
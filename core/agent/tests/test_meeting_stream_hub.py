@@ -0,0 +1,85 @@
+"""meeting_stream_hub: N viewers of one meeting share ONE redis tail.
+
+Driven against an async fakeredis wrapped in a call counter: the XREAD count must not scale with the
+subscriber count, a cursor inside the ring is served from memory, and a cursor older than the ring
+falls back to a paged XRANGE without skipping an entry.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+
+import fakeredis
+import pytest
+
+from control_plane.meeting_stream_hub import MeetingStreamHubs
+
+TKEY = "tc:meeting:m1"
+
+
+class _Counting:
+    """Proxy an async redis client, counting calls per command."""
+
+    def __init__(self, r):
+        self.r = r
+        self.calls = Counter()
+
+    def __getattr__(self, name):
+        fn = getattr(self.r, name)
+
+        async def call(*args, **kwargs):
+            self.calls[name] += 1
+            return await fn(*args, **kwargs)
+        return call
+
+
+def _ids(resp, key=TKEY):
+    return [entry_id for stream, entries in resp if stream == key for entry_id, _ in entries]
+
+
+@pytest.mark.asyncio
+async def test_fifty_viewers_share_one_reader():
+    r = _Counting(fakeredis.FakeAsyncRedis(decode_responses=True))
+    hubs = MeetingStreamHubs(lambda: r)
+    subs = [await hubs.subscribe("m1", "m1") for _ in range(50)]
+    assert hubs.stats()[0]["subscribers"] == 50
+
+    reads = [asyncio.create_task(s.xread({TKEY: "$"}, count=500, block=5000)) for s in subs]
+    await asyncio.sleep(0.05)
+    await r.r.xadd(TKEY, {"payload": "{}"}, id="5-0")
+    results = await asyncio.wait_for(asyncio.gather(*reads), timeout=5)
+
+    assert all(_ids(resp) == ["5-0"] for resp in results)   # every viewer got the entry …
+    assert r.calls["xread"] <= 3                             # … off ONE tail, not 50 XREADs
+    assert r.calls["xrange"] == 0
+    assert hubs.stats()[0]["buffer_hit_rate"] == 1.0
+
+    for s in subs:
+        s.close()
+    assert hubs.stats() == []                                # the last viewer out stops the reader
+
+
+@pytest.mark.asyncio
+async def test_cursor_older_than_the_ring_falls_back_to_xrange():
+    raw = fakeredis.FakeAsyncRedis(decode_responses=True)
+    for n in range(1, 4):
+        await raw.xadd(TKEY, {"n": str(n)}, id=f"{n}-0")
+    r = _Counting(raw)
+    hubs = MeetingStreamHubs(lambda: r, buffer_size=2)
+    live = await hubs.subscribe("m1", "m1")
+    replay = await hubs.subscribe("m1", "m1")
+    for n in range(4, 8):   # the ring (size 2) now holds 6-0, 7-0; its floor is 5-0
+        await raw.xadd(TKEY, {"n": str(n)}, id=f"{n}-0")
+
+    got = []
+    while len(got) < 7:     # a full replay from 0-0, paged at count=2
+        resp = await replay.xread({TKEY: got[-1] if got else "0-0"}, count=2, block=2000)
+        got += _ids(resp)
+    assert got == [f"{n}-0" for n in range(1, 8)]            # gapless across XRANGE → ring
+    assert _ids(await live.xread({TKEY: "6-0"}, count=500, block=2000)) == ["7-0"]
+
+    row = hubs.stats()[0]
+    assert r.calls["xrange"] == row["buffer_misses"] >= 1
+    assert row["buffer_hits"] >= 1 and row["subscribers"] == 2
+    live.close()
+    replay.close()
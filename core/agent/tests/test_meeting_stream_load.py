@@ -0,0 +1,147 @@
+"""Load: ONE agent-api process holds 2,000 concurrent live-meeting SSE viewers.
+
+`/api/meeting/stream` used to be a sync generator — every viewer pinned a threadpool worker (anyio's
+default limiter is 40) in a 15s XREAD BLOCK on its own `redis.from_url` pool, so viewer 41 waited for a
+free thread before it saw a byte. The async engine parks each viewer as a coroutine on its meeting's
+shared hub (one redis tail for all 2,000). This drives the ASGI app directly (no TestClient threads) against an async
+fakeredis: every viewer must receive its seed while ALL of them are connected at once, then the live
+segment and meeting-end once the transcript ends.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+
+import fakeredis
+import pytest
+
+from control_plane import api
+from control_plane.api import create_app
+from shared.config import load_settings
+from control_plane.dispatch import Dispatcher
+
+from .test_api import _FakeIdentity, _FakeRuntime
+
+VIEWERS = 2000
+
+
+def _app(r):
+    return create_app(
+        Dispatcher(load_settings(), _FakeRuntime(), _FakeIdentity()), redis_url="redis://test",
+        meeting_owner_lookup=lambda user_id, meeting_id: {"id": meeting_id, "native_meeting_id": meeting_id},
+        meeting_stream_redis=r,
+    )
+
+
+class _Viewer:
+    """A bare ASGI client: one GET, the response body accumulated as it streams."""
+
+    def __init__(self):
+        self.status = None
+        self.body = ""
+        self.seeded = asyncio.Event()
+        self._gone = asyncio.Event()
+        self._sent = False
+
+    async def receive(self):
+        if not self._sent:
+            self._sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self._gone.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+        elif message["type"] == "http.response.body":
+            self.body += message.get("body", b"").decode()
+            if '"seed"' in self.body:
+                self.seeded.set()
+
+    async def run(self, app, meeting_id):
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "path": "/api/meeting/stream", "raw_path": b"/api/meeting/stream",
+            "query_string": f"meeting_id={meeting_id}&session_uid={meeting_id}".encode(),
+            "headers": [(b"host", b"test"), (b"x-user-id", b"u_owner")],
+            "client": ("test", 1), "server": ("test", 80), "root_path": "",
+        }
+        try:
+            await app(scope, self.receive, self.send)
+        finally:
+            self._gone.set()
+
+
+def _segment(text, sid):
+    return {"payload": json.dumps({"type": "transcription", "segments": [
+        {"speaker": "A", "text": text, "start": 1, "segment_id": sid}]})}
+
+
+@pytest.mark.asyncio
+async def test_two_thousand_concurrent_viewers_on_one_process():
+    r = fakeredis.FakeAsyncRedis(decode_responses=True)
+    await r.xadd("tc:meeting:m1", _segment("seed", "s0"))
+    app = _app(r)
+    threads_before = threading.active_count()
+
+    viewers = [_Viewer() for _ in range(VIEWERS)]
+    tasks = [asyncio.create_task(v.run(app, "m1")) for v in viewers]
+    # every viewer is connected and seeded at the SAME time — a thread-per-viewer engine stalls here
+    await asyncio.wait_for(asyncio.gather(*(v.seeded.wait() for v in viewers)), timeout=60)
+    assert threading.active_count() - threads_before < 100  # no thread per viewer
+
+    await r.xadd("tc:meeting:m1", _segment("live", "s1"))
+    await r.xadd("tc:meeting:m1", {"payload": json.dumps({"type": "session_end"})})
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=60)
+
+    for v in viewers:
+        assert v.status == 200
+        assert '"live"' in v.body          # the post-connect segment reached every viewer
+        assert '"meeting-end"' in v.body   # no proc stream → the view closes after the drain
+
+
+def test_default_stream_redis_is_one_shared_blocking_pool(monkeypatch):
+    """Without an injected client every viewer shares ONE BlockingConnectionPool, sized by
+    MEETING_STREAM_REDIS_CONNECTIONS (a viewer past the cap waits for a connection, never errors)."""
+    import redis.asyncio as aredis
+
+    monkeypatch.setattr(api, "MEETING_STREAM_REDIS_CONNECTIONS", 7)
+    client = api._meeting_stream_pool("redis://test:6379/0")
+    pool = client.connection_pool
+    assert isinstance(pool, aredis.BlockingConnectionPool)
+    assert pool.max_connections == 7 and pool.timeout is None
+
+
+class _StubClient:
+    def __init__(self):
+        self.hubs = []
+        self.closed_with = None
+        self.readers_stopped_at_close = None
+
+    async def aclose(self, close_connection_pool=None):
+        self.readers_stopped_at_close = [hub._task.done() for hub in self.hubs]
+        self.closed_with = close_connection_pool
+
+
+def test_stream_pool_is_opened_at_startup_and_closed_after_the_hubs_stop(monkeypatch):
+    """One pool per process: built by the startup hook on the serving loop, closed by the shutdown
+    hook — after every live meeting's reader has been stopped, so none is left blocked on it."""
+    from fastapi.testclient import TestClient
+
+    r = fakeredis.FakeAsyncRedis(decode_responses=True)
+    built = []
+    monkeypatch.setattr(api, "_meeting_stream_pool", lambda url: built.append(_StubClient()) or built[-1])
+    app = create_app(Dispatcher(load_settings(), _FakeRuntime(), _FakeIdentity()), redis_url="redis://test",
+                     meeting_owner_lookup=lambda user_id, meeting_id: None)
+    hubs = app.state.meeting_stream_hubs
+    assert built == []
+
+    with TestClient(app) as c:
+        assert len(built) == 1 and hubs._redis() is built[0]
+        hubs._redis = lambda: r                       # the hub itself reads through fakeredis
+        sub = c.portal.call(hubs.subscribe, "m1", "m1")
+        built[0].hubs = list(hubs._hubs.values())
+    assert built[0].closed_with is True and built[0].readers_stopped_at_close == [True]
+    assert hubs.stats() == []
+    sub.close()                                       # a viewer released after shutdown is a no-op
@@ -9,6 +9,8 @@ from __future__ import annotations
 import json
 import pathlib
 
+import pytest
+
 from llm.claude_code import ClaudeCodeHarness, _link_skills_into_workspace
 from worker.worker import serve
 
@@ -360,6 +362,89 @@ def test_serve_meeting_persists_and_advances_cursor():
     assert s.kv["proc:meeting:m1:cursor"] == "6-0"  # advanced to the last cleaned raw entry
 
 
+class _PipelineCountingRedis:
+    """A fakeredis client that counts round trips: direct commands, and one per ``pipeline().execute()``."""
+
+    def __init__(self):
+        import fakeredis
+
+        self.r = fakeredis.FakeRedis(decode_responses=True)
+        self.direct = 0
+        self.pipelines = []  # command count of each executed pipeline
+
+    def xread(self, *args, **kwargs):
+        return self.r.xread(*args, **kwargs)
+
+    def xadd(self, *args, **kwargs):
+        self.direct += 1
+        return self.r.xadd(*args, **kwargs)
+
+    def set(self, *args, **kwargs):
+        self.direct += 1
+        return self.r.set(*args, **kwargs)
+
+    def pipeline(self, transaction=True):
+        pipe = self.r.pipeline(transaction=transaction)
+        execute = pipe.execute
+
+        def counted(raise_on_error=True):
+            self.pipelines.append(len(pipe.command_stack))
+            return execute(raise_on_error=raise_on_error)
+
+        pipe.execute = counted
+        return pipe
+
+
+def test_serve_meeting_pipelines_proc_out_and_cursor_writes():
+    """Over a redis client, a batch's baseline notes go out in ONE pipeline (its cursor in a second,
+    once they have landed), and a beat's 40 upgrade notes + its card events + turn-complete in ONE
+    more — not ~45 sequential round trips."""
+    r = _PipelineCountingRedis()
+    for i in range(40):
+        r.r.xadd("tc:m1", {"payload": json.dumps({"type": "transcription", "segments": [
+            {**_seg("Jane", f"line {i}"), "segment_id": f"s{i}"}]})}, id=f"{i + 1}-0")
+    r.r.xadd("tc:m1", {"payload": json.dumps({"type": "session_end"})}, id="41-0")
+
+    def card_turn(segs):
+        yield from _notes_card_turn(segs)
+        yield {"type": "card", "card": {"kind": "person", "title": "Jane", "body": "speaker"}}
+
+    serve_meeting(r, transcript_stream="tc:m1", out_topic="o", card_turn=card_turn, idle_ms=10,
+                  beat_segments=100, proc_stream="proc:meeting:m1", cursor_key="proc:meeting:m1:cursor")
+
+    assert r.direct == 0
+    # XREAD batch (40 baseline notes, then the cursor SET), final beat (40 upgrades + card +
+    # turn-complete), then the view_end marker
+    assert r.pipelines == [40, 1, 42, 1]
+    assert r.r.get("proc:meeting:m1:cursor") == "40-0"
+    proc = [f for _id, f in r.r.xrange("proc:meeting:m1")]
+    texts = [json.loads(f["note"])["text"] for f in proc[:-1]]
+    assert texts[:40] == [f"Line {i}" for i in range(40)]              # stream order preserved
+    assert texts[40:] == [f"clean:line {i}" for i in range(40)]
+    assert proc[-1] == {"type": "view_end", "cursor": "41-0"}
+    assert [json.loads(f["event"])["type"] for _id, f in r.r.xrange("o")] == ["card", "turn-complete"]
+
+
+def test_stream_batch_holds_the_cursor_back_when_an_xadd_fails():
+    """A failed XADD (here: WRONGTYPE) raises from flush() and the cursor SET is never sent, so the
+    cursor cannot move past a segment whose baseline note was not written."""
+    import redis as redis_lib
+
+    from worker.engine import _StreamBatch
+
+    r = _PipelineCountingRedis()
+    r.r.set("proc:meeting:m1", "not a stream")
+    batch = _StreamBatch(r)
+    batch.xadd("o", {"event": "{}"})
+    batch.xadd("proc:meeting:m1", {"note": "{}"})
+    batch.set("proc:meeting:m1:cursor", "7-0")
+    with pytest.raises(redis_lib.ResponseError):
+        batch.flush()
+    assert r.pipelines == [2]                         # the cursor pipeline never ran
+    assert r.r.get("proc:meeting:m1:cursor") is None
+    assert r.r.xlen("o") == 1                         # the XADD ahead of the failure still landed
+
+
 def _proc_markers(s, proc_stream):
     return [f for name, f in s.out if name == proc_stream and f.get("type") == "view_end"]
 
@@ -208,6 +208,52 @@ class _Stream(Protocol):
     # xrevrange is OPTIONAL (serve() falls back to "$" when the stream object lacks it — older fakes):
     # it anchors the in-topic read at the boot-time tail so a message XADDed while the entrypoint turn
     # runs is consumed after it instead of lost ("$" only sees entries added after the first xread).
+    # pipeline is OPTIONAL too (_StreamBatch writes straight through without it).
+
+
+class _StreamBatch:
+    """Write side of a ``_Stream`` that coalesces XADD / SET into ONE round trip per ``flush()``.
+
+    Over a redis client, writes queue on a non-transactional ``pipeline()``, in call order, so every
+    stream keeps its entry order. A stream without ``pipeline`` (the test fakes) is written straight
+    through and ``flush()`` is a no-op. The SETs (cursors) go in a second pipeline only once every
+    XADD has landed — a failed XADD raises from ``flush()`` before any cursor moves past it. SETs are
+    best-effort, as ``_set_cursor`` already was: a failed SET is logged and dropped."""
+
+    def __init__(self, stream: _Stream) -> None:
+        self._stream = stream
+        self._pipelined = callable(getattr(stream, "pipeline", None))
+        self._ops: list[tuple[str, tuple]] = []
+
+    def xadd(self, name: str, fields: dict) -> str | None:
+        if not self._pipelined:
+            return self._stream.xadd(name, fields)
+        self._ops.append(("xadd", (name, fields)))
+        return None  # the id lands on flush; no caller reads it
+
+    def set(self, key: str, value: str) -> None:
+        if not self._pipelined:
+            setter = getattr(self._stream, "set", None)
+            if setter is not None:
+                setter(key, value)
+            return
+        self._ops.append(("set", (key, value)))
+
+    def flush(self) -> None:
+        if not self._ops:
+            return
+        ops, self._ops = self._ops, []
+        for group in ([o for o in ops if o[0] != "set"], [o for o in ops if o[0] == "set"]):
+            if not group:
+                continue
+            pipe = self._stream.pipeline(transaction=False)
+            for op, args in group:
+                getattr(pipe, op)(*args)
+            for (op, _args), result in zip(group, pipe.execute(raise_on_error=False)):
+                if isinstance(result, Exception):
+                    if op != "set":
+                        raise result
+                    log.warning("stream batch: SET failed: %s", result)
 
 
 # ── the agent turn over the mounted workspace (drives the llm HarnessPort) ────────────────────────
@@ -490,6 +536,9 @@ def main() -> None:  # pragma: no cover — the container entrypoint (wired in t
                 polish_rules=cfg.polish_rules, tag_rules=cfg.tag_rules,
             ),
             idle_ms=idle_ms, beat_segments=cfg.cadence_segments,
+            # Beats overlap (up to K, stamped by dispatch from meeting_beat_concurrency) off the
+            # ingest loop, so a slow LLM never holds back the baseline notes arriving behind it.
+            beat_concurrency=int(os.environ.get("VEXA_MEETING_BEAT_CONCURRENCY", "2")),
             doc_turn=doc_turn, enabled=cfg.enabled,
             start_id=os.environ.get("VEXA_TRANSCRIPT_START_ID", "0"),
             # P0 (cross-tenant leak fix): BOTH the processed-notes stream AND its cursor key on the
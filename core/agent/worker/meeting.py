@@ -13,6 +13,8 @@ from __future__ import annotations
 import json
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Iterator
 
@@ -28,7 +30,7 @@ from shared.agent_config import (
     DEFAULT_POLISH_RULES,
     DEFAULT_TAG_RULES,
 )
-from worker.engine import _Stream
+from worker.engine import _Stream, _StreamBatch
 from worker.engine import run_turn_over_workspace as _engine_run_turn_over_workspace
 
 # Back-compat aliases (pre-llm-split names the worker.worker shim re-exports).
@@ -406,7 +408,7 @@ def upsert_meeting_transcript_file(path: Path, meta: dict, note: dict) -> None:
     path.write_text(render_meeting_transcript(meta, notes))
 
 
-def _set_cursor(stream: _Stream, cursor_key: str | None, raw_id: str) -> None:
+def _set_cursor(stream: _Stream | _StreamBatch, cursor_key: str | None, raw_id: str) -> None:
     """Freeze the per-meeting processed CURSOR = the last raw transcript stream-id cleaned. Best-effort:
     a fake stream without ``set`` (or a transient redis error) must never break the live beat."""
     if not cursor_key:
@@ -439,6 +441,7 @@ def serve_meeting(
     on_proc_note: Callable[[dict], None] | None = None,
     on_envelope: Callable[[dict], None] | None = None,
     proc_params: dict | None = None,
+    beat_concurrency: int = 0,
 ) -> None:
     """Consume the meeting's ``transcript.v1`` Stream (the meetings⊥agent seam — read by schema), gate
     cheaply (a NEW speaker, or ``beat_segments`` segments), and run a copilot beat that XADDs proactive
@@ -446,6 +449,12 @@ def serve_meeting(
     — a refining draft updates its line in place rather than piling up a duplicate. The transcript keeps
     it non-idle; ``session_end`` (or an idle gap) reaps it.
 
+    ``beat_concurrency`` = K > 0 takes the beats OFF the ingest loop: at most K run at once on a
+    per-meeting pool while ingest keeps emitting baseline notes, and a gate that fires while all K are
+    busy queues ONE more beat, which takes the newest window when it launches (later gates coalesce
+    into it). ``0`` runs each beat inline on the ingest loop (deterministic — what the unit fixtures
+    use).
+
     Cards surfaced across the meeting are accumulated (de-duped by title) and, on ``session_end``,
     handed to ``doc_turn`` — the post-meeting WRITE turn that authors/updates the kg meeting entity.
     """
@@ -457,8 +466,21 @@ def serve_meeting(
     seen_titles: set[str] = set()
     notes: list[dict] = []          # running 1:1 cleaned notes (by id), the envelope render source
     notes_by_id: dict[str, dict] = {}
+    note_beat: dict[str, int] = {}  # note id → the beat that last upgraded it (a late older beat loses)
     last = start_id
     n = 0
+    # Ingest and the beat pool share the state above; every mutation (and every XADD, so each stream
+    # keeps one writer at a time) happens under ``lock``. Only the LLM call itself runs outside it.
+    lock = threading.RLock()
+    settled = threading.Condition(lock)
+    pool = (ThreadPoolExecutor(max_workers=beat_concurrency, thread_name_prefix="meeting-beat")
+            if beat_concurrency > 0 else None)
+    in_flight = 0
+    queued = False
+    failures: list[BaseException] = []
+    # Proc notes, beat events and the cursor queue here and reach redis in ONE pipelined round trip
+    # per XREAD batch / per beat (``writes.flush()``, under ``lock`` so each stream keeps its order).
+    writes = _StreamBatch(stream)
 
     def _persist_envelope() -> None:
         """DURABLE RENDER SOURCE (deterministic dual-source): persist the SAME running notes/cards the
@@ -473,14 +495,23 @@ def serve_meeting(
 
     mirror_dirty: dict[str, dict] = {}  # note id → latest merged note, awaiting a mirror flush
 
-    def _emit_proc_note(note: dict) -> None:
+    def _emit_proc_note(note: dict, beat: int = 0) -> None:
         """XADD ONE cleaned note (id == segment_id) onto the per-meeting processed STREAM — the ONE
         live carrier of cleaned notes (processed-notes.v1; the SSE tails it, the db-writer persists
         it) — and accumulate it into the running envelope + the mirror batch. The workspace-file and
         envelope mirrors are DERIVED views flushed per beat / at session_end (ADR 0027) — writing
-        them per note was an O(n²) rewrite in the hot loop."""
+        them per note was an O(n²) rewrite in the hot loop.
+
+        ``beat`` is the beat that produced an upgrade (0 = the ingest baseline). With overlapping
+        beats an older beat can finish last; its note for an id a newer beat already upgraded is
+        dropped rather than rolling the line back."""
         if not note:
             return
+        nid = str(note.get("id") or "").strip()
+        if beat and nid:
+            if note_beat.get(nid, 0) > beat:
+                return
+            note_beat[nid] = beat
         if proc_stream:
             fields = {"note": json.dumps(note)}
             if proc_params:
@@ -488,10 +519,9 @@ def serve_meeting(
                 # durable consumer (meeting-api db-writer → meeting.data processed views) records
                 # reproducible provenance for the view it persists.
                 fields["params"] = json.dumps(proc_params)
-            stream.xadd(proc_stream, fields)
+            writes.xadd(proc_stream, fields)
         # Accumulate the SAME 1:1 cleaned note (keyed by id) into the running envelope notes — a refining
         # pass UPDATES its line in place rather than duplicating, exactly like the markdown upsert.
-        nid = str(note.get("id") or "").strip()
         if nid:
             existing = notes_by_id.get(nid)
             if existing is None:
@@ -515,93 +545,169 @@ def serve_meeting(
             _persist_envelope()
         mirror_dirty.clear()
 
-    def _run_beat(segs: list[dict], idx: int) -> None:
+    def _take_window() -> tuple[int, list[dict]] | None:
+        """Stage the next beat from the mutable window (under ``lock``). Each segment's rewrite pass is
+        RESERVED here, not when the beat finishes, so an overlapping beat stages the NEXT pass and a
+        segment still leaves the window after its third."""
+        nonlocal n, processing_window, window_by_id
+        n += 1
+        mutable = [seg for seg in processing_window if int(seg.get("_rewrite_passes", 0)) < 3]
+        staged = [{**seg, "rewrite_pass": int(seg.get("_rewrite_passes", 0)) + 1} for seg in mutable]
+        for seg in mutable:
+            seg["_rewrite_passes"] = int(seg.get("_rewrite_passes", 0)) + 1
+        processing_window = [seg for seg in processing_window if int(seg.get("_rewrite_passes", 0)) < 3]
+        window_by_id = {seg["segment_id"]: seg for seg in processing_window}
+        return (n, staged) if staged else None
+
+    def _run_beat(idx: int, staged: list[dict]) -> None:
         tid = f"beat{idx}"
-        staged = [{**seg, "rewrite_pass": int(seg.get("_rewrite_passes", 0)) + 1} for seg in segs]
-        for ev in card_turn(staged):
-            if ev.get("type") == "card":
-                _accumulate_card(cards, seen_titles, ev.get("card") or {})
-            elif ev.get("type") == "note":
-                # The LLM rewrite returned a valid note for this id → UPGRADE the cleaned-stream text
-                # (baseline already emitted at ingest; this is the richer pass, still 1:1 by segment_id).
-                # Notes ride ONLY processed-notes.v1 — the out-stream is cards + agent activity, per
-                # its name (ADR 0027 carrier collapse; the SSE tails the proc stream directly).
-                _emit_proc_note(ev.get("note") or {})
-                continue
-            stream.xadd(out_topic, {"event": json.dumps({**ev, "turn_id": tid})})
-        stream.xadd(out_topic, {"event": json.dumps({"type": "turn-complete", "turn_id": tid})})
-        sent_ids = {id(seg) for seg in segs}
-        for seg in processing_window:
-            if id(seg) in sent_ids:
-                seg["_rewrite_passes"] = int(seg.get("_rewrite_passes", 0)) + 1
-        _flush_mirror()
-
-    while True:
-        resp = stream.xread({transcript_stream: last}, count=50, block=idle_ms)
-        if not resp:
-            return  # transcript idle/ended → reap
-        new_speaker = False
-        for _name, entries in resp:
-            for entry_id, fields in entries:
-                last = entry_id
-                payload = json.loads(fields.get("payload", "{}"))
-                if payload.get("type") == "session_end":
-                    mutable = [seg for seg in processing_window if int(seg.get("_rewrite_passes", 0)) < 3]
-                    if mutable and enabled:
-                        n += 1
-                        _run_beat(mutable, n)
-                    _flush_mirror()      # ingest-only notes (no beat ran) reach the mirrors too
-                    _persist_envelope()  # final durable render source (notes + accumulated cards)
-                    # processed-notes.v1 ``view_end`` (ADR 0027): the stream is COMPLETE here — the
-                    # final beat has run and every note is emitted. The db-writer flushes the durable
-                    # view ON this marker (its bounded deadline covers a worker that dies without one);
-                    # the live SSE closes on it. Emitted BEFORE the doc turn (30s+ of LLM the durable
-                    # flush must not wait on) and regardless of ``enabled`` (baseline notes flow even
-                    # with live beats off — the emit gate is proc_stream, same as _emit_proc_note's).
-                    if proc_stream:
-                        end_marker: dict = {"type": "view_end"}
-                        if last and last != "0":
-                            end_marker["cursor"] = str(last)
-                        stream.xadd(proc_stream, end_marker)
-                    if doc_turn is not None:  # post-meeting WRITE: author/update the kg meeting entity
-                        _emit_turn(stream, out_topic, lambda: doc_turn(cards), "meeting-doc")
-                    return  # meeting ended → reap
-                for seg_index, seg in enumerate(payload.get("segments", [])):
-                    sid = seg.get("segment_id") or f"{entry_id}:{seg_index}"
-                    existing = window_by_id.get(sid)
-                    if existing is not None:
-                        # A live draft refining (or finalizing) a segment already in the window: update
-                        # it IN PLACE so the next beat reads the latest text, never a duplicate line.
-                        # Identity is preserved, so the rewrite-pass bookkeeping still holds.
-                        existing["text"] = seg.get("text", existing.get("text"))
-                        existing["completed"] = seg.get("completed", True)
-                        continue
-                    item = dict(seg)
-                    item["segment_id"] = sid
-                    item["_rewrite_passes"] = 0
-                    window_by_id[sid] = item
-                    buffer.append(item)
-                    processing_window.append(item)
-                    # Baseline 1:1 cleaned note onto the processed stream — ALWAYS present per segment,
-                    # so the cleaned channel never has a gap even before/without an LLM upgrade beat.
-                    base = _proc_note(item)
-                    if base is not None:
-                        _emit_proc_note(base)
-                    sp = seg.get("speaker")
-                    if sp and sp not in seen_speakers:
-                        seen_speakers.add(sp)
-                        new_speaker = True
+        for ev in card_turn(staged):  # the LLM call — the only part that runs outside the lock
+            with lock:
+                if ev.get("type") == "card":
+                    _accumulate_card(cards, seen_titles, ev.get("card") or {})
+                elif ev.get("type") == "note":
+                    # The LLM rewrite returned a valid note for this id → UPGRADE the cleaned-stream
+                    # text (baseline already emitted at ingest; this is the richer pass, still 1:1 by
+                    # segment_id). Notes ride ONLY processed-notes.v1 — the out-stream is cards + agent
+                    # activity, per its name (ADR 0027 carrier collapse; the SSE tails the proc stream).
+                    _emit_proc_note(ev.get("note") or {}, idx)
+                    continue
+                writes.xadd(out_topic, {"event": json.dumps({**ev, "turn_id": tid})})
+        with lock:
+            writes.xadd(out_topic, {"event": json.dumps({"type": "turn-complete", "turn_id": tid})})
+            writes.flush()
+            _flush_mirror()
+
+    def _pooled_beat(idx: int, staged: list[dict]) -> None:
+        nonlocal in_flight, queued
+        try:
+            _run_beat(idx, staged)
+        except BaseException as e:  # noqa: BLE001 — re-raised on the ingest loop
+            with lock:
+                failures.append(e)
+        finally:
+            with lock:
+                in_flight -= 1
+                if queued and not failures:
+                    queued = False
+                    _launch()
+                settled.notify_all()
+
+    def _launch() -> None:
+        """Start a beat on the pool (under ``lock``), or queue one if K are already running."""
+        nonlocal in_flight, queued
+        if in_flight >= beat_concurrency:
+            queued = True
+            return
+        job = _take_window()
+        if job is not None:
+            in_flight += 1
+            pool.submit(_pooled_beat, *job)
+
+    def _settle(*, drop_queued: bool) -> None:
+        """Wait out the in-flight (and, unless dropped, the queued) beats; surface a beat's failure."""
+        nonlocal queued
+        with settled:
+            if drop_queued:
+                queued = False
+            while in_flight and not failures:
+                settled.wait()
+            if failures:
+                raise failures[0]
+
+    try:
+        while True:
+            resp = stream.xread({transcript_stream: last}, count=50, block=idle_ms)
+            if not resp:
+                _settle(drop_queued=False)
+                return  # transcript idle/ended → reap
+            new_speaker = False
+            ended = False
+            cleaned = None  # the last raw entry of this batch whose segments were cleaned
+            with lock:
+                if failures:
+                    raise failures[0]
+                for _name, entries in resp:
+                    for entry_id, fields in entries:
+                        last = entry_id
+                        payload = json.loads(fields.get("payload", "{}"))
+                        if payload.get("type") == "session_end":
+                            ended = True
+                            break
+                        for seg_index, seg in enumerate(payload.get("segments", [])):
+                            sid = seg.get("segment_id") or f"{entry_id}:{seg_index}"
+                            existing = window_by_id.get(sid)
+                            if existing is not None:
+                                # A live draft refining (or finalizing) a segment already in the window:
+                                # update it IN PLACE so the next beat reads the latest text, never a
+                                # duplicate line. Identity is preserved, so the rewrite-pass bookkeeping
+                                # still holds.
+                                existing["text"] = seg.get("text", existing.get("text"))
+                                existing["completed"] = seg.get("completed", True)
+                                continue
+                            item = dict(seg)
+                            item["segment_id"] = sid
+                            item["_rewrite_passes"] = 0
+                            window_by_id[sid] = item
+                            buffer.append(item)
+                            processing_window.append(item)
+                            # Baseline 1:1 cleaned note onto the processed stream — ALWAYS present per
+                            # segment, so the cleaned channel never has a gap even before/without an
+                            # LLM upgrade beat.
+                            base = _proc_note(item)
+                            if base is not None:
+                                _emit_proc_note(base)
+                            sp = seg.get("speaker")
+                            if sp and sp not in seen_speakers:
+                                seen_speakers.add(sp)
+                                new_speaker = True
+                        cleaned = entry_id
+                    if ended:
+                        break
                 # Advance the per-meeting CURSOR to the last raw stream-id we've now cleaned (gap-fill
-                # picks up from here on re-enable; OFF freezes it at the last processed entry).
-                _set_cursor(stream, cursor_key, entry_id)
-        if enabled and buffer and (new_speaker or len(buffer) >= beat_segments):
-            n += 1
-            mutable = [seg for seg in processing_window if int(seg.get("_rewrite_passes", 0)) < 3]
-            if mutable:
-                _run_beat(mutable, n)
-            processing_window = [seg for seg in processing_window if int(seg.get("_rewrite_passes", 0)) < 3]
-            window_by_id = {seg["segment_id"]: seg for seg in processing_window}
-            buffer = []
+                # picks up from here on re-enable; OFF freezes it at the last processed entry) — ONE
+                # SET per batch, in the same round trip as the batch's baseline notes.
+                if cleaned is not None:
+                    _set_cursor(writes, cursor_key, cleaned)
+                writes.flush()
+                if not ended and enabled and buffer and (new_speaker or len(buffer) >= beat_segments):
+                    if pool is None:
+                        job = _take_window()
+                        if job is not None:
+                            _run_beat(*job)
+                    else:
+                        _launch()
+                    buffer = []
+            if not ended:
+                continue
+            # session_end: the final beat supersedes any queued one, and runs only once every
+            # in-flight beat has landed — so ``view_end`` below still follows the LAST note.
+            _settle(drop_queued=True)
+            with lock:
+                if enabled and any(int(seg.get("_rewrite_passes", 0)) < 3 for seg in processing_window):
+                    _run_beat(*_take_window())
+                _flush_mirror()      # ingest-only notes (no beat ran) reach the mirrors too
+                _persist_envelope()  # final durable render source (notes + accumulated cards)
+                # processed-notes.v1 ``view_end`` (ADR 0027): the stream is COMPLETE here — the
+                # final beat has run and every note is emitted. The db-writer flushes the durable
+                # view ON this marker (its bounded deadline covers a worker that dies without one);
+                # the live SSE closes on it. Emitted BEFORE the doc turn (30s+ of LLM the durable
+                # flush must not wait on) and regardless of ``enabled`` (baseline notes flow even
+                # with live beats off — the emit gate is proc_stream, same as _emit_proc_note's).
+                if proc_stream:
+                    end_marker: dict = {"type": "view_end"}
+                    if last and last != "0":
+                        end_marker["cursor"] = str(last)
+                    writes.xadd(proc_stream, end_marker)
+                writes.flush()
+            if doc_turn is not None:  # post-meeting WRITE: author/update the kg meeting entity
+                _emit_turn(stream, out_topic, lambda: doc_turn(cards), "meeting-doc")
+            return  # meeting ended → reap
+    finally:
+        if pool is not None:
+            with lock:
+                queued = False
+            pool.shutdown(wait=True)
 
 
 def _accumulate_card(cards: list[dict], seen_titles: set[str], card: dict) -> None:
@@ -140,8 +140,8 @@ class FakePubSub:
         # Yield a subscribe confirmation then stream messages (mirrors redis-py pubsub.listen).
         yield {"type": "subscribe"}
         while True:
-            data = await self._queue.get()
-            yield {"type": "message", "data": data}
+            channel, data = await self._queue.get()
+            yield {"type": "message", "channel": channel, "data": data}
 
 
 class FakeRedis:
@@ -186,7 +186,7 @@ class FakeRedis:
 
     async def publish(self, channel: str, data: str) -> None:
         for q in list(self._subs.get(channel, [])):
-            await q.put(data)
+            await q.put((channel, data))
 
 
 class CollectorAuthorizer:
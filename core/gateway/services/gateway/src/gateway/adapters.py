@@ -22,6 +22,7 @@ import os
 from contextlib import asynccontextmanager
 from typing import Optional
 
+from .authcache import ResolveCache, follow_invalidations
 from .obs import TRACE_HEADER, get_trace_id
 from .ports import AuthUnavailable
 
@@ -74,15 +75,22 @@ class AdminApiAuthorizer:
     ``resolve`` POSTs ``/internal/validate`` to admin-api (carrying ``X-Internal-Secret`` when
     configured, and forwarding the request trace_id); ``authorize_subscribe`` POSTs
     ``/ws/authorize-subscribe`` to meeting-api (which now hosts the folded-in collector, P2) with
-    the resolved user identity.
+    the resolved user identity. With a ``cache`` (``authcache.ResolveCache``) repeat resolutions of
+    a key are answered in-process and concurrent misses share one validate call.
     """
 
-    def __init__(self, client, admin_api_url: str, meeting_api_url: str):
+    def __init__(self, client, admin_api_url: str, meeting_api_url: str, cache=None):
         self._client = client
         self._admin_api_url = admin_api_url.rstrip("/")
         self._meeting_api_url = meeting_api_url.rstrip("/")
+        self.cache = cache
 
     async def resolve(self, api_key: str) -> Optional[dict]:
+        if self.cache is not None:
+            return await self.cache.resolve(api_key, self._validate)
+        return await self._validate(api_key)
+
+    async def _validate(self, api_key: str) -> Optional[dict]:
         import httpx
 
         headers = {TRACE_HEADER: get_trace_id() or ""}
@@ -170,7 +178,7 @@ def build_auth_and_downstream(admin_api_url: str, meeting_api_url: str):
         timeout=httpx.Timeout(connect=10.0, read=None, write=10.0, pool=10.0),
         limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
     )
-    authorizer = AdminApiAuthorizer(auth_client, admin_api_url, meeting_api_url)
+    authorizer = AdminApiAuthorizer(auth_client, admin_api_url, meeting_api_url, cache=ResolveCache())
     downstream = HttpxDownstreamClient(forward_client, stream_client=stream_client)
     return authorizer, downstream
 
@@ -234,6 +242,29 @@ def build_production_app(
     from .edge_guard import apply_guard
 
     apply_guard(app)
+
+    # Resolved identities are cached (authcache.py); admin-api's invalidations ride the worker's
+    # shared pub/sub connection so a deleted token stops resolving without waiting out the TTL.
+    @app.on_event("startup")
+    async def _follow_auth_invalidations() -> None:
+        import asyncio
+
+        app.state.auth_invalidations = asyncio.create_task(
+            follow_invalidations(authorizer.cache, app.state.ws_multiplexer)
+        )
+
+    @app.on_event("shutdown")
+    async def _stop_following_auth_invalidations() -> None:
+        import asyncio
+
+        task = getattr(app.state, "auth_invalidations", None)
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
     return app
 
 
@@ -14,8 +14,10 @@ behavior is the v0.12 carve of the deployed ``services/api-gateway/main.py``:
     unsubscribe → Unsubscribed ack AND stop the fan-in; ping → pong; the invalid_json /
     unknown_action / invalid_subscribe_payload / invalid_unsubscribe_payload / missing_api_key
     error vocabulary; raw redis payloads forwarded over ``tc:…:mutable`` / ``bm:…:status`` /
-    ``va:…:chat`` (main.py:2165-2340),
-  * ``/health`` — liveness ``{status:"ok", service:"gateway"}`` (gate:health discovers it).
+    ``va:…:chat`` (main.py:2165-2340) — through ONE shared, ref-counted pubsub connection per
+    worker (``fanout.ChannelMultiplexer``) instead of a connection per subscription,
+  * ``/health`` — liveness ``{status:"ok", service:"gateway"}`` (gate:health discovers it), plus
+    the ``/ws`` multiplexer's metrics under ``ws``.
 
 The collaborators (admin-api, downstream services, redis) are injected as PORTS (``ports.py``)
 so the same app runs with real adapters in prod (``adapters.py``) and in-process fakes in the
@@ -40,6 +42,7 @@ from fastapi import FastAPI, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
 from fastapi.routing import APIRoute
 
+from .fanout import SLOW_CONSUMER_CLOSE_CODE, ChannelMultiplexer
 from .obs import TRACE_HEADER, TraceMiddleware, get_trace_id, log_event, set_user_id
 from .ports import Authorizer, AuthUnavailable, DownstreamClient, RedisBus
 
@@ -295,17 +298,29 @@ def create_app(
     ``authorizer``  — resolves ``x-api-key`` → user/scopes (admin-api ``/internal/validate``).
     ``downstream``  — forwards proxied HTTP requests to meeting-api (the unified control plane:
                       /bots + /transcripts + /meetings + /recordings all live there now, P2).
-    ``redis``       — pub/sub bus for the ``/ws`` fan-in.
+    ``redis``       — pub/sub bus for the ``/ws`` fan-in; every socket of the app shares ONE
+                      pubsub connection through ``app.state.ws_multiplexer`` (``fanout.py``),
+                      whose ``metrics()`` (subscribers, queue depth, dropped frames) is served
+                      as ``/health``'s ``ws`` section; it is closed on app shutdown.
     """
     app = FastAPI(title="Vexa API Gateway (v0.12)")
+    ws_multiplexer = ChannelMultiplexer(redis)
+    app.state.ws_multiplexer = ws_multiplexer
     # The edge: mint/read X-Trace-Id and bind it for the request (logevent.v1 trace_id).
     app.add_middleware(TraceMiddleware)
 
+    # The worker's shared pub/sub connection and its reader task go with the worker.
+    @app.on_event("shutdown")
+    async def _close_ws_multiplexer() -> None:
+        await ws_multiplexer.close()
+
     # --- liveness probe (gate:health): the edge is up. No auth (mirrors a real LB health
-    # check), no downstream call. 200 + {status:"ok", service:"gateway"} = process is up.
+    # check), no downstream call. 200 + {status:"ok", service:"gateway"} = process is up. The
+    # ADDITIVE `ws` section is the /ws fan-in's multiplexer metrics (sockets, channels, queue
+    # depth, dropped frames) — counts only, and it never flips `status`.
     @app.get("/health")
     async def health():
-        return {"status": "ok", "service": "gateway"}
+        return {"status": "ok", "service": "gateway", "ws": ws_multiplexer.metrics()}
 
     # --- /auth/me — caller identity from the API key (GET /auth/me with x-api-key →
     # user_id/email/scopes); the dashboard's login + session-validation resolve the user via this.
@@ -501,9 +516,13 @@ def create_app(
         # Content-Length from the (already httpx-decoded) body; a stale one would corrupt it.
         # ``mcp-session-id``/``mcp-protocol-version`` join them for the same reason: they are the
         # MCP transport's session binding, and a forward that eats them breaks the handshake.
+        # ``etag`` rides along so a client can revalidate a transcript with If-None-Match (the
+        # request header is already forwarded; the upstream's 304 comes back verbatim).
+        # ``x-next-cursor`` names the next page of a range-scoped transcript read.
         passthrough = {
             k: resp_headers[k]
-            for k in ("content-range", "accept-ranges", "content-disposition") + _MCP_HEADERS
+            for k in ("content-range", "accept-ranges", "content-disposition", "etag", "x-next-cursor")
+            + _MCP_HEADERS
             if k in resp_headers
         }
         return Response(
@@ -922,7 +941,7 @@ def create_app(
     # ---- the /ws multiplex (carve of main.websocket_multiplex, main.py:2165-2340) ----
     @app.websocket("/ws")
     async def websocket_multiplex(ws: WebSocket):
-        await run_multiplex(ws, authorizer, redis)
+        await run_multiplex(ws, authorizer, redis, ws_multiplexer)
 
     # ---- deny by default, at BUILD time ----
     # The route table is now complete, so every route must have declared its scopes. Refusing to
@@ -941,7 +960,12 @@ def create_app(
     return app
 
 
-async def run_multiplex(ws: WebSocket, authorizer: Authorizer, redis: RedisBus) -> None:
+async def run_multiplex(
+    ws: WebSocket,
+    authorizer: Authorizer,
+    redis: RedisBus,
+    multiplexer: Optional[ChannelMultiplexer] = None,
+) -> None:
     """The ``/ws`` control loop + fan-in, carved verbatim from main.websocket_multiplex.
 
     PUBLIC (P2 follow-up): the conformance ws-harness drives this directly to exercise the SHIPPED
@@ -956,6 +980,10 @@ async def run_multiplex(ws: WebSocket, authorizer: Authorizer, redis: RedisBus)
       otherwise   → an ``error`` frame (invalid_json / unknown_action / invalid_*_payload).
     Each subscription fans in ``tc:meeting:{id}:mutable`` / ``bm:meeting:{id}:status`` /
     ``va:meeting:{id}:chat`` and forwards every raw payload to the socket (main.py:2204).
+
+    The fan-in rides ``multiplexer`` — the worker's shared pub/sub connection (``fanout.py``);
+    ``create_app`` passes its own. Called without one (the conformance harness), the socket gets a
+    private multiplexer that is closed with it.
     """
     # --- optional WS guard hook (GUARD_WS_ENABLED, default false) ---
     # HTTP SecurityMiddleware does not intercept /ws (Starlette middleware is HTTP-only).
@@ -1018,27 +1046,30 @@ async def run_multiplex(ws: WebSocket, authorizer: Authorizer, redis: RedisBus)
     user_id = user_data["user_id"]
     set_user_id(user_id)
 
-    sub_tasks: Dict[Tuple, asyncio.Task] = {}
+    own_multiplexer = multiplexer is None
+    mux = ChannelMultiplexer(redis) if own_multiplexer else multiplexer
+    subscriber = mux.subscriber()
+    sub_channels: Dict[Tuple, List[str]] = {}
     subscribed_meetings: Set[Tuple] = set()
 
-    async def fan_in(channels: List[str]):
-        pubsub = redis.pubsub()
-        await pubsub.subscribe(*channels)
+    async def pump():
+        # The socket's single send path: every channel's frames arrive through one bounded queue,
+        # in publish order, so a slow socket only ever backs up itself.
         try:
-            async for message in pubsub.listen():
-                if message.get("type") != "message":
-                    continue
-                data = message.get("data")
+            async for data in subscriber.frames():
                 try:
                     await ws.send_text(data)  # forward the raw redis payload (main.py:2204)
                 except Exception:
-                    break
-        finally:
-            try:
-                await pubsub.unsubscribe(*channels)
-                await pubsub.close()
-            except Exception:
-                pass
+                    return
+        except asyncio.CancelledError:
+            if not subscriber.overflowed:
+                raise
+        # The queue overflowed under the "disconnect" policy (a send stuck on the client is
+        # abandoned): close so the client reconnects and re-fetches.
+        try:
+            await ws.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        except Exception:
+            pass
 
     async def subscribe_meeting(platform: str, native_id: str, user_id, meeting_id):
         key = (platform, native_id, user_id)
@@ -1050,25 +1081,28 @@ async def run_multiplex(ws: WebSocket, authorizer: Authorizer, redis: RedisBus)
             f"bm:meeting:{meeting_id}:status",
             f"va:meeting:{meeting_id}:chat",
         ]
-        sub_tasks[key] = asyncio.create_task(fan_in(channels))
+        sub_channels[key] = channels
+        await mux.subscribe(subscriber, channels)
 
     async def unsubscribe_meeting(platform: str, native_id: str, user_id):
         key = (platform, native_id, user_id)
-        task = sub_tasks.pop(key, None)
-        if task:
-            task.cancel()
+        channels = sub_channels.pop(key, None)
+        if channels:
+            await mux.unsubscribe(subscriber, channels)
         subscribed_meetings.discard(key)
 
     # Auto-subscribe the authed socket to its USER scope (Track G — meeting-status-ws §C.2). The
     # user-scoped redis channel `u:{user_id}:meetings` carries every meeting.status frame for this
     # user (the publisher mirrors each bm:meeting:{id}:status onto it — §C.3). No client `subscribe`
-    # frame is needed: the identity is resolved at connect. This reuses the SAME verbatim `fan_in`
+    # frame is needed: the identity is resolved at connect. This reuses the SAME verbatim fan-in
     # path as the per-meeting channels — the gateway is a thin raw forwarder for the user channel
     # exactly as it is for tc:/bm:/va:. Per-meeting subscriptions below are unchanged.
     user_channel = f"u:{user_id}:meetings"
-    user_sub_task = asyncio.create_task(fan_in([user_channel]))
+    pump_task = asyncio.create_task(pump())
+    subscriber.on_overflow = pump_task.cancel
 
     try:
+        await mux.subscribe(subscriber, [user_channel])
         while True:
             try:
                 raw = await ws.receive_text()
@@ -1180,9 +1214,16 @@ async def run_multiplex(ws: WebSocket, authorizer: Authorizer, redis: RedisBus)
     except WebSocketDisconnect:
         pass
     finally:
-        user_sub_task.cancel()  # Track G — tear down the user-scope fan-in on disconnect.
-        for task in sub_tasks.values():
-            task.cancel()
+        # Drop every ref this socket held (the user-scope channel included — Track G); the shared
+        # connection UNSUBSCRIBEs whichever channels no other socket still wants.
+        pump_task.cancel()
+        try:
+            await pump_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        await mux.release(subscriber)
+        if own_multiplexer:
+            await mux.close()
 
 
 # Backward-compatible private alias (kept so any existing internal reference still resolves; the
@@ -0,0 +1,195 @@
+"""``ResolveCache`` — a bounded LRU+TTL cache of API-key resolutions for ``AdminApiAuthorizer``.
+
+Every proxied REST call (and every ``/ws`` subscribe) resolved its ``x-api-key`` by POSTing
+admin-api ``/internal/validate`` — an extra hop plus a Postgres read and commit on the hot path of
+every gateway request, and the bulk of the gateway's p50. The cache answers repeat resolutions of
+the same key in-process:
+
+  * keyed by ``key_fingerprint`` (sha256 of the key) — plaintext keys are never held as dict keys;
+  * a short POSITIVE TTL (``AUTH_CACHE_TTL_S``) for a resolved identity and a shorter NEGATIVE TTL
+    (``AUTH_CACHE_NEGATIVE_TTL_S``) for a definitive "invalid key" — so a burst of bad keys is not a
+    burst of admin-api hops, yet a just-minted key is usable within seconds;
+  * NO caching of ``AuthUnavailable`` — "no verdict" (#495) is retried on the next request;
+  * SINGLE-FLIGHT: concurrent misses for one key share a single validate call, and a caller that
+    goes away does not cancel it for the others;
+  * explicit INVALIDATION from admin-api over redis pub/sub (``AUTH_INVALIDATION_CHANNEL``):
+    ``{"token": <fingerprint>}`` on token delete, ``{"user_id": <id>}`` when a user's validate
+    answer changes (patch, webhook, memberships, admin bootstrap). Anything unrecognized clears the
+    whole cache. A resolution in flight when an invalidation lands is returned but not stored.
+
+The TTL is the staleness bound when the invalidation channel is down (the follower clears the
+cache whenever its subscription is cut off, but a lost message cannot be detected), so it stays
+short. ``metrics()`` reports size, hits, misses, coalesced waiters and invalidations.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from .obs import log_event
+
+AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", "10000"))
+AUTH_CACHE_TTL_S = float(os.getenv("AUTH_CACHE_TTL_S", "30"))
+AUTH_CACHE_NEGATIVE_TTL_S = float(os.getenv("AUTH_CACHE_NEGATIVE_TTL_S", "5"))
+# The channel admin-api publishes invalidations to (admin_api.app.auth_events).
+AUTH_INVALIDATION_CHANNEL = os.getenv("AUTH_INVALIDATION_CHANNEL", "auth:invalidate")
+
+_MISS = object()
+
+
+def key_fingerprint(api_key: str) -> str:
+    """The cache key for ``api_key`` — also what admin-api publishes when the token is deleted."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+class ResolveCache:
+    """``fingerprint → (expires_at, identity-or-None)``, least-recently-used evicted past ``maxsize``."""
+
+    def __init__(
+        self,
+        *,
+        maxsize: Optional[int] = None,
+        ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = AUTH_CACHE_SIZE if maxsize is None else maxsize
+        self.ttl = AUTH_CACHE_TTL_S if ttl is None else ttl
+        self.negative_ttl = AUTH_CACHE_NEGATIVE_TTL_S if negative_ttl is None else negative_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Optional[dict]]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Bumped by every invalidation: a load that started under an older epoch is not stored.
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    async def resolve(
+        self, api_key: str, load: Callable[[str], Awaitable[Optional[dict]]]
+    ) -> Optional[dict]:
+        """``load(api_key)``'s verdict, from the cache when fresh. Raises whatever ``load`` raises
+        (``AuthUnavailable``) — to every caller sharing that flight — and caches nothing then."""
+        fp = key_fingerprint(api_key)
+        cached = self._lookup(fp)
+        if cached is not _MISS:
+            self.hits += 1
+            return cached
+        task = self._inflight.get(fp)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(fp, api_key, load))
+            self._inflight[fp] = task
+            task.add_done_callback(lambda t: self._settle(fp, t))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def invalidate_key(self, fingerprint: str) -> None:
+        self._epoch += 1
+        self.invalidations += 1
+        self._entries.pop(fingerprint, None)
+
+    def invalidate_user(self, user_id) -> None:
+        self._epoch += 1
+        self.invalidations += 1
+        uid = str(user_id)
+        for fp in [fp for fp, (_, v) in self._entries.items() if v and str(v.get("user_id")) == uid]:
+            del self._entries[fp]
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self.invalidations += 1
+        self._entries.clear()
+
+    def apply_invalidation(self, payload) -> None:
+        """Apply one message from ``AUTH_INVALIDATION_CHANNEL`` (see the module docstring)."""
+        try:
+            msg = json.loads(payload)
+        except (TypeError, ValueError):
+            msg = None
+        if isinstance(msg, dict) and msg.get("token"):
+            self.invalidate_key(str(msg["token"]))
+        elif isinstance(msg, dict) and msg.get("user_id") is not None:
+            self.invalidate_user(msg["user_id"])
+        else:
+            self.clear()
+
+    def metrics(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+            "inflight": len(self._inflight),
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ---- internals ----
+
+    def _lookup(self, fp: str):
+        entry = self._entries.get(fp)
+        if entry is None:
+            return _MISS
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[fp]
+            return _MISS
+        self._entries.move_to_end(fp)
+        return value
+
+    async def _load(self, fp: str, api_key: str, load) -> Optional[dict]:
+        epoch = self._epoch
+        value = await load(api_key)
+        ttl = self.ttl if value else self.negative_ttl
+        if epoch == self._epoch and ttl > 0 and self.maxsize > 0:
+            self._entries[fp] = (self._clock() + ttl, value)
+            self._entries.move_to_end(fp)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def _settle(self, fp: str, task: asyncio.Future) -> None:
+        if self._inflight.get(fp) is task:
+            del self._inflight[fp]
+        if not task.cancelled():
+            task.exception()  # retrieved here, so a flight nobody awaited any more never warns
+
+
+async def follow_invalidations(cache: ResolveCache, multiplexer,
+                               channel: str = AUTH_INVALIDATION_CHANNEL) -> None:
+    """Apply admin-api's invalidations to ``cache`` for as long as the worker runs.
+
+    Rides the worker's shared ``/ws`` pub/sub connection (``fanout.ChannelMultiplexer``) instead of
+    opening its own. Invalidations published while that connection was down never arrive, so the
+    cache is cleared when the multiplexer reports it re-SUBSCRIBEd (``on_gap``). The subscriber is
+    ``lossless``: a full queue cuts it off instead of dropping a revocation, and a cut-off
+    subscription also clears the cache before re-subscribing."""
+
+    def _gap() -> None:
+        cache.clear()
+        log_event("auth_cache_invalidation_gap", audience="system", level="warning",
+                  span="auth", fields={"channel": channel})
+
+    while True:
+        sub = multiplexer.subscriber(lossless=True)
+        sub.on_gap = _gap
+        try:
+            await multiplexer.subscribe(sub, [channel])
+            async for payload in sub.frames():
+                cache.apply_invalidation(payload)
+        finally:
+            await multiplexer.release(sub)
+        cache.clear()
+        log_event("auth_cache_invalidation_resubscribe", audience="system", level="warning",
+                  span="auth", fields={"channel": channel})
+        await asyncio.sleep(1.0)
@@ -0,0 +1,279 @@
+"""``ChannelMultiplexer`` — ONE redis pub/sub connection per gateway worker for the ``/ws`` fan-in.
+
+The carve of ``main.websocket_multiplex`` opened a fresh ``redis.pubsub()`` per (socket, meeting)
+subscription: 1,000 dashboard sockets watching 300 meetings held ~1,300 redis connections, and
+redis serialized every ``tc:meeting:{id}:mutable`` payload once per subscriber. The multiplexer
+replaces that with:
+
+  * one pubsub connection, shared by every socket of the worker (``create_app`` builds one and
+    hands it to ``run_multiplex``);
+  * REF-COUNTED channel subscriptions — redis SUBSCRIBEs a channel when its first socket wants it
+    and UNSUBSCRIBEs when the last one lets go, so each payload crosses the wire once per worker;
+  * in-process fan-out into a BOUNDED queue per socket (``Subscriber``), drained by that socket's
+    own send pump — one slow browser can no longer back-pressure the shared reader;
+  * a slow-consumer policy for a full queue (``WS_SLOW_CONSUMER_POLICY``): ``disconnect`` (default)
+    closes the socket with 1013 "try again later" so the client reconnects and re-fetches a
+    consistent transcript; ``drop`` discards the frame and keeps the socket. A ``lossless``
+    subscriber (the auth-cache invalidation follower) is always cut off, never silently dropped.
+
+``metrics()`` snapshots socket / channel / subscription counts, queue depth and the dropped-frame,
+slow-disconnect and reconnect totals. A reader that loses its redis connection reconnects with backoff and
+re-SUBSCRIBEs every live channel; the sockets never see it beyond the frames published meanwhile.
+A subscriber that cannot afford that gap sets ``on_gap``, called once the connection is back.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import AsyncIterator, Callable, Dict, Iterable, Optional, Set
+
+from .obs import log_event
+from .ports import PubSub, RedisBus
+
+# Frames buffered per socket before the slow-consumer policy applies.
+WS_SUBSCRIBER_QUEUE_SIZE = int(os.getenv("WS_SUBSCRIBER_QUEUE_SIZE", "256"))
+# What a full per-socket queue does: "disconnect" (close 1013) or "drop" (discard the frame).
+WS_SLOW_CONSUMER_POLICY = os.getenv("WS_SLOW_CONSUMER_POLICY", "disconnect").strip().lower()
+
+SLOW_CONSUMER_CLOSE_CODE = 1013  # RFC 6455 "Try Again Later"
+_RECONNECT_BACKOFF_MAX_S = 30.0
+
+# Queued in place of the buffered frames when a socket is cut off under the "disconnect" policy.
+_OVERFLOW = object()
+
+
+class Subscriber:
+    """One socket's handle on the multiplexer: its channel refs and its bounded frame queue.
+
+    ``on_overflow`` is called once when the socket is cut off — the owner uses it to abandon a send
+    that is itself stuck on the slow client. ``on_gap`` is called after the shared connection was
+    lost and re-SUBSCRIBEd: frames published in between never arrived. A ``lossless`` subscriber is
+    cut off on a full queue whatever the policy, so a dropped frame always ends ``frames()``."""
+
+    def __init__(self, maxsize: int, *, lossless: bool = False):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.channels: Dict[str, int] = {}
+        self.lossless = lossless
+        self.dropped = 0
+        self.overflowed = False
+        self.on_overflow: Optional[Callable[[], None]] = None
+        self.on_gap: Optional[Callable[[], None]] = None
+
+    async def frames(self) -> AsyncIterator[str]:
+        """The raw payloads to forward, in publish order; ends when the socket was cut off."""
+        while True:
+            item = await self.queue.get()
+            if item is _OVERFLOW:
+                return
+            yield item
+
+
+class ChannelMultiplexer:
+    """Shares one ``RedisBus.pubsub()`` across every ``/ws`` socket of the process."""
+
+    def __init__(self, redis: RedisBus, *, queue_size: Optional[int] = None,
+                 policy: Optional[str] = None):
+        self._redis = redis
+        self.queue_size = WS_SUBSCRIBER_QUEUE_SIZE if queue_size is None else queue_size
+        self.policy = WS_SLOW_CONSUMER_POLICY if policy is None else policy
+        self._channels: Dict[str, Set[Subscriber]] = {}
+        self._subscribers: Set[Subscriber] = set()
+        self._pubsub: Optional[PubSub] = None
+        self._reader: Optional[asyncio.Task] = None
+        # Serializes every SUBSCRIBE/UNSUBSCRIBE on the shared connection with the ref changes.
+        self._lock = asyncio.Lock()
+        self.dropped_frames = 0
+        self.slow_consumer_disconnects = 0
+        self.reconnects = 0
+
+    def subscriber(self, *, lossless: bool = False) -> Subscriber:
+        sub = Subscriber(self.queue_size, lossless=lossless)
+        self._subscribers.add(sub)
+        return sub
+
+    async def subscribe(self, sub: Subscriber, channels: Iterable[str]) -> None:
+        """Add ``sub`` to ``channels``; redis SUBSCRIBEs only the channels nobody held yet."""
+        async with self._lock:
+            fresh = []
+            for ch in channels:
+                sub.channels[ch] = sub.channels.get(ch, 0) + 1
+                if sub.channels[ch] > 1:
+                    continue
+                members = self._channels.setdefault(ch, set())
+                if not members:
+                    fresh.append(ch)
+                members.add(sub)
+            if fresh:
+                # Registered before returning, so the caller's ``subscribed`` ack is truthful.
+                try:
+                    if self._pubsub is None:
+                        self._pubsub = self._redis.pubsub()
+                        await self._pubsub.subscribe(*self._channels)
+                    else:
+                        await self._pubsub.subscribe(*fresh)
+                except Exception as e:  # noqa: BLE001 — the reader reconnects and re-subscribes
+                    self._log_redis_error("subscribe", e)
+            self._ensure_reader()
+
+    async def unsubscribe(self, sub: Subscriber, channels: Iterable[str]) -> None:
+        """Drop ``sub``'s ref on ``channels``; redis UNSUBSCRIBEs the ones nobody holds any more."""
+        async with self._lock:
+            released = []
+            for ch in channels:
+                refs = sub.channels.get(ch, 0) - 1
+                if refs > 0:
+                    sub.channels[ch] = refs
+                    continue
+                sub.channels.pop(ch, None)
+                members = self._channels.get(ch)
+                if members is None:
+                    continue
+                members.discard(sub)
+                if not members:
+                    del self._channels[ch]
+                    released.append(ch)
+            await self._release_channels(released)
+
+    async def release(self, sub: Subscriber) -> None:
+        """Forget ``sub`` entirely (socket closed): every ref it held is dropped."""
+        self._subscribers.discard(sub)
+        if sub.channels:
+            await self.unsubscribe(sub, list(sub.channels))
+
+    async def close(self) -> None:
+        """Stop the reader and close the shared connection (worker shutdown)."""
+        async with self._lock:
+            held = list(self._channels)
+            self._channels.clear()
+            await self._release_channels(held)
+
+    def metrics(self) -> dict:
+        depths = [s.queue.qsize() for s in self._subscribers]
+        return {
+            "sockets": len(self._subscribers),
+            "channels": len(self._channels),
+            "subscriptions": sum(len(m) for m in self._channels.values()),
+            "max_subscribers_per_channel": max((len(m) for m in self._channels.values()), default=0),
+            "queue_depth_total": sum(depths),
+            "queue_depth_max": max(depths, default=0),
+            "dropped_frames": self.dropped_frames,
+            "slow_consumer_disconnects": self.slow_consumer_disconnects,
+            "reconnects": self.reconnects,
+            "redis_connections": 0 if self._pubsub is None else 1,
+        }
+
+    # ---- internals ----
+
+    async def _release_channels(self, channels: list) -> None:
+        """UNSUBSCRIBE ``channels``; with nothing left to hold, stop the reader and free the
+        connection (held under ``_lock``)."""
+        if self._channels:
+            if channels and self._pubsub is not None:
+                try:
+                    await self._pubsub.unsubscribe(*channels)
+                except Exception as e:  # noqa: BLE001 — a dead connection is replaced on reconnect
+                    self._log_redis_error("unsubscribe", e)
+            return
+        reader, pubsub = self._reader, self._pubsub
+        self._reader, self._pubsub = None, None
+        if reader is not None and reader is not asyncio.current_task():
+            reader.cancel()
+            try:
+                await reader
+            except (asyncio.CancelledError, Exception):
+                pass
+        if pubsub is None:
+            return
+        try:
+            await pubsub.unsubscribe(*channels)
+            await pubsub.close()
+        except Exception:
+            pass
+
+    def _ensure_reader(self) -> None:
+        if self._channels and (self._reader is None or self._reader.done()):
+            self._reader = asyncio.create_task(self._read())
+
+    async def _connect(self) -> PubSub:
+        async with self._lock:
+            if self._pubsub is None:
+                self._pubsub = self._redis.pubsub()
+                if self._channels:
+                    await self._pubsub.subscribe(*self._channels)
+            return self._pubsub
+
+    async def _read(self) -> None:
+        backoff = 0.5
+        lost = False
+        while self._channels:
+            pubsub = None
+            try:
+                pubsub = await self._connect()
+                if lost:
+                    lost = False
+                    self._signal_gap()
+                async for message in pubsub.listen():
+                    backoff = 0.5
+                    if message.get("type") == "message":
+                        self._dispatch(message.get("channel"), message.get("data"))
+                # listen() returns once the connection holds no channel; with refs still live
+                # that is a lost subscription — fall through and rebuild the connection.
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # noqa: BLE001 — the connection is rebuilt, the sockets stay up
+                self._log_redis_error("listen", e)
+            async with self._lock:
+                if self._pubsub is pubsub and pubsub is not None:
+                    self._pubsub = None
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+            if not self._channels:
+                return
+            lost = True
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, _RECONNECT_BACKOFF_MAX_S)
+
+    def _signal_gap(self) -> None:
+        """The connection is back after a loss: tell every subscriber that asked (``on_gap``)."""
+        self.reconnects += 1
+        for sub in tuple(self._subscribers):
+            if sub.on_gap is not None:
+                sub.on_gap()
+
+    def _dispatch(self, channel, data) -> None:
+        if isinstance(channel, (bytes, bytearray)):
+            channel = channel.decode()
+        for sub in tuple(self._channels.get(channel, ())):
+            self._offer(sub, data)
+
+    def _offer(self, sub: Subscriber, data) -> None:
+        if sub.overflowed:
+            return
+        try:
+            sub.queue.put_nowait(data)
+            return
+        except asyncio.QueueFull:
+            pass
+        self.dropped_frames += 1
+        sub.dropped += 1
+        if self.policy == "drop" and not sub.lossless:
+            if sub.dropped == 1:
+                log_event("ws_slow_consumer", audience="system", level="warning", span="ws",
+                          fields={"policy": "drop", "queue_size": self.queue_size})
+            return
+        # "disconnect": the buffered frames are moot once the socket is going away.
+        sub.overflowed = True
+        self.slow_consumer_disconnects += 1
+        while not sub.queue.empty():
+            sub.queue.get_nowait()
+        sub.queue.put_nowait(_OVERFLOW)
+        if sub.on_overflow is not None:
+            sub.on_overflow()
+        log_event("ws_slow_consumer", audience="system", level="warning", span="ws",
+                  fields={"policy": "disconnect", "queue_size": self.queue_size})
+
+    def _log_redis_error(self, op: str, e: Exception) -> None:
+        log_event("ws_fanout_redis_error", audience="system", level="error", span="ws",
+                  fields={"op": op, "reason": type(e).__name__, "detail": str(e)})
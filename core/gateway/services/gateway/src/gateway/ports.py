@@ -161,7 +161,8 @@ class PubSub(Protocol):
     async def close(self) -> None: ...
 
     def listen(self) -> AsyncIterator[dict]:
-        """Yield ``{"type": "message"|"subscribe", "data": <str>}`` dicts (redis-py shape)."""
+        """Yield ``{"type": "message"|"subscribe", "channel": <str>, "data": <str>}`` dicts
+        (redis-py shape) — ``channel`` routes a shared subscription's payload to its sockets."""
         ...
 
 
@@ -169,6 +170,7 @@ class PubSub(Protocol):
 class RedisBus(Protocol):
     """The pub/sub bus the ``/ws`` multiplex fans in from. ``pubsub()`` returns a fresh
     subscription; the app subscribes to ``tc:…:mutable`` / ``bm:…:status`` / ``va:…:chat`` and
-    forwards every raw payload to the socket (``main.fan_in`` — main.py:2195-2212)."""
+    forwards every raw payload to the socket (``main.fan_in`` — main.py:2195-2212). One
+    subscription is shared by every socket of the worker (``fanout.ChannelMultiplexer``)."""
 
     def pubsub(self) -> PubSub: ...
@@ -135,8 +135,8 @@ class FakePubSub:
     async def listen(self):
         yield {"type": "subscribe"}
         while True:
-            data = await self._queue.get()
-            yield {"type": "message", "data": data}
+            channel, data = await self._queue.get()
+            yield {"type": "message", "channel": channel, "data": data}
 
 
 class FakeRedis:
@@ -150,4 +150,4 @@ class FakeRedis:
 
     async def publish(self, channel: str, data: str) -> None:
         for q in list(self._subs.get(channel, [])):
-            await q.put(data)
+            await q.put((channel, data))
@@ -11,6 +11,7 @@ key mass-401'd valid keys in production (#483/#495). These use httpx.MockTranspo
 and no redis are needed (build_production_app is exercised at container boot / conformance).
 """
 import asyncio
+import json
 
 import pytest
 
@@ -149,3 +150,176 @@ async def test_auth_isolated_from_slow_downstream():
     release.set()
     await hang
     await forward_client.aclose()
+
+
+def _cached_authorizer(handler, **cache_kwargs):
+    from gateway.authcache import ResolveCache
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AdminApiAuthorizer(client, ADMIN, "http://meeting-api:8080",
+                              cache=ResolveCache(**cache_kwargs))
+
+
+async def test_cached_resolve_single_flights_misses_and_serves_hits_until_the_ttl():
+    """Concurrent misses for one key share ONE validate hop; later resolutions are hits until the
+    positive TTL lapses. An invalid key is cached too, for the shorter negative TTL."""
+    now = {"t": 0.0}
+    calls: list[str] = []
+    gate = asyncio.Event()
+
+    async def handler(req):
+        token = req.read().decode()
+        calls.append(token)
+        await gate.wait()
+        if "bad" in token:
+            return httpx.Response(401, json={"detail": "Invalid token"})
+        return httpx.Response(200, json={"user_id": 7, "scopes": ["bot"]})
+
+    auth = _cached_authorizer(handler, ttl=30, negative_ttl=5, clock=lambda: now["t"])
+    flights = [asyncio.ensure_future(auth.resolve("vxa_bot_ok")) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    gate.set()
+    assert [u["user_id"] for u in await asyncio.gather(*flights)] == [7] * 5
+    assert len(calls) == 1 and auth.cache.metrics()["coalesced"] == 4
+
+    assert await auth.resolve("vxa_bot_bad") is None
+    now["t"] = 10.0
+    assert (await auth.resolve("vxa_bot_ok"))["user_id"] == 7
+    assert await auth.resolve("vxa_bot_bad") is None
+    assert len(calls) == 3  # the negative entry expired at t=5; the positive one still holds
+    now["t"] = 31.0
+    await auth.resolve("vxa_bot_ok")
+    assert len(calls) == 4
+
+
+async def test_cached_resolve_never_caches_unavailable():
+    """No verdict (#495) is not cached: the next request retries the hop."""
+    answers = [httpx.Response(503, text="down"), httpx.Response(200, json={"user_id": 7})]
+    auth = _cached_authorizer(lambda req: answers.pop(0))
+    with pytest.raises(AuthUnavailable):
+        await auth.resolve("vxa_bot_ok")
+    assert (await auth.resolve("vxa_bot_ok"))["user_id"] == 7
+
+
+async def test_invalidation_messages_evict_by_token_fingerprint_and_by_user():
+    from gateway.authcache import key_fingerprint
+
+    calls: list[str] = []
+
+    def handler(req):
+        calls.append(req.read().decode())
+        uid = 8 if "other" in calls[-1] else 7
+        return httpx.Response(200, json={"user_id": uid})
+
+    auth = _cached_authorizer(handler)
+    for key in ("vxa_bot_a", "vxa_bot_b", "vxa_bot_other"):
+        await auth.resolve(key)
+    assert len(auth.cache) == 3
+
+    auth.cache.apply_invalidation(json.dumps({"token": key_fingerprint("vxa_bot_a")}))
+    assert len(auth.cache) == 2
+    auth.cache.apply_invalidation(json.dumps({"user_id": 7}))
+    assert len(auth.cache) == 1  # only user 8's key survives
+    auth.cache.apply_invalidation("garbage")
+    assert len(auth.cache) == 0
+
+
+async def test_resolution_in_flight_during_an_invalidation_is_not_stored():
+    gate = asyncio.Event()
+
+    async def handler(req):
+        await gate.wait()
+        return httpx.Response(200, json={"user_id": 7})
+
+    auth = _cached_authorizer(handler)
+    flight = asyncio.ensure_future(auth.resolve("vxa_bot_ok"))
+    await asyncio.sleep(0.01)
+    auth.cache.apply_invalidation(json.dumps({"user_id": 7}))
+    gate.set()
+    assert (await flight)["user_id"] == 7
+    assert len(auth.cache) == 0
+
+
+async def test_follow_invalidations_applies_messages_from_the_shared_multiplexer():
+    from conftest import FakeRedis
+    from gateway.authcache import AUTH_INVALIDATION_CHANNEL, ResolveCache, follow_invalidations
+    from gateway.fanout import ChannelMultiplexer
+
+    redis = FakeRedis()
+    mux = ChannelMultiplexer(redis)
+    cache = ResolveCache()
+    cache._entries["fp"] = (float("inf"), {"user_id": 7})
+    task = asyncio.ensure_future(follow_invalidations(cache, mux))
+    await asyncio.sleep(0.01)
+    await redis.publish(AUTH_INVALIDATION_CHANNEL, json.dumps({"user_id": 7}))
+    await asyncio.sleep(0.01)
+    assert len(cache) == 0
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await mux.close()
+
+
+async def test_follow_invalidations_clears_the_cache_when_the_connection_is_rebuilt():
+    """The multiplexer's reader reconnects and re-SUBSCRIBEs on its own, so ``frames()`` never ends
+    — invalidations published during the gap are gone, and the cache must be cleared on the signal."""
+    from conftest import FakePubSub, FakeRedis
+    from gateway.authcache import AUTH_INVALIDATION_CHANNEL, ResolveCache, follow_invalidations
+    from gateway.fanout import ChannelMultiplexer
+
+    cut = asyncio.Event()
+
+    class _CutOnce(FakePubSub):
+        async def listen(self):
+            yield {"type": "subscribe"}
+            await cut.wait()
+            raise ConnectionError("connection reset")
+
+    class _FlakyRedis(FakeRedis):
+        pubsubs = 0
+
+        def pubsub(self):
+            _FlakyRedis.pubsubs += 1
+            return _CutOnce(self) if _FlakyRedis.pubsubs == 1 else FakePubSub(self)
+
+    redis = _FlakyRedis()
+    mux = ChannelMultiplexer(redis)
+    cache = ResolveCache()
+    task = asyncio.ensure_future(follow_invalidations(cache, mux))
+    await asyncio.sleep(0.01)
+    cache._entries["fp"] = (float("inf"), {"user_id": 7})
+    cut.set()                                            # the revocation for 7 is published meanwhile
+    for _ in range(200):
+        if mux.metrics()["reconnects"]:
+            break
+        await asyncio.sleep(0.01)
+    assert mux.metrics()["reconnects"] == 1
+    assert len(cache) == 0
+    cache._entries["fp2"] = (float("inf"), {"user_id": 8})
+    await redis.publish(AUTH_INVALIDATION_CHANNEL, json.dumps({"user_id": 8}))
+    await asyncio.sleep(0.01)
+    assert len(cache) == 0                               # still following after the rebuild
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await mux.close()
+
+
+async def test_invalidation_follower_is_exempt_from_the_drop_policy():
+    """Under ``drop`` a full queue would discard a token revocation silently; the follower is cut off
+    instead, which clears the cache and re-subscribes."""
+    from conftest import FakeRedis
+    from gateway.authcache import AUTH_INVALIDATION_CHANNEL
+    from gateway.fanout import ChannelMultiplexer
+
+    redis = FakeRedis()
+    mux = ChannelMultiplexer(redis, queue_size=1, policy="drop")
+    follower, socket = mux.subscriber(lossless=True), mux.subscriber()
+    await mux.subscribe(follower, [AUTH_INVALIDATION_CHANNEL])
+    await mux.subscribe(socket, [AUTH_INVALIDATION_CHANNEL])
+    for token in ("t1", "t2"):
+        await redis.publish(AUTH_INVALIDATION_CHANNEL, json.dumps({"token": token}))
+    await asyncio.sleep(0.01)
+    assert follower.overflowed and [f async for f in follower.frames()] == []
+    assert not socket.overflowed and socket.dropped == 1  # a plain socket keeps the drop policy
+    await mux.close()
@@ -23,6 +23,26 @@ def test_health_ok():
     assert body["service"] == "gateway"
 
 
+def test_health_reports_the_ws_multiplexer():
+    body = TestClient(_app()).get("/health").json()
+    assert body["ws"]["sockets"] == 0
+    assert body["ws"]["redis_connections"] == 0
+    assert {"dropped_frames", "queue_depth_max", "slow_consumer_disconnects"} <= set(body["ws"])
+
+
+def test_shutdown_closes_the_ws_multiplexer():
+    app = _app()
+    closed = []
+
+    async def close():
+        closed.append(True)
+
+    app.state.ws_multiplexer.close = close
+    with TestClient(app):
+        assert closed == []
+    assert closed == [True]
+
+
 def test_health_needs_no_api_key():
     """Health must be reachable WITHOUT an x-api-key — it is not a client route."""
     client = TestClient(_app())
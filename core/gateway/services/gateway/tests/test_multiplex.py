@@ -5,7 +5,9 @@ proving the carve of ``main.websocket_multiplex``:
   * missing api-key → missing_api_key error + close 4401,
   * subscribe → subscribed ack; a redis payload on a subscribed channel is forwarded RAW,
   * unsubscribe → unsubscribed ack AND the fan-in STOPS (later payloads are not forwarded),
-  * ping → pong; invalid_json / unknown_action error frames.
+  * ping → pong; invalid_json / unknown_action error frames,
+  * sockets sharing a ``ChannelMultiplexer`` share ONE pubsub connection and ref-count channels;
+    a slow socket's full queue disconnects (or drops) it without stalling the others.
 """
 from __future__ import annotations
 
@@ -14,6 +16,7 @@ import json
 from typing import Optional
 
 from gateway.app import _run_multiplex
+from gateway.fanout import SLOW_CONSUMER_CLOSE_CODE, ChannelMultiplexer
 from gateway.ports import AuthUnavailable
 from conftest import FakeAuthorizer, FakeRedis
 
@@ -200,3 +203,101 @@ async def test_connect_auto_subscribes_user_channel_and_forwards():
 
     ws.disconnect()
     await task
+
+
+class _CountingRedis(FakeRedis):
+    def __init__(self):
+        super().__init__()
+        self.connections = 0
+
+    def pubsub(self):
+        self.connections += 1
+        return super().pubsub()
+
+
+async def _settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def test_sockets_share_one_pubsub_and_channels_are_ref_counted():
+    """Two sockets watching the same meeting through the app's multiplexer hold ONE redis pubsub
+    connection with ONE subscription per channel; each payload reaches both. The channel stays
+    subscribed until its last socket leaves, and then the connection itself is released."""
+    redis, auth = _CountingRedis(), FakeAuthorizer(valid_key=API_KEY, auth_map=AUTH_MAP)
+    mux = ChannelMultiplexer(redis)
+    a = _WS(inbound=[SUBSCRIBE], api_key=API_KEY, close_when_drained=False)
+    b = _WS(inbound=[SUBSCRIBE], api_key=API_KEY, close_when_drained=False)
+    ta = asyncio.ensure_future(_run_multiplex(a, auth, redis, mux))
+    tb = asyncio.ensure_future(_run_multiplex(b, auth, redis, mux))
+    await _settle()
+
+    assert redis.connections == 1
+    assert len(redis._subs["tc:meeting:42:mutable"]) == 1
+    m = mux.metrics()
+    assert (m["sockets"], m["max_subscribers_per_channel"], m["redis_connections"]) == (2, 2, 1)
+
+    await redis.publish("tc:meeting:42:mutable", json.dumps({"type": "transcription_segment", "text": "hi"}))
+    await _settle()
+    for ws in (a, b):
+        assert any(f.get("text") == "hi" for f in ws.sent), ws.sent
+
+    a.disconnect()
+    await ta
+    assert redis._subs["tc:meeting:42:mutable"]  # b still holds the channel
+    assert mux.metrics()["sockets"] == 1
+
+    b.disconnect()
+    await tb
+    assert not redis._subs["tc:meeting:42:mutable"]
+    assert mux.metrics()["redis_connections"] == 0 and mux.metrics()["channels"] == 0
+
+
+class _StalledWS(_WS):
+    """A socket whose client stopped reading: every send blocks."""
+
+    async def send_text(self, data: str) -> None:
+        if "transcription_segment" in data:
+            await asyncio.Event().wait()
+        await super().send_text(data)
+
+
+async def test_slow_consumer_is_disconnected_without_stalling_the_others():
+    redis, auth = FakeRedis(), FakeAuthorizer(valid_key=API_KEY, auth_map=AUTH_MAP)
+    mux = ChannelMultiplexer(redis, queue_size=2, policy="disconnect")
+    slow = _StalledWS(inbound=[SUBSCRIBE], api_key=API_KEY, close_when_drained=False)
+    fast = _WS(inbound=[SUBSCRIBE], api_key=API_KEY, close_when_drained=False)
+    tasks = [asyncio.ensure_future(_run_multiplex(ws, auth, redis, mux)) for ws in (slow, fast)]
+    await _settle()
+
+    for i in range(6):
+        await redis.publish("tc:meeting:42:mutable", json.dumps({"type": "transcription_segment", "n": i}))
+        await _settle()
+    assert slow.close_code == SLOW_CONSUMER_CLOSE_CODE
+    assert [f["n"] for f in fast.sent if f.get("type") == "transcription_segment"] == list(range(6))
+    m = mux.metrics()
+    assert m["slow_consumer_disconnects"] == 1 and m["dropped_frames"] >= 1
+
+    for ws in (slow, fast):
+        ws.disconnect()
+    await asyncio.gather(*tasks)
+    assert mux.metrics()["sockets"] == 0
+
+
+async def test_drop_policy_discards_frames_and_keeps_the_socket():
+    redis, auth = FakeRedis(), FakeAuthorizer(valid_key=API_KEY, auth_map=AUTH_MAP)
+    mux = ChannelMultiplexer(redis, queue_size=1, policy="drop")
+    slow = _StalledWS(inbound=[SUBSCRIBE], api_key=API_KEY, close_when_drained=False)
+    task = asyncio.ensure_future(_run_multiplex(slow, auth, redis, mux))
+    await _settle()
+
+    for i in range(4):
+        await redis.publish("tc:meeting:42:mutable", json.dumps({"type": "transcription_segment", "n": i}))
+        await _settle()
+    m = mux.metrics()
+    # one frame is stuck in the blocked send, one waits in the queue, the rest are dropped
+    assert m["dropped_frames"] == 2 and m["queue_depth_max"] == 1
+    assert slow.close_code is None and m["slow_consumer_disconnects"] == 0
+
+    slow.disconnect()
+    await task
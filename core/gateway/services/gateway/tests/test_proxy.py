@@ -126,6 +126,28 @@ def test_range_response_preserves_content_range_headers():
     assert r.headers["content-type"].startswith("audio/webm")
 
 
+def test_transcript_etag_is_passed_through_for_revalidation():
+    """meeting-api tags transcript responses with an ETag; the proxy must hand it to the client
+    (and forward the client's If-None-Match) or conditional re-fetches can never hit."""
+    downstream = FakeDownstream(status_code=200, body={"segments": []},
+                                extra_headers={"etag": '"abc123"'})
+    client, _ = _client(downstream=downstream)
+    r = client.get("/transcripts/google_meet/abc-defg-hij",
+                   headers={**AUTH, "if-none-match": '"abc123"'})
+    assert r.headers["etag"] == '"abc123"'
+    assert downstream.last["headers"]["if-none-match"] == '"abc123"'
+
+
+def test_transcript_page_cursor_is_passed_through():
+    """A full transcript page names its successor in X-Next-Cursor; the query window is forwarded
+    and the cursor header handed back, or a client could never fetch page two."""
+    downstream = FakeDownstream(status_code=200, body={"segments": []},
+                                extra_headers={"x-next-cursor": "2.0/ch-0:1:a"})
+    client, _ = _client(downstream=downstream)
+    r = client.get("/transcripts/google_meet/abc-defg-hij?limit=1", headers=AUTH)
+    assert r.headers["x-next-cursor"] == "2.0/ch-0:1:a"
+
+
 def test_rate_limit_returns_429_past_the_per_user_cap():
     """WS-6: with a per-user limiter injected, requests up to the bucket pass (verbatim), the next is
     throttled with 429 + Retry-After — closing the unlimited-requests-on-a-valid-key DoS gap."""
@@ -0,0 +1,138 @@
+"""Load test — ``/internal/validate`` throughput on ONE hot token, inline vs write-behind last-use.
+
+Runs ``--requests`` validations of a single token through ``--concurrency`` workers, twice:
+
+  * ``inline``       — the old path: the validate SELECT, then ``UPDATE api_tokens SET
+    last_used_at`` + COMMIT on every request (every request writes the same row);
+  * ``write_behind`` — the validate SELECT only, ``last_used.tracker.touch`` in memory, and the
+    background flusher (``run_flusher``) applying one coalesced UPDATE per interval.
+
+The statements are the validate path's own (the api_tokens ⨝ users lookup by token, the
+last-use write / ``coalesced_update``), not the HTTP layer, so the numbers isolate the DB cost.
+The default target is a temp-file SQLite (aiosqlite) where every statement and COMMIT is charged
+a simulated round trip (``--rtt-ms``) — and a write holds SQLite's lock through it, as a hot-row
+UPDATE holds its row lock until COMMIT on Postgres. Point ``--dsn`` at a scratch Postgres
+(``postgresql+asyncpg://…``) for real numbers; the two tables are created and dropped by the script.
+
+    python benchmarks/bench_validate_hot_token.py [--requests 2000] [--concurrency 32] [--rtt-ms 0.5] [--dsn URL]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sqlalchemy import event, text  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from admin_api.app.last_used import LastUsedTracker, run_flusher  # noqa: E402
+
+TOKEN = "vxa_bot_hot_token"
+_DDL = (
+    "CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255), max_concurrent_bots INTEGER, "
+    "data TEXT)",
+    "CREATE TABLE api_tokens (id INTEGER PRIMARY KEY, token VARCHAR(255) UNIQUE, user_id INTEGER, "
+    "expires_at TIMESTAMP, last_used_at TIMESTAMP)",
+    "INSERT INTO users (id, email, max_concurrent_bots, data) VALUES (1, 'hot@vexa.ai', 3, '{}')",
+    f"INSERT INTO api_tokens (id, token, user_id) VALUES (1, '{TOKEN}', 1)",
+)
+_LOOKUP = text(
+    "SELECT t.id, t.expires_at, u.id, u.email, u.max_concurrent_bots, u.data FROM api_tokens t "
+    "JOIN users u ON t.user_id = u.id WHERE t.token = :token"
+)
+_TOUCH = text("UPDATE api_tokens SET last_used_at = :now WHERE id = :id")
+
+
+async def _validate_inline(factory) -> None:
+    async with factory() as db:
+        row = (await db.execute(_LOOKUP, {"token": TOKEN})).first()
+        await db.execute(_TOUCH, {"now": datetime.utcnow(), "id": row[0]})
+        await db.commit()
+
+
+async def _validate_write_behind(factory, tracker: LastUsedTracker) -> None:
+    async with factory() as db:
+        row = (await db.execute(_LOOKUP, {"token": TOKEN})).first()
+    tracker.touch(row[0])
+
+
+async def _run(dsn: str, mode: str, requests: int, concurrency: int, rtt: float) -> dict:
+    engine = create_async_engine(dsn, pool_size=concurrency, max_overflow=0) \
+        if dsn.startswith("postgresql") else create_async_engine(dsn)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS api_tokens"))
+        await conn.execute(text("DROP TABLE IF EXISTS users"))
+        for ddl in _DDL:
+            await conn.execute(text(ddl))
+    writes = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _hop(conn, cursor, statement, *args):  # one simulated round trip per statement
+        if statement.lstrip().upper().startswith(("UPDATE", "WITH")):
+            writes[0] += 1
+        if rtt:
+            time.sleep(rtt)
+
+    @event.listens_for(engine.sync_engine, "commit")
+    def _commit_hop(conn):  # …and per COMMIT, with the write lock still held
+        if rtt:
+            time.sleep(rtt)
+
+    factory = async_sessionmaker(engine)
+    tracker = LastUsedTracker()
+    flusher = asyncio.create_task(run_flusher(factory, interval=0.25, tracker=tracker)) \
+        if mode == "write_behind" else None
+    remaining = [requests]
+
+    async def worker():
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            if mode == "inline":
+                await _validate_inline(factory)
+            else:
+                await _validate_write_behind(factory, tracker)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    if flusher is not None:
+        flusher.cancel()  # its final flush lands the last use
+        try:
+            await flusher
+        except asyncio.CancelledError:
+            pass
+    async with engine.begin() as conn:
+        last_used = (await conn.execute(text("SELECT last_used_at FROM api_tokens WHERE id = 1"))).scalar()
+        await conn.execute(text("DROP TABLE api_tokens"))
+        await conn.execute(text("DROP TABLE users"))
+    await engine.dispose()
+    assert last_used is not None, f"{mode}: last_used_at was never recorded"
+    return {"mode": mode, "requests": requests, "concurrency": concurrency,
+            "elapsed_s": round(elapsed, 3), "validations_per_s": round(requests / elapsed, 1),
+            "last_used_writes": writes[0]}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--concurrency", type=int, default=32)
+    ap.add_argument("--rtt-ms", type=float, default=0.5)
+    ap.add_argument("--dsn", default=None)
+    args = ap.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        dsn = args.dsn or f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"
+        for mode in ("inline", "write_behind"):
+            print(json.dumps(asyncio.run(_run(dsn, mode, args.requests, args.concurrency,
+                                              args.rtt_ms / 1000))))
+
+
+if __name__ == "__main__":
+    main()
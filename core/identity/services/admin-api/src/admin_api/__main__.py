@@ -8,6 +8,7 @@ request. uvicorn-target: ``uvicorn admin_api.__main__:app`` / ``python -m admin_
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import os
 import socket
@@ -93,7 +94,8 @@ def _database_url() -> str:
 
 
 def build_production_app():
-    """Configure the DB engine + assemble the app; converge the schema on startup."""
+    """Configure the DB engine + assemble the app; converge the schema and start the last-use flusher
+    in its lifespan."""
     from .app import db as app_db
     from .app.main import create_app
     from .config_preflight import preflight
@@ -112,10 +114,26 @@ def build_production_app():
         pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
         max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
     )
-    app = create_app()
 
-    @app.on_event("startup")
-    async def _converge_schema() -> None:
+    # Auth-cache invalidations for the gateway (app/auth_events.py). Every surface wires REDIS_URL;
+    # left unset (a bare dev run) nothing is published and the gateway's short resolve-cache TTL is
+    # the only staleness bound.
+    redis_url = os.getenv("REDIS_URL")
+    publisher = None
+    if redis_url:
+        import redis.asyncio as aioredis
+
+        from .app import auth_events
+
+        publisher = aioredis.from_url(redis_url, decode_responses=True)
+        auth_events.configure(publisher)
+
+    # /internal/validate records token last-use write-behind (app/last_used.py); its flusher drains
+    # it in coalesced batches, and once more on shutdown.
+    from .app import last_used
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
         # Idempotent, never-drops convergence — safe to run on every boot (matches the parent's
         # ensure_schema() discipline). The async engine is the one db.configure() just bound.
         # #901: the first connect here is where a cold-start DNS race surfaces (socket.gaierror);
@@ -124,13 +142,28 @@ def build_production_app():
         #
         # #1186: convergence is also the readiness gate for the schema INVARIANTS. If a UNIQUE
         # index cannot be created (duplicate rows block it), ensure_schema raises
-        # SchemaInvariantError out of this ASGI-lifespan startup hook; uvicorn aborts startup and
+        # SchemaInvariantError out of this ASGI-lifespan startup; uvicorn aborts startup and
         # exits(3), so the port never binds, /health never answers, and the compose healthcheck /
         # k8s startupProbe+readinessProbe never pass. Deliberate: the spawn path documents relying
         # on uq_meeting_active_user_platform_native as its DB backstop, so a DB where that index is
         # absent must not be served by a process that assumes it. Not retried (see
         # _is_transient_connect_error) — it needs an operator, not a backoff.
         await _connect_with_retry(lambda: ensure_schema(app_db.get_engine(), Base))
+        flusher = asyncio.create_task(last_used.run_flusher(app_db.get_session_factory()))
+        app.state.last_used_flusher = flusher
+        try:
+            yield
+        finally:
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+            if publisher is not None:
+                auth_events.configure(None)
+                await publisher.aclose()
+
+    app = create_app(lifespan=lifespan)
 
     return app
 
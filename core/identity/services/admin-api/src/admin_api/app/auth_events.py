@@ -0,0 +1,54 @@
+"""Auth-cache invalidation events — what admin-api tells the gateway when a key's answer changes.
+
+The gateway caches ``/internal/validate`` answers for a short TTL (gateway ``authcache.py``). When
+an admin action changes what validate would return, admin-api publishes on
+``AUTH_INVALIDATION_CHANNEL`` so every gateway worker drops the stale entry at once:
+
+  * ``{"token": sha256(token)}`` — the token was deleted;
+  * ``{"user_id": id}``          — the user's validate answer changed (limits, billing data,
+                                   webhook, workspace memberships, admin role).
+
+Like the DB engine (``db.configure``), the publisher is INJECTED: ``configure(redis_client)`` binds
+it at boot when ``REDIS_URL`` is set. Unbound, publishing is a no-op and the gateway's TTL is the
+only bound. Publishing is best-effort and always AFTER the commit — a redis failure never fails
+the admin call that already happened.
+"""
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Optional
+
+logger = logging.getLogger("admin_api.auth_events")
+
+AUTH_INVALIDATION_CHANNEL = os.getenv("AUTH_INVALIDATION_CHANNEL", "auth:invalidate")
+
+_redis: Optional[Any] = None
+
+
+def configure(redis_client: Optional[Any]) -> None:
+    """Bind (or, with ``None``, unbind) the async redis client invalidations are published on."""
+    global _redis
+    _redis = redis_client
+
+
+def token_fingerprint(token: str) -> str:
+    """sha256 of the token — the key the gateway caches it under (never the token itself)."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def _publish(message: dict) -> None:
+    if _redis is None:
+        return
+    try:
+        await _redis.publish(AUTH_INVALIDATION_CHANNEL, json.dumps(message))
+    except Exception as e:  # noqa: BLE001 — best-effort; the gateway TTL bounds the staleness
+        logger.warning("auth invalidation publish failed (%s): %s", type(e).__name__, e)
+
+
+async def token_revoked(token: str) -> None:
+    await _publish({"token": token_fingerprint(token)})
+
+
+async def user_changed(user_id: int) -> None:
+    await _publish({"user_id": user_id})
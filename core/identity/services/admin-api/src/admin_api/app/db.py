@@ -38,6 +38,12 @@ def configure(
     _session_factory = async_sessionmaker(bind=_engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def get_session_factory() -> async_sessionmaker:
+    if _session_factory is None:
+        raise RuntimeError("admin_api.app.db not configured — call configure(database_url) first")
+    return _session_factory
+
+
 def get_engine():
     if _engine is None:
         raise RuntimeError("admin_api.app.db not configured — call configure(database_url) first")
@@ -0,0 +1,105 @@
+"""Write-behind ``api_tokens.last_used_at`` — keeps ``/internal/validate`` a pure read.
+
+``/internal/validate`` is the hottest path in the system (the gateway resolves a key through it),
+and it used to set ``last_used_at`` and COMMIT on every call: a row write per request, all of them
+contending on the same row for a popular token. ``last_used_at`` is informational (the token list
+shows it), so it does not need per-request precision.
+
+Validation now only ``touch``\\ es an in-memory ``token_id → latest use`` map. A background flusher
+(``run_flusher``, started at boot) drains it every ``LAST_USED_FLUSH_INTERVAL_S`` into ONE
+coalesced statement however many validations happened in between:
+
+    WITH v(id, used_at) AS (VALUES (…), (…))
+    UPDATE api_tokens SET last_used_at = v.used_at FROM v
+     WHERE api_tokens.id = v.id AND (last_used_at IS NULL OR last_used_at < v.used_at)
+
+The guard keeps replicas (each with its own tracker) from moving a token's last use backwards. A
+failed or cancelled flush merges its batch back for the next tick; the worst a crash loses is one interval of
+last-use timestamps, never a validation.
+"""
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Dict, Optional
+
+logger = logging.getLogger("admin_api.last_used")
+
+LAST_USED_FLUSH_INTERVAL_S = float(os.getenv("LAST_USED_FLUSH_INTERVAL_S", "10"))
+
+
+class LastUsedTracker:
+    """The pending ``token_id → last use`` map; only the newest use per token is kept."""
+
+    def __init__(self):
+        self._pending: Dict[int, datetime] = {}
+
+    def touch(self, token_id: int, at: Optional[datetime] = None) -> None:
+        at = at or datetime.utcnow()
+        prev = self._pending.get(token_id)
+        if prev is None or at > prev:
+            self._pending[token_id] = at
+
+    def drain(self) -> Dict[int, datetime]:
+        batch, self._pending = self._pending, {}
+        return batch
+
+    def restore(self, batch: Dict[int, datetime]) -> None:
+        """Put back a batch whose flush failed, keeping any newer use recorded since."""
+        for token_id, at in batch.items():
+            self.touch(token_id, at)
+
+    async def flush(self, session_factory) -> int:
+        """Write the pending uses in one statement; returns how many tokens it covered."""
+        batch = self.drain()
+        if not batch:
+            return 0
+        try:
+            async with session_factory() as db:
+                await db.execute(coalesced_update(batch))
+                await db.commit()
+        except BaseException:  # a shutdown cancel mid-statement too: the final flush retries it
+            self.restore(batch)
+            raise
+        return len(batch)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+def coalesced_update(batch: Dict[int, datetime]):
+    """The single ``UPDATE … FROM (VALUES …)`` that applies ``batch`` (see the module docstring)."""
+    from sqlalchemy import DateTime, Integer, column, or_, update, values
+
+    from ..schema.models import APIToken
+
+    v = values(column("id", Integer), column("used_at", DateTime), name="v").data(
+        sorted(batch.items())  # a stable row-lock order across concurrent flushers
+    ).cte("v")
+    return (
+        update(APIToken)
+        .where(APIToken.id == v.c.id)
+        .where(or_(APIToken.last_used_at.is_(None), APIToken.last_used_at < v.c.used_at))
+        .values(last_used_at=v.c.used_at)
+    )
+
+
+# The process-wide tracker validate_token touches and the boot-time flusher drains.
+tracker = LastUsedTracker()
+
+
+async def run_flusher(session_factory, interval: float = LAST_USED_FLUSH_INTERVAL_S,
+                      tracker: LastUsedTracker = tracker) -> None:
+    """Flush ``tracker`` every ``interval`` seconds until cancelled, then one final time."""
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await tracker.flush(session_factory)
+            except Exception as e:  # noqa: BLE001 — the batch was restored; retried next tick
+                logger.warning("last_used_at flush failed (%s): %s", type(e).__name__, e)
+    finally:
+        try:
+            await tracker.flush(session_factory)
+        except Exception as e:  # noqa: BLE001 — shutting down; one interval of last-use is lost
+            logger.warning("final last_used_at flush failed (%s): %s", type(e).__name__, e)
@@ -9,8 +9,8 @@ exercises:
     - internal: `X-Internal-Secret` == INTERNAL_API_SECRET, FAIL-CLOSED      → /internal/validate
 
   /internal/validate (the gateway's authz oracle): returns user_id + scopes + max_concurrent +
-  email, plus webhook_url/secret/events from user.data; rejects expired tokens; bumps
-  last_used_at; FAILS CLOSED when INTERNAL_API_SECRET is unset (503) and on a bad secret (403).
+  email, plus webhook_url/secret/events from user.data; rejects expired tokens; records
+  last_used_at write-behind (``last_used.py`` — no write on the request); FAILS CLOSED when INTERNAL_API_SECRET is unset (503) and on a bad secret (403).
 
   Token mint: scoped {bot,tx,browser}. Scopes via JSON body `{"scopes":["bot","tx"]}` or
   query `?scopes=bot,tx` / `?scope=bot` (body wins when present). Optional `name` /
@@ -30,6 +30,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..schema.models import APIToken, PlatformSetting, User
 from ..token_scope import VALID_SCOPES, generate_prefixed_token
+from . import auth_events, last_used
 from .db import get_db
 
 ADMIN_KEY_HEADER = APIKeyHeader(name="X-Admin-API-Key", auto_error=False)
@@ -357,8 +358,10 @@ def _resolve_capture_signal(user_data: dict, platform_diagnostics: dict) -> bool
     return True
 
 
-def create_app() -> FastAPI:
-    app = FastAPI(title="Vexa Admin API (v0.12)")
+def create_app(lifespan=None) -> FastAPI:
+    """The admin-api surface. ``lifespan`` is the boot wiring's startup/shutdown (``__main__``);
+    tests build the app without one."""
+    app = FastAPI(title="Vexa Admin API (v0.12)", lifespan=lifespan)
 
     # --- liveness probe (gate:health): process-up, no DB dependency. Readiness (DB reachable)
     # is a separate concern — keeping /health a pure liveness check makes it green without a
@@ -424,6 +427,7 @@ def create_app() -> FastAPI:
             }
         await db.commit()
         await db.refresh(user)
+        await auth_events.user_changed(user.id)
         return UserResponse.model_validate(user)
 
     @app.post("/admin/users/{user_id}/tokens", response_model=TokenResponse,
@@ -487,8 +491,10 @@ def create_app() -> FastAPI:
         tok = await db.get(APIToken, token_id)
         if not tok:
             raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Token not found")
+        token_value = tok.token
         await db.delete(tok)
         await db.commit()
+        await auth_events.token_revoked(token_value)
         return Response(status_code=status.HTTP_204_NO_CONTENT)
 
     # --- user tier: webhook self-serve (writes to user.data JSONB) ---
@@ -508,6 +514,7 @@ def create_app() -> FastAPI:
         db.add(user)
         await db.commit()
         await db.refresh(user)
+        await auth_events.user_changed(user.id)
         return UserResponse.model_validate(user)
 
     @app.get("/user/webhook")
@@ -749,8 +756,8 @@ def create_app() -> FastAPI:
         if api_token.expires_at is not None and api_token.expires_at < datetime.utcnow():
             raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Token expired")
 
-        api_token.last_used_at = datetime.utcnow()
-        await db.commit()
+        # A pure read: last use is recorded write-behind and flushed in coalesced batches.
+        last_used.tracker.touch(api_token.id)
 
         scopes = list(api_token.scopes) if api_token.scopes else ["legacy"]
         resp = {
@@ -852,6 +859,7 @@ def create_app() -> FastAPI:
         attributes.flag_modified(user, "data")
         db.add(user)
         await db.commit()
+        await auth_events.user_changed(user.id)
         return {"claimed": True, "admin_exists": True}
 
     @app.get("/internal/users/{user_id}/memberships", include_in_schema=False)
@@ -881,6 +889,7 @@ def create_app() -> FastAPI:
         attributes.flag_modified(user, "data")
         db.add(user)
         await db.commit()
+        await auth_events.user_changed(user.id)
         return {"memberships": memberships}
 
     @app.delete("/internal/users/{user_id}/memberships/{workspace_id}", include_in_schema=False)
@@ -896,6 +905,7 @@ def create_app() -> FastAPI:
         attributes.flag_modified(user, "data")
         db.add(user)
         await db.commit()
+        await auth_events.user_changed(user.id)
         return {"memberships": memberships}
 
     # --- internal tier: calendar-sync configs — meeting-api's ICS poller discovers every user
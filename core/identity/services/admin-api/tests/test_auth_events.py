@@ -0,0 +1,55 @@
+"""Auth-cache invalidations — what admin-api publishes for the gateway's resolve cache.
+
+The gateway caches ``/internal/validate`` answers keyed by sha256 of the key; a token delete must
+publish THAT fingerprint (never the token), a user change the user id. Publishing is best-effort:
+a redis failure never fails the admin call, and with no redis bound nothing is attempted.
+Offline, no docker — the publisher is a fake.
+"""
+import asyncio
+import hashlib
+import json
+
+import pytest
+
+from admin_api.app import auth_events
+
+
+class _FakeRedis:
+    def __init__(self, fail=False):
+        self.published = []
+        self._fail = fail
+
+    async def publish(self, channel, message):
+        if self._fail:
+            raise ConnectionError("redis down")
+        self.published.append((channel, json.loads(message)))
+
+
+@pytest.fixture()
+def bus():
+    fake = _FakeRedis()
+    auth_events.configure(fake)
+    yield fake
+    auth_events.configure(None)
+
+
+def test_token_revoked_publishes_the_fingerprint_not_the_token(bus):
+    asyncio.run(auth_events.token_revoked("vxa_bot_secret"))
+    [(channel, msg)] = bus.published
+    assert channel == auth_events.AUTH_INVALIDATION_CHANNEL
+    assert msg == {"token": hashlib.sha256(b"vxa_bot_secret").hexdigest()}
+    assert "vxa_bot_secret" not in json.dumps(msg)
+
+
+def test_user_changed_publishes_the_user_id(bus):
+    asyncio.run(auth_events.user_changed(42))
+    assert bus.published == [(auth_events.AUTH_INVALIDATION_CHANNEL, {"user_id": 42})]
+
+
+def test_publish_is_best_effort_and_a_noop_when_unbound():
+    auth_events.configure(_FakeRedis(fail=True))
+    try:
+        asyncio.run(auth_events.user_changed(1))  # swallowed + logged, never raised
+    finally:
+        auth_events.configure(None)
+    asyncio.run(auth_events.token_revoked("vxa_bot_x"))  # unbound → nothing to do
@@ -0,0 +1,161 @@
+"""Write-behind ``last_used_at`` — ``/internal/validate`` only touches memory; a flush applies every
+use since the last one as ONE coalesced ``UPDATE … FROM (VALUES …)``, never moving a token's last
+use backwards, and a failed flush keeps its batch for the next tick.
+
+Offline: the statement runs on SQLite (``UPDATE … FROM`` + a VALUES CTE, same as Postgres) wherever
+SQLAlchemy + aiosqlite are installed; the end-to-end validate → flush path is in
+``test_stack_admin_api.py`` (docker).
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from admin_api.app.last_used import LastUsedTracker
+
+T0 = datetime(2026, 7, 1, 12, 0, 0)
+
+
+def test_touch_keeps_only_the_newest_use_per_token():
+    t = LastUsedTracker()
+    t.touch(1, T0)
+    t.touch(1, T0 + timedelta(seconds=5))
+    t.touch(1, T0 + timedelta(seconds=2))  # out-of-order arrival never regresses
+    t.touch(2, T0)
+    assert t.drain() == {1: T0 + timedelta(seconds=5), 2: T0}
+    assert len(t) == 0
+
+
+def test_flush_is_one_statement_and_never_moves_last_use_backwards():
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy import event, text
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE api_tokens (id INTEGER PRIMARY KEY, last_used_at DATETIME)"))
+            await conn.execute(text("INSERT INTO api_tokens (id) VALUES (1), (2), (3)"))
+            # token 3 was already used LATER by another replica's flush
+            await conn.execute(text("UPDATE api_tokens SET last_used_at = '2026-07-01 13:00:00.000000' WHERE id = 3"))
+        updates: list[str] = []
+        event.listen(engine.sync_engine, "before_cursor_execute",
+                     lambda conn, cur, stmt, *a: updates.append(stmt) if "UPDATE" in stmt else None)
+
+        t = LastUsedTracker()
+        for i in range(1000):  # a hot token validated 1000× between flushes
+            t.touch(1, T0 + timedelta(milliseconds=i))
+        t.touch(2, T0)
+        t.touch(3, T0)
+        assert await t.flush(async_sessionmaker(engine)) == 3
+        assert await t.flush(async_sessionmaker(engine)) == 0  # nothing pending → no statement
+        async with engine.connect() as conn:
+            rows = dict((await conn.execute(text("SELECT id, last_used_at FROM api_tokens"))).all())
+        await engine.dispose()
+        return updates, rows
+
+    updates, rows = asyncio.run(scenario())
+    assert len(updates) == 1
+    assert str(rows[1]).startswith("2026-07-01 12:00:00.999")
+    assert str(rows[2]).startswith("2026-07-01 12:00:00")
+    assert str(rows[3]).startswith("2026-07-01 13:00:00")  # the newer use elsewhere is kept
+
+
+def test_failed_flush_restores_its_batch():
+    class _Broken:
+        async def __aenter__(self):
+            raise ConnectionError("db down")
+
+        async def __aexit__(self, *exc):
+            return False
+
+    t = LastUsedTracker()
+    t.touch(1, T0)
+    with pytest.raises(ConnectionError):
+        asyncio.run(t.flush(_Broken))
+    t.touch(1, T0 - timedelta(seconds=1))
+    assert t.drain() == {1: T0}
+
+
+
+def test_flusher_cancelled_mid_flush_still_lands_the_batch_in_its_final_flush():
+    """Shutdown cancels ``run_flusher``; a cancel that lands inside the in-flight statement must put
+    the batch back, or the final flush finds nothing and that interval's uses are lost."""
+    pytest.importorskip("sqlalchemy")
+    from admin_api.app.last_used import run_flusher
+
+    written = []
+
+    async def scenario():
+        in_flight = asyncio.Event()
+
+        class _Session:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self, stmt):
+                if not in_flight.is_set():
+                    in_flight.set()
+                    await asyncio.Event().wait()    # the tick's statement hangs until cancelled
+                written.append(stmt)
+
+            async def commit(self):
+                pass
+
+        t = LastUsedTracker()
+        t.touch(1, T0)
+        task = asyncio.ensure_future(run_flusher(_Session, interval=0, tracker=t))
+        await in_flight.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return t
+
+    t = asyncio.run(scenario())
+    assert len(written) == 1 and len(t) == 0
+
+def test_production_lifespan_starts_and_drains_the_flusher(monkeypatch):
+    """The boot wiring's lifespan converges the schema, starts the flusher, and on shutdown cancels
+    it (its final flush runs) and closes the invalidation publisher."""
+    pytest.importorskip("sqlalchemy")
+    from fastapi.testclient import TestClient
+
+    from admin_api import __main__ as boot
+    from admin_api.app import auth_events, last_used
+    from admin_api.schema import sync
+
+    calls = []
+
+    async def fake_ensure_schema(engine, base):
+        calls.append("schema")
+
+    async def fake_flusher(session_factory):
+        calls.append("flusher started")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            calls.append("final flush")
+
+    class _Publisher:
+        async def aclose(self):
+            calls.append("publisher closed")
+
+    import redis.asyncio as aioredis
+
+    monkeypatch.setenv("INTERNAL_API_SECRET", "a-real-secret")
+    monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://u:p@localhost:5432/vexa")
+    monkeypatch.setenv("REDIS_URL", "redis://redis:6379/0")
+    monkeypatch.setattr(sync, "ensure_schema", fake_ensure_schema)
+    monkeypatch.setattr(last_used, "run_flusher", fake_flusher)
+    monkeypatch.setattr(aioredis, "from_url", lambda *a, **k: _Publisher())
+
+    with TestClient(boot.build_production_app()) as client:
+        assert client.get("/health").status_code == 200
+        assert calls == ["schema", "flusher started"]
+        assert auth_events._redis is not None
+    assert calls[2:] == ["final flush", "publisher closed"]
+    assert auth_events._redis is None
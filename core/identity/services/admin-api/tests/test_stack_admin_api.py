@@ -620,6 +620,24 @@ def test_list_user_tokens_scoped_and_secret_free(client):
     assert client.get(f"/admin/users/{alice['id']}/tokens").status_code == 403  # admin tier required
 
 
+def test_validate_is_a_pure_read_and_last_used_lands_on_flush(client):
+    """/internal/validate no longer writes: repeated validations leave last_used_at untouched until
+    the write-behind flush, which then records the latest use in one coalesced UPDATE."""
+    from admin_api.app import last_used
+
+    uid = client.post("/admin/users", headers=_admin(), json={"email": "hot@vexa.ai"}).json()["id"]
+    token = client.post(f"/admin/users/{uid}/tokens?scope=bot", headers=_admin()).json()["token"]
+    last_used.tracker.drain()
+    for _ in range(5):
+        r = client.post("/internal/validate", headers={"X-Internal-Secret": INTERNAL_SECRET},
+                        json={"token": token})
+        assert r.status_code == 200
+    assert client.get(f"/admin/users/{uid}/tokens", headers=_admin()).json()[0]["last_used_at"] is None
+
+    assert client.portal.call(last_used.tracker.flush, app_db.get_session_factory()) == 1
+    assert client.get(f"/admin/users/{uid}/tokens", headers=_admin()).json()[0]["last_used_at"]
+
+
 def _internal(h=None):
     return {"X-Internal-Secret": INTERNAL_SECRET, **(h or {})}
 
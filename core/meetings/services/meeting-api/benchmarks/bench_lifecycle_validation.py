@@ -0,0 +1,75 @@
+"""Lifecycle-callback benchmark — per-call vs compiled-once contract validators.
+
+Replays the receiver's per-callback work in-process (no HTTP): validate the inbound lifecycle.v1
+``LifecycleEvent``, advance the FSM (``LifecycleSink.apply_change``), build the
+``meeting.status_change`` envelope and the typed envelope (each self-checked against webhook.v1).
+Each meeting is a joining → active → completed run of the lifecycle.v1 goldens, so a third of the
+callbacks also build a typed ``meeting.started`` / ``meeting.completed`` envelope. Three modes:
+
+  * ``per_call`` — a fresh ``Draft202012Validator`` per check (the old ``conforms``/``_conforms``);
+  * ``cached``   — the shared compiled-once validators (``contract_validation``);
+  * ``sampled``  — cached, with the envelope self-checks sampled at ``--sample`` (inbound events are
+    still always validated).
+
+    python benchmarks/bench_lifecycle_validation.py [--callbacks 3000] [--sample 0.01]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import jsonschema  # noqa: E402
+from referencing import Registry, Resource  # noqa: E402
+
+from meeting_api import contract_validation  # noqa: E402
+from meeting_api.lifecycle import receiver, webhook  # noqa: E402
+from meeting_api.lifecycle.machine import LifecycleSink, TransitionSource  # noqa: E402
+
+_GOLDEN = Path(receiver.__file__).resolve().parents[5] / "contracts" / "lifecycle.v1" / "golden"
+_RUN = [json.loads((_GOLDEN / f"LifecycleEvent.{name}.json").read_text())
+        for name in ("joining", "active", "completed-stopped")]
+
+
+def _per_call_validator(schema: dict, shape: str) -> jsonschema.Draft202012Validator:
+    reg = Registry().with_resource(schema["$id"], Resource.from_contents(schema))
+    return jsonschema.Draft202012Validator({"$ref": f"{schema['$id']}#/$defs/{shape}"}, registry=reg)
+
+
+def _run(mode: str, callbacks: int, sample: float) -> dict:
+    original = contract_validation.validator
+    if mode == "per_call":
+        contract_validation.validator = _per_call_validator
+    contract_validation.SELF_CHECK_SAMPLE = sample if mode == "sampled" else 1.0
+    sink = LifecycleSink()
+    envelopes = 0
+    try:
+        started = time.perf_counter()
+        for i in range(callbacks):
+            event = dict(_RUN[i % 3], connection_id=f"sess-{i // 3}")
+            receiver.conforms(event, "LifecycleEvent")
+            change = sink.apply_change(event, transition_source=TransitionSource.BOT_CALLBACK)
+            webhook.build_status_change_envelope(change)
+            envelopes += 1 + (webhook.build_typed_envelope(change) is not None)
+        elapsed = time.perf_counter() - started
+    finally:
+        contract_validation.validator = original
+    return {"mode": mode, "callbacks": callbacks, "envelopes": envelopes,
+            "ms": round(elapsed * 1000, 1), "callbacks_per_s": round(callbacks / elapsed)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--callbacks", type=int, default=3000)
+    parser.add_argument("--sample", type=float, default=0.01)
+    args = parser.parse_args()
+    for mode in ("per_call", "cached", "sampled"):
+        print(json.dumps(_run(mode, args.callbacks, args.sample)))
+
+
+if __name__ == "__main__":
+    main()
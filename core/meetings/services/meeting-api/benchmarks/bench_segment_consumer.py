@@ -0,0 +1,126 @@
+"""Segment-consumer backlog benchmark — fixed ``count=10`` poll vs the adaptive blocking consumer.
+
+Seeds a fakeredis ``transcription_segments`` stream with a synthetic backlog (default 10k messages
+spread over 200 meetings — the "meeting block ends, every bot flushes" burst) and drains it twice:
+
+  * ``fixed``    — the old loop: ``consume_segments(count=10)`` then a ``SEGMENT_CONSUMER_INTERVAL``
+                   sleep between ticks;
+  * ``adaptive`` — ``consume_adaptive``: blocking read, batch size following the group lag.
+
+fakeredis has no network, so every bus call is charged a simulated round trip (``--rtt-ms``) to
+model a real Redis hop. Reports wall time to drain, ticks, and the meeting_api.obs histograms.
+
+    python benchmarks/bench_segment_consumer.py [--messages 10000] [--rtt-ms 0.5] [--interval 0.5]
+
+The fixed loop really sleeps ``--interval`` per tick (1000 ticks for 10k messages) — pass a smaller
+interval for a quick run; the gap between the two modes is then the read/write batching alone.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import fakeredis.aioredis  # noqa: E402
+
+from meeting_api import obs  # noqa: E402
+from meeting_api.collector.fakes import FakeRedisBus, InMemoryTranscriptStore  # noqa: E402
+from meeting_api.collector.ingest import (  # noqa: E402
+    STREAM_NAME,
+    AdaptiveBatchSize,
+    consume_adaptive,
+    consume_segments,
+)
+
+MEETINGS = 200
+
+
+class _RttBus(FakeRedisBus):
+    """A FakeRedisBus that charges ``rtt`` seconds per bus call (one simulated network hop)."""
+
+    def __init__(self, client, rtt: float):
+        super().__init__(client)
+        self._rtt = rtt
+
+    async def _hop(self):
+        if self._rtt:
+            await asyncio.sleep(self._rtt)
+
+    async def read_segments(self, **kw):
+        await self._hop()
+        return await super().read_segments(**kw)
+
+    async def stream_lag(self, **kw):
+        await self._hop()
+        return await super().stream_lag(**kw)
+
+    async def ack(self, **kw):
+        await self._hop()
+        return await super().ack(**kw)
+
+    async def publish(self, channel, data):
+        await self._hop()
+        return await super().publish(channel, data)
+
+    async def publish_many(self, messages):
+        await self._hop()
+        return await super().publish_many(messages)
+
+    async def xadd_many(self, stream, payloads):
+        await self._hop()
+        return await super().xadd_many(stream, payloads)
+
+
+async def _seed(client, n: int) -> None:
+    async with client.pipeline(transaction=False) as pipe:
+        for i in range(n):
+            mid = 1 + i % MEETINGS
+            payload = {"type": "transcription", "meeting_id": str(mid), "native_meeting_id": f"n-{mid}",
+                       "segments": [{"segment_id": f"{mid}:{i}", "start": float(i), "end": float(i) + 1.0,
+                                     "text": f"words {i}", "language": "en", "completed": True}]}
+            pipe.xadd(STREAM_NAME, {"payload": json.dumps(payload)})
+        await pipe.execute()
+
+
+async def _run(mode: str, n: int, rtt: float, interval: float) -> dict:
+    client = fakeredis.aioredis.FakeRedis()
+    await _seed(client, n)
+    bus = _RttBus(client, rtt)
+    store = InMemoryTranscriptStore()
+    obs.reset_metrics()
+    sizer = AdaptiveBatchSize()
+    ticks = drained = 0
+    started = time.perf_counter()
+    while drained < n:
+        ticks += 1
+        if mode == "fixed":
+            drained += await consume_segments(store, bus, count=10)
+            await asyncio.sleep(interval)
+        else:
+            drained += await consume_adaptive(store, bus, sizer, block_ms=2000)
+    elapsed = time.perf_counter() - started
+    await client.aclose()
+    snap = obs.metrics_snapshot()
+    return {"mode": mode, "messages": n, "seconds": round(elapsed, 3), "ticks": ticks,
+            "msgs_per_s": round(n / elapsed), "final_count": sizer.count if mode == "adaptive" else 10,
+            "histograms": {k: {"count": v["count"], "sum": round(v["sum"], 4)} for k, v in snap.items()}}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--messages", type=int, default=10_000)
+    ap.add_argument("--rtt-ms", type=float, default=0.5)
+    ap.add_argument("--interval", type=float, default=0.5,
+                    help="the fixed loop's sleep between ticks (SEGMENT_CONSUMER_INTERVAL)")
+    args = ap.parse_args()
+    for mode in ("adaptive", "fixed"):
+        print(json.dumps(asyncio.run(_run(mode, args.messages, args.rtt_ms / 1000, args.interval))))
+
+
+if __name__ == "__main__":
+    main()
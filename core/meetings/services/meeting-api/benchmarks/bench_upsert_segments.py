@@ -0,0 +1,94 @@
+"""Durable-sink benchmark — per-row vs chunked multi-VALUES ``upsert_segments``.
+
+Drives ``SqlAlchemyTranscriptStore.upsert_segments`` with batches of 10 / 100 / 1000 segments twice:
+
+  * ``per_row`` — ``UPSERT_CHUNK_SIZE = 1``: one ``INSERT … ON CONFLICT`` per segment (the old loop);
+  * ``bulk``    — the configured chunk (``DB_WRITER_UPSERT_CHUNK``, default 500).
+
+Each size runs a fresh insert then a full re-flush (every row takes the ON CONFLICT UPDATE path),
+as a finalize after an earlier partial flush would. The default target is an in-memory SQLite
+(aiosqlite), which has no network, so every statement is charged a simulated round trip
+(``--rtt-ms``); point ``--dsn`` at a scratch Postgres (``postgresql+asyncpg://…``) for real numbers
+— the table is created and dropped by the script.
+
+    python benchmarks/bench_upsert_segments.py [--sizes 10,100,1000] [--rtt-ms 0.5] [--dsn URL]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sqlalchemy import event, text  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from meeting_api.collector import adapters  # noqa: E402
+from meeting_api.collector.adapters import SqlAlchemyTranscriptStore  # noqa: E402
+
+_DDL = (
+    "CREATE TABLE transcriptions (id {pk}, meeting_id INTEGER NOT NULL, start_time FLOAT NOT NULL, "
+    "end_time FLOAT NOT NULL, text TEXT NOT NULL, speaker VARCHAR(255), language VARCHAR(10), "
+    "created_at TIMESTAMP, session_uid VARCHAR, segment_id VARCHAR)",
+    "CREATE UNIQUE INDEX ix_transcription_meeting_segment ON transcriptions "
+    "(meeting_id, segment_id) WHERE segment_id IS NOT NULL",
+)
+
+_BULK_CHUNK = adapters.UPSERT_CHUNK_SIZE  # the configured chunk, captured before per_row overrides it
+
+
+def _segments(n: int, revision: int) -> list[dict]:
+    return [{"segment_id": f"seg-{i}", "start": i * 2.0, "end": i * 2.0 + 1.5,
+             "text": f"segment {i} rev {revision}", "speaker": "Alice", "language": "en",
+             "session_uid": "sess-1"} for i in range(n)]
+
+
+async def _run(dsn: str, mode: str, n: int, rtt: float) -> dict:
+    engine = create_async_engine(dsn)
+    pk = "SERIAL PRIMARY KEY" if engine.dialect.name == "postgresql" else "INTEGER PRIMARY KEY"
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS transcriptions"))
+        for ddl in _DDL:
+            await conn.execute(text(ddl.format(pk=pk)))
+    statements = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _hop(conn, cursor, statement, *args):  # one simulated round trip per statement
+        if statement.lstrip().upper().startswith("INSERT"):
+            statements[0] += 1
+            if rtt:
+                time.sleep(rtt)
+
+    adapters.UPSERT_CHUNK_SIZE = 1 if mode == "per_row" else _BULK_CHUNK
+    store = SqlAlchemyTranscriptStore(session_factory=async_sessionmaker(engine), redis_client=None)
+    timings = {}
+    for phase, revision in (("insert", 1), ("reflush", 2)):
+        started = time.perf_counter()
+        await store.upsert_segments(1, _segments(n, revision))
+        timings[phase] = round((time.perf_counter() - started) * 1000, 2)
+    async with engine.begin() as conn:
+        rows = (await conn.execute(text("SELECT count(*) FROM transcriptions"))).scalar()
+        await conn.execute(text("DROP TABLE transcriptions"))
+    await engine.dispose()
+    assert rows == n, f"{mode}: expected {n} rows after the re-flush, found {rows}"
+    return {"mode": mode, "segments": n, "statements": statements[0],
+            "insert_ms": timings["insert"], "reflush_ms": timings["reflush"]}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="10,100,1000")
+    ap.add_argument("--rtt-ms", type=float, default=0.5)
+    ap.add_argument("--dsn", default="sqlite+aiosqlite://")
+    args = ap.parse_args()
+    for n in (int(s) for s in args.sizes.split(",")):
+        for mode in ("per_row", "bulk"):
+            print(json.dumps(asyncio.run(_run(args.dsn, mode, n, args.rtt_ms / 1000))))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,8 @@ adapters (SQLAlchemy + redis + MinIO/S3 + httpx-runtime), then — per P4 — AL
 control-plane background loops alongside the HTTP app via the FastAPI lifespan:
 
   * **collector segment consumer** — drains the ``transcription_segments`` redis stream
-    (``consume_segments`` → ``ingest`` → publish ``tc:…:mutable``) on a poll interval.
+    (``consume_adaptive`` → ``ingest_batch`` → publish ``tc:…:mutable``) with a blocking, adaptively
+    sized XREADGROUP.
   * **db-writer** — the RESTORED parent flush loop (0.10 ``process_redis_to_postgres``): each tick
     moves immutable live segments from the redis hash ``meeting:{id}:segments`` into the
     ``transcriptions`` table (upsert on segment identity; redis trimmed only after the confirmed
@@ -276,7 +277,13 @@ def _attach_background_loops(
     is DELIBERATELY left unguarded — it is a Redis competing consumer (``XREADGROUP … ">"``) whose
     single-delivery is already exact, and guarding it would needlessly serialize the replicas' reads.
     """
-    from .collector.ingest import RECLAIM_MIN_IDLE_MS, consume_segments, reclaim_segments
+    from .collector.ingest import (
+        READ_BLOCK_MS,
+        RECLAIM_MIN_IDLE_MS,
+        AdaptiveBatchSize,
+        consume_adaptive,
+        reclaim_segments,
+    )
     from .sweeps.single_flight import PgAdvisoryLock, run_single_flight, sweep_lock_key
 
     # One shared advisory-lock backend across the guarded loops (each keyed by its own loop name).
@@ -293,7 +300,13 @@ def _attach_background_loops(
     # survivor without a dedicated loop (no second /health heartbeat to maintain). The min-idle gate
     # (RECLAIM_MIN_IDLE_MS) ensures a live peer's in-flight batch is never stolen.
     seg_reclaim_every = max(1, int(os.getenv("SEGMENT_RECLAIM_EVERY_N_TICKS", "120")))
+    # The consumer reads with XREADGROUP BLOCK, so its tick rate follows the traffic rather than
+    # seg_interval; the reclaim cadence is therefore kept in wall-clock terms — the same N × interval
+    # period the tick-counted version had (~60s by default).
+    seg_reclaim_period = seg_reclaim_every * seg_interval
     webhook_interval = float(os.getenv("WEBHOOK_DRAIN_INTERVAL", "5"))
+    webhook_concurrency = int(os.getenv("WEBHOOK_RETRY_CONCURRENCY", "16"))
+    webhook_per_host = int(os.getenv("WEBHOOK_RETRY_PER_HOST", "4"))
     # The db-writer cadence — the parent's BACKGROUND_TASK_INTERVAL (10s); either env name works.
     db_writer_interval = float(
         os.getenv("DB_WRITER_INTERVAL_S", os.getenv("BACKGROUND_TASK_INTERVAL", "10"))
@@ -360,25 +373,33 @@ def _attach_background_loops(
     app.state.pipeline_pending_alarm = int(os.getenv("PIPELINE_PENDING_ALARM", "100"))
 
     async def _segment_consumer_loop() -> None:
-        # Drain the transcription_segments stream → persist + publish tc:…:mutable.
-        tick_n = 0
+        # Drain the transcription_segments stream → persist + publish tc:…:mutable. Each tick is ONE
+        # adaptive read: it parks in XREADGROUP BLOCK (SEGMENT_CONSUMER_BLOCK_MS) instead of sleeping,
+        # so a burst is picked up the moment it lands, and the batch size grows with the group lag
+        # (and shrinks back once caught up). SEGMENT_CONSUMER_BLOCK_MS=0 restores the plain poll.
+        sizer = AdaptiveBatchSize()
+        last_reclaim = _time.monotonic()
         while True:
+            failed = False
             try:
-                await consume_segments(transcript_store, segment_bus)
-                # #636: every N ticks, reclaim any ORPHANED (crashed-replica) un-acked batch idle
-                # past RECLAIM_MIN_IDLE_MS and drain it through the same ingest→ack path. Bounded to
-                # one XAUTOCLAIM per pass (its cursor continues next time) — never a hang surface.
-                tick_n += 1
-                if tick_n % seg_reclaim_every == 0:
+                await consume_adaptive(transcript_store, segment_bus, sizer, block_ms=READ_BLOCK_MS)
+                # #636: every reclaim period, reclaim any ORPHANED (crashed-replica) un-acked batch
+                # idle past RECLAIM_MIN_IDLE_MS and drain it through the same ingest→ack path. Bounded
+                # to one XAUTOCLAIM per pass (its cursor continues next time) — never a hang surface.
+                if _time.monotonic() - last_reclaim >= seg_reclaim_period:
+                    last_reclaim = _time.monotonic()
                     await reclaim_segments(
                         transcript_store, segment_bus, min_idle_ms=RECLAIM_MIN_IDLE_MS
                     )
             except asyncio.CancelledError:
                 raise
             except Exception:
+                failed = True
                 log.exception("segment consumer tick failed")
             ticks["segment-consumer"] = _time.monotonic()  # #527: alive this iteration
-            await asyncio.sleep(seg_interval)
+            # The blocking read paces the loop; poll mode (BLOCK_MS=0) or a failed tick backs off
+            # seg_interval instead. The 0-sleep still yields, so the loop never starves the app.
+            await asyncio.sleep(seg_interval if (failed or not READ_BLOCK_MS) else 0)
 
     async def _db_writer_loop() -> None:
         # The RESTORED parent db-writer (0.10 process_redis_to_postgres): each tick, flush every
@@ -398,7 +419,15 @@ def _attach_background_loops(
         last_reconcile = [0.0]  # 0 ⇒ the first tick reconciles
 
         async def _tick(reconcile: bool):
+            started = _time.monotonic()
             await db_writer_tick(redis_client, transcript_store, reconcile=reconcile)
+            elapsed = _time.monotonic() - started
+            if elapsed > db_writer_interval:
+                # The sweep no longer fits its cadence — the flush is falling behind the live
+                # meetings. Raise DB_WRITER_CONCURRENCY (pool permitting) or the interval.
+                log.warning(
+                    "db-writer tick took %.1fs, longer than its %.1fs interval", elapsed, db_writer_interval,
+                )
 
         while True:
             now = _time.monotonic()
@@ -429,7 +458,10 @@ def _attach_background_loops(
                 return await client.post(url, content=body, headers=headers)
 
         async def _tick():
-            await drain_retry_queue(redis_client, _transport)
+            await drain_retry_queue(
+                redis_client, _transport,
+                concurrency=webhook_concurrency, per_host=webhook_per_host,
+            )
             if system_webhook_sink is not None:
                 await system_webhook_sink.drain()
 
@@ -13,7 +13,8 @@ sub-package of ``meeting_api`` mounted here (the v0.12 analog of the parent ``ma
     POST ``/ws/authorize-subscribe`` (+ the ``transcription_segments`` → ``tc:…:mutable`` consumer).
   * **recordings** — POST ``/internal/recordings/upload``, GET ``/recordings``,
     GET ``/recordings/{id}/master`` (chunks + master → ``meeting.data`` JSONB).
-  * **obs** — ``TraceMiddleware`` (logevent.v1 trace_id threading) + the shared ``GET /health``.
+  * **obs** — ``TraceMiddleware`` (logevent.v1 trace_id threading) + the shared ``GET /health`` and
+    ``GET /metrics``.
 
 webhooks + scheduling are library bricks (no HTTP surface of their own in the core path — they are
 driven by the lifecycle/bot_spawn flows); they are re-exported from the package front door and wired
@@ -39,7 +40,7 @@ from . import recordings as _recordings
 from .collector.app import build_router as _build_collector_router
 from .collector.ports import RedisBus, TranscriptStore
 from .lifecycle.machine import LifecycleSink, MeetingStore
-from .obs import TraceMiddleware
+from .obs import TraceMiddleware, metrics_snapshot
 
 #: In-process capture of the last N emitted webhook envelopes — an eval/introspection seam, never a
 #: durable store (the DB meeting row is the durable record; the WebhookSink is the delivery path).
@@ -216,6 +217,12 @@ def create_app(
                 return JSONResponse(body, status_code=503)
         return body
 
+    @app.get("/metrics")
+    async def metrics():
+        """The process-local metrics registry (collector ingest/batch/lag histograms, cache and
+        webhook-guard counters, contract self-check counts). No auth, like ``/health``."""
+        return metrics_snapshot()
+
     # --- bot_spawn ports (resolved FIRST: the meeting_repo is also the lifecycle-persistence target) ---
     if meeting_repo is None:
         meeting_repo = _bot_spawn_fakes().InMemoryMeetingRepo()
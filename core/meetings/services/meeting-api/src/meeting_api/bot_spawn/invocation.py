@@ -27,8 +27,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
-import jsonschema
-from referencing import Registry, Resource
+from .. import contract_validation
+
 
 # ── sealed-schema loaders (the seam, P8 — by path, not import) ──────────────────────────────────
 
@@ -47,9 +47,6 @@ _INVOCATION_SCHEMA = _load_schema(
 _RUNTIME_SCHEMA = _load_schema(
     Path("runtime") / "contracts" / "runtime.v1" / "runtime.schema.json"
 )
-_INV_REGISTRY = Registry().with_resource(
-    _INVOCATION_SCHEMA["$id"], Resource.from_contents(_INVOCATION_SCHEMA)
-)
 
 #: The platforms the MEETING-BOT spawn flow can actually invoke — the sealed invocation.v1
 #: Platform enum, read from the schema itself so this set can never drift from what
@@ -58,25 +55,18 @@ _INV_REGISTRY = Registry().with_resource(
 #: router refuses the difference with a typed 422 BEFORE any DB write, instead of writing a
 #: meeting row and then dying inside the schema validation with a 500 that orphans the row.
 SPAWNABLE_PLATFORMS = frozenset(_INVOCATION_SCHEMA["$defs"]["Platform"]["enum"])
-_RT_REGISTRY = Registry().with_resource(
-    _RUNTIME_SCHEMA["$id"], Resource.from_contents(_RUNTIME_SCHEMA)
-)
-
-
-def _conforms(obj: dict, schema: dict, registry: Registry, shape: str) -> None:
-    jsonschema.Draft202012Validator(
-        {"$ref": f"{schema['$id']}#/$defs/{shape}"}, registry=registry
-    ).validate(obj)
+contract_validation.precompile(_INVOCATION_SCHEMA, ("Invocation",))
+contract_validation.precompile(_RUNTIME_SCHEMA, ("WorkloadSpec",))
 
 
 def conforms_invocation(obj: dict) -> None:
     """Validate ``obj`` against ``invocation.v1#/$defs/Invocation`` (raises on non-conformance)."""
-    _conforms(obj, _INVOCATION_SCHEMA, _INV_REGISTRY, "Invocation")
+    contract_validation.conforms(obj, _INVOCATION_SCHEMA, "Invocation")
 
 
 def conforms_workload_spec(obj: dict) -> None:
     """Validate ``obj`` against ``runtime.v1#/$defs/WorkloadSpec`` (raises on non-conformance)."""
-    _conforms(obj, _RUNTIME_SCHEMA, _RT_REGISTRY, "WorkloadSpec")
+    contract_validation.conforms(obj, _RUNTIME_SCHEMA, "WorkloadSpec")
 
 
 # ── MeetingToken (HS256 JWT) — ported verbatim from parent meetings.mint_meeting_token ──────────
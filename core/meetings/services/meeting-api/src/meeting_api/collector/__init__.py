@@ -15,9 +15,10 @@ Public surface (the front door):
     ``MeetingListResponse``), POST ``/ws/authorize-subscribe`` (the gateway ``/ws`` authorizer
     hop), ``/health``. (When mounted into the unified app its routes are merged in;
     standalone ``create_app`` is still used by the conformance harness + this module's tests.)
-  - ``ingest(store, redis, message)`` / ``consume_segments(store, redis, ...)`` — the
-    segment-ingestion unit: ``transcription_segments`` stream → store → publish
-    ``tc:meeting:{id}:mutable``.
+  - ``ingest(store, redis, message)`` / ``ingest_batch(store, redis, messages)`` /
+    ``consume_segments(store, redis, ...)`` — the segment-ingestion unit: ``transcription_segments``
+    stream → store → publish ``tc:meeting:{id}:mutable`` (``ingest_batch`` pipelines a read batch
+    into one store write + one feed pipeline per meeting).
   - ``ports`` — the Protocols: ``TranscriptStore``, ``RedisBus`` (+ ``PubSub``).
   - ``adapters.build_production_app(...)`` — wire ``create_app`` with real SQLAlchemy + redis.
   - ``fakes`` — ``InMemoryTranscriptStore`` / ``FakeRedisBus`` (offline drivers).
@@ -30,12 +31,13 @@ the shipped collector; this package imports nothing from conformance.
 from __future__ import annotations
 
 from .app import create_app
-from .ingest import consume_segments, ingest
+from .ingest import consume_segments, ingest, ingest_batch
 from .ports import PubSub, RedisBus, TranscriptStore
 
 __all__ = [
     "create_app",
     "ingest",
+    "ingest_batch",
     "consume_segments",
     "TranscriptStore",
     "RedisBus",
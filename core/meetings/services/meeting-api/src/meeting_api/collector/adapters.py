@@ -22,10 +22,20 @@ import json
 import logging
 import os
 import secrets
+from dataclasses import replace
 from datetime import datetime, timezone
 from typing import Optional
 
 from .ports import RedisBus, TranscriptStore
+from .transcript_cache import (
+    CACHEABLE_STATUSES,
+    TRANSCRIPT_VERSION_TTL_S,
+    LocalVersions,
+    TranscriptCache,
+    new_version,
+    transcript_version_key,
+)
+from .transcript_window import TranscriptWindow
 
 log = logging.getLogger("meeting_api.collector.adapters")
 
@@ -51,6 +61,24 @@ def _decode_claimed(resp) -> "list[tuple[str, dict]]":
     return out
 
 
+def _group_lag(groups, group: str) -> "Optional[int]":
+    """Pick ``group``'s ``lag`` out of an XINFO GROUPS response (names/keys may be bytes). ``None``
+    when the group is absent or the server does not report lag (Redis < 7 / an invalidated lag)."""
+    for entry in groups or []:
+        if not isinstance(entry, dict):
+            continue
+        info = {(k.decode() if isinstance(k, bytes) else k): v for k, v in entry.items()}
+        name = info.get("name")
+        if (name.decode() if isinstance(name, bytes) else name) != group:
+            continue
+        lag = info.get("lag")
+        try:
+            return int(lag) if lag is not None else None
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
 def _sha(s: str) -> str:
     return hashlib.sha256(s.encode()).hexdigest()
 
@@ -232,6 +260,34 @@ def _segment_to_api(seg: dict) -> dict:
     return out
 
 
+# Rows per multi-VALUES upsert statement: 9 bind params a row, so 500 rows stay far below the
+# Postgres 32767-parameter ceiling while keeping a finalize of a long meeting to a few round trips.
+UPSERT_CHUNK_SIZE = max(1, int(os.environ.get("DB_WRITER_UPSERT_CHUNK", "500")))
+
+_UPSERT_COLUMNS = ("mid", "start", "end", "text", "speaker", "lang", "uid", "segid", "created")
+
+
+def _bulk_upsert_statement(rows: list[dict]) -> tuple[str, dict]:
+    """One ``INSERT … VALUES (…), (…) ON CONFLICT (meeting_id, segment_id) DO UPDATE`` for ``rows``
+    (each keyed by ``_UPSERT_COLUMNS``) and its bind params — ``:<col>_<n>`` per row. The conflict
+    clause is the parent db-writer's, unchanged."""
+    values = []
+    params: dict = {}
+    for n, row in enumerate(rows):
+        values.append("(" + ", ".join(f":{col}_{n}" for col in _UPSERT_COLUMNS) + ")")
+        for col in _UPSERT_COLUMNS:
+            params[f"{col}_{n}"] = row[col]
+    stmt = f"""
+        INSERT INTO transcriptions (meeting_id, start_time, end_time, text, speaker, language, session_uid, segment_id, created_at)
+        VALUES {", ".join(values)}
+        ON CONFLICT (meeting_id, segment_id) WHERE segment_id IS NOT NULL
+        DO UPDATE SET text = EXCLUDED.text, speaker = EXCLUDED.speaker,
+                      start_time = EXCLUDED.start_time, end_time = EXCLUDED.end_time,
+                      language = EXCLUDED.language, created_at = EXCLUDED.created_at
+    """
+    return stmt, params
+
+
 class SqlAlchemyTranscriptStore:
     """``TranscriptStore`` over a SQLAlchemy-async ``session_factory`` (the ``meetings`` /
     ``transcriptions`` tables; recordings/notes live in ``meeting.data`` JSONB — NO separate
@@ -245,6 +301,10 @@ class SqlAlchemyTranscriptStore:
         # numeric meeting_id → (native_meeting_id, platform). The id→native map is immutable for a
         # meeting row, so cache it forever once resolved (bounded by the live meeting set).
         self._native_cache: dict[int, tuple[str, str]] = {}
+        # Assembled segments of TERMINAL meetings, keyed by the redis transcript version (see
+        # ``transcript_cache``). Without redis the version lives in this process only.
+        self._transcript_cache = TranscriptCache()
+        self._local_versions = LocalVersions()
 
     async def native_for(self, meeting_id) -> "Optional[tuple[str, str]]":
         """Resolve a NUMERIC meeting_id → (native_meeting_id, platform) from the meetings table.
@@ -279,25 +339,51 @@ class SqlAlchemyTranscriptStore:
     # session in scope. The response is byte-identical to the old single-pass build; only the
     # transaction scope changes. (See C2's tx-scope gate, which enforces this shape for good.)
 
-    async def _transcript_pg_part(self, db, meeting) -> "tuple[dict, dict, list]":
+    async def _transcript_pg_part(
+        self, db, meeting, window: "Optional[TranscriptWindow]" = None,
+    ) -> "tuple[dict, dict, list]":
         """DB-ONLY half: SELECT the persisted ``transcriptions`` for this row and SNAPSHOT every
         meeting-row field the response needs into plain values — all while the session is live.
         Returns ``(snap, seg_by_id, order)``. Nothing here awaits a non-DB backend, so the caller's
-        transaction stays scoped to Postgres statements only (#508).
-
-        The row fields are copied to a plain dict on purpose: after the session closes, touching an
-        expired ORM attribute raises ``MissingGreenlet`` — the same reason ``bot_spawn/adapters.py``
-        snapshots before returning (``:192-194``)."""
-        from sqlalchemy import select
+        transaction stays scoped to Postgres statements only (#508)."""
+        seg_by_id, order = await self._select_segments(db, meeting.id, window)
+        return self._snapshot_meeting(meeting), seg_by_id, order
+
+    async def _select_segments(
+        self, db, meeting_id: int, window: "Optional[TranscriptWindow]" = None,
+    ) -> "tuple[dict, list]":
+        """The persisted ``transcriptions`` of one meeting as api.v1 segments: ``(seg_by_id, order)``.
+
+        A ``window`` is pushed into the SQL: start-time bounds and the keyset cursor as predicates
+        over ``ix_transcription_meeting_start (meeting_id, start_time)``, ordered by the window's key
+        ``(start_time, segment_id)`` and LIMITed — a poll reads only the delta, not the transcript.
+        The segment_id tiebreak compares and orders under ``COLLATE "C"`` (bytewise), the order
+        Python's ``str`` comparison uses for the cursor and the live-hash merge; the database's
+        locale collation would page a tie differently and skip or repeat segments."""
+        from sqlalchemy import and_, func, literal, or_, select
 
         from .models import Transcription
 
-        seg_rows = (
-            await db.execute(
-                select(Transcription).where(Transcription.meeting_id == meeting.id)
-            )
-        ).scalars().all()
-        data = meeting.data if isinstance(meeting.data, dict) else {}
+        stmt = select(Transcription).where(Transcription.meeting_id == meeting_id)
+        if window is not None:
+            tiebreak = func.coalesce(Transcription.segment_id, "").collate("C")
+            if window.start_from is not None:
+                stmt = stmt.where(Transcription.start_time >= window.start_from)
+            if window.start_to is not None:
+                stmt = stmt.where(Transcription.start_time < window.start_to)
+            if window.after_start is not None:
+                if window.after_segment is None:
+                    stmt = stmt.where(Transcription.start_time > window.after_start)
+                else:
+                    stmt = stmt.where(or_(
+                        Transcription.start_time > window.after_start,
+                        and_(Transcription.start_time == window.after_start,
+                             tiebreak > literal(window.after_segment).collate("C")),
+                    ))
+            stmt = stmt.order_by(Transcription.start_time, tiebreak)
+            if window.limit:
+                stmt = stmt.limit(window.limit)
+        seg_rows = (await db.execute(stmt)).scalars().all()
         # Postgres-persisted segments (the background db-writer flush path).
         seg_by_id: dict = {}
         order: list = []
@@ -311,8 +397,15 @@ class SqlAlchemyTranscriptStore:
             if sid not in seg_by_id:
                 order.append(sid)
             seg_by_id[sid] = s
-        # Snapshot every field the response body reads, INSIDE the live session (see docstring).
-        snap = {
+        return seg_by_id, order
+
+    @staticmethod
+    def _snapshot_meeting(meeting) -> dict:
+        """Every meeting-row field the response body reads, copied to plain values INSIDE the live
+        session: after the session closes, touching an expired ORM attribute raises
+        ``MissingGreenlet`` — the same reason ``bot_spawn/adapters.py`` snapshots before returning
+        (``:192-194``)."""
+        return {
             "id": meeting.id,
             "platform": meeting.platform,
             "platform_specific_id": meeting.platform_specific_id,
@@ -320,12 +413,12 @@ class SqlAlchemyTranscriptStore:
             "start_time": meeting.start_time,
             "end_time": meeting.end_time,
             "created_at": meeting.created_at,
-            "data": data,
+            "data": meeting.data if isinstance(meeting.data, dict) else {},
         }
-        return snap, seg_by_id, order
 
     async def _merge_live_segments(
         self, pg: "tuple[dict, dict, list]", *, viewer_is_owner: bool,
+        window: "Optional[TranscriptWindow]" = None,
     ) -> dict:
         """POST-SESSION half: merge the LIVE Redis in-flight hash, sort, derive absolute times, and
         assemble the api.v1 ``TranscriptionResponse`` dict. NO database session is open here — this
@@ -342,33 +435,81 @@ class SqlAlchemyTranscriptStore:
         native-keyed read constrains ``Meeting.user_id == user_id`` in SQL, and the by-id read
         evaluates an explicit owner branch inside its authorization check. Passing the decision down
         beats re-deriving it here, where the caller's ``user_id`` is not even in scope."""
-        from .projection import project_response_data
-
         snap, seg_by_id, order = pg
-        data = snap["data"]
+        segments = await self._assemble_segments(snap, seg_by_id, order, window)
+        return self._transcript_response(snap, segments, viewer_is_owner=viewer_is_owner)
+
+    async def _assemble_segments(
+        self, snap: dict, seg_by_id: dict, order: list, window: "Optional[TranscriptWindow]" = None,
+    ) -> list:
+        """The response's ``segments``: the persisted ones merged with the live Redis hash, sorted,
+        absolute times derived. Viewer-independent — the cacheable part of a transcript read.
+
+        With a ``window`` the persisted rows arrive already windowed (``_select_segments``), the
+        live-hash entries outside it are skipped before they are mapped, and the merge is cut to the
+        window's key order + limit. A hash entry that moved OUT of the window also drops its stale
+        persisted copy — the hash is the newer of the two.
+
+        The SQL LIMIT runs before the merge, so when the hash overrides rows of a FULL persisted page
+        it can pop or move them and leave the page short of rows that sat just past the LIMIT — and
+        the ``X-Next-Cursor`` built from that page would skip them for good. That page is re-read
+        with ``limit + len(hash)`` rows (each hash entry displaces at most one), in a fresh session
+        opened after the Redis read (#508)."""
         # Merge the LIVE Redis hash of in-flight segments (``meeting:{id}:segments``) — the source
         # of truth before/until the db-writer flush. The carve had dropped this merge, so a transcript
         # whose segments are still only in Redis (every short/just-finished meeting) read as EMPTY.
-        if self._redis is not None:
-            try:
-                raw = await self._redis.hgetall(f"meeting:{snap['id']}:segments")
-                for v in (raw.values() if isinstance(raw, dict) else []):
-                    try:
-                        seg = json.loads(v.decode() if isinstance(v, (bytes, bytearray)) else v)
-                    except Exception:
-                        continue
-                    s = _segment_to_api(seg)
-                    sid = s.get("segment_id") or f"rh-{len(order)}"
-                    if sid not in seg_by_id:
-                        order.append(sid)
-                    seg_by_id[sid] = s
-            except Exception:
-                pass
-        segments = sorted((seg_by_id[k] for k in order), key=lambda s: (s.get("start") or 0.0))
+        live = await self._live_hash_segments(snap["id"])
+        if (window is not None and window.limit and len(order) >= window.limit
+                and self._session_factory is not None
+                and any(seg.get("segment_id") in seg_by_id for seg in live)):
+            async with self._session_factory() as db:
+                seg_by_id, order = await self._select_segments(
+                    db, snap["id"], replace(window, limit=window.limit + len(live)))
+        for seg in live:
+            if window is not None and not window.contains(seg):
+                seg_by_id.pop(seg.get("segment_id"), None)
+                continue
+            s = _segment_to_api(seg)
+            sid = s.get("segment_id") or f"rh-{len(order)}"
+            if sid not in seg_by_id:
+                order.append(sid)
+            seg_by_id[sid] = s
+        if window is not None:
+            segments = window.apply(seg_by_id[k] for k in order if k in seg_by_id)
+        else:
+            segments = sorted((seg_by_id[k] for k in order), key=lambda s: (s.get("start") or 0.0))
         # The dashboard's renderer SKIPS any segment without absolute_start_time
         # (use-vexa-websocket.ts: `if (!seg.absolute_start_time) continue`). Derive it when a producer
         # didn't supply it, so the historical transcript renders. See `_fill_absolute_times`.
         _fill_absolute_times(segments, snap["start_time"] or snap["created_at"])
+        return segments
+
+    async def _live_hash_segments(self, meeting_id: int) -> list:
+        """The parsed entries of the live Redis segment hash, or ``[]`` without Redis / on a read
+        error (a transcript read degrades to the persisted rows, never fails on the hash)."""
+        if self._redis is None:
+            return []
+        try:
+            raw = await self._redis.hgetall(f"meeting:{meeting_id}:segments")
+        except Exception:
+            return []
+        out = []
+        for v in (raw.values() if isinstance(raw, dict) else []):
+            try:
+                seg = json.loads(v.decode() if isinstance(v, (bytes, bytearray)) else v)
+            except Exception:
+                continue
+            if isinstance(seg, dict):
+                out.append(seg)
+        return out
+
+    @staticmethod
+    def _transcript_response(snap: dict, segments: list, *, viewer_is_owner: bool) -> dict:
+        """The api.v1 ``TranscriptionResponse`` for a snapshotted row + its assembled segments, with
+        ``data`` projected for THIS viewer (see ``_merge_live_segments``)."""
+        from .projection import project_response_data
+
+        data = snap["data"]
         return {
             "id": snap["id"],
             "platform": snap["platform"],
@@ -383,7 +524,7 @@ class SqlAlchemyTranscriptStore:
             "segments": segments,
         }
 
-    async def get_transcript(self, user_id, platform, native_meeting_id) -> Optional[dict]:
+    async def get_transcript(self, user_id, platform, native_meeting_id, window=None) -> Optional[dict]:
         from sqlalchemy import select  # lazy: SQLAlchemy not needed for the in-memory fakes
 
         from .models import Meeting  # local re-export of the admin-api models
@@ -405,13 +546,21 @@ class SqlAlchemyTranscriptStore:
             deletion_state = data.get("artifact_deletion") or {}
             if deletion_state and deletion_state.get("state", "completed") == "completed":
                 return None
-            pg = await self._transcript_pg_part(db, meeting)
+            if meeting.status in CACHEABLE_STATUSES:
+                snap = self._snapshot_meeting(meeting)
+                pg = None  # settled transcript — segments come from the versioned cache below
+            else:
+                pg = await self._transcript_pg_part(db, meeting, window)
         # Session closed (transaction ended, connection returned to pool) BEFORE the Redis merge (#508).
         # The SELECT above constrains ``Meeting.user_id == user_id``, so a row reached through this
         # path is by construction the caller's own — the native-keyed read has no share branch.
-        return await self._merge_live_segments(pg, viewer_is_owner=True)
+        if pg is None:
+            return await self._cached_transcript(snap, viewer_is_owner=True, window=window)
+        return await self._merge_live_segments(pg, viewer_is_owner=True, window=window)
 
-    async def get_transcript_by_id(self, user_id, meeting_id, member_workspaces=None) -> Optional[dict]:
+    async def get_transcript_by_id(
+        self, user_id, meeting_id, member_workspaces=None, window=None,
+    ) -> Optional[dict]:
         """Exact-row transcript for ``meeting.id == meeting_id``, authorized by the SAME three-way rule as
         authorize_subscribe: (a) owner, (b) member of the bound workspace, (c) redeemed a transcript-share
         link (``data.transcript_viewers``). Any other caller → ``None`` (→ 404), so it can never leak an
@@ -440,11 +589,74 @@ class SqlAlchemyTranscriptStore:
             )
             if not authorized:
                 return None
-            pg = await self._transcript_pg_part(db, meeting)
+            if meeting.status in CACHEABLE_STATUSES:
+                snap = self._snapshot_meeting(meeting)
+                pg = None  # settled transcript — segments come from the versioned cache below
+            else:
+                pg = await self._transcript_pg_part(db, meeting, window)
         # Session closed (transaction ended, connection returned to pool) BEFORE the Redis merge (#508).
         # The response projection reuses branch (a) above — the SAME decision that authorized this
         # read decides which tier of the blob it may carry, so the two can never disagree.
-        return await self._merge_live_segments(pg, viewer_is_owner=is_owner)
+        if pg is None:
+            return await self._cached_transcript(snap, viewer_is_owner=is_owner, window=window)
+        return await self._merge_live_segments(pg, viewer_is_owner=is_owner, window=window)
+
+    async def _cached_transcript(
+        self, snap: dict, *, viewer_is_owner: bool, window: "Optional[TranscriptWindow]" = None,
+    ) -> dict:
+        """A TERMINAL meeting's transcript through the versioned segment cache (``transcript_cache``).
+        The version is read BEFORE the rows, so a write racing this read can only leave a newer
+        assembly under the older version — which the writer's fresh version already supersedes. A
+        miss SELECTs the rows in a session of its own and assembles exactly as the live path does;
+        the viewer's projection is applied to the fresh row snapshot either way. The cache holds the
+        WHOLE transcript, so a ``window`` is cut from it in memory."""
+        mid = snap["id"]
+        version = await self._transcript_version(mid)
+        segments = self._transcript_cache.get(mid, version) if version is not None else None
+        if segments is None:
+            async with self._session_factory() as db:
+                seg_by_id, order = await self._select_segments(db, mid)
+            segments = await self._assemble_segments(snap, seg_by_id, order)
+            if version is not None:
+                self._transcript_cache.put(mid, version, segments)
+        segments = window.apply(segments) if window is not None else list(segments)
+        return self._transcript_response(snap, segments, viewer_is_owner=viewer_is_owner)
+
+    async def _transcript_version(self, meeting_id: int) -> Optional[str]:
+        """The meeting's current transcript version; a missing token is minted (SET NX) so the
+        next writer replaces something every replica agrees on. None ⇒ redis unreadable — the read
+        goes uncached rather than trusting a version it could not confirm."""
+        if self._redis is None:
+            return self._local_versions.current(meeting_id)
+        key = transcript_version_key(meeting_id)
+        try:
+            current = await self._redis.get(key)
+            if current is None:
+                await self._redis.set(key, new_version(), nx=True, ex=TRANSCRIPT_VERSION_TTL_S)
+                current = await self._redis.get(key)
+        except Exception:  # noqa: BLE001 — a cache-key read must never fail the transcript read
+            return None
+        if current is None:
+            return None
+        return current.decode() if isinstance(current, (bytes, bytearray)) else str(current)
+
+    async def _bump_transcript_version(self, meeting_id) -> None:
+        """Invalidate every replica's cached assembly of this meeting: replace its version token.
+        Called AFTER the write committed, so a reader that sees the new token also sees the write.
+        When redis cannot take the new token, this replica's entry is dropped at once and the
+        others' age out (``TRANSCRIPT_CACHE_MAX_AGE_S``)."""
+        try:
+            mid = int(meeting_id)
+        except (TypeError, ValueError):
+            return
+        if self._redis is None:
+            self._local_versions.bump(mid)
+            return
+        try:
+            await self._redis.set(transcript_version_key(mid), new_version(), ex=TRANSCRIPT_VERSION_TTL_S)
+        except Exception:  # noqa: BLE001 — best-effort; the cache's max age bounds the staleness
+            self._transcript_cache.discard(mid)
+            log.warning("transcript version bump failed for meeting %s", mid)
 
     async def list_meetings(self, user_id, *, status=None, platform=None, limit=None, offset=None,
                             member_workspaces=None, list_view=False, meeting_id=None, slim=False):
@@ -715,17 +927,47 @@ class SqlAlchemyTranscriptStore:
         # the background db-writer (``collector/db_writer.py``) — exactly the parent's
         # persistence-only path (0.10 ``processors.py``): the same pipeline SADDs the meeting into
         # ``active_meetings`` (the db-writer's sweep set) and re-arms the hash TTL, so an abandoned
-        # hash cannot linger forever once its segments were flushed.
+        # hash cannot linger forever once its segments were flushed. The settle index (the
+        # db-writer's ZRANGEBYSCORE of due segment ids) is written in the same MULTI, so it never
+        # disagrees with the hash about a field — as is the transcript-version bump, so a segment
+        # arriving for a settled meeting invalidates its cached assembly at no extra round trip.
         if self._redis is None:
             return
-        from .db_writer import ACTIVE_MEETINGS_KEY, segments_hash_key
+        from .db_writer import ACTIVE_MEETINGS_KEY, segments_hash_key, segments_index_key, settle_score
 
         hash_key = segments_hash_key(meeting_id)
+        index_key = segments_index_key(meeting_id)
         ttl = int(os.environ.get("REDIS_SEGMENT_TTL", "3600"))
         async with self._redis.pipeline(transaction=True) as pipe:
             pipe.sadd(ACTIVE_MEETINGS_KEY, str(meeting_id))
             pipe.hset(hash_key, segment["segment_id"], json.dumps(segment))
+            pipe.zadd(index_key, {segment["segment_id"]: settle_score(segment)})
             pipe.expire(hash_key, ttl)
+            pipe.expire(index_key, ttl)
+            pipe.set(transcript_version_key(meeting_id), new_version(), ex=TRANSCRIPT_VERSION_TTL_S)
+            await pipe.execute()
+
+    async def append_segments(self, meeting_id, segments) -> None:
+        # The batch form of ``append_segment``: ONE MULTI/EXEC for the whole batch — a single SADD, a
+        # multi-field HSET (later entries for a repeated segment_id win, as sequential HSETs would)
+        # and one TTL re-arm — instead of a transaction per segment; the settle index likewise gets
+        # one multi-member ZADD, and one version bump.
+        if self._redis is None or not segments:
+            return
+        from .db_writer import ACTIVE_MEETINGS_KEY, segments_hash_key, segments_index_key, settle_score
+
+        hash_key = segments_hash_key(meeting_id)
+        index_key = segments_index_key(meeting_id)
+        ttl = int(os.environ.get("REDIS_SEGMENT_TTL", "3600"))
+        mapping = {seg["segment_id"]: json.dumps(seg) for seg in segments}
+        scores = {seg["segment_id"]: settle_score(seg) for seg in segments}
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.sadd(ACTIVE_MEETINGS_KEY, str(meeting_id))
+            pipe.hset(hash_key, mapping=mapping)
+            pipe.zadd(index_key, scores)
+            pipe.expire(hash_key, ttl)
+            pipe.expire(index_key, ttl)
+            pipe.set(transcript_version_key(meeting_id), new_version(), ex=TRANSCRIPT_VERSION_TTL_S)
             await pipe.execute()
 
     async def delete_segments(self, meeting_id, segment_ids) -> None:
@@ -737,9 +979,10 @@ class SqlAlchemyTranscriptStore:
             return
         # Leg 1: drop from the redis flush hash (before the db-writer persists an un-flushed draft).
         if self._redis is not None:
-            from .db_writer import segments_hash_key
+            from .db_writer import segments_hash_key, segments_index_key
             try:
                 await self._redis.hdel(segments_hash_key(meeting_id), *ids)
+                await self._redis.zrem(segments_index_key(meeting_id), *ids)
             except Exception:  # noqa: BLE001 — best-effort; the DB delete is the durable backstop
                 pass
         # Leg 2: delete any already-flushed rows.
@@ -752,18 +995,25 @@ class SqlAlchemyTranscriptStore:
         async with self._session_factory() as db:
             await db.execute(stmt, {"mid": int(meeting_id), "sids": ids})
             await db.commit()
+        await self._bump_transcript_version(meeting_id)
 
     async def upsert_segments(self, meeting_id, segments) -> None:
         """The db-writer's durable sink — UPSERT a batch of flushed segments into ``transcriptions``
         on the segment identity ``(meeting_id, segment_id)`` (the partial unique index
         ``ix_transcription_meeting_segment`` in the admin-api authoritative schema), exactly the
         parent db-writer's ON CONFLICT statement: idempotent, a re-flushed rewrite lands as an
-        UPDATE, never a duplicate row."""
+        UPDATE, never a duplicate row.
+
+        The batch goes out as multi-row ``INSERT … VALUES (…), (…) … ON CONFLICT`` statements of at
+        most ``UPSERT_CHUNK_SIZE`` rows, all in ONE transaction — a 500-segment finalize is one round
+        trip instead of 500 while the pooled connection is held. A segment id repeated within the
+        batch keeps its LAST occurrence (what the row-at-a-time loop left behind; Postgres rejects a
+        statement that would update the same row twice)."""
         from datetime import datetime as _dt
 
         from sqlalchemy import text as sql_text  # lazy: not needed for the in-memory fakes
 
-        rows = []
+        by_segid: dict[str, dict] = {}
         for seg in segments:
             sid = seg.get("segment_id")
             if not sid:
@@ -775,28 +1025,22 @@ class SqlAlchemyTranscriptStore:
                 continue
             if end < start:
                 start, end = end, start
-            rows.append({
+            by_segid.pop(str(sid), None)  # re-insert so the batch keeps last-occurrence order
+            by_segid[str(sid)] = {
                 "mid": int(meeting_id), "start": start, "end": end,
                 "text": seg.get("text") or "", "speaker": seg.get("speaker"),
                 "lang": seg.get("language"), "uid": seg.get("session_uid"),
                 "segid": str(sid), "created": _dt.utcnow(),
-            })
+            }
+        rows = list(by_segid.values())
         if not rows:
             return
         async with self._session_factory() as db:
-            for row in rows:
-                await db.execute(
-                    sql_text("""
-                        INSERT INTO transcriptions (meeting_id, start_time, end_time, text, speaker, language, session_uid, segment_id, created_at)
-                        VALUES (:mid, :start, :end, :text, :speaker, :lang, :uid, :segid, :created)
-                        ON CONFLICT (meeting_id, segment_id) WHERE segment_id IS NOT NULL
-                        DO UPDATE SET text = EXCLUDED.text, speaker = EXCLUDED.speaker,
-                                      start_time = EXCLUDED.start_time, end_time = EXCLUDED.end_time,
-                                      language = EXCLUDED.language, created_at = EXCLUDED.created_at
-                    """),
-                    row,
-                )
+            for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+                stmt, params = _bulk_upsert_statement(rows[i:i + UPSERT_CHUNK_SIZE])
+                await db.execute(sql_text(stmt), params)
             await db.commit()
+        await self._bump_transcript_version(meeting_id)
 
     async def processed_view_cursor(self, meeting_id, view_id) -> Optional[str]:
         """The ``source_cursor`` of the ``view_id`` view inside ``meeting.data['processed']['views']``
@@ -838,6 +1082,7 @@ class SqlAlchemyTranscriptStore:
             )
             flag_modified(meeting, "data")
             await db.commit()
+        await self._bump_transcript_version(meeting_id)
 
     async def _mutate_docs(self, user_id, platform, native_meeting_id, mutator):
         """Owner-scoped atomic read→modify→write of ``meeting.data['docs']`` under ONE
@@ -1259,12 +1504,14 @@ class SqlAlchemyTranscriptStore:
             meeting.data = data
             flag_modified(meeting, "data")
             await db.commit()
+        await self._bump_transcript_version(meeting_id)
 
         # The DB tombstone makes this retryable: if Redis cleanup fails, a repeat reaches this same
         # terminal row and tries the cache/stream cleanup again without resurrecting durable data.
         if self._redis is not None:
             await self._redis.delete(
-                f"meeting:{meeting_id}:segments", f"proc:meeting:{meeting_id}"
+                f"meeting:{meeting_id}:segments", f"meeting:{meeting_id}:segments:settle",
+                f"proc:meeting:{meeting_id}",
             )
             await self._redis.srem("active_meetings", str(meeting_id))
         return True
@@ -1279,13 +1526,14 @@ class RedisStreamBus:
         self._reclaim_unsupported = False  # #636: log-once latch when the Redis lacks XAUTOCLAIM
         self._prune_unsupported = False  # #660: log-once latch when the Redis lacks XINFO CONSUMERS
 
-    async def read_segments(self, *, group, consumer, stream, count=10):
+    async def read_segments(self, *, group, consumer, stream, count=10, block_ms=None):
         try:
             await self._client.xgroup_create(name=stream, groupname=group, id="0", mkstream=True)
         except Exception:
             pass  # BUSYGROUP — group already exists
         resp = await self._client.xreadgroup(
-            groupname=group, consumername=consumer, streams={stream: ">"}, count=count
+            groupname=group, consumername=consumer, streams={stream: ">"}, count=count,
+            block=block_ms,
         )
         out: list[tuple[str, dict]] = []
         for _stream_name, messages in resp or []:
@@ -1371,6 +1619,17 @@ class RedisStreamBus:
             })
         return out
 
+    async def stream_lag(self, *, group, stream):
+        """XINFO GROUPS → the group's undelivered backlog (``lag``), or ``None`` when unknown. Never
+        raises: a missing stream/group or an older Redis just leaves the adaptive sizer blind."""
+        from redis.exceptions import ResponseError
+
+        try:
+            groups = await self._client.xinfo_groups(stream)
+        except ResponseError:
+            return None
+        return _group_lag(groups, group)
+
     async def delete_consumer(self, *, group, stream, consumer):
         """#660: XGROUP DELCONSUMER — returns the pending count the consumer held (0 for a ghost)."""
         return await self._client.xgroup_delconsumer(stream, group, consumer)
@@ -1382,11 +1641,30 @@ class RedisStreamBus:
     async def publish(self, channel, data):
         return await self._client.publish(channel, data)
 
+    async def publish_many(self, messages):
+        """Pipelined ``publish`` — every ``(channel, data)`` in ONE round trip, in list order."""
+        if not messages:
+            return []
+        async with self._client.pipeline(transaction=False) as pipe:
+            for channel, data in messages:
+                pipe.publish(channel, data)
+            return await pipe.execute()
+
     async def xadd(self, stream, payload):
         """Append one entry to a redis STREAM under the ``payload`` field — the native transcript feed
         ``tc:meeting:{native}`` the collector owns as single writer (P23)."""
         return await self._client.xadd(stream, {"payload": json.dumps(payload)})
 
+    async def xadd_many(self, stream, payloads):
+        """Pipelined ``xadd`` — every entry in ONE round trip, appended in list order (a plain
+        pipeline, not MULTI: the entries are independent and the stream keeps their order)."""
+        if not payloads:
+            return []
+        async with self._client.pipeline(transaction=False) as pipe:
+            for payload in payloads:
+                pipe.xadd(stream, {"payload": json.dumps(payload)})
+            return await pipe.execute()
+
 
 def build_production_app(
     *,
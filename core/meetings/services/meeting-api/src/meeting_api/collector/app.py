@@ -5,7 +5,10 @@ v0.12 carve of the deployed ``services/meeting-api/meeting_api/collector/endpoin
 
   * **GET /transcripts/{platform}/{native_meeting_id}** — the meeting's transcript document,
     conforming to api.v1 ``#/components/schemas/TranscriptionResponse`` (sealed). 404 when the
-    caller owns no such meeting.
+    caller owns no such meeting. Carries an ``ETag``; a matching ``If-None-Match`` gets a 304
+    (as does ``/transcripts/by-id/{meeting_id}``). Optional ``after`` cursor / ``start_from`` /
+    ``start_to`` / ``limit`` range the segments (``transcript_window``); a full page names its
+    successor in ``X-Next-Cursor``.
   * **GET /meetings** — the caller's meetings, conforming to api.v1
     ``#/components/schemas/MeetingListResponse`` (sealed). Optional ``status`` / ``platform`` /
     ``limit`` / ``offset`` filters (parent's ``get_meetings``).
@@ -40,6 +43,7 @@ from .meeting_link import parse_meeting_url
 from .obs import TraceMiddleware as _DefaultTraceMiddleware
 from .obs import log_event as _default_log_event
 from .ports import RedisBus, TranscriptStore
+from .transcript_window import TranscriptWindow, cursor_for
 
 
 # The two INTENT states the USER owns (pre-FSM). The user dropdown is the source of truth for
@@ -84,6 +88,49 @@ async def _publish_user_meeting_status(
                   span="meetings.intent.publish", fields={"error": str(e)})
 
 
+def _conditional_json(request: Request, doc: dict, headers: Optional[dict] = None) -> Response:
+    """``doc`` as a JSON response carrying a strong ``ETag`` (a digest of the exact body bytes), or
+    an empty ``304 Not Modified`` when the request's ``If-None-Match`` already names that ETag. A
+    client re-polling an unchanged transcript then costs a digest, not a multi-MB transfer."""
+    import hashlib
+
+    response = JSONResponse(content=doc, headers=headers)
+    etag = '"' + hashlib.sha256(response.body).hexdigest()[:32] + '"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison (RFC 9110 §13.1.2): a W/ prefix on the client's copy still matches.
+        candidates = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers={**(headers or {}), "ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
+
+def _transcript_window(
+    after: Optional[str], start_from: Optional[float], start_to: Optional[float], limit: Optional[int],
+) -> Optional[TranscriptWindow]:
+    """The transcript routes' range query params as a ``TranscriptWindow`` (None when absent);
+    a malformed ``after`` cursor is the client's error → 422."""
+    try:
+        return TranscriptWindow.from_query(
+            after=after, start_from=start_from, start_to=start_to, limit=limit,
+        )
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"Invalid 'after' cursor: {after!r}")
+
+
+def _page_headers(doc: dict, window: Optional[TranscriptWindow]) -> Optional[dict]:
+    """``X-Next-Cursor`` for a FULL page — the cursor resuming after its last segment. A page shorter
+    than ``limit`` is the end of the range, so it carries none. (A header, not a body field: the
+    api.v1 ``TranscriptionResponse`` is sealed.)"""
+    if window is None or not window.limit:
+        return None
+    segments = doc.get("segments") or []
+    if len(segments) < window.limit:
+        return None
+    return {"X-Next-Cursor": cursor_for(segments[-1])}
+
+
 def _resolve_user_id(x_user_id: Optional[str]) -> int:
     """The gateway injects ``x-user-id`` after it resolves ``x-api-key`` (anti-spoofing: it
     strips any client-supplied identity header first). Missing → 401 fail-closed."""
@@ -126,10 +173,18 @@ def build_router(
         request: Request,
         x_user_id: Optional[str] = Header(default=None),
         x_user_workspaces: Optional[str] = Header(default=None),
+        after: Optional[str] = Query(default=None),
+        start_from: Optional[float] = Query(default=None),
+        start_to: Optional[float] = Query(default=None),
+        limit: Optional[int] = Query(default=None, ge=1),
     ):
         user_id = _resolve_user_id(x_user_id)
         member_workspaces = {w.strip() for w in (x_user_workspaces or "").split(",") if w.strip()}
-        doc = await store.get_transcript_by_id(user_id, meeting_id, member_workspaces)
+        window = _transcript_window(after, start_from, start_to, limit)
+        if window is None:
+            doc = await store.get_transcript_by_id(user_id, meeting_id, member_workspaces)
+        else:
+            doc = await store.get_transcript_by_id(user_id, meeting_id, member_workspaces, window=window)
         if doc is None:
             log_event(
                 "transcript_not_found", audience="system", level="warning",
@@ -141,7 +196,7 @@ def build_router(
             user_id=user_id, meeting_id=str(meeting_id),
             fields={"segments": len(doc.get("segments", []))},
         )
-        return JSONResponse(content=doc)
+        return _conditional_json(request, doc, _page_headers(doc, window))
 
     # --- GET /transcripts/{platform}/{native_meeting_id} → api.v1 TranscriptionResponse ---
     @router.get("/transcripts/{platform}/{native_meeting_id}")
@@ -150,9 +205,17 @@ def build_router(
         native_meeting_id: str,
         request: Request,
         x_user_id: Optional[str] = Header(default=None),
+        after: Optional[str] = Query(default=None),
+        start_from: Optional[float] = Query(default=None),
+        start_to: Optional[float] = Query(default=None),
+        limit: Optional[int] = Query(default=None, ge=1),
     ):
         user_id = _resolve_user_id(x_user_id)
-        doc = await store.get_transcript(user_id, platform, native_meeting_id)
+        window = _transcript_window(after, start_from, start_to, limit)
+        if window is None:
+            doc = await store.get_transcript(user_id, platform, native_meeting_id)
+        else:
+            doc = await store.get_transcript(user_id, platform, native_meeting_id, window=window)
         if doc is None:
             log_event(
                 "transcript_not_found",
@@ -175,7 +238,7 @@ def build_router(
             meeting_id=f"{platform}/{native_meeting_id}",
             fields={"segments": len(doc.get("segments", []))},
         )
-        return JSONResponse(content=doc)
+        return _conditional_json(request, doc, _page_headers(doc, window))
 
     # A planned meeting belongs to schedule/preparation surfaces until a bot run claims it.
     # Keep the set explicit so list pagination can exclude plans in SQL rather than making
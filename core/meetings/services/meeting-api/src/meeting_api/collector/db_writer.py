@@ -19,6 +19,10 @@ Parent semantics, kept exactly:
   * **trim policy** — flushed (and empty-text) hash fields are HDEL'd **only after** the sink
     confirms the durable write; a failed write leaves the hash intact for the next tick. When a
     hash drains empty its meeting id leaves the ``active_meetings`` set.
+  * **settle index** — beside each hash, ``meeting:{id}:segments:settle`` (a sorted set written in
+    the same transaction) scores every segment id by the time its hold ends, so a tick
+    ``ZRANGEBYSCORE``s the settled ids and ``HMGET``s only those; the full HGETALL scan remains for
+    finalize (threshold 0) and for a hash the index does not fully cover (written pre-index).
   * **discovery** — the ``active_meetings`` set (maintained ATOMICALLY with every hash write by
     ``append_segment`` — one transactional sadd+hset+expire) is authoritative in steady state, so a
     tick sweeps the SET alone. The self-healing ``meeting:*:segments`` key scan — for a hash written
@@ -31,6 +35,9 @@ Additions over the parent:
   * ``finalize_meeting(...)`` — the completion hook: flush EVERYTHING left (threshold 0, mutable
     tail included) the moment the lifecycle FSM lands on a terminal status, so a completed meeting's
     transcript is durable immediately instead of eventually.
+  * **concurrent sweep** — meetings are flushed through a bounded semaphore
+    (``DB_WRITER_CONCURRENCY``) instead of one after another, so a tick's wall time no longer grows
+    linearly with live meetings; per-meeting ordering and isolation are unchanged.
   * ``flush_meeting_processed(...)`` — drain the copilot's cleaned-notes stream
     (``proc:meeting:{meeting_id}``, agent-worker the single writer, P23) into the meeting row's
     ``data['processed']`` JSONB (the documented meeting.data home; NO schema change), resuming
@@ -55,15 +62,37 @@ is unit-tested offline, no docker.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Awaitable, Callable, Iterable, Optional
+
+from ..db import engine_pool_kwargs, pool_ceiling
+from ..obs import histogram
 
 log = logging.getLogger("meeting_api.collector.db_writer")
 
 ACTIVE_MEETINGS_KEY = "active_meetings"
+# How many meetings one tick flushes at once. The per-meeting work is a handful of redis round trips
+# plus one durable upsert and a cursor read — all I/O — so a sequential sweep grew linearly with live
+# meetings and overran DB_WRITER_INTERVAL_S at a few hundred. Bounded by the engine pool the writer
+# shares with the request handlers: the default is the steady DB_POOL_SIZE, leaving the overflow to
+# the handlers, and an explicit value is capped below the pool ceiling (DB_POOL_SIZE +
+# DB_MAX_OVERFLOW) so a flush wave can never queue the handlers on pool checkout. 1 restores the
+# sequential sweep.
+_WRITER_POOL_HEADROOM = 2  # connections a flush wave always leaves to the request handlers
+
+
+def _writer_concurrency() -> int:
+    default = engine_pool_kwargs()["pool_size"]
+    wanted = int(os.environ.get("DB_WRITER_CONCURRENCY", "0")) or default
+    return max(1, min(wanted, pool_ceiling() - _WRITER_POOL_HEADROOM))
+
+
+DB_WRITER_CONCURRENCY = _writer_concurrency()
 IMMUTABILITY_THRESHOLD = float(os.environ.get("IMMUTABILITY_THRESHOLD", "30"))
 
 # ── the hold is a per-LANE guarantee, not a global one (M21, 2026-08-13) ────────────────────────
@@ -199,6 +228,26 @@ def segments_hash_key(meeting_id) -> str:
     return f"meeting:{meeting_id}:segments"
 
 
+def segments_index_key(meeting_id) -> str:
+    """The hash's companion SETTLE INDEX — a sorted set of its segment ids, each scored by the epoch
+    second the segment may become durable (``settle_score``). Written in the SAME transaction as the
+    hash field (``append_segment``), so a tick ``ZRANGEBYSCORE``s exactly the settled ids and
+    ``HMGET``s only those instead of HGETALL-and-parse of the whole (mostly mutable) hash."""
+    return f"meeting:{meeting_id}:segments:settle"
+
+
+def settle_score(seg: dict) -> float:
+    """When ``seg`` leaves its mutability hold: ``updated_at`` + its lane's threshold
+    (``threshold_for`` against ``IMMUTABILITY_THRESHOLD``). Scoring the SETTLE time rather than the
+    raw ``updated_at`` keeps the per-lane holds a single range query — a confirmed Teams CSRC row is
+    settled the moment it lands while its gmeet neighbours wait out the full window. No parseable
+    ``updated_at`` ⇒ 0 (immediately flushable, as the full scan treats it)."""
+    updated_at = _parse_updated_at(seg.get("updated_at"))
+    if updated_at is None:
+        return 0.0
+    return updated_at.timestamp() + threshold_for(seg, IMMUTABILITY_THRESHOLD)
+
+
 def proc_stream_key(meeting_id) -> str:
     """The copilot's cleaned-notes stream for ONE meeting row — keyed by the NUMERIC meeting id
     (unique per row) so a re-sent bot on the same native link can never mix/clobber a previous
@@ -217,7 +266,7 @@ def _parse_updated_at(raw: Optional[str]) -> Optional[datetime]:
         s = raw[:-1] + "+00:00" if raw.endswith("Z") else raw
         dt = datetime.fromisoformat(s)
         return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, AttributeError):
         return None
 
 
@@ -235,10 +284,20 @@ async def flush_meeting_segments(
     threshold = IMMUTABILITY_THRESHOLD if immutability_threshold is None else immutability_threshold
     now = now or datetime.now(timezone.utc)
     hash_key = segments_hash_key(meeting_id)
-    raw = await redis_c.hgetall(hash_key)
+    index_key = segments_index_key(meeting_id)
+    raw = None
+    if immutability_threshold is None:
+        # The steady-state tick: only the SETTLED fields, via the settle index. None ⇒ the index
+        # can't vouch for the whole hash (a pre-index field) — fall back to the full scan.
+        raw = await _settled_fields(redis_c, meeting_id, now)
+        if raw == {}:
+            return 0  # nothing settled yet; the hash is non-empty, so the meeting stays active
+    if raw is None:
+        raw = await redis_c.hgetall(hash_key)
     if not raw:
         try:
             await redis_c.srem(ACTIVE_MEETINGS_KEY, str(meeting_id))
+            await redis_c.delete(index_key)
         except Exception:  # noqa: BLE001 — set upkeep is best-effort
             pass
         return 0
@@ -273,21 +332,50 @@ async def flush_meeting_segments(
         except Exception:
             import os as _os
             try:
-                await redis_c.expire(hash_key, int(_os.environ.get("REDIS_SEGMENT_TTL", "3600")))
+                ttl = int(_os.environ.get("REDIS_SEGMENT_TTL", "3600"))
+                await redis_c.expire(hash_key, ttl)
+                await redis_c.expire(index_key, ttl)
             except Exception:  # noqa: BLE001 — best-effort re-arm; the original error matters more
                 pass
             raise
     if done_fields:
         await redis_c.hdel(hash_key, *done_fields)
+        await redis_c.zrem(index_key, *done_fields)
     remaining = await redis_c.hlen(hash_key)
     if not remaining:
         try:
             await redis_c.srem(ACTIVE_MEETINGS_KEY, str(meeting_id))
+            await redis_c.delete(index_key)
         except Exception:  # noqa: BLE001
             pass
     return len(batch)
 
 
+async def _settled_fields(redis_c, meeting_id: int, now: datetime) -> "Optional[dict]":
+    """The hash fields whose settle score is due at ``now`` — ``ZRANGEBYSCORE`` the settle index then
+    ``HMGET`` just those, so the cost scales with the settled count, not the hash size. ``{}`` when
+    the hash is non-empty but nothing has settled. ``None`` when the index can't be trusted to cover
+    the hash (empty hash, or fewer index members than fields — a hash written before the index
+    existed): the caller then does the full HGETALL scan, exactly as before. Index members whose
+    field is already gone (expired/retracted) are pruned here."""
+    hash_key = segments_hash_key(meeting_id)
+    index_key = segments_index_key(meeting_id)
+    try:
+        fields = await redis_c.hlen(hash_key)
+        if not fields or await redis_c.zcard(index_key) < fields:
+            return None
+        ids = await redis_c.zrangebyscore(index_key, "-inf", now.timestamp())
+    except Exception:  # noqa: BLE001 — an unreadable index must never block the flush; full scan
+        return None
+    if not ids:
+        return {}
+    values = await redis_c.hmget(hash_key, ids)
+    stale = [field for field, value in zip(ids, values) if value is None]
+    if stale:
+        await redis_c.zrem(index_key, *stale)
+    return {field: value for field, value in zip(ids, values) if value is not None}
+
+
 async def flush_meeting_processed(redis_c, sink, meeting_id: int) -> int:
     """Drain NEW entries of the meeting's processed-notes stream (``proc:meeting:{meeting_id}``,
     written by the agent worker) into the copilot view of the meeting row's
@@ -359,6 +447,18 @@ async def _processed_complete(redis_c, sink, meeting_id: int) -> bool:
     return await cursor_of(meeting_id, PROC_VIEW_ID) == _s(entry_id)
 
 
+async def _fan_out(items: Iterable, work: Callable[..., Awaitable], concurrency: int) -> list:
+    """Run ``work(item)`` for every item, at most ``concurrency`` at a time; results in item order.
+    ``work`` owns its own error isolation — an exception escaping it propagates."""
+    gate = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(item):
+        async with gate:
+            return await work(item)
+
+    return await asyncio.gather(*(_one(item) for item in items))
+
+
 async def db_writer_tick(
     redis_c,
     sink,
@@ -366,16 +466,25 @@ async def db_writer_tick(
     immutability_threshold: Optional[float] = None,
     now: Optional[datetime] = None,
     reconcile: bool = False,
+    concurrency: Optional[int] = None,
 ) -> int:
     """ONE db-writer sweep (the loop body ``__main__`` polls): flush every discovered meeting's
     immutable segments to the durable sink, then drain its processed-notes stream. Returns the total
     segments stored. Per-meeting failures are contained — one bad meeting never starves the rest.
 
+    Meetings are flushed CONCURRENTLY, at most ``concurrency`` (default ``DB_WRITER_CONCURRENCY``)
+    at a time. Each meeting's own steps stay strictly ordered (upsert → HDEL → processed drain), so
+    trim-after-confirm holds per meeting exactly as in the sequential sweep. The tick's wall time and
+    each meeting's flush latency are recorded as ``db_writer.tick_s`` / ``db_writer.meeting_flush_s``.
+
     Discovery is the ``active_meetings`` set (authoritative in steady state — ``append_segment`` SADDs
     the meeting in the SAME transaction that writes its hash). ``reconcile=True`` ADDITIONALLY runs the
     O(keyspace) ``meeting:*:segments`` scan to self-heal a set/hash divergence or a pre-set (mid-upgrade)
     hash; it is OFF the per-tick hot path (``reconcile`` defaults False) because that scan saturated
     Redis and starved the /health probe (#893) — the loop runs it only on startup + every N minutes."""
+    started = time.perf_counter()
+    limit = DB_WRITER_CONCURRENCY if concurrency is None else concurrency
+    meeting_latency = histogram("db_writer.meeting_flush_s")
     ids: set[str] = set()
     try:
         members = await redis_c.smembers(ACTIVE_MEETINGS_KEY)
@@ -391,20 +500,26 @@ async def db_writer_tick(
         except Exception:  # noqa: BLE001
             pass
 
-    total = 0
-    for raw_id in ids:
+    async def _flush_one(raw_id: str) -> int:
         try:
             meeting_id = int(raw_id)
         except (TypeError, ValueError):
-            continue
+            return 0
+        t0 = time.perf_counter()
         try:
-            total += await flush_meeting_segments(
+            stored = await flush_meeting_segments(
                 redis_c, sink, meeting_id,
                 immutability_threshold=immutability_threshold, now=now,
             )
             await flush_meeting_processed(redis_c, sink, meeting_id)
+            return stored
         except Exception:  # noqa: BLE001 — isolate per meeting; the next tick retries
             log.exception("db-writer flush failed for meeting %s", raw_id)
+            return 0
+        finally:
+            meeting_latency.observe(time.perf_counter() - t0)
+
+    total = sum(await _fan_out(ids, _flush_one, limit))
 
     # Finalized-but-incomplete processed streams (ADR 0027): re-drain each parked meeting until its
     # view_end marker is drained-through, or its deadline passes. These meetings have LEFT the sweep
@@ -415,13 +530,15 @@ async def db_writer_tick(
     except Exception:  # noqa: BLE001 — the pending pass is additive; never break the main sweep
         pending = []
     now_ts = (now or datetime.now(timezone.utc)).timestamp()
-    for member, deadline in pending or []:
+
+    async def _redrain_one(entry) -> None:
+        member, deadline = entry
         raw_id = _s(member)
         try:
             meeting_id = int(raw_id)
         except (TypeError, ValueError):
             await redis_c.zrem(PROC_PENDING_KEY, member)
-            continue
+            return
         try:
             await flush_meeting_processed(redis_c, sink, meeting_id)
             if await _processed_complete(redis_c, sink, meeting_id):
@@ -438,6 +555,8 @@ async def db_writer_tick(
         except Exception:  # noqa: BLE001 — isolate per meeting; the next tick retries
             log.exception("pending processed re-drain failed for meeting %s", raw_id)
 
+    await _fan_out(pending or [], _redrain_one, limit)
+
     # #527 C2: bound the ingest stream in steady state (trims only acked entries past the retention
     # window; never an unread one). Isolated — a trim failure never blocks the durable flush above.
     try:
@@ -445,6 +564,7 @@ async def db_writer_tick(
         await _trim_segments_stream(redis_c, STREAM_RETENTION_S, now_ms)
     except Exception:  # noqa: BLE001
         log.exception("segment stream retention trim failed")
+    histogram("db_writer.tick_s").observe(time.perf_counter() - started)
     return total
 
 
@@ -115,12 +115,13 @@ class InMemoryTranscriptStore:
         matches.sort(key=lambda kv: (kv[1].get("created_at") or "", kv[0]), reverse=True)
         return matches[0][0]
 
-    async def _transcript_doc(self, mid, *, viewer_is_owner: bool) -> dict:
+    async def _transcript_doc(self, mid, *, viewer_is_owner: bool, window=None) -> dict:
         """Build the api.v1 ``TranscriptionResponse`` for row ``mid`` — shared by ``get_transcript``
         (native → newest) and ``get_transcript_by_id`` (exact row). Keyed by the row id ``mid``, so a
         by-id read returns exactly that row's segments/notes. Mirrors the real store's viewer-aware
         response projection, ``viewer_is_owner`` included — the fake and the real store must agree on
-        what a share recipient receives, since most of the suite drives the fake."""
+        what a share recipient receives, since most of the suite drives the fake. A ``window``
+        (``transcript_window.TranscriptWindow``) slices the merged segments the same way."""
         from .projection import project_response_data
 
         m = self._meetings[mid]
@@ -137,7 +138,10 @@ class InMemoryTranscriptStore:
                 sid = seg.get("segment_id")
                 if sid:
                     by_id[sid] = seg
-        segments = sorted(by_id.values(), key=lambda s: float(s.get("start", 0.0)))
+        if window is not None:
+            segments = window.apply(by_id.values())
+        else:
+            segments = sorted(by_id.values(), key=lambda s: float(s.get("start", 0.0)))
         return {
             "id": mid,
             "platform": m["platform"],
@@ -152,7 +156,7 @@ class InMemoryTranscriptStore:
             "segments": [_segment_to_api(s) for s in segments],
         }
 
-    async def get_transcript(self, user_id, platform, native_meeting_id) -> Optional[dict]:
+    async def get_transcript(self, user_id, platform, native_meeting_id, window=None) -> Optional[dict]:
         mid = self._find(user_id, platform, native_meeting_id)
         if mid is None:
             return None
@@ -161,9 +165,11 @@ class InMemoryTranscriptStore:
             return None
         # ``_find`` matches on ``m["user_id"] == user_id`` (mirroring the real store's SQL), so a row
         # reached by the native-keyed path is always the caller's own.
-        return await self._transcript_doc(mid, viewer_is_owner=True)
+        return await self._transcript_doc(mid, viewer_is_owner=True, window=window)
 
-    async def get_transcript_by_id(self, user_id, meeting_id, member_workspaces=None) -> Optional[dict]:
+    async def get_transcript_by_id(
+        self, user_id, meeting_id, member_workspaces=None, window=None,
+    ) -> Optional[dict]:
         """Exact-row transcript authorized by owner OR transcript-viewer OR bound-workspace member (mirrors
         authorize_subscribe) — any other caller → ``None`` (a different tenant's row never leaks)."""
         try:
@@ -184,7 +190,9 @@ class InMemoryTranscriptStore:
             or (bool(member_workspaces) and data.get("workspace_id") in member_workspaces)
         )
         # Same decision, two uses: whether the read is allowed, and which tier of ``data`` it carries.
-        return await self._transcript_doc(mid, viewer_is_owner=is_owner) if authorized else None
+        if not authorized:
+            return None
+        return await self._transcript_doc(mid, viewer_is_owner=is_owner, window=window)
 
     async def list_meetings(self, user_id, *, status=None, platform=None, limit=None, offset=None,
                             member_workspaces=None, list_view=False, meeting_id=None, slim=False):
@@ -580,7 +588,8 @@ class InMemoryTranscriptStore:
         m["data"] = data
         if self._redis is not None:
             await self._redis.delete(
-                f"meeting:{meeting_id}:segments", f"proc:meeting:{meeting_id}"
+                f"meeting:{meeting_id}:segments", f"meeting:{meeting_id}:segments:settle",
+                f"proc:meeting:{meeting_id}",
             )
             await self._redis.srem("active_meetings", str(meeting_id))
         return True
@@ -604,23 +613,49 @@ class InMemoryTranscriptStore:
             # Prod-topology mode: live segments land in the redis HASH (+ the db-writer's
             # active_meetings sweep set), exactly like SqlAlchemyTranscriptStore.append_segment;
             # only the db-writer tick moves them into the durable dict.
-            from .db_writer import ACTIVE_MEETINGS_KEY, segments_hash_key
+            from .db_writer import ACTIVE_MEETINGS_KEY, segments_hash_key, segments_index_key, settle_score
 
             await self._redis.sadd(ACTIVE_MEETINGS_KEY, str(meeting_id))
             await self._redis.hset(
                 segments_hash_key(meeting_id), segment["segment_id"], json.dumps(segment)
             )
+            await self._redis.zadd(
+                segments_index_key(meeting_id), {segment["segment_id"]: settle_score(segment)}
+            )
             return
         self._row_or_placeholder(meeting_id)["segments"][segment["segment_id"]] = segment
 
+    async def append_segments(self, meeting_id, segments) -> None:
+        """Batch ``append_segment`` — one SADD + one multi-field HSET in prod-topology mode (the same
+        shape as ``SqlAlchemyTranscriptStore.append_segments``), last-write-wins in list order."""
+        if not segments:
+            return
+        if self._redis is not None:
+            from .db_writer import ACTIVE_MEETINGS_KEY, segments_hash_key, segments_index_key, settle_score
+
+            await self._redis.sadd(ACTIVE_MEETINGS_KEY, str(meeting_id))
+            await self._redis.hset(
+                segments_hash_key(meeting_id),
+                mapping={seg["segment_id"]: json.dumps(seg) for seg in segments},
+            )
+            await self._redis.zadd(
+                segments_index_key(meeting_id),
+                {seg["segment_id"]: settle_score(seg) for seg in segments},
+            )
+            return
+        stored = self._row_or_placeholder(meeting_id)["segments"]
+        for seg in segments:
+            stored[seg["segment_id"]] = seg
+
     async def delete_segments(self, meeting_id, segment_ids) -> None:
         ids = [str(s) for s in (segment_ids or []) if s]
         if not ids:
             return
         if self._redis is not None:
-            from .db_writer import segments_hash_key
+            from .db_writer import segments_hash_key, segments_index_key
 
             await self._redis.hdel(segments_hash_key(meeting_id), *ids)
+            await self._redis.zrem(segments_index_key(meeting_id), *ids)
             return
         segs = self._row_or_placeholder(meeting_id)["segments"]
         for sid in ids:
@@ -672,13 +707,23 @@ class FakeRedisBus:
         field is ``payload`` (the parent's stream field name)."""
         return await self._client.xadd(stream, {"payload": json.dumps(payload)})
 
-    async def read_segments(self, *, group, consumer, stream, count=10):
+    async def xadd_many(self, stream: str, payloads: list) -> list:
+        """Mirror of ``RedisStreamBus.xadd_many`` — one fakeredis pipeline, list order kept."""
+        if not payloads:
+            return []
+        async with self._client.pipeline(transaction=False) as pipe:
+            for payload in payloads:
+                pipe.xadd(stream, {"payload": json.dumps(payload)})
+            return await pipe.execute()
+
+    async def read_segments(self, *, group, consumer, stream, count=10, block_ms=None):
         try:
             await self._client.xgroup_create(name=stream, groupname=group, id="0", mkstream=True)
         except Exception:
             pass
         resp = await self._client.xreadgroup(
-            groupname=group, consumername=consumer, streams={stream: ">"}, count=count
+            groupname=group, consumername=consumer, streams={stream: ">"}, count=count,
+            block=block_ms,
         )
         out: list[tuple[str, dict]] = []
         for _stream_name, messages in resp or []:
@@ -728,6 +773,18 @@ class FakeRedisBus:
             })
         return out
 
+    async def stream_lag(self, *, group, stream):
+        """Mirror of ``RedisStreamBus.stream_lag`` (fakeredis reports XINFO GROUPS ``lag``)."""
+        from redis.exceptions import ResponseError
+
+        from .adapters import _group_lag
+
+        try:
+            groups = await self._client.xinfo_groups(stream)
+        except ResponseError:
+            return None
+        return _group_lag(groups, group)
+
     async def delete_consumer(self, *, group, stream, consumer):
         return await self._client.xgroup_delconsumer(stream, group, consumer)
 
@@ -738,3 +795,13 @@ class FakeRedisBus:
     async def publish(self, channel, data):
         self.published.append((channel, data))
         return await self._client.publish(channel, data)
+
+    async def publish_many(self, messages):
+        """Mirror of ``RedisStreamBus.publish_many`` — every pair is logged to ``published`` too."""
+        if not messages:
+            return []
+        self.published.extend(messages)
+        async with self._client.pipeline(transaction=False) as pipe:
+            for channel, data in messages:
+                pipe.publish(channel, data)
+            return await pipe.execute()
@@ -10,9 +10,17 @@ This carve splits that into a pure, explicitly-driven core:
   * ``ingest(store, redis, message)`` — process ONE stream message: parse the JSON ``payload``,
     append each valid segment to the store, publish one ``:mutable`` update per meeting. Returns
     the number of segments persisted.
+  * ``ingest_batch(store, redis, messages)`` — the pipelined form of ``ingest`` over a whole read
+    batch: every segment a batch carries for one meeting lands in ONE store write
+    (``append_segments`` — a single SADD + multi-field HSET + EXPIRE transaction) and ONE pipelined
+    run of native-feed XADDs (``xadd_many``), instead of two round trips per segment.
   * ``consume_segments(store, redis, ...)`` — drain a batch from the bus (``read_segments`` →
-    ``ingest`` each → ``ack``). No background loop: the eval calls this explicitly, like the
+    ``ingest_batch`` → ``ack``). No background loop: the eval calls this explicitly, like the
     runtime scheduler's ``tick()`` — same in ⇒ same out.
+  * ``consume_adaptive(store, redis, sizer, ...)`` — the same drain for the always-on loop: a
+    blocking ``XREADGROUP BLOCK`` read sized by an ``AdaptiveBatchSize`` that grows while the group
+    lag (XINFO) outruns a batch and shrinks once reads come back under-filled. Records batch size,
+    lag and ingest latency into the ``meeting_api.obs`` histograms.
 
 The ``:mutable`` payload mirrors the bot's live publisher
 (``services/vexa-bot_new/src/adapters/transcript-redis.ts``):
@@ -23,6 +31,7 @@ from __future__ import annotations
 import json
 import os
 import socket
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -48,6 +57,12 @@ RECLAIM_MIN_IDLE_MS = int(os.environ.get("COLLECTOR_RECLAIM_MIN_IDLE_MS", "60000
 # which re-registers on its very next XREADGROUP — is never mistaken for a ghost. The ``pending == 0``
 # guard is the load-bearing safety: a consumer still holding an in-flight batch is NEVER pruned.
 CONSUMER_TTL_MS = int(os.environ.get("COLLECTOR_CONSUMER_TTL_MS", str(30 * 60 * 1000)))
+# Adaptive consumer: the read size floats between these bounds (``AdaptiveBatchSize``), and each
+# read parks server-side for up to SEGMENT_CONSUMER_BLOCK_MS waiting for new entries. Keep the block
+# well under the Redis client's socket_timeout (10s) so a quiet stream never reads as a dead socket.
+BATCH_MIN = int(os.environ.get("SEGMENT_BATCH_MIN", "10"))
+BATCH_MAX = int(os.environ.get("SEGMENT_BATCH_MAX", "500"))
+READ_BLOCK_MS = int(os.environ.get("SEGMENT_CONSUMER_BLOCK_MS", "2000"))
 
 
 def _mutable_channel(meeting_id: int) -> str:
@@ -157,6 +172,75 @@ def _log_publish_failure(meeting_id: int, e: Exception) -> None:
         pass
 
 
+def _decode_payload(message: dict) -> Optional[dict]:
+    """The JSON ``payload`` field of one decoded stream message, or ``None`` when it is absent or
+    unparseable (the message is then skipped — and still acked — like any other malformed entry)."""
+    payload_raw = message.get("payload")
+    if not payload_raw:
+        return None
+    try:
+        data = json.loads(payload_raw) if isinstance(payload_raw, (str, bytes)) else payload_raw
+    except (json.JSONDecodeError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _parse_transcription(data: dict) -> Optional["tuple[int, list[dict]]"]:
+    """A ``transcription`` / ``transcript`` payload → ``(meeting_id, valid segments)``, or ``None``
+    when the payload is any other message type or lacks a numeric meeting id / segment list. The
+    segments are filtered + normalized through ``_coerce_segment`` (possibly leaving none)."""
+    if data.get("type", "transcription") not in ("transcription", "transcript"):
+        return None
+    try:
+        meeting_id = int(data.get("meeting_id"))
+    except (TypeError, ValueError):
+        return None
+    raw_segments = data.get("segments")
+    if not isinstance(raw_segments, list):
+        return None
+    persisted = [seg for seg in (_coerce_segment(raw) for raw in raw_segments) if seg is not None]
+    return meeting_id, persisted
+
+
+async def _mutable_update(
+    store: TranscriptStore, meeting_id: int, data: dict, persisted: list[dict]
+) -> "tuple[str, str, str]":
+    """Build the change-only ``:mutable`` update for one message's persisted segments →
+    ``(channel, payload_json, wire_uid)``; ``wire_uid`` is what the native-feed entries carry (the
+    native id when known, else the row id)."""
+    # A change-only mutable update (bot's live-path shape). ``confirmed`` carries the completed
+    # segments, ``pending`` the drafts — the dashboard renders both.
+    confirmed = [s for s in persisted if s["completed"]]
+    pending = [s for s in persisted if not s["completed"]]
+    speaker = persisted[0].get("speaker") or ""
+    # Stamp the NATIVE meeting id (and platform) so the agent-api live relay can re-key
+    # numeric→native WITHOUT a user-scoped /meetings lookup (which fails for any meeting not owned
+    # by the relay's bot key → segments never reach the terminal's native channel). The collector
+    # owns the mapping (it persists by meeting_id); best-effort — a miss leaves it numeric-only.
+    # PREFER the native id the producer STAMPED on the segment (P23: one writer, no re-derivation —
+    # and no DB lookup that can miss, which left tc:meeting:{native} empty and the copilot starved).
+    # Fall back to the store mapping only for older bots that don't stamp it.
+    native_id = data.get("native_meeting_id")
+    platform_native = data.get("platform")
+    if not native_id:
+        pair = await _resolve_native(store, meeting_id)
+        native_id, platform_native = pair if pair else (None, None)
+    payload = json.dumps({
+        "type": "transcript",
+        "meeting": {"id": meeting_id, "native_id": native_id, "platform": platform_native},
+        "speaker": speaker,
+        "confirmed": confirmed,
+        "pending": pending,
+        "ts": _now_iso(),
+    })
+    return _mutable_channel(meeting_id), payload, native_id or str(meeting_id)
+
+
+def _feed_entries(wire_uid: str, persisted: list[dict]) -> list[dict]:
+    """The native-feed wire entries for ``persisted`` (in order) — empty-text segments are skipped."""
+    return [_to_native_wire(wire_uid, seg) for seg in persisted if (seg.get("text") or "").strip()]
+
+
 async def ingest(store: TranscriptStore, redis: RedisBus, message: dict) -> int:
     """Process ONE ``transcription_segments`` stream message.
 
@@ -166,12 +250,8 @@ async def ingest(store: TranscriptStore, redis: RedisBus, message: dict) -> int:
 
     Trusted internal stream (the bot is the producer): ``meeting_id`` comes from the payload.
     """
-    payload_raw = message.get("payload")
-    if not payload_raw:
-        return 0
-    try:
-        data = json.loads(payload_raw) if isinstance(payload_raw, (str, bytes)) else payload_raw
-    except (json.JSONDecodeError, ValueError):
+    data = _decode_payload(message)
+    if data is None:
         return 0
 
     msg_type = data.get("type", "transcription")
@@ -220,60 +300,22 @@ async def ingest(store: TranscriptStore, redis: RedisBus, message: dict) -> int:
         except Exception as e:  # noqa: BLE001 — best-effort live fan-out
             _log_publish_failure(meeting_id, e)
         return 0
-    if msg_type not in ("transcription", "transcript"):
-        # session_start / speaker events are out of scope for this segment unit.
-        return 0
-
-    try:
-        meeting_id = int(data.get("meeting_id"))
-    except (TypeError, ValueError):
-        return 0
 
-    raw_segments = data.get("segments")
-    if not isinstance(raw_segments, list):
+    # session_start / speaker events are out of scope for this segment unit.
+    parsed = _parse_transcription(data)
+    if parsed is None:
         return 0
-
-    persisted: list[dict] = []
-    for raw in raw_segments:
-        seg = _coerce_segment(raw)
-        if seg is None:
-            continue
+    meeting_id, persisted = parsed
+    for seg in persisted:
         await store.append_segment(meeting_id, seg)
-        persisted.append(seg)
 
     if persisted:
-        # Publish a change-only mutable update (bot's live-path shape). ``confirmed`` carries the
-        # completed segments, ``pending`` the drafts — the dashboard renders both.
-        confirmed = [s for s in persisted if s["completed"]]
-        pending = [s for s in persisted if not s["completed"]]
-        speaker = persisted[0].get("speaker") or ""
-        # Stamp the NATIVE meeting id (and platform) so the agent-api live relay can re-key
-        # numeric→native WITHOUT a user-scoped /meetings lookup (which fails for any meeting not owned
-        # by the relay's bot key → segments never reach the terminal's native channel). The collector
-        # owns the mapping (it persists by meeting_id); best-effort — a miss leaves it numeric-only.
-        # PREFER the native id the producer STAMPED on the segment (P23: one writer, no re-derivation —
-        # and no DB lookup that can miss, which left tc:meeting:{native} empty and the copilot starved).
-        # Fall back to the store mapping only for older bots that don't stamp it.
-        native_id = data.get("native_meeting_id")
-        platform_native = data.get("platform")
-        if not native_id:
-            pair = await _resolve_native(store, meeting_id)
-            native_id, platform_native = pair if pair else (None, None)
-        # FAULT-ISOLATED (P18): the segments are already persisted (durable). A transient redis blip on
-        # the live publish must NOT propagate out of ingest() — that would abort the batch BEFORE
+        channel, update, wire_uid = await _mutable_update(store, meeting_id, data, persisted)
+        # FAULT-ISOLATED (P18): the segments are already persisted (durable). A transient redis blip
+        # on the live publish must NOT propagate out of ingest() — that would abort the batch BEFORE
         # consume_segments acks it. Surface it and return the persisted count.
         try:
-            await redis.publish(
-                _mutable_channel(meeting_id),
-                json.dumps({
-                    "type": "transcript",
-                    "meeting": {"id": meeting_id, "native_id": native_id, "platform": platform_native},
-                    "speaker": speaker,
-                    "confirmed": confirmed,
-                    "pending": pending,
-                    "ts": _now_iso(),
-                }),
-            )
+            await redis.publish(channel, update)
         except Exception as e:  # noqa: BLE001 — publish is best-effort; persistence already succeeded
             _log_publish_failure(meeting_id, e)
         # P23/P0: the collector is the SINGLE writer of the transcript feed tc:meeting:{meeting_id}
@@ -282,18 +324,85 @@ async def ingest(store: TranscriptStore, redis: RedisBus, message: dict) -> int:
         # unconditionally now (no longer gated on native resolution — the row id is always in scope). The
         # native id still rides in the wire payload for DISPLAY. Empty-text segments are skipped.
         stream = _transcript_stream(meeting_id)
-        wire_uid = native_id or str(meeting_id)
-        for seg in persisted:
-            if not (seg.get("text") or "").strip():
-                continue
+        for entry in _feed_entries(wire_uid, persisted):
             try:
-                await redis.xadd(stream, _to_native_wire(wire_uid, seg))
+                await redis.xadd(stream, entry)
             except Exception as e:  # noqa: BLE001 — best-effort; persistence already succeeded
                 _log_publish_failure(meeting_id, e)
 
     return len(persisted)
 
 
+async def _flush_coalesced(
+    store: TranscriptStore, redis: RedisBus, pending: "list[tuple[int, dict, list[dict]]]"
+) -> int:
+    """Persist + fan out the transcription messages ``ingest_batch`` buffered, in arrival order.
+
+    Segments are grouped per meeting into ONE ``append_segments`` write (arrival order kept, so a
+    segment_id repeated inside the batch still resolves last-write-wins). Each message keeps its
+    own ``:mutable`` update (the payload shape is per-message) but they all go out in ONE
+    ``publish_many`` pipeline, and each meeting's feed entries go out as ONE ordered
+    ``xadd_many``. Returns the segments persisted."""
+    by_meeting: dict[int, list[dict]] = {}
+    for meeting_id, _data, persisted in pending:
+        if persisted:
+            by_meeting.setdefault(meeting_id, []).extend(persisted)
+    for meeting_id, segments in by_meeting.items():
+        await store.append_segments(meeting_id, segments)
+
+    updates: list[tuple[str, str]] = []
+    feeds: dict[int, list[dict]] = {}
+    for meeting_id, data, persisted in pending:
+        if not persisted:
+            continue
+        channel, update, wire_uid = await _mutable_update(store, meeting_id, data, persisted)
+        updates.append((channel, update))
+        feeds.setdefault(meeting_id, []).extend(_feed_entries(wire_uid, persisted))
+    # FAULT-ISOLATED (P18), as in ``ingest``: the segments are durable already; a publish blip is
+    # surfaced, never raised (raising would skip the ack and re-deliver the whole batch).
+    try:
+        await redis.publish_many(updates)
+    except Exception as e:  # noqa: BLE001 — publish is best-effort; persistence already succeeded
+        for meeting_id in feeds:  # every meeting whose update rode the failed pipeline
+            _log_publish_failure(meeting_id, e)
+    for meeting_id, entries in feeds.items():
+        if not entries:
+            continue
+        try:
+            await redis.xadd_many(_transcript_stream(meeting_id), entries)
+        except Exception as e:  # noqa: BLE001 — best-effort; persistence already succeeded
+            _log_publish_failure(meeting_id, e)
+    return sum(len(segments) for segments in by_meeting.values())
+
+
+async def ingest_batch(store: TranscriptStore, redis: RedisBus, messages: "list[dict]") -> int:
+    """Process a read batch of ``transcription_segments`` messages with pipelined writes.
+
+    Same result as calling ``ingest`` on each message in order, but consecutive transcription
+    messages are coalesced: each meeting's segments cost one ``append_segments`` transaction and
+    one pipelined run of feed XADDs rather than two round trips per segment. A control message
+    (``session_end`` / ``transcript_retract``) first flushes everything buffered before it, so the
+    feed keeps its order (a ``session_end`` marker never lands ahead of the segments it closes, a
+    retract never races the append it withdraws). The batch's ``:mutable`` updates share one
+    publish pipeline. Returns the total persisted segments."""
+    total = 0
+    pending: list[tuple[int, dict, list[dict]]] = []
+    for message in messages:
+        data = _decode_payload(message)
+        parsed = _parse_transcription(data) if data is not None else None
+        if parsed is not None:
+            meeting_id, persisted = parsed
+            pending.append((meeting_id, data, persisted))
+            continue
+        if pending:
+            total += await _flush_coalesced(store, redis, pending)
+            pending = []
+        total += await ingest(store, redis, message)
+    if pending:
+        total += await _flush_coalesced(store, redis, pending)
+    return total
+
+
 async def consume_segments(
     store: TranscriptStore,
     redis: RedisBus,
@@ -302,20 +411,98 @@ async def consume_segments(
     group: str = CONSUMER_GROUP,
     consumer: str = CONSUMER_NAME,
     count: int = 10,
+    pipelined: bool = True,
 ) -> int:
-    """Drain ONE batch from the bus: read → ingest each → ack. Returns the total segments
-    persisted across the batch. No background loop — the caller drives it (eval ``tick``)."""
+    """Drain ONE batch from the bus: read → ingest → ack. Returns the total segments
+    persisted across the batch. No background loop — the caller drives it (eval ``tick``).
+
+    ``pipelined`` (default) runs the batch through ``ingest_batch`` — one store transaction and one
+    feed pipeline per meeting; ``False`` keeps the per-message ``ingest`` path. Either way the batch
+    is acked only after every message in it was processed."""
     batch = await redis.read_segments(group=group, consumer=consumer, stream=stream, count=count)
     total = 0
-    acked: list[str] = []
-    for message_id, fields in batch:
-        total += await ingest(store, redis, fields)
-        acked.append(message_id)
+    acked = [message_id for message_id, _fields in batch]
+    if pipelined:
+        total = await ingest_batch(store, redis, [fields for _message_id, fields in batch])
+    else:
+        for _message_id, fields in batch:
+            total += await ingest(store, redis, fields)
     if acked:
         await redis.ack(group=group, stream=stream, message_ids=acked)
     return total
 
 
+class AdaptiveBatchSize:
+    """The adaptive consumer's read size. A FULL read whose group lag is still at least one more
+    batch deep (or unknown) doubles ``count``; a full read that drained the backlog holds it; an
+    UNDER-FILLED read (the stream is caught up) halves it back toward ``minimum``. Clamped to
+    ``[minimum, maximum]`` — the ceiling bounds how much one tick holds un-acked in the PEL."""
+
+    def __init__(self, minimum: int = BATCH_MIN, maximum: int = BATCH_MAX):
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum))
+        self.count = self.minimum
+
+    def update(self, *, read: int, lag: Optional[int]) -> int:
+        """Fold one read's outcome in and return the next ``count``."""
+        if read >= self.count:
+            if lag is None or lag >= self.count:
+                self.count = min(self.maximum, self.count * 2)
+        else:
+            self.count = max(self.minimum, self.count // 2)
+        return self.count
+
+
+async def _stream_lag(redis: RedisBus, *, group: str, stream: str) -> Optional[int]:
+    fn = getattr(redis, "stream_lag", None)
+    if fn is None:
+        return None
+    try:
+        return await fn(group=group, stream=stream)
+    except Exception:  # noqa: BLE001 — sizing signal only; never fail the tick on it
+        return None
+
+
+async def consume_adaptive(
+    store: TranscriptStore,
+    redis: RedisBus,
+    sizer: AdaptiveBatchSize,
+    *,
+    stream: str = STREAM_NAME,
+    group: str = CONSUMER_GROUP,
+    consumer: str = CONSUMER_NAME,
+    block_ms: Optional[int] = READ_BLOCK_MS,
+) -> int:
+    """Drain ONE adaptively-sized batch: blocking read → ``ingest_batch`` → ack, then resize.
+
+    The read blocks up to ``block_ms`` for new entries (``None``/``0`` → a plain non-blocking read),
+    so the loop driving this needs no sleep between ticks. The group lag is only asked for after a
+    FULL read — an under-filled read already proves the backlog was drained, so an idle consumer
+    costs one round trip per tick, not two. Histograms (``meeting_api.obs``): ``collector.batch_size``,
+    ``collector.stream_lag`` and ``collector.ingest_latency_s`` (ingest + ack of one batch). Returns
+    the segments persisted."""
+    from ..obs import SIZE_BUCKETS, histogram
+
+    count = sizer.count
+    batch = await redis.read_segments(
+        group=group, consumer=consumer, stream=stream, count=count, block_ms=block_ms or None,
+    )
+    total = 0
+    lag: Optional[int] = 0
+    if batch:
+        started = time.monotonic()
+        total = await ingest_batch(store, redis, [fields for _message_id, fields in batch])
+        await redis.ack(group=group, stream=stream, message_ids=[m for m, _f in batch])
+        histogram("collector.ingest_latency_s").observe(time.monotonic() - started)
+        if len(batch) >= count:
+            lag = await _stream_lag(redis, group=group, stream=stream)
+    histogram("collector.batch_size", SIZE_BUCKETS).observe(len(batch))
+    if lag is not None:
+        histogram("collector.stream_lag", SIZE_BUCKETS).observe(lag)
+    sizer.update(read=len(batch), lag=lag)
+    return total
+
+
 async def reclaim_segments(
     store: TranscriptStore,
     redis: RedisBus,
@@ -14,6 +14,9 @@ The core is a tiny factory keyed by service name (``make_log_event`` / ``make_tr
 so the in-process conformance chain can stand up a collector-bound emitter that shares the
 gateway's MODULE-GLOBAL contextvars — modelling, in one process, the contextvar propagation
 the real cross-process services get via ``X-Trace-Id``.
+
+The collector's metrics (ingest latency, batch size, stream lag, cache hits …) record into the
+service-wide registry in ``meeting_api.obs``, served at ``GET /metrics``.
 """
 from __future__ import annotations
 
@@ -30,15 +30,19 @@ class TranscriptStore(Protocol):
     home — there is NO separate recordings table)."""
 
     async def get_transcript(
-        self, user_id: int, platform: str, native_meeting_id: str
+        self, user_id: int, platform: str, native_meeting_id: str, window: Any = None,
     ) -> Optional[dict]:
         """The transcript document for ``(user, platform, native_id)`` — an api.v1
         ``TranscriptionResponse``-shaped dict (id, platform, status, start/end, segments[], …),
-        or ``None`` when the user owns no such meeting (the route maps ``None`` → 404)."""
+        or ``None`` when the user owns no such meeting (the route maps ``None`` → 404).
+
+        ``window`` (a ``transcript_window.TranscriptWindow``) limits ``segments`` to a cursor /
+        start-time range / page size; None is the whole transcript. Both read methods take it."""
         ...
 
     async def get_transcript_by_id(
-        self, user_id: int, meeting_id: int, member_workspaces: "Optional[set[str]]" = None
+        self, user_id: int, meeting_id: int, member_workspaces: "Optional[set[str]]" = None,
+        window: Any = None,
     ) -> Optional[dict]:
         """The transcript document for a SPECIFIC meeting ROW (``meeting.id``), authorized by owner OR
         transcript-share viewer OR bound-workspace member (``member_workspaces``) — the same api.v1
@@ -103,6 +107,13 @@ class TranscriptStore(Protocol):
         persistence)."""
         ...
 
+    async def append_segments(self, meeting_id: int, segments: list) -> None:
+        """Persist a batch of ingested segments for ``meeting_id`` in ONE write — the same per-segment
+        semantics as ``append_segment`` (keyed by ``segment_id``, last-write-wins in list order), but a
+        single transaction instead of one per segment. ``ingest_batch`` coalesces a read batch into
+        one call per meeting."""
+        ...
+
     async def delete_segments(self, meeting_id: int, segment_ids: list) -> None:
         """Withdraw retracted drafts by ``segment_id``: drop them from the live segments hash (before an
         un-flushed draft reaches Postgres) AND delete any already-flushed rows. Idempotent — a missing id
@@ -271,8 +282,18 @@ class RedisBus(Protocol):
     """
 
     async def read_segments(
-        self, *, group: str, consumer: str, stream: str, count: int = 10
+        self, *, group: str, consumer: str, stream: str, count: int = 10,
+        block_ms: Optional[int] = None,
     ) -> list[tuple[str, dict]]:
+        """XREADGROUP up to ``count`` new entries. ``block_ms`` turns it into a blocking read
+        (``XREADGROUP BLOCK``): the call parks server-side until an entry arrives or the timeout
+        lapses, so an idle consumer needs no client-side sleep/poll. ``None`` → non-blocking."""
+        ...
+
+    async def stream_lag(self, *, group: str, stream: str) -> Optional[int]:
+        """The group's backlog — entries not yet delivered to any consumer (the ``lag`` field of
+        ``XINFO GROUPS``). ``None`` when the server cannot say (no group yet, or a Redis < 7 that
+        does not report lag); the adaptive consumer then sizes from the batch fill alone."""
         ...
 
     async def reclaim_orphans(
@@ -304,8 +325,18 @@ class RedisBus(Protocol):
 
     async def publish(self, channel: str, data: str) -> Any: ...
 
+    async def publish_many(self, messages: list[tuple[str, str]]) -> Any:
+        """PUBLISH several ``(channel, data)`` pairs, in order, in one pipelined round trip — the
+        batch form of ``publish`` ``ingest_batch`` uses for a batch's ``:mutable`` updates."""
+        ...
+
     async def xadd(self, stream: str, payload: dict) -> Any:
         """Append one entry to a redis STREAM (``payload`` is the inner JSON, stored under the
         ``payload`` field). The collector is the SINGLE writer of the per-meeting native transcript
         feed ``tc:meeting:{native}`` (P23) — the copilot worker + terminal SSE read it."""
         ...
+
+    async def xadd_many(self, stream: str, payloads: list[dict]) -> Any:
+        """Append several entries to ONE stream, in order, in a single pipelined round trip — the
+        batch form of ``xadd`` ``ingest_batch`` uses for a meeting's feed entries."""
+        ...
@@ -0,0 +1,126 @@
+"""Versioned cache of ASSEMBLED transcript segments for terminal meetings.
+
+A completed/failed meeting's transcript cannot change on its own, yet every read of it re-SELECTs
+every ``transcriptions`` row, re-maps each through ``_segment_to_api``, sorts, and re-derives
+absolute times — and dashboards and MCP tools re-fetch the same finished transcripts constantly.
+``SqlAlchemyTranscriptStore`` therefore keeps the assembled segment list per meeting here, tagged
+with the meeting's TRANSCRIPT VERSION, and serves it while the version is unchanged.
+
+The version is an opaque token in redis (``meeting:{id}:transcript_version``) that every writer
+able to change what a read returns REPLACES with a fresh one — ``append_segment(s)``,
+``upsert_segments``, ``delete_segments``, ``merge_processed_view`` and the artifact-deletion steps. Replacing (not
+INCR-ing) means a key that expired or was never written can never re-issue a value an old cache
+entry still carries: a missing key is re-minted fresh on read, which is simply a miss. Every replica
+reads the same key, so one replica's db-writer flush invalidates every replica's cache. A bump
+that fails (redis unreachable) drops the writing replica's own entry; the other replicas' entries
+expire after ``TRANSCRIPT_CACHE_MAX_AGE_S``, which bounds how long a missed bump can go unseen.
+
+Only the segment list is cached. The meeting row is still read (and authorized) per request, and
+the per-viewer ``data`` projection is applied to that fresh row after the cache — so a cached
+entry is viewer-independent and can never carry one viewer's tier of the blob to another.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from ..obs import counter
+
+# The meeting statuses whose transcript is settled — only these are cached.
+CACHEABLE_STATUSES = frozenset({"completed", "failed"})
+
+TRANSCRIPT_CACHE_SIZE = int(os.environ.get("TRANSCRIPT_CACHE_SIZE", "256"))
+# Longest a cached assembly is served, whatever its version says — the bound on staleness when a
+# writer's version bump could not reach redis.
+TRANSCRIPT_CACHE_MAX_AGE_S = float(os.environ.get("TRANSCRIPT_CACHE_MAX_AGE_S", "300"))
+# Lifetime of a version token. Only bounds the key's footprint: an expired token is re-minted on
+# the next read (one miss), never reused.
+TRANSCRIPT_VERSION_TTL_S = int(os.environ.get("TRANSCRIPT_VERSION_TTL_S", str(7 * 24 * 3600)))
+
+
+def transcript_version_key(meeting_id) -> str:
+    return f"meeting:{meeting_id}:transcript_version"
+
+
+def new_version() -> str:
+    """A fresh version token — never equal to one issued before it."""
+    return str(time.time_ns())
+
+
+class TranscriptCache:
+    """A bounded LRU of ``meeting_id → (version, segments)``. One entry per meeting: a ``put`` at a
+    new version replaces the old one, so a stale version is never retained next to the live one.
+    ``get`` only returns segments stored under exactly the version asked for, and no older than
+    ``max_age_s``. Hits and misses are counted as ``transcript_cache.hit`` /
+    ``transcript_cache.miss`` in the service registry."""
+
+    def __init__(self, maxsize: int = TRANSCRIPT_CACHE_SIZE,
+                 max_age_s: float = TRANSCRIPT_CACHE_MAX_AGE_S):
+        self.maxsize = maxsize
+        self.max_age_s = max_age_s
+        self._entries: "OrderedDict[int, tuple[str, list, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, meeting_id: int, version: str) -> Optional[list]:
+        with self._lock:
+            entry = self._entries.get(meeting_id)
+            if entry is not None and time.monotonic() - entry[2] > self.max_age_s:
+                del self._entries[meeting_id]
+                entry = None
+            if entry is None or entry[0] != version:
+                counter("transcript_cache.miss").inc()
+                return None
+            self._entries.move_to_end(meeting_id)
+            counter("transcript_cache.hit").inc()
+            return entry[1]
+
+    def put(self, meeting_id: int, version: str, segments: list) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[meeting_id] = (version, segments, time.monotonic())
+            self._entries.move_to_end(meeting_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, meeting_id: int) -> None:
+        with self._lock:
+            self._entries.pop(meeting_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LocalVersions:
+    """The version tokens of a store without redis (they live in this process only): a bounded LRU
+    of ``meeting_id → token``. An evicted meeting is re-minted a fresh token on its next read — a
+    cache miss, never a stale hit."""
+
+    def __init__(self, maxsize: int = TRANSCRIPT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._tokens: "OrderedDict[int, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def current(self, meeting_id: int) -> str:
+        with self._lock:
+            token = self._tokens.get(meeting_id)
+            if token is None:
+                token = new_version()
+            self._store(meeting_id, token)
+            return token
+
+    def bump(self, meeting_id: int) -> None:
+        with self._lock:
+            self._store(meeting_id, new_version())
+
+    def _store(self, meeting_id: int, token: str) -> None:
+        self._tokens[meeting_id] = token
+        self._tokens.move_to_end(meeting_id)
+        while len(self._tokens) > max(self.maxsize, 1):
+            self._tokens.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
@@ -0,0 +1,90 @@
+"""Range-scoped transcript reads — the ``after`` cursor, the start-time window and the page ``limit``.
+
+A client polling a long LIVE meeting used to re-download the whole transcript every few seconds.
+The transcript routes accept an optional window instead, and the stores push it down: the real
+store into SQL (``start_time`` predicates over ``ix_transcription_meeting_start`` on
+``(meeting_id, start_time)``, ordered and LIMITed there), the live-hash merge and the in-memory
+fake through ``TranscriptWindow.apply`` — so a poll costs O(delta), not O(transcript).
+
+Segments are ordered by the KEY ``(start, segment_id)`` — ``start`` alone ties whenever two
+speakers begin together, and a keyset cursor needs a total order. The cursor is that key as text,
+``"<start>/<segment_id>"`` (or a bare ``"<start>"`` for "strictly after this start time"); the
+route hands the last returned segment's cursor back in ``X-Next-Cursor`` when a page came back
+full. Nothing is added to the sealed api.v1 body.
+
+This module is what the router, the real store (``adapters.py``) and the fake (``fakes.py``) share,
+so the three can never disagree on what a window selects.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+
+def segment_key(seg: dict) -> "tuple[float, str]":
+    """The total order a window pages through: ``(start, segment_id)`` (a missing id sorts first)."""
+    try:
+        start = float(seg.get("start", seg.get("start_time", 0.0)) or 0.0)
+    except (TypeError, ValueError):
+        start = 0.0
+    return start, str(seg.get("segment_id") or "")
+
+
+def cursor_for(seg: dict) -> str:
+    """The ``after`` cursor that resumes strictly after ``seg``."""
+    start, sid = segment_key(seg)
+    return f"{start!r}/{sid}"
+
+
+@dataclass(frozen=True)
+class TranscriptWindow:
+    """Which slice of a transcript a read returns. Every bound is optional; all given bounds apply.
+
+    ``after_start``/``after_segment`` — keyset cursor: only segments whose key is strictly greater
+    than ``(after_start, after_segment)`` (``after_segment`` None ⇒ strictly after the start time).
+    ``start_from``/``start_to`` — ``start_from <= start < start_to``. ``limit`` — at most this many
+    segments, the first ones in key order."""
+
+    after_start: Optional[float] = None
+    after_segment: Optional[str] = None
+    start_from: Optional[float] = None
+    start_to: Optional[float] = None
+    limit: Optional[int] = None
+
+    @classmethod
+    def from_query(
+        cls,
+        *,
+        after: Optional[str] = None,
+        start_from: Optional[float] = None,
+        start_to: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> "Optional[TranscriptWindow]":
+        """The window the route's query params describe, or None when they describe none (the
+        unwindowed read, byte-identical to before). Raises ``ValueError`` on a malformed cursor."""
+        after_start = after_segment = None
+        if after:
+            head, sep, tail = after.partition("/")
+            after_start = float(head)
+            after_segment = tail if sep else None
+        window = cls(after_start, after_segment, start_from, start_to, limit)
+        return window if window != cls() else None
+
+    def contains(self, seg: dict) -> bool:
+        """Whether ``seg`` falls inside the window's bounds (``limit`` aside)."""
+        key = segment_key(seg)
+        start = key[0]
+        if self.start_from is not None and start < self.start_from:
+            return False
+        if self.start_to is not None and start >= self.start_to:
+            return False
+        if self.after_start is not None:
+            if self.after_segment is None:
+                return start > self.after_start
+            return key > (self.after_start, self.after_segment)
+        return True
+
+    def apply(self, segments: Iterable[dict]) -> list:
+        """The window's slice of ``segments``: in-bounds, key-ordered, cut to ``limit``."""
+        page = sorted((s for s in segments if self.contains(s)), key=segment_key)
+        return page[: self.limit] if self.limit else page
@@ -0,0 +1,82 @@
+"""Compiled-once validators for the sealed contracts meeting-api checks at its seams.
+
+Every seam check used to build a fresh ``jsonschema.Draft202012Validator`` for
+``{"$ref": "<$id>#/$defs/<shape>"}`` over a fresh-per-call resolver — for every bot lifecycle
+callback and every webhook envelope built. Construction itself is cheap, but each new validator
+starts with a cold ``$ref`` resolver, so every call re-walked the registry for the same shape.
+``validator(schema, shape)`` returns ONE validator per ``(schema $id, shape)``, built the first
+time and reused after (modules ``precompile`` their shapes at import, so the first request pays
+nothing either); its resolver stays warm across calls.
+
+Two entry points:
+
+* ``conforms(obj, schema, shape)`` — always validates. For inputs (a bot's lifecycle POST).
+* ``self_check(obj, schema, shape)`` — for objects meeting-api built itself, where validation
+  only guards our own code. Runs on a ``CONTRACT_SELF_CHECK_SAMPLE`` fraction of calls (default
+  ``1`` = every call, the historical behaviour). A deployment can dial it down once the builders
+  are trusted. A sampled-in call that fails still raises, so a regression surfaces at that rate.
+"""
+from __future__ import annotations
+
+import os
+import random
+import threading
+from typing import Any, Dict, Iterable, Tuple
+
+import jsonschema
+from referencing import Registry, Resource
+
+from .obs import counter
+
+#: Fraction of ``self_check`` calls that actually validate (1 = all, 0 = none).
+SELF_CHECK_SAMPLE = float(os.environ.get("CONTRACT_SELF_CHECK_SAMPLE", "1"))
+
+_validators: Dict[Tuple[str, str], jsonschema.Draft202012Validator] = {}
+_registries: Dict[str, Registry] = {}
+_lock = threading.Lock()
+
+
+def registry(schema: dict) -> Registry:
+    """The registry holding ``schema`` under its ``$id`` (one per schema id)."""
+    sid = schema["$id"]
+    with _lock:
+        reg = _registries.get(sid)
+        if reg is None:
+            reg = _registries[sid] = Registry().with_resource(sid, Resource.from_contents(schema))
+        return reg
+
+
+def validator(schema: dict, shape: str) -> jsonschema.Draft202012Validator:
+    """The cached validator for ``<schema $id>#/$defs/<shape>``."""
+    key = (schema["$id"], shape)
+    v = _validators.get(key)
+    if v is None:
+        reg = registry(schema)
+        with _lock:
+            v = _validators.get(key)
+            if v is None:
+                v = _validators[key] = jsonschema.Draft202012Validator(
+                    {"$ref": f"{schema['$id']}#/$defs/{shape}"}, registry=reg
+                )
+    return v
+
+
+def precompile(schema: dict, shapes: Iterable[str]) -> None:
+    """Build (and warm) the validators for ``shapes`` now, at import, not on the first request."""
+    for shape in shapes:
+        validator(schema, shape).is_valid({})  # resolves the $ref chain once
+
+
+def conforms(obj: Any, schema: dict, shape: str) -> None:
+    """Validate ``obj`` against ``<schema>#/$defs/<shape>`` (raises ``ValidationError``)."""
+    validator(schema, shape).validate(obj)
+
+
+def self_check(obj: Any, schema: dict, shape: str, *, sample: float | None = None) -> None:
+    """``conforms`` for objects we built ourselves, on a ``sample`` fraction of calls
+    (default ``SELF_CHECK_SAMPLE``). Skips are counted as ``contract_self_check.skipped``."""
+    rate = SELF_CHECK_SAMPLE if sample is None else sample
+    if rate < 1 and (rate <= 0 or random.random() >= rate):
+        counter("contract_self_check.skipped").inc()
+        return
+    validator(schema, shape).validate(obj)
@@ -35,6 +35,12 @@ def engine_pool_kwargs() -> dict:
     }
 
 
+def pool_ceiling() -> int:
+    """The most connections one engine opens at once: ``pool_size + max_overflow`` (15 by default)."""
+    kw = engine_pool_kwargs()
+    return kw["pool_size"] + kw["max_overflow"]
+
+
 def build_engine(database_url: str):
     """Construct the async engine with the env-steered pool (the single seam)."""
     from sqlalchemy.ext.asyncio import create_async_engine
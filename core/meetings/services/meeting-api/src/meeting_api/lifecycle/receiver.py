@@ -19,8 +19,8 @@ from typing import Any, Dict, Optional
 import jsonschema
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from referencing import Registry, Resource
 
+from .. import contract_validation
 from .machine import IllegalTransition, LifecycleSink, MeetingStore, TransitionSource
 from .webhook import build_status_change_envelope, build_typed_envelope
 from ..obs import TraceMiddleware, log_event
@@ -46,14 +46,13 @@ def _load_lifecycle_schema() -> dict:
 
 
 _SCHEMA = _load_lifecycle_schema()
-_REGISTRY = Registry().with_resource(_SCHEMA["$id"], Resource.from_contents(_SCHEMA))
+contract_validation.precompile(_SCHEMA, ("LifecycleEvent",))
 
 
 def conforms(obj: Dict[str, Any], shape: str) -> None:
-    """Validate `obj` against `lifecycle.v1#/$defs/<shape>` (raises on non-conformance)."""
-    jsonschema.Draft202012Validator(
-        {"$ref": f"{_SCHEMA['$id']}#/$defs/{shape}"}, registry=_REGISTRY
-    ).validate(obj)
+    """Validate `obj` against `lifecycle.v1#/$defs/<shape>` (raises on non-conformance).
+    The validator is compiled once per shape (``contract_validation``), not per callback."""
+    contract_validation.conforms(obj, _SCHEMA, shape)
 
 
 def create_app(
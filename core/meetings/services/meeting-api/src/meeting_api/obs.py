@@ -8,15 +8,22 @@ identical because all three conform to the one contract.
 Provides a ``trace_id`` propagated via ``contextvars``, ``log_event(...)`` emitting one JSON
 line conforming to ``logevent.v1``, and ``TraceMiddleware`` that reads/sets ``X-Trace-Id``
 (reuse an incoming id; mint only if absent) so this hop's logs share the caller's trace_id.
+
+Alongside the log lines, the service's process-local metrics registry: fixed-bucket ``Histogram``s
+(cumulative ``le`` buckets + count + sum, the Prometheus shape) fetched by name through
+``histogram(...)``, monotonic ``Counter``s through ``counter(...)``, both read back as one plain dict
+by ``metrics_snapshot()`` and served at ``GET /metrics``. No exporter dependency — the collector
+loops, the webhook SSRF guard and the contract self-check all record into it.
 """
 from __future__ import annotations
 
 import contextvars
 import json
 import sys
+import threading
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -91,3 +98,101 @@ class TraceMiddleware(BaseHTTPMiddleware):
             return response
         finally:
             _trace_id.reset(token)
+
+
+# ---- Process-local metrics -------------------------------------------------------------------
+
+# Default latency buckets, in seconds (1ms … 10s).
+LATENCY_BUCKETS_S = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Default size buckets — batch sizes and stream lag (entries).
+SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """A fixed-bucket histogram: cumulative ``le`` bucket counts plus ``count`` and ``sum``.
+
+    ``observe`` is O(buckets) and thread-safe (the consumer loop and a threadpool route may both
+    record); ``snapshot`` returns plain values so a caller can serialize it as-is."""
+
+    def __init__(self, name: str, buckets: Sequence[float]):
+        self.name = name
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * len(self.buckets)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._count += 1
+            self._sum += value
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self._counts[i] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "count": self._count,
+                "sum": self._sum,
+                "buckets": {str(b): n for b, n in zip(self.buckets, self._counts)},
+            }
+
+
+class Counter:
+    """A monotonic counter (hits, misses, drops …). Thread-safe like ``Histogram``."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        with self._lock:
+            return self._value
+
+
+_histograms: dict[str, Histogram] = {}
+_counters: dict[str, Counter] = {}
+_registry_lock = threading.Lock()
+
+
+def histogram(name: str, buckets: Sequence[float] = LATENCY_BUCKETS_S) -> Histogram:
+    """The process-wide histogram named ``name`` (created with ``buckets`` on first use)."""
+    with _registry_lock:
+        h = _histograms.get(name)
+        if h is None:
+            h = _histograms[name] = Histogram(name, buckets)
+        return h
+
+
+def counter(name: str) -> Counter:
+    """The process-wide counter named ``name`` (created at 0 on first use)."""
+    with _registry_lock:
+        c = _counters.get(name)
+        if c is None:
+            c = _counters[name] = Counter(name)
+        return c
+
+
+def metrics_snapshot() -> dict:
+    """Every registered metric, keyed by name — a histogram as ``{count, sum, buckets}``, a counter
+    as its plain integer value."""
+    with _registry_lock:
+        histograms = list(_histograms.items())
+        counters = list(_counters.items())
+    out: dict = {name: h.snapshot() for name, h in histograms}
+    out.update((name, c.value) for name, c in counters)
+    return out
+
+
+def reset_metrics() -> None:
+    """Drop every registered metric (tests)."""
+    with _registry_lock:
+        _histograms.clear()
+        _counters.clear()
@@ -17,8 +17,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import jsonschema
-from referencing import Registry, Resource
+from .. import contract_validation
+
 
 # The meeting-api endpoint a scheduled bot fires against. Mirrors the parent's
 # `@router.post("/bots", ...)` in `services/meeting-api/meeting_api/meetings.py`.
@@ -42,14 +42,12 @@ def _load_schedule_schema() -> dict:
 
 
 _SCHEMA = _load_schedule_schema()
-_REGISTRY = Registry().with_resource(_SCHEMA["$id"], Resource.from_contents(_SCHEMA))
+contract_validation.precompile(_SCHEMA, ("ScheduleJob",))
 
 
 def conforms(obj: Dict[str, Any], shape: str = "ScheduleJob") -> None:
     """Validate `obj` against `schedule.v1#/$defs/<shape>` (raises on non-conformance)."""
-    jsonschema.Draft202012Validator(
-        {"$ref": f"{_SCHEMA['$id']}#/$defs/{shape}"}, registry=_REGISTRY
-    ).validate(obj)
+    contract_validation.conforms(obj, _SCHEMA, shape)
 
 
 # --- the user-facing scheduling intent ----------------------------------------------------
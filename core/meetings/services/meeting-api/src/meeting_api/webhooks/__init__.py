@@ -9,7 +9,8 @@ in `meetings/contracts/webhook.v1`.
 * ``build_envelope`` / ``sign_payload`` / ``build_headers`` / ``verify_signature`` —
   the envelope + HMAC-over-`ts.payload` scheme (and its verifier).
 * ``validate_webhook_url`` / ``SSRFError`` — the SSRF URL-guard (localhost/link-local/
-  private CIDRs + internal hostnames).
+  private CIDRs + internal hostnames); ``validate_webhook_url_async`` resolves off the event
+  loop through a ``CachingResolver`` (TTL'd positive/negative DNS cache, bounded lookup pool).
 * ``is_event_enabled`` — the per-client event filter (subscribed events in user.data).
 * ``WebhookSink`` — the port: build → SSRF-guard → filter → deliver → enqueue-on-failure.
 * ``RetryQueue`` — the fakeredis-backed exponential-backoff retry queue.
@@ -41,7 +42,7 @@ from .retry import (
     RetryQueue,
     drain_retry_queue,
 )
-from .ssrf import SSRFError, validate_webhook_url
+from .ssrf import CachingResolver, SSRFError, validate_webhook_url, validate_webhook_url_async
 from .system import (
     SYSTEM_DEAD_LETTER_KEY,
     SYSTEM_PROCESSING_KEY,
@@ -69,8 +70,10 @@ __all__ = [
     "InMemoryDeliveryLedger",
     "RedisDeliveryLedger",
     "build_delivery_record",
+    "CachingResolver",
     "SSRFError",
     "validate_webhook_url",
+    "validate_webhook_url_async",
     "SYSTEM_DEAD_LETTER_KEY",
     "SYSTEM_PROCESSING_KEY",
     "SYSTEM_RETRY_QUEUE_KEY",
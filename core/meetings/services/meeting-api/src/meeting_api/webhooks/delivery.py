@@ -23,7 +23,7 @@ from datetime import datetime, timezone
 from typing import Any, Awaitable, Callable, Dict, Optional
 from uuid import uuid4
 
-from .ssrf import SSRFError, validate_webhook_url
+from .ssrf import SSRFError, validate_webhook_url_async
 
 # Frozen wire constants (match webhook.v1 + the parent).
 WEBHOOK_API_VERSION = "2026-03-01"
@@ -232,7 +232,7 @@ class WebhookSink:
 
         # 2. SSRF guard — reject private/internal targets before any HTTP.
         try:
-            validate_webhook_url(url, resolver=self._resolver)
+            await validate_webhook_url_async(url, resolver=self._resolver)
         except SSRFError as e:
             return DeliveryResult(status="blocked", error=str(e))
 
@@ -1,22 +1,31 @@
 """The Redis-backed reliable retry queue + the crash-safe worker sweep.
 
 Derived from the parent's `webhook_retry_worker.py`, reimplemented clean. Failed deliveries are
-persisted to a Redis list (`webhook:retry_queue`); each entry carries its own `next_retry_at` +
-`attempt`, and the exponential `BACKOFF_SCHEDULE`. `drain_retry_queue` is ONE worker tick (the
+persisted to a Redis sorted set (`webhook:retry_queue:due`) scored by their `next_retry_at`; each
+entry carries its own `next_retry_at` + `attempt`, and the exponential `BACKOFF_SCHEDULE`. `drain_retry_queue` is ONE worker tick (the
 parent's `_process_queue` loop body) — the eval calls it directly instead of running the background
 poll loop, so the test is deterministic (no sleeps).
 
 Crash-safety (issue #520). The old drain LPOPped every entry into a process-local `requeue` list
 and RPUSHed it back only at the END of the sweep, so a worker crash mid-sweep lost every popped
 entry — the recovery mechanism itself dropped envelopes. This drain uses the classic Redis
-**reliable-queue** pattern: each entry is atomically moved from the queue into a **processing list**
-with ``RPOPLPUSH`` (never held only in process memory), delivered, then removed from the processing
+**reliable-queue** pattern: each entry is copied into a **processing list** BEFORE it is removed from
+the queue (never held only in process memory; the ``ZREM`` decides which worker owns it), delivered, then removed from the processing
 list on ack / re-queued with a bumped attempt+next_retry_at on reschedule / moved to the
 dead-letter list on exhaustion. A crash leaves the in-flight entry in the processing list; the next
 tick's reclaim pass moves any processing entry older than a **lease** back to the queue, where it is
 re-delivered. Re-delivery is at-least-once and safe to dedupe: #519 made ``event_id`` deterministic,
 so a receiver dedupes a lease-reclaim redelivery on its stored ``event_id``.
 
+Due-indexed queue. The queue used to be a plain list, so every tick RPOPLPUSHed, stamped and
+LPUSHed back EVERY entry just to discover it was not due yet — O(queue) Redis round-trips per tick,
+most of them for entries hours away from their next attempt. The due ZSET makes a tick touch only
+``ZRANGEBYSCORE -inf now``: not-yet-due entries are never read. Due entries are delivered
+concurrently, bounded by a global cap (``concurrency``) and a per-destination-host cap
+(``per_host``) so one slow receiver cannot hold every slot and a burst never hammers one host.
+The legacy list (``webhook:retry_queue``) is migrated into the ZSET at the start of each tick
+(``migrate_legacy_queue``) — an old replica still RPUSHing to it mid-rollout is picked up too.
+
 Scope (stated plainly): this closes the crash-mid-sweep loss. It does NOT make the ledger survive a
 full Redis restart / storage outage — the ledger is still in Redis, which the hosted platform runs
 memory-only. Restart/outage durability requires persistent managed Redis (an owner/infra decision);
@@ -27,6 +36,7 @@ as `WebhookSink`, so the worker drains against the fake receiver too.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from typing import Any, Awaitable, Callable, Dict, List, Optional
@@ -37,7 +47,11 @@ from .delivery import build_headers
 
 RETRY_QUEUE_KEY = "webhook:retry_queue"
 
-# The reliable-queue processing list: an entry is RPOPLPUSH'd here while in-flight, so a crash
+# The due index: a sorted set of entry JSON scored by `next_retry_at`, stored next to the queue key.
+# The bare queue key is the pre-ZSET list, only ever read by the migration.
+RETRY_DUE_KEY = f"{RETRY_QUEUE_KEY}:due"
+
+# The reliable-queue processing list: an entry is pushed here while in-flight, so a crash
 # mid-delivery leaves it recoverable (never held only in process memory). The next tick's reclaim
 # pass returns processing entries older than the lease to the retry queue.
 PROCESSING_KEY = "webhook:retry_processing"
@@ -57,8 +71,15 @@ BACKOFF_SCHEDULE = [60, 300, 1800, 7200]  # 1m, 5m, 30m, 2h
 
 MAX_AGE_SECONDS = 86400  # 24h — drop entries older than this
 
+# Delivery fan-out per tick: at most DEFAULT_CONCURRENCY deliveries in flight, at most
+# DEFAULT_PER_HOST of them to any one destination host. Due entries are read DEFAULT_BATCH at a time.
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST = 4
+DEFAULT_BATCH = 500
+
 # Transient claim-bookkeeping keys stamped onto an entry while it sits in the processing list
 # (the lease clock + a unique token so LREM matches exactly). Stripped before re-queue / delivery.
+# Queued entries carry a random `id` so two otherwise-identical enqueues stay distinct ZSET members.
 _CLAIM_AT = "_claimed_at"
 _CLAIM_TOKEN = "_claim"
 
@@ -75,12 +96,18 @@ def _transport_error_category(error: Exception) -> str:
     return "transport_exception"
 
 
+def due_key(key: str) -> str:
+    """The due-index ZSET for the queue named ``key``."""
+    return f"{key}:due"
+
+
 class RetryQueue:
-    """A thin async wrapper over the Redis list that holds failed deliveries."""
+    """A thin async wrapper over the Redis due index that holds failed deliveries."""
 
     def __init__(self, redis: Any, key: str = RETRY_QUEUE_KEY):
         self.redis = redis
         self.key = key
+        self.due_key = due_key(key)
 
     async def enqueue(
         self,
@@ -93,6 +120,7 @@ class RetryQueue:
     ) -> None:
         ts = time.time() if now is None else now
         entry = {
+            "id": uuid4().hex,
             "url": url,
             "payload": envelope,
             "webhook_secret": webhook_secret,
@@ -103,10 +131,11 @@ class RetryQueue:
         }
         if metadata:
             entry["metadata"] = metadata
-        await self.redis.rpush(self.key, json.dumps(entry))
+        await self.redis.zadd(self.due_key, {json.dumps(entry): entry["next_retry_at"]})
 
     async def depth(self) -> int:
-        return await self.redis.llen(self.key)
+        # Count a not-yet-migrated legacy list too, so depth is right mid-rollout.
+        return await self.redis.zcard(self.due_key) + await self.redis.llen(self.key)
 
 
 async def _deliver_one(entry: dict, transport: Transport) -> tuple[bool, Optional[int], Optional[str]]:
@@ -188,6 +217,48 @@ async def _dead_letter(
         )
 
 
+def _requeue_score(entry: dict) -> float:
+    try:
+        return float(entry.get("next_retry_at", 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _target_host(raw: Any) -> str:
+    try:
+        return urlsplit(str(json.loads(raw).get("url") or "")).hostname or ""
+    except Exception:  # noqa: BLE001 — a corrupt entry shares the "" gate; the drain drops it
+        return ""
+
+
+async def migrate_legacy_queue(
+    redis: Any,
+    *,
+    key: str = RETRY_QUEUE_KEY,
+    due: Optional[str] = None,
+) -> int:
+    """Move entries from the pre-ZSET retry list ``key`` into its due index. Returns #moved.
+
+    Each entry is ZADDed (scored by its ``next_retry_at``) BEFORE it is LREMed from the list, and
+    the ZSET member is the raw entry, so a crash mid-migration re-adds the same member on the next
+    run — idempotent, never a loss. Safe to run every tick and from every replica: once the list is
+    empty it costs one LINDEX.
+    """
+    due = due or due_key(key)
+    moved = 0
+    while True:
+        raw = await redis.lindex(key, 0)
+        if raw is None:
+            return moved
+        try:
+            score = _requeue_score(json.loads(raw))
+        except (json.JSONDecodeError, TypeError):
+            score = 0.0  # corrupt — due at once, so the drain drops it
+        await redis.zadd(due, {raw: score})
+        await redis.lrem(key, 1, raw)
+        moved += 1
+
+
 async def _reclaim_stale_processing(
     redis: Any,
     *,
@@ -200,10 +271,11 @@ async def _reclaim_stale_processing(
 
     An entry sits in the processing list only while a sweep is delivering it. If a sweep crashes,
     its in-flight entry stays there; this pass (run at the start of every tick) moves any entry
-    whose claim is older than ``lease`` — or that was never stamped (crash between the RPOPLPUSH and
-    the stamp) — back to the queue, where the next claim re-delivers it. Entries still within their
-    lease are live (a concurrent/just-started delivery) and left untouched. Re-queue is RPUSH-before-
-    LREM so a crash here duplicates rather than loses (at-least-once; deduped on ``event_id``).
+    whose claim is older than ``lease`` — or that was never stamped (crash between the copy and the
+    stamp of a pre-ZSET sweep) — back to the queue, where the next claim re-delivers it. Entries
+    still within their lease are live (a concurrent/just-started delivery) and left untouched.
+    Re-queue is ZADD-before-LREM so a crash here duplicates rather than loses (at-least-once;
+    deduped on ``event_id``).
     """
     items = await redis.lrange(processing_key, 0, -1)
     reclaimed = 0
@@ -218,12 +290,91 @@ async def _reclaim_stale_processing(
             continue  # still within the lease — a live in-flight delivery, leave it
         entry.pop(_CLAIM_AT, None)
         entry.pop(_CLAIM_TOKEN, None)
-        await redis.rpush(key, json.dumps(entry))  # back to the queue FIRST (crash → dup, not loss)
+        # back to the queue FIRST (crash → dup, not loss); it keeps its (past) due time
+        await redis.zadd(due_key(key), {json.dumps(entry): _requeue_score(entry)})
         await redis.lrem(processing_key, 1, raw)
         reclaimed += 1
     return reclaimed
 
 
+async def _claim(
+    redis: Any, raw: Any, entry: dict, *, stamp_at: float, due: str, processing_key: str
+) -> Optional[str]:
+    """Move one due entry into the processing list; returns its stamped form, or ``None`` if
+    another worker won it.
+
+    The stamped copy (lease clock + unique token, so the LREM that finalizes it matches exactly)
+    is RPUSHed BEFORE the ZREM: a crash in between leaves it both queued and in processing — a
+    duplicate the lease reclaim folds back, never a loss. The ZREM is the ownership decision.
+    """
+    stamped_entry = dict(entry)
+    stamped_entry[_CLAIM_AT] = stamp_at
+    stamped_entry[_CLAIM_TOKEN] = uuid4().hex
+    stamped = json.dumps(stamped_entry)
+    await redis.rpush(processing_key, stamped)
+    if not await redis.zrem(due, raw):
+        await redis.lrem(processing_key, 1, stamped)  # claimed by a concurrent sweep
+        return None
+    return stamped
+
+
+async def _resolve_due(
+    redis: Any,
+    raw: Any,
+    transport: Transport,
+    *,
+    now: Optional[float],
+    due: str,
+    processing_key: str,
+    dead_letter_key: str,
+) -> int:
+    """Claim + resolve one due entry (deliver / reschedule / dead-letter). Returns 1 if processed."""
+    try:
+        entry = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        await redis.zrem(due, raw)  # corrupt — drop from the queue
+        return 1
+
+    clock = time.time() if now is None else now
+    stamped = await _claim(redis, raw, entry, stamp_at=clock, due=due, processing_key=processing_key)
+    if stamped is None:
+        return 0
+
+    created_at = entry.get("created_at", 0)
+    attempt = entry.get("attempt", 0)
+
+    if clock - created_at > MAX_AGE_SECONDS:
+        # expired — dead-letter (don't deliver)
+        await _dead_letter(redis, entry, reason="max_age_exceeded", now=clock, key=dead_letter_key)
+        await redis.lrem(processing_key, 1, stamped)
+        return 1
+
+    success, status_code, error = await _deliver_one(entry, transport)
+
+    if success:
+        await redis.lrem(processing_key, 1, stamped)  # ack — drop from processing
+        return 1
+
+    # The first wait (BACKOFF[0]) was already applied at enqueue, so the next wait is
+    # BACKOFF[attempt + 1]. When that index runs off the end the schedule is exhausted.
+    next_idx = attempt + 1
+    if next_idx >= len(BACKOFF_SCHEDULE):
+        # exhausted — dead-letter (permanently failed)
+        await _dead_letter(
+            redis, entry, reason="schedule_exhausted",
+            status_code=status_code, error=error, now=clock, key=dead_letter_key,
+        )
+        await redis.lrem(processing_key, 1, stamped)
+        return 1
+    entry["attempt"] = next_idx
+    entry["next_retry_at"] = clock + BACKOFF_SCHEDULE[next_idx]
+    # Re-queue under its new due time (not re-read this sweep: it is in the future) and
+    # ZADD-before-LREM so a crash here duplicates rather than loses (deduped on event_id).
+    await redis.zadd(due, {json.dumps(entry): entry["next_retry_at"]})
+    await redis.lrem(processing_key, 1, stamped)
+    return 1
+
+
 async def drain_retry_queue(
     redis: Any,
     transport: Transport,
@@ -233,16 +384,20 @@ async def drain_retry_queue(
     key: str = RETRY_QUEUE_KEY,
     processing_key: str = PROCESSING_KEY,
     dead_letter_key: str = DEAD_LETTER_KEY,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    per_host: int = DEFAULT_PER_HOST,
+    batch: int = DEFAULT_BATCH,
 ) -> int:
-    """One crash-safe worker sweep: process every READY entry once. Returns #processed.
+    """One crash-safe worker sweep: process every DUE entry once. Returns #processed.
 
-    First reclaims any orphaned in-flight entries (a crashed prior sweep). Then, for each queued
-    entry, atomically claims it into the processing list (``RPOPLPUSH``), and — WITHOUT ever holding
-    it only in memory — resolves it individually: entries not yet due (`next_retry_at > now`) are
-    returned to the queue untouched; entries past MAX_AGE or that exhaust the schedule are
-    dead-lettered; a delivered (2xx / permanent 4xx) entry is dropped from processing; a
-    failed-but-retryable entry gets a bumped `attempt` + the next backoff and is re-queued. Pass
-    `now` to drive the clock forward deterministically in the eval.
+    First migrates any legacy list entries into the due index and reclaims orphaned in-flight
+    entries (a crashed prior sweep). Then reads only the due entries (``next_retry_at <= now``,
+    ``batch`` at a time) and resolves them concurrently — at most ``concurrency`` in flight, at most
+    ``per_host`` per destination host. Each entry is claimed into the processing list, and — WITHOUT
+    ever holding it only in memory — resolved individually: entries past MAX_AGE or that exhaust the
+    schedule are dead-lettered; a delivered (2xx / permanent 4xx) entry is dropped from processing;
+    a failed-but-retryable entry gets a bumped `attempt` + the next backoff and is re-queued under
+    its new due time. Pass `now` to drive the clock forward deterministically in the eval.
 
     Backoff is indexed by `attempt + 1`: `enqueue` already set the first wait to BACKOFF_SCHEDULE[0]
     (60s), so the drain schedules the *next* wait. The effective wait sequence a target experiences
@@ -253,78 +408,36 @@ async def drain_retry_queue(
     expiry — never held only in process memory (the loss the old LPOP-hold-RPUSH drain had).
     """
     clock = time.time() if now is None else now
+    due = due_key(key)
 
-    # 0. Reclaim orphaned in-flight entries from a crashed prior sweep before claiming new work.
+    # 0. Fold in a pre-ZSET list, then reclaim orphaned in-flight entries before claiming new work.
+    await migrate_legacy_queue(redis, key=key, due=due)
     await _reclaim_stale_processing(
         redis, now=clock, lease=lease, key=key, processing_key=processing_key
     )
 
-    queue_len = await redis.llen(key)
-    if queue_len == 0:
-        return 0
+    gate = asyncio.Semaphore(max(1, concurrency))
+    host_gates: Dict[str, asyncio.Semaphore] = {}
 
-    processed = 0
+    async def _one(raw: Any) -> int:
+        host = _target_host(raw)
+        host_gate = host_gates.setdefault(host, asyncio.Semaphore(max(1, per_host)))
+        # Host gate first: an entry queued behind a saturated host must not hold a global slot.
+        async with host_gate:
+            async with gate:
+                return await _resolve_due(
+                    redis, raw, transport, now=now, due=due,
+                    processing_key=processing_key, dead_letter_key=dead_letter_key,
+                )
 
-    for _ in range(queue_len):
-        raw = await redis.rpoplpush(key, processing_key)  # atomic claim into the processing list
-        if raw is None:
-            break
-        try:
-            entry = json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
-            await redis.lrem(processing_key, 1, raw)  # corrupt — drop from processing
-            processed += 1
-            continue
-
-        # Stamp a lease clock + unique claim token so a crash leaves a reclaimable entry, and so the
-        # LREM that finalizes this entry matches EXACTLY it (the just-claimed row is at head/index 0).
-        stamped_entry = dict(entry)
-        stamped_entry[_CLAIM_AT] = clock
-        stamped_entry[_CLAIM_TOKEN] = uuid4().hex
-        stamped = json.dumps(stamped_entry)
-        await redis.lset(processing_key, 0, stamped)
-
-        created_at = entry.get("created_at", 0)
-        next_retry_at = entry.get("next_retry_at", 0)
-        attempt = entry.get("attempt", 0)
-
-        if clock - created_at > MAX_AGE_SECONDS:
-            processed += 1  # expired — dead-letter (don't deliver)
-            await _dead_letter(redis, entry, reason="max_age_exceeded", now=clock, key=dead_letter_key)
-            await redis.lrem(processing_key, 1, stamped)
-            continue
-
-        if next_retry_at > clock:
-            # not due yet — return the ORIGINAL entry to the queue HEAD (LPUSH: we claim from the
-            # tail via RPOPLPUSH, so a head re-queue is not re-popped within this same sweep).
-            # LPUSH-before-LREM so a crash here duplicates rather than loses (deduped on event_id).
-            await redis.lpush(key, raw)
-            await redis.lrem(processing_key, 1, stamped)
-            continue
-
-        success, status_code, error = await _deliver_one(entry, transport)
-        processed += 1
-
-        if success:
-            await redis.lrem(processing_key, 1, stamped)  # ack — drop from processing
-            continue
-
-        # The first wait (BACKOFF[0]) was already applied at enqueue, so the next wait is
-        # BACKOFF[attempt + 1]. When that index runs off the end the schedule is exhausted.
-        next_idx = attempt + 1
-        if next_idx >= len(BACKOFF_SCHEDULE):
-            # exhausted — dead-letter (permanently failed)
-            await _dead_letter(
-                redis, entry, reason="schedule_exhausted",
-                status_code=status_code, error=error, now=clock, key=dead_letter_key,
-            )
-            await redis.lrem(processing_key, 1, stamped)
-            continue
-        entry["attempt"] = next_idx
-        entry["next_retry_at"] = clock + BACKOFF_SCHEDULE[next_idx]
-        # Re-queue to the HEAD (LPUSH: not re-popped this sweep, since we claim from the tail) and
-        # LPUSH-before-LREM so a crash here duplicates rather than loses (deduped on event_id).
-        await redis.lpush(key, json.dumps(entry))
-        await redis.lrem(processing_key, 1, stamped)
-
-    return processed
+    processed = 0
+    seen: set = set()
+    while True:
+        page = await redis.zrangebyscore(due, "-inf", clock, start=0, num=max(1, batch))
+        # A member a concurrent sweep is mid-claiming can reappear (it is ZREMed after the copy);
+        # never resolve the same member twice in one sweep.
+        fresh = [raw for raw in page if raw not in seen]
+        if not fresh:
+            return processed
+        seen.update(fresh)
+        processed += sum(await asyncio.gather(*(_one(raw) for raw in fresh)))
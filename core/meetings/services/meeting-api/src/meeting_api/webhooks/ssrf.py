@@ -26,14 +26,41 @@ Only the resolve step touches the network (`socket.getaddrinfo`) — it is skipp
 literal-IP and blocked-hostname URLs, which is the only path the autonomous eval
 exercises (no DNS, no live receiver). The eval can also pass `resolver=...` to stub
 resolution deterministically.
+
+Resolution off the event loop
+-----------------------------
+`getaddrinfo` blocks, and both halves above run on meeting-api's event loop (submit-time in
+`WebhookSink.deliver`, connect-time in the pinned transport for every delivery), so one slow
+resolver used to stall every coroutine in the process. The async entry points
+(`validate_webhook_url_async`, `revalidate_at_connect_async`) resolve through a
+`CachingResolver`: `getaddrinfo` runs on a small dedicated thread pool (its size IS the
+concurrency limit), concurrent lookups of one host share a single call, and answers are cached
+per hostname for a short TTL — failures too, for a shorter one. Caching does not reopen the
+rebinding window: the transport still dials only an IP that was validated, and a cached answer
+is one that passed the blocklist. A `CachingResolver` (own TTLs, pool size, metric names) is
+injected through the same `resolver=` hook; a plain callable still works and is called inline.
 """
 from __future__ import annotations
 
+import asyncio
 import ipaddress
+import os
 import socket
-from typing import Any, Callable, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
+from ..obs import counter, histogram
+
+# Positive / negative answer lifetimes (s) and the lookup thread-pool size of the shared resolver.
+DNS_CACHE_TTL_S = float(os.environ.get("WEBHOOK_DNS_CACHE_TTL_S", "30"))
+DNS_NEGATIVE_TTL_S = float(os.environ.get("WEBHOOK_DNS_NEGATIVE_TTL_S", "5"))
+DNS_CONCURRENCY = int(os.environ.get("WEBHOOK_DNS_CONCURRENCY", "8"))
+DNS_CACHE_SIZE = 4096
+
 # Blocked IP ranges per OWASP (localhost, private, link-local, multicast).
 _BLOCKED_IPV4_NETWORKS = [
     ipaddress.ip_network("0.0.0.0/8"),       # current network
@@ -137,6 +164,129 @@ def _resolve_host(hostname: str) -> List[str]:
     return ips
 
 
+class CachingResolver:
+    """A hostname → IPs resolver with a TTL-bounded positive/negative cache.
+
+    ``resolve`` (async) runs ``lookup`` on a private pool of ``max_concurrency`` threads, so
+    the event loop never blocks on DNS and a resolver outage can tie up at most that many
+    threads; concurrent misses on one hostname share one lookup. Calling the instance directly
+    is the sync path (cache, else an inline lookup) so it also fits every sync ``resolver=``
+    parameter. Counts ``<metrics>.hit`` / ``.miss`` / ``.negative_hit`` and times lookups in
+    ``<metrics>.lookup_s`` in the collector registry.
+    """
+
+    def __init__(
+        self,
+        lookup: Optional[Callable[[str], List[str]]] = None,
+        *,
+        ttl_s: float = DNS_CACHE_TTL_S,
+        negative_ttl_s: float = DNS_NEGATIVE_TTL_S,
+        max_concurrency: int = DNS_CONCURRENCY,
+        maxsize: int = DNS_CACHE_SIZE,
+        metrics: str = "webhook_dns",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._lookup = lookup or _resolve_host
+        self.ttl_s = ttl_s
+        self.negative_ttl_s = negative_ttl_s
+        self.max_concurrency = max(1, max_concurrency)
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple[float, List[str]]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._hit = counter(f"{metrics}.hit")
+        self._negative_hit = counter(f"{metrics}.negative_hit")
+        self._miss = counter(f"{metrics}.miss")
+        self._lookup_s = histogram(f"{metrics}.lookup_s")
+
+    def cached(self, hostname: str) -> Optional[List[str]]:
+        """The live cached answer for ``hostname`` (``[]`` = cached failure), else ``None``."""
+        key = hostname.lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        (self._hit if entry[1] else self._negative_hit).inc()
+        return list(entry[1])
+
+    def __call__(self, hostname: str) -> List[str]:
+        ips = self.cached(hostname)
+        if ips is None:
+            self._miss.inc()
+            ips = self._timed_lookup(hostname)
+        return ips
+
+    async def resolve(self, hostname: str) -> List[str]:
+        ips = self.cached(hostname)
+        if ips is not None:
+            return ips
+        key = hostname.lower()
+        with self._lock:
+            fut = self._inflight.get(key)
+            if fut is None:
+                self._miss.inc()
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="webhook-dns")
+                fut = self._inflight[key] = self._pool.submit(self._timed_lookup, hostname)
+                fut.add_done_callback(lambda _f, _k=key: self._forget(_k, _f))
+        # shield: a cancelled awaiter must not cancel the lookup other awaiters share
+        return list(await asyncio.shield(asyncio.wrap_future(fut)))
+
+    def _timed_lookup(self, hostname: str) -> List[str]:
+        t0 = time.perf_counter()
+        try:
+            ips = self._lookup(hostname)
+        except Exception:  # noqa: BLE001 — a lookup error is an unresolvable host
+            ips = []
+        self._lookup_s.observe(time.perf_counter() - t0)
+        ttl = self.ttl_s if ips else self.negative_ttl_s
+        with self._lock:
+            self._entries[hostname.lower()] = (self._clock() + ttl, list(ips))
+            self._entries.move_to_end(hostname.lower())
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return ips
+
+    def _forget(self, key: str, fut: Future) -> None:
+        with self._lock:
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+
+_default_resolver: Optional[CachingResolver] = None
+
+
+def default_resolver() -> CachingResolver:
+    """The process-wide `CachingResolver` the async paths use when no ``resolver`` is injected."""
+    global _default_resolver
+    if _default_resolver is None:
+        _default_resolver = CachingResolver()
+    return _default_resolver
+
+
+async def _resolve_async(hostname: str, resolver: Any) -> List[str]:
+    if resolver is None:
+        resolver = default_resolver()
+    if isinstance(resolver, CachingResolver):
+        return await resolver.resolve(hostname)
+    return resolver(hostname)  # an injected plain callable (the eval's stubs) — called inline
+
+
 def _validate_resolved_ips(ips: List[str]) -> None:
     """Reject if resolution failed or ANY resolved IP is in the blocklist (anti-rebinding)."""
     if not ips:
@@ -146,19 +296,9 @@ def _validate_resolved_ips(ips: List[str]) -> None:
             raise SSRFError("Webhook URL cannot target internal or private networks")
 
 
-def validate_webhook_url(url: str, resolver: Callable[[str], List[str]] | None = None) -> PinnedURL:
-    """Validate a webhook URL is safe (not SSRF-vulnerable). Return a ``PinnedURL`` if valid.
-
-    - Only http:// and https:// schemes.
-    - Block private/loopback/link-local/multicast IPs and internal hostnames.
-    - Resolve DNS names and validate every resolved IP (anti-rebinding). The `resolver`
-      hook lets the eval stub resolution; defaults to `socket.getaddrinfo`.
-    - Return a ``PinnedURL`` carrying the resolved-and-validated IP(s) so delivery can PIN
-      the connection (rather than re-resolving an attacker-controlled hostname at connect
-      time — the TOCTOU window). The string value is the original URL (Host/SNI preserved).
-
-    Raises `SSRFError` (a ValueError) with a user-friendly message when blocked.
-    """
+def _precheck_url(url: str) -> "PinnedURL | tuple[str, Optional[int], str]":
+    """Everything but DNS: scheme, hostname blocklist, literal IPs. Returns the ``PinnedURL`` for a
+    literal IP, else ``(hostname, port, scheme)`` still to be resolved."""
     parsed = urlparse(url)
 
     if parsed.scheme not in ("http", "https"):
@@ -180,10 +320,54 @@ def validate_webhook_url(url: str, resolver: Callable[[str], List[str]] | None =
         return PinnedURL(url, host=hostname, port=port, scheme=parsed.scheme, pinned_ips=[hostname])
     except ValueError:
         pass  # not a literal IP — resolve below
+    return hostname, port, parsed.scheme
+
 
+def validate_webhook_url(url: str, resolver: Callable[[str], List[str]] | None = None) -> PinnedURL:
+    """Validate a webhook URL is safe (not SSRF-vulnerable). Return a ``PinnedURL`` if valid.
+
+    - Only http:// and https:// schemes.
+    - Block private/loopback/link-local/multicast IPs and internal hostnames.
+    - Resolve DNS names and validate every resolved IP (anti-rebinding). The `resolver`
+      hook lets the eval stub resolution; defaults to `socket.getaddrinfo`.
+    - Return a ``PinnedURL`` carrying the resolved-and-validated IP(s) so delivery can PIN
+      the connection (rather than re-resolving an attacker-controlled hostname at connect
+      time — the TOCTOU window). The string value is the original URL (Host/SNI preserved).
+
+    Blocks on DNS — on the event loop use `validate_webhook_url_async`.
+    Raises `SSRFError` (a ValueError) with a user-friendly message when blocked.
+    """
+    checked = _precheck_url(url)
+    if isinstance(checked, PinnedURL):
+        return checked
+    hostname, port, scheme = checked
     ips = (resolver or _resolve_host)(hostname)
     _validate_resolved_ips(ips)
-    return PinnedURL(url, host=hostname, port=port, scheme=parsed.scheme, pinned_ips=ips)
+    return PinnedURL(url, host=hostname, port=port, scheme=scheme, pinned_ips=ips)
+
+
+async def validate_webhook_url_async(url: str, resolver: Any = None) -> PinnedURL:
+    """`validate_webhook_url` without blocking the loop: resolves through `CachingResolver`
+    (the shared one unless ``resolver`` injects another, or a plain stub callable)."""
+    checked = _precheck_url(url)
+    if isinstance(checked, PinnedURL):
+        return checked
+    hostname, port, scheme = checked
+    ips = await _resolve_async(hostname, resolver)
+    _validate_resolved_ips(ips)
+    return PinnedURL(url, host=hostname, port=port, scheme=scheme, pinned_ips=ips)
+
+
+def _precheck_host(hostname: str) -> Optional[List[str]]:
+    if _is_blocked_hostname(hostname):
+        raise SSRFError("Webhook URL cannot target internal or private networks")
+    try:
+        ipaddress.ip_address(hostname)
+    except ValueError:
+        return None
+    if _is_blocked_ip(hostname):
+        raise SSRFError("Webhook URL cannot target internal or private networks")
+    return [hostname]
 
 
 def revalidate_at_connect(hostname: str, resolver: Callable[[str], List[str]] | None = None) -> List[str]:
@@ -193,29 +377,34 @@ def revalidate_at_connect(hostname: str, resolver: Callable[[str], List[str]] |
     the connection layer re-checks at the moment it dials, so a freshly-flipped A-record is
     caught. Raises `SSRFError` if the host now resolves to a blocked IP (or won't resolve).
     """
-    if _is_blocked_hostname(hostname):
-        raise SSRFError("Webhook URL cannot target internal or private networks")
-    try:
-        ipaddress.ip_address(hostname)
-        if _is_blocked_ip(hostname):
-            raise SSRFError("Webhook URL cannot target internal or private networks")
-        return [hostname]
-    except ValueError:
-        pass
+    literal = _precheck_host(hostname)
+    if literal is not None:
+        return literal
     ips = (resolver or _resolve_host)(hostname)
     _validate_resolved_ips(ips)
     return ips
 
 
+async def revalidate_at_connect_async(hostname: str, resolver: Any = None) -> List[str]:
+    """`revalidate_at_connect` without blocking the loop (see `validate_webhook_url_async`)."""
+    literal = _precheck_host(hostname)
+    if literal is not None:
+        return literal
+    ips = await _resolve_async(hostname, resolver)
+    _validate_resolved_ips(ips)
+    return ips
+
+
 def build_pinned_transport(
     inner: "Any" = None,
-    resolver: Callable[[str], List[str]] | None = None,
+    resolver: Any = None,
 ) -> "Any":
     """Wrap an httpx async transport so every dial re-validates + PINS the resolved IP (WH2).
 
     For each request the wrapper:
       1. re-resolves + re-validates the host (`revalidate_at_connect`) — closing the TOCTOU
-         window between submit-time validation and the actual connect;
+         window between submit-time validation and the actual connect — off the event loop,
+         through the shared `CachingResolver` unless ``resolver`` injects one;
       2. rewrites the request URL host to a validated IP while preserving the original Host
          header and setting TLS SNI to the original hostname (`sni_hostname` extension), so
          certificate verification still matches the real host.
@@ -241,7 +430,7 @@ def build_pinned_transport(
             except ValueError:
                 is_literal = False
 
-            validated_ips = revalidate_at_connect(host, resolver=self._resolver)
+            validated_ips = await revalidate_at_connect_async(host, resolver=self._resolver)
             if is_literal:
                 # Already an IP and already validated — dial as-is.
                 return await self._base.handle_async_request(request)
@@ -25,6 +25,18 @@ def test_create_app_health():
     assert body["service"] == "meeting-api"
 
 
+def test_create_app_serves_the_metrics_registry():
+    from meeting_api import obs
+
+    obs.reset_metrics()
+    obs.counter("test.hits").inc(3)
+    obs.histogram("test.latency_s").observe(0.02)
+    body = TestClient(create_app()).get("/metrics").json()
+    assert body["test.hits"] == 3
+    assert body["test.latency_s"]["count"] == 1 and body["test.latency_s"]["buckets"]["0.025"] == 1
+    obs.reset_metrics()
+
+
 def test_unified_app_mounts_every_module_route():
     """Every module's core route is reachable on the ONE app (the routing table is composed)."""
     store = InMemoryTranscriptStore()
@@ -61,6 +61,58 @@ def test_get_transcript_other_user_is_404():
     assert r.status_code == 404
 
 
+def test_get_transcript_etag_revalidates_with_304_until_the_transcript_changes():
+    """The transcript routes carry an ETag of the exact body; If-None-Match with it → 304 and no body.
+    A changed transcript gets a new ETag, so the stale one no longer short-circuits."""
+    store, mid = _seeded()
+    client = TestClient(create_app(store, redis=None))
+    url = "/transcripts/google_meet/abc-defg-hij"
+    first = client.get(url, headers=GATEWAY_HEADERS)
+    etag = first.headers["etag"]
+    assert client.get(f"/transcripts/by-id/{mid}", headers=GATEWAY_HEADERS).headers["etag"] == etag
+
+    r = client.get(url, headers={**GATEWAY_HEADERS, "if-none-match": etag})
+    assert r.status_code == 304 and r.content == b""
+    assert client.get(url, headers={**GATEWAY_HEADERS, "if-none-match": f"W/{etag}"}).status_code == 304
+
+    store._meetings[mid]["segments"]["ch-0:2:a"] = {
+        "segment_id": "ch-0:2:a", "start": 3.0, "end": 4.0, "text": "Later.", "language": "en"}
+    r = client.get(url, headers={**GATEWAY_HEADERS, "if-none-match": etag})
+    assert r.status_code == 200 and r.headers["etag"] != etag
+    assert [s["text"] for s in r.json()["segments"]] == ["This is Anna.", "Later."]
+
+
+def test_get_transcript_pages_by_cursor_and_ranges_by_start():
+    """``limit`` pages the segments in (start, segment_id) order; a full page names its successor in
+    X-Next-Cursor and the last (short) page names none. ``start_from``/``start_to`` bound the range;
+    a malformed cursor is a 422. Each page still conforms to the sealed TranscriptionResponse."""
+    store, mid = _seeded()
+    for i, start in enumerate([3.0, 5.0, 5.0, 7.0]):
+        sid = f"ch-1:{i}:b"
+        store._meetings[mid]["segments"][sid] = {
+            "segment_id": sid, "start": start, "end": start + 1, "text": f"s{i}", "language": "en"}
+    client = TestClient(create_app(store, redis=None))
+    url = f"/transcripts/by-id/{mid}"
+
+    seen, params = [], {"limit": 2}
+    while True:
+        r = client.get(url, headers=GATEWAY_HEADERS, params=params)
+        assert r.status_code == 200, r.text
+        assert_api_conforms("TranscriptionResponse", r.json())
+        seen += [s["text"] for s in r.json()["segments"]]
+        if "x-next-cursor" not in r.headers:
+            break
+        params = {"limit": 2, "after": r.headers["x-next-cursor"]}
+    assert seen == ["This is Anna.", "s0", "s1", "s2", "s3"]
+
+    r = client.get("/transcripts/google_meet/abc-defg-hij", headers=GATEWAY_HEADERS,
+                   params={"start_from": 3.0, "start_to": 7.0})
+    assert [s["text"] for s in r.json()["segments"]] == ["s0", "s1", "s2"]
+    assert "x-next-cursor" not in r.headers
+
+    assert client.get(url, headers=GATEWAY_HEADERS, params={"after": "not-a-cursor"}).status_code == 422
+
+
 def test_get_meetings_conforms():
     store, _ = _seeded()
     store.seed_meeting(user_id=USER, platform="zoom", native_meeting_id="99887766",
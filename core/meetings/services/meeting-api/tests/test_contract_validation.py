@@ -0,0 +1,32 @@
+"""Compiled-once contract validators — one validator per (schema $id, shape), reused by every seam
+check; ``self_check`` honours its sample rate; inbound ``conforms`` always validates."""
+from __future__ import annotations
+
+import jsonschema
+import pytest
+
+from meeting_api import contract_validation
+from meeting_api.lifecycle import receiver, webhook
+from meeting_api.obs import metrics_snapshot, reset_metrics
+
+
+def test_validators_are_compiled_once_per_schema_and_shape():
+    v = contract_validation.validator(webhook._SCHEMA, "Envelope")
+    assert contract_validation.validator(webhook._SCHEMA, "Envelope") is v
+    assert contract_validation.validator(receiver._SCHEMA, "LifecycleEvent") is not v
+    assert (receiver._SCHEMA["$id"], "LifecycleEvent") in contract_validation._validators  # at import
+
+
+def test_inbound_conforms_always_validates():
+    with pytest.raises(jsonschema.ValidationError):
+        receiver.conforms({"not": "a lifecycle event"}, "LifecycleEvent")
+
+
+def test_self_check_sampling():
+    reset_metrics()
+    bad = {"event_type": "meeting.status_change"}
+    with pytest.raises(jsonschema.ValidationError):
+        contract_validation.self_check(bad, webhook._SCHEMA, "Envelope", sample=1)
+    for _ in range(5):
+        contract_validation.self_check(bad, webhook._SCHEMA, "Envelope", sample=0)
+    assert metrics_snapshot()["contract_self_check.skipped"] == 5
@@ -35,6 +35,7 @@ from meeting_api.collector.db_writer import (
     flush_meeting_segments,
     proc_stream_key,
     segments_hash_key,
+    segments_index_key,
 )
 from meeting_api.collector.fakes import FakeRedisBus, InMemoryTranscriptStore
 
@@ -221,6 +222,49 @@ async def test_mutable_tail_stays_in_redis_until_it_settles(store, bus, redis_c)
     assert [s["text"] for s in doc["segments"]] == ["fresh"]  # live read merge
 
 
+async def test_tick_reads_only_settled_fields_through_the_settle_index(store, redis_c, monkeypatch):
+    """The steady-state tick never HGETALLs the hash: it ZRANGEBYSCOREs the settle index and HMGETs
+    exactly the settled ids, so a long meeting's mutable bulk is not re-read and re-parsed per tick."""
+    now = datetime.now(timezone.utc)
+    await store.append_segments(1, [
+        *({**_seg(f"m{i}", float(i), f"mutable {i}"), "updated_at": now.isoformat()} for i in range(40)),
+        {**_seg("old-1", 100.0, "settled one"), "updated_at": (now - timedelta(minutes=5)).isoformat()},
+        {**_seg("old-2", 101.0, "settled two"), "updated_at": (now - timedelta(minutes=5)).isoformat()},
+    ])
+    hgetall_calls: list = []
+    hmget_ids: list = []
+    real_hgetall, real_hmget = redis_c.hgetall, redis_c.hmget
+
+    async def _hgetall(key):
+        hgetall_calls.append(key)
+        return await real_hgetall(key)
+
+    async def _hmget(key, ids):
+        hmget_ids.extend(i.decode() for i in ids)
+        return await real_hmget(key, ids)
+
+    monkeypatch.setattr(redis_c, "hgetall", _hgetall)
+    monkeypatch.setattr(redis_c, "hmget", _hmget)
+
+    assert await db_writer_tick(redis_c, store, now=now) == 2
+    assert hgetall_calls == []
+    assert sorted(hmget_ids) == ["old-1", "old-2"]
+    assert _durable_texts(store) == ["settled one", "settled two"]
+    assert await redis_c.hlen(segments_hash_key(1)) == 40
+    assert await redis_c.zcard(segments_index_key(1)) == 40  # flushed ids left the index too
+
+
+async def test_hash_written_before_the_settle_index_falls_back_to_the_full_scan(store, redis_c):
+    """A hash the index does not cover (written by a pre-index replica mid-upgrade) is still drained
+    — the tick detects the gap (fewer index members than fields) and does the full HGETALL scan."""
+    await store.append_segment(1, _seg("indexed", 1.0, "new writer"))
+    await redis_c.hset(segments_hash_key(1), "legacy", json.dumps(_seg("legacy", 2.0, "old writer")))
+
+    assert await db_writer_tick(redis_c, store, now=LATER) == 2
+    assert _durable_texts(store) == ["new writer", "old writer"]
+    assert await redis_c.exists(segments_hash_key(1), segments_index_key(1)) == 0
+
+
 # ── M21: the hold is per-LANE, because only a lane that refines in place needs it ───────────────
 
 async def test_teams_csrc_confirmed_segment_flushes_without_waiting_out_the_hold(store, bus, redis_c):
@@ -309,6 +353,106 @@ async def test_redis_is_trimmed_only_after_a_confirmed_durable_write(store, bus,
     assert _durable_texts(store) == ["keep me"]
 
 
+async def test_db_writer_tick_flushes_meetings_concurrently_within_the_bound(redis_c):
+    """The sweep fans out across meetings through a bounded semaphore: never more than
+    ``concurrency`` upserts in flight, a failing meeting is isolated (its hash stays INTACT for the
+    next tick), and the tick + per-meeting latency histograms are recorded."""
+    import asyncio
+
+    from meeting_api import obs
+
+    obs.reset_metrics()
+    store = InMemoryTranscriptStore(redis_client=redis_c)
+    for mid in range(1, 9):
+        store.seed_meeting(user_id=USER, platform="google_meet", native_meeting_id=f"n-{mid}", meeting_id=mid)
+        await store.append_segment(mid, {**_seg(f"s{mid}", 1.0, f"meeting {mid}"),
+                                         "updated_at": datetime.now(timezone.utc).isoformat()})
+
+    class _SlowSink:
+        def __init__(self):
+            self.in_flight = 0
+            self.peak = 0
+
+        async def upsert_segments(self, meeting_id, segments):
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                if meeting_id == 3:
+                    raise RuntimeError("postgres rejected meeting 3")
+                await store.upsert_segments(meeting_id, segments)
+            finally:
+                self.in_flight -= 1
+
+    sink = _SlowSink()
+    assert await db_writer_tick(redis_c, sink, now=LATER, concurrency=3) == 7
+    assert sink.peak == 3  # concurrent, but never past the bound
+    assert await redis_c.hlen(segments_hash_key(3)) == 1  # the failed meeting kept its redis copy
+    assert _durable_texts(store, 5) == ["meeting 5"]
+
+    metrics = obs.metrics_snapshot()
+    assert metrics["db_writer.meeting_flush_s"]["count"] == 8
+    assert metrics["db_writer.tick_s"]["count"] == 1
+
+
+def test_db_writer_concurrency_fits_the_engine_pool(monkeypatch):
+    """The default bound is DB_POOL_SIZE (the overflow stays with the request handlers), and an
+    explicit DB_WRITER_CONCURRENCY is capped below the pool ceiling."""
+    from meeting_api.collector import db_writer
+
+    for key in ("DB_WRITER_CONCURRENCY", "DB_POOL_SIZE", "DB_MAX_OVERFLOW"):
+        monkeypatch.delenv(key, raising=False)
+    assert db_writer._writer_concurrency() == 5          # pool 5 + overflow 10
+    monkeypatch.setenv("DB_POOL_SIZE", "8")
+    assert db_writer._writer_concurrency() == 8
+    monkeypatch.setenv("DB_WRITER_CONCURRENCY", "64")
+    assert db_writer._writer_concurrency() == 16         # 8 + 10 − headroom 2
+    monkeypatch.setenv("DB_WRITER_CONCURRENCY", "1")
+    assert db_writer._writer_concurrency() == 1
+
+async def test_sqlalchemy_upsert_segments_is_chunked_multirow_with_same_conflict_semantics(monkeypatch):
+    """The durable sink issues multi-VALUES upserts of at most ``UPSERT_CHUNK_SIZE`` rows in one
+    transaction (not one statement per segment), and keeps the ON CONFLICT (meeting_id, segment_id)
+    semantics: a re-flush UPDATEs in place, a repeated id within a batch keeps its last text.
+    Runs on SQLite (same ON CONFLICT … WHERE upsert grammar) wherever SQLAlchemy + aiosqlite are."""
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy import event, text
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from meeting_api.collector import adapters
+    from meeting_api.collector.adapters import SqlAlchemyTranscriptStore
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE transcriptions (id INTEGER PRIMARY KEY, meeting_id INTEGER NOT NULL, "
+            "start_time FLOAT NOT NULL, end_time FLOAT NOT NULL, text TEXT NOT NULL, speaker TEXT, "
+            "language TEXT, created_at TIMESTAMP, session_uid TEXT, segment_id TEXT)"
+        ))
+        await conn.execute(text(
+            "CREATE UNIQUE INDEX ix_transcription_meeting_segment ON transcriptions "
+            "(meeting_id, segment_id) WHERE segment_id IS NOT NULL"
+        ))
+    inserts: list[str] = []
+    event.listen(engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cur, stmt, *a: inserts.append(stmt) if "INSERT" in stmt else None)
+    monkeypatch.setattr(adapters, "UPSERT_CHUNK_SIZE", 4)
+    store = SqlAlchemyTranscriptStore(session_factory=async_sessionmaker(engine), redis_client=None)
+
+    await store.upsert_segments(1, [_seg(f"s{i}", float(i), f"draft {i}") for i in range(10)])
+    assert len(inserts) == 3  # ceil(10 / 4) statements, not 10
+
+    await store.upsert_segments(1, [_seg("s2", 2.0, "first"), _seg("s2", 2.0, "polished"),
+                                    _seg("s11", 11.0, "new")])
+    async with engine.connect() as conn:
+        rows = (await conn.execute(text(
+            "SELECT segment_id, text FROM transcriptions ORDER BY start_time"))).all()
+    await engine.dispose()
+    assert len(rows) == 11  # the re-flush UPDATEd s2 in place — no duplicate row
+    assert dict(rows)["s2"] == "polished"
+
+
 # ── (c) completion finalizes — terminal lifecycle advance ⇒ immediate durable flush ─────────────
 
 async def _terminal_app_and_stores(redis_c):
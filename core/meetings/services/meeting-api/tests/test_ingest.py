@@ -8,7 +8,9 @@ Asserts:
   * a ``:mutable`` update is published on the EXACT channel the gateway ``/ws`` subscribes to
     (``tc:meeting:{id}:mutable``) with the bot's live payload shape;
   * malformed segments (missing segment_id / zero-length / inverted) are filtered;
-  * ``consume_segments`` drains a fakeredis stream batch via XREADGROUP + XACK.
+  * ``consume_segments`` drains a fakeredis stream batch via XREADGROUP + XACK;
+  * ``ingest_batch`` coalesces a batch into one store write + one feed pipeline per meeting, with the
+    same outcome (and feed order) as per-message ``ingest``.
 """
 from __future__ import annotations
 
@@ -17,9 +19,9 @@ import json
 import fakeredis.aioredis
 import pytest
 
-from meeting_api.collector import consume_segments, ingest
+from meeting_api.collector import consume_segments, ingest, ingest_batch
 from meeting_api.collector.fakes import FakeRedisBus, InMemoryTranscriptStore
-from meeting_api.collector.ingest import STREAM_NAME, _mutable_channel
+from meeting_api.collector.ingest import STREAM_NAME, _mutable_channel, _transcript_stream
 
 
 @pytest.fixture
@@ -172,3 +174,158 @@ async def test_consume_segments_drains_a_fakeredis_batch(store, bus):
     assert {s["text"] for s in doc["segments"]} == {"one", "two"}
     # acked: a second drain reads nothing new
     assert await consume_segments(store, bus) == 0
+
+
+class _CountingStore(InMemoryTranscriptStore):
+    """Records every store write so a test can count the round trips a batch costs."""
+
+    def __init__(self, redis_client=None):
+        super().__init__(redis_client)
+        self.writes: list[tuple[str, int, int]] = []
+
+    async def append_segment(self, meeting_id, segment):
+        self.writes.append(("one", meeting_id, 1))
+        await super().append_segment(meeting_id, segment)
+
+    async def append_segments(self, meeting_id, segments):
+        self.writes.append(("many", meeting_id, len(segments)))
+        await super().append_segments(meeting_id, segments)
+
+
+def _seg(sid: str, start: float, text: str, completed: bool = True) -> dict:
+    return {"segment_id": sid, "start": start, "end": start + 1.0, "text": text, "language": "en",
+            "speaker": "Alice", "completed": completed}
+
+
+async def _feed(bus, meeting_id: int) -> list[dict]:
+    entries = await bus._client.xrange(_transcript_stream(meeting_id))
+    return [json.loads(fields[b"payload"]) for _id, fields in entries]
+
+
+async def test_ingest_batch_coalesces_one_write_per_meeting(bus):
+    client = fakeredis.aioredis.FakeRedis()
+    store = _CountingStore(redis_client=client)
+    store.seed_meeting(meeting_id=1, user_id=7, platform="google_meet", native_meeting_id="abc-defg-hij")
+    store.seed_meeting(meeting_id=2, user_id=7, platform="google_meet", native_meeting_id="klm-nopq-rst")
+    messages = [
+        _message(1, [_seg("a", 0.0, "one"), _seg("b", 1.0, "two")]),
+        _message(2, [_seg("x", 0.0, "other")]),
+        _message(1, [_seg("b", 1.0, "two, refined"), _seg("c", 2.0, "three", completed=False)]),
+    ]
+    assert await ingest_batch(store, bus, messages) == 5
+    assert sorted(store.writes) == [("many", 1, 4), ("many", 2, 1)]
+    # a segment_id repeated inside the batch resolves last-write-wins, like sequential appends
+    doc = await store.get_transcript(7, "google_meet", "abc-defg-hij")
+    assert [s["text"] for s in doc["segments"]] == ["one", "two, refined", "three"]
+    # one :mutable publish per message (the payload shape is per-message) …
+    assert len(bus.published) == 3
+    # … and every feed entry lands, in arrival order
+    assert [e["segments"][0]["text"] for e in await _feed(bus, 1)] == ["one", "two", "two, refined", "three"]
+    await client.aclose()
+
+
+
+async def test_ingest_batch_logs_every_meeting_of_a_failed_publish(bus, monkeypatch):
+    import sys
+
+    ingest_mod = sys.modules[ingest_batch.__module__]
+
+    client = fakeredis.aioredis.FakeRedis()
+    store = _CountingStore(redis_client=client)
+    store.seed_meeting(meeting_id=1, user_id=7, platform="google_meet", native_meeting_id="abc-defg-hij")
+    store.seed_meeting(meeting_id=2, user_id=7, platform="google_meet", native_meeting_id="klm-nopq-rst")
+
+    async def _down(messages):
+        raise ConnectionError("redis down")
+
+    failed: list[int] = []
+    monkeypatch.setattr(bus, "publish_many", _down)
+    monkeypatch.setattr(ingest_mod, "_log_publish_failure", lambda meeting_id, e: failed.append(meeting_id))
+    messages = [_message(1, [_seg("a", 0.0, "one")]), _message(2, [_seg("x", 0.0, "other")]),
+                _message(1, [_seg("b", 1.0, "two")])]
+    assert await ingest_batch(store, bus, messages) == 3   # persisted regardless
+    assert failed == [1, 2]
+    await client.aclose()
+
+async def test_ingest_batch_matches_per_message_ingest(store, bus):
+    messages = [
+        _message(1, [_seg("a", 0.0, "keep"), _seg("p", 1.0, "draft", completed=False)]),
+        _retract_message(1, ["p"]),
+        _message(1, [_seg("b", 2.0, "after")]),
+        {"payload": json.dumps({"type": "session_end", "meeting_id": "1", "uid": "sess-1"})},
+    ]
+    assert await ingest_batch(store, bus, messages) == 3
+    doc = await store.get_transcript(7, "google_meet", "abc-defg-hij")
+    assert [s["text"] for s in doc["segments"]] == ["keep", "after"]
+    # control messages flush the buffered segments first, so the feed keeps stream order
+    kinds = [e.get("type") if e.get("type") != "transcription" else e["segments"][0]["text"]
+             for e in await _feed(bus, 1)]
+    assert kinds == ["keep", "draft", "retract", "after", "session_end"]
+
+
+async def test_consume_segments_per_message_mode_still_available(store, bus):
+    await bus.xadd(STREAM_NAME, {"type": "transcription", "meeting_id": "1",
+                                 "segments": [_seg("a", 0.0, "one")]})
+    assert await consume_segments(store, bus, pipelined=False) == 1
+    assert await consume_segments(store, bus) == 0
+
+
+async def test_sqlalchemy_store_append_segments_is_one_transaction():
+    # The production store's Redis leg needs no database: one MULTI lands the active-set entry,
+    # every field, and the TTL re-arm.
+    from meeting_api.collector.adapters import SqlAlchemyTranscriptStore
+    from meeting_api.collector.db_writer import ACTIVE_MEETINGS_KEY, segments_hash_key
+
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    store = SqlAlchemyTranscriptStore(session_factory=None, redis_client=client)
+    await store.append_segments(9, [_seg("a", 0.0, "one"), _seg("b", 1.0, "two"), _seg("a", 0.0, "uno")])
+    assert await client.smembers(ACTIVE_MEETINGS_KEY) == {"9"}
+    stored = await client.hgetall(segments_hash_key(9))
+    assert {k: json.loads(v)["text"] for k, v in stored.items()} == {"a": "uno", "b": "two"}
+    assert await client.ttl(segments_hash_key(9)) > 0
+    await client.aclose()
+
+
+# ── adaptive consumer: blocking read + batch size that follows the group lag ─────────────────────
+
+
+def test_adaptive_batch_size_grows_with_lag_and_shrinks_when_idle():
+    from meeting_api.collector.ingest import AdaptiveBatchSize
+
+    sizer = AdaptiveBatchSize(minimum=10, maximum=80)
+    assert sizer.count == 10
+    assert sizer.update(read=10, lag=500) == 20      # full read, deep backlog → grow
+    assert sizer.update(read=20, lag=None) == 40     # full read, lag unknown → grow
+    assert sizer.update(read=40, lag=5000) == 80
+    assert sizer.update(read=80, lag=5000) == 80     # clamped at the ceiling
+    assert sizer.update(read=80, lag=3) == 80        # full read that drained the backlog → hold
+    assert sizer.update(read=7, lag=0) == 40         # under-filled → caught up → shrink
+    for _ in range(5):
+        sizer.update(read=0, lag=0)
+    assert sizer.count == 10                         # never below the floor
+
+
+async def test_consume_adaptive_drains_a_backlog_and_records_histograms(store, bus):
+    from meeting_api import obs
+    from meeting_api.collector.ingest import AdaptiveBatchSize, consume_adaptive
+
+    obs.reset_metrics()
+    for i in range(300):
+        await bus.xadd(STREAM_NAME, {"type": "transcription", "meeting_id": "1",
+                                     "segments": [_seg(f"s{i}", float(i), f"t{i}")]})
+    sizer = AdaptiveBatchSize(minimum=10, maximum=100)
+    counts, total = [], 0
+    while True:
+        counts.append(sizer.count)
+        n = await consume_adaptive(store, bus, sizer, block_ms=10)
+        if not n:
+            break
+        total += n
+    assert total == 300
+    assert counts[:4] == [10, 20, 40, 80] and max(counts) == 100  # grew while the lag outran a batch
+    assert sizer.count < 100                                       # the empty tail read shrank it
+    snap = obs.metrics_snapshot()
+    assert snap["collector.batch_size"]["sum"] == 300
+    assert snap["collector.ingest_latency_s"]["count"] == len(counts) - 1
+    assert snap["collector.stream_lag"]["count"] >= 1
+    assert await bus.stream_lag(group="collector_group", stream=STREAM_NAME) == 0
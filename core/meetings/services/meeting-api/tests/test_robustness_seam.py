@@ -279,9 +279,9 @@ def test_segment_consumer_loop_survives_a_throwing_tick():
 
 def test_real_loop_factory_survives_throwing_consume(monkeypatch):
     """Build the production app+loops via __main__._attach_background_loops and confirm the wired
-    `_segment_consumer_loop` (the SHIPPED closure) survives a `consume_segments` that throws once.
+    `_segment_consumer_loop` (the SHIPPED closure) survives a `consume_adaptive` that throws once.
 
-    We patch the module-level `consume_segments` the loop imports, start the loop task, let it tick
+    We patch the module-level `consume_adaptive` the loop imports, start the loop task, let it tick
     a few times, then assert the task is still RUNNING (not crashed) and that consume was retried."""
     import importlib
 
@@ -289,19 +289,19 @@ def test_real_loop_factory_survives_throwing_consume(monkeypatch):
 
     # `meeting_api.collector.__init__` re-exports the `ingest` function, shadowing the submodule for
     # attribute access — use importlib to get the real module object. `_attach_background_loops` does
-    # `from .collector.ingest import consume_segments` at call-time, so patching the module attr here
+    # `from .collector.ingest import consume_adaptive` at call-time, so patching the module attr here
     # (before the attach) is what the loop closure will pick up.
     ingest_mod = importlib.import_module("meeting_api.collector.ingest")
 
     calls = {"n": 0}
 
-    async def flaky_consume(store, redis, **kwargs):
+    async def flaky_consume(store, redis, sizer, **kwargs):
         calls["n"] += 1
         if calls["n"] == 1:
             raise RuntimeError("transient stream read failure")
         return 0
 
-    monkeypatch.setattr(ingest_mod, "consume_segments", flaky_consume)
+    monkeypatch.setattr(ingest_mod, "consume_adaptive", flaky_consume)
     monkeypatch.setenv("SEGMENT_CONSUMER_INTERVAL", "0")  # tight loop for the test
 
     async def _run():
@@ -22,6 +22,7 @@ from meeting_api.webhooks import (
     build_system_webhook_from_env,
     verify_signature,
 )
+from meeting_api.webhooks.retry import due_key
 
 
 SECRET = "system-callback-secret"
@@ -202,8 +203,8 @@ async def test_retry_uses_system_queue_and_same_event_identity(
     result = await system.deliver(envelope, label="meeting:43")
     assert result.status == "queued"
     assert await system.retry_depth() == 1
-    assert await fake_redis.llen(SYSTEM_RETRY_QUEUE_KEY) == 1
-    assert await fake_redis.llen(RETRY_QUEUE_KEY) == 0
+    assert await fake_redis.zcard(due_key(SYSTEM_RETRY_QUEUE_KEY)) == 1
+    assert await fake_redis.zcard(due_key(RETRY_QUEUE_KEY)) == 0
 
     receiver.default_code = 200
     processed = await system.drain(
@@ -79,3 +79,250 @@ async def test_merge_without_redis_returns_persisted_only():
     doc = await store._merge_live_segments((_snap(), seg_by_id, order), viewer_is_owner=True)
     assert [s["segment_id"] for s in doc["segments"]] == ["s-pg"]
     assert list(doc.keys()) == EXPECTED_KEYS
+
+
+# ── the versioned assembly cache for TERMINAL meetings ──────────────────────────────────────────
+
+
+class _NullSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+async def test_terminal_transcript_is_served_from_the_versioned_cache_until_a_write_bumps_it():
+    """A completed meeting's assembled segments are cached under its transcript version: a re-read
+    skips the row SELECT + assembly, the per-viewer projection is still applied to the fresh row,
+    and a sink write (here the version bump ``upsert_segments`` performs) forces re-assembly."""
+    import fakeredis.aioredis
+
+    from meeting_api import obs
+
+    obs.reset_metrics()
+    redis = fakeredis.aioredis.FakeRedis()
+    store = SqlAlchemyTranscriptStore(session_factory=_NullSession, redis_client=redis)
+    selects = []
+
+    async def _select_segments(db, meeting_id):
+        selects.append(meeting_id)
+        return _pg_part()
+
+    store._select_segments = _select_segments
+    snap = {**_snap(), "status": "completed",
+            "data": {**_snap()["data"], "webhook_url": "https://owner.example/hook"}}
+
+    owner = await store._cached_transcript(snap, viewer_is_owner=True)
+    viewer = await store._cached_transcript(snap, viewer_is_owner=False)
+    assert selects == [5]  # the second read was a cache hit
+    assert owner["segments"] == viewer["segments"]
+    assert owner["data"]["webhook_url"] == "https://owner.example/hook"
+    assert "webhook_url" not in viewer["data"]  # projection applied AFTER the cache, per viewer
+    assert list(owner.keys()) == EXPECTED_KEYS
+
+    await store._bump_transcript_version(5)
+    await store._cached_transcript(snap, viewer_is_owner=True)
+    assert selects == [5, 5]
+    metrics = obs.metrics_snapshot()
+    assert metrics["transcript_cache.hit"] == 1 and metrics["transcript_cache.miss"] == 2
+    await redis.aclose()
+
+
+async def test_terminal_transcript_read_goes_uncached_when_the_version_is_unreadable():
+    """A redis that cannot answer the version read must not be trusted with a cached answer — the
+    read assembles from the rows, every time."""
+    class _DownRedis(_RedisStub):
+        async def get(self, key):
+            raise ConnectionError("redis down")
+
+    store = SqlAlchemyTranscriptStore(session_factory=_NullSession, redis_client=_DownRedis({}))
+    selects = []
+
+    async def _select_segments(db, meeting_id):
+        selects.append(meeting_id)
+        return _pg_part()
+
+    store._select_segments = _select_segments
+    snap = {**_snap(), "status": "completed"}
+    for _ in range(2):
+        doc = await store._cached_transcript(snap, viewer_is_owner=True)
+        assert [s["segment_id"] for s in doc["segments"]] == ["s-pg"]
+    assert selects == [5, 5]
+
+
+async def test_a_failed_version_bump_drops_this_replicas_cached_assembly():
+    """A bump redis refused must not leave the old assembly served for the token's 7-day life: the
+    writing replica drops its entry, so the next read re-assembles."""
+    import fakeredis.aioredis
+
+    redis = fakeredis.aioredis.FakeRedis()
+    store = SqlAlchemyTranscriptStore(session_factory=_NullSession, redis_client=redis)
+    selects = []
+
+    async def _select_segments(db, meeting_id):
+        selects.append(meeting_id)
+        return _pg_part()
+
+    store._select_segments = _select_segments
+    snap = {**_snap(), "status": "completed"}
+    await store._cached_transcript(snap, viewer_is_owner=True)
+
+    real_set = redis.set
+
+    async def _refused(*args, **kwargs):
+        raise ConnectionError("redis down")
+
+    redis.set = _refused
+    await store._bump_transcript_version(5)
+    redis.set = real_set
+    await store._cached_transcript(snap, viewer_is_owner=True)
+    assert selects == [5, 5]
+    await redis.aclose()
+
+
+def test_cached_assembly_ages_out_whatever_its_version(monkeypatch):
+    from meeting_api.collector import transcript_cache
+    from meeting_api.collector.transcript_cache import TranscriptCache
+
+    now = [1000.0]
+    monkeypatch.setattr(transcript_cache.time, "monotonic", lambda: now[0])
+    cache = TranscriptCache(maxsize=4, max_age_s=60)
+    cache.put(5, "v1", ["seg"])
+    now[0] += 59
+    assert cache.get(5, "v1") == ["seg"]
+    now[0] += 2
+    assert cache.get(5, "v1") is None and len(cache) == 0
+
+
+def test_local_versions_are_a_bounded_lru():
+    from meeting_api.collector.transcript_cache import LocalVersions
+
+    versions = LocalVersions(maxsize=2)
+    first = versions.current(1)
+    assert versions.current(1) == first
+    versions.current(2)
+    versions.current(3)              # evicts meeting 1, the least recently read
+    assert len(versions) == 2
+    assert versions.current(1) != first   # re-minted fresh: a miss, never a stale hit
+    token = versions.current(3)
+    versions.bump(3)
+    assert versions.current(3) != token
+
+
+async def test_appending_a_segment_bumps_the_transcript_version():
+    """A late segment for a settled meeting invalidates its cached assembly — the bump rides the
+    append's own MULTI."""
+    import fakeredis.aioredis
+
+    from meeting_api.collector.transcript_cache import transcript_version_key
+
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    store = SqlAlchemyTranscriptStore(session_factory=None, redis_client=redis)
+    seg = {"segment_id": "s1", "start": 1.0, "end": 2.0, "text": "late", "completed": True}
+    await store.append_segment(5, seg)
+    first = await redis.get(transcript_version_key(5))
+    assert first is not None
+    await store.append_segments(5, [{**seg, "segment_id": "s2"}])
+    assert await redis.get(transcript_version_key(5)) not in (None, first)
+    await redis.aclose()
+
+
+async def _sqlite_transcriptions(rows):
+    """An in-memory sqlite engine holding meeting 5's ``transcriptions`` as ``(start, segment_id)``
+    rows (text ``t<i>``), with the bytewise "C" collation the keyset tiebreak names."""
+    from sqlalchemy import event, text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _c_collation(dbapi_conn, _record):
+        # Postgres ships the bytewise "C" collation the tiebreak names; sqlite needs it registered.
+        aconn = dbapi_conn.driver_connection
+        dbapi_conn.run_async(lambda _c: aconn._execute(
+            aconn._conn.create_collation, "C", lambda a, b: (a > b) - (a < b)))
+
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE transcriptions (id INTEGER PRIMARY KEY, meeting_id INTEGER NOT NULL, "
+            "start_time FLOAT NOT NULL, end_time FLOAT NOT NULL, text TEXT NOT NULL, speaker TEXT, "
+            "language TEXT, created_at TIMESTAMP, session_uid TEXT, segment_id TEXT)"
+        ))
+        for i, (start, sid) in enumerate(rows):
+            await conn.execute(text(
+                "INSERT INTO transcriptions (meeting_id, start_time, end_time, text, segment_id) "
+                "VALUES (5, :s, :e, :t, :sid)"), {"s": start, "e": start + 1, "t": f"t{i}", "sid": sid})
+    return engine
+
+
+async def test_windowed_read_pushes_range_cursor_and_limit_into_sql():
+    """``_select_segments`` with a window filters, orders by (start_time, segment_id) and LIMITs in
+    the SELECT itself — the rows never reach Python — and a cursor resumes strictly after a tie.
+    The live-hash merge then keeps only hash entries inside the same window."""
+    import pytest
+
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from meeting_api.collector.transcript_window import TranscriptWindow
+
+    engine = await _sqlite_transcriptions(
+        [(1.0, "a"), (2.0, "b"), (2.0, "c"), (3.0, "d"), (9.0, "e")])
+    selects: list[str] = []
+    event.listen(engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cur, stmt, *a: selects.append(stmt) if "SELECT" in stmt else None)
+    store = SqlAlchemyTranscriptStore(session_factory=async_sessionmaker(engine), redis_client=None)
+
+    async with store._session_factory() as db:
+        first, order = await store._select_segments(db, 5, TranscriptWindow(start_to=5.0, limit=2))
+        rest, rest_order = await store._select_segments(
+            db, 5, TranscriptWindow.from_query(after="2.0/b", start_to=5.0))
+    await engine.dispose()
+    assert order == ["a", "b"]
+    assert rest_order == ["c", "d"]
+    assert "LIMIT" in selects[0] and "ORDER BY" in selects[0]
+    assert selects[0].count('COLLATE "C"') == 1                    # the ORDER BY tiebreak
+    assert selects[1].count('COLLATE "C"') == 3                    # + both sides of the cursor tie
+
+    hash_map = {"meeting:5:segments": {
+        "c": json.dumps({"segment_id": "c", "start": 2.0, "end": 3.0, "text": "live c"}),
+        "z": json.dumps({"segment_id": "z", "start": 7.0, "end": 8.0, "text": "out of range"}),
+    }}
+    store._redis = _RedisStub(hash_map)
+    doc = await store._merge_live_segments(
+        (_snap(), rest, rest_order), viewer_is_owner=True,
+        window=TranscriptWindow.from_query(after="2.0/b", start_to=5.0))
+    assert [s["text"] for s in doc["segments"]] == ["live c", "t3"]
+
+
+async def test_a_hash_override_across_the_page_edge_never_skips_a_persisted_row():
+    """Rows A(1), B(2), C(3) with limit=2 and the hash moving B to 10: the SQL page [A, B] would
+    merge to [A, B@10], whose cursor jumps past C for good. The full page is re-read wide enough
+    that C fills the slot B vacated, and paging on visits every segment exactly once."""
+    import pytest
+
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from meeting_api.collector.transcript_window import TranscriptWindow, cursor_for
+
+    engine = await _sqlite_transcriptions([(1.0, "a"), (2.0, "b"), (3.0, "c")])
+    store = SqlAlchemyTranscriptStore(session_factory=async_sessionmaker(engine), redis_client=_RedisStub(
+        {"meeting:5:segments": {"b": json.dumps({"segment_id": "b", "start": 10.0, "end": 11.0,
+                                                  "text": "moved b"})}}))
+    seen, after = [], None
+    for _ in range(4):
+        window = TranscriptWindow.from_query(after=after, limit=2)
+        async with store._session_factory() as db:
+            pg = (_snap(), *await store._select_segments(db, 5, window))
+        page = (await store._merge_live_segments(pg, viewer_is_owner=True, window=window))["segments"]
+        seen += [s["text"] for s in page]
+        if len(page) < 2:
+            break
+        after = cursor_for(page[-1])
+    await engine.dispose()
+    assert seen == ["t0", "t2", "moved b"]
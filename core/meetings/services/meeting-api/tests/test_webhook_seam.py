@@ -31,7 +31,6 @@ import pytest
 from meeting_api.webhooks import (
     BACKOFF_SCHEDULE,
     MAX_AGE_SECONDS,
-    RETRY_QUEUE_KEY,
     DeliveryResult,
     RetryQueue,
     SSRFError,
@@ -47,6 +46,9 @@ from meeting_api.webhooks.retry import (
     DEAD_LETTER_KEY,
     DEFAULT_LEASE_SECONDS,
     PROCESSING_KEY,
+    RETRY_QUEUE_KEY,
+    RETRY_DUE_KEY,
+    migrate_legacy_queue,
 )
 
 SECRET = "whsec_seam_secret"
@@ -55,6 +57,20 @@ URL = "https://hooks.example.com/vexa"
 # A resolver stub so the SSRF guard never touches DNS for our public test host.
 _PUBLIC = lambda host: ["93.184.216.34"]  # noqa: E731
 
+
+
+async def _head(redis) -> Optional[str]:
+    """The earliest-due queued entry (raw JSON), or None."""
+    members = await redis.zrange(RETRY_DUE_KEY, 0, 0)
+    return members[0] if members else None
+
+
+async def _rewrite_head(redis, entry: dict) -> None:
+    """Replace the earliest-due queued entry with ``entry`` (re-scored by its next_retry_at)."""
+    await redis.zrem(RETRY_DUE_KEY, await _head(redis))
+    await redis.zadd(RETRY_DUE_KEY, {json.dumps(entry): entry["next_retry_at"]})
+
+
 # A per-client config: subscribed to meeting.completed, explicitly OFF for status_change.
 SUBSCRIBED = {"meeting.completed": True, "meeting.status_change": False}
 
@@ -401,7 +417,7 @@ def test_documented_schedule_constants():
 async def test_enqueue_first_retry_uses_first_backoff(fake_redis):
     queue = RetryQueue(fake_redis)
     await queue.enqueue(url=URL, envelope={"x": 1}, webhook_secret=SECRET, now=1000.0)
-    raw = await fake_redis.lindex(RETRY_QUEUE_KEY, 0)
+    raw = await _head(fake_redis)
     entry = json.loads(raw)
     assert entry["attempt"] == 0
     assert entry["next_retry_at"] == 1000.0 + BACKOFF_SCHEDULE[0], "first retry after 60s"
@@ -425,7 +441,7 @@ async def test_backoff_delays_match_schedule_each_sweep(fake_redis):
 
     # The first wait is the one enqueue set (base+60); each later wait is the one a failed drain
     # sweep sets on the requeued entry. Together they form the effective wait sequence.
-    first_due = json.loads(await fake_redis.lindex(RETRY_QUEUE_KEY, 0))["next_retry_at"]
+    first_due = json.loads(await _head(fake_redis))["next_retry_at"]
     effective_delays: List[float] = [first_due - base]
     clock = base
     for _ in range(len(BACKOFF_SCHEDULE) + 2):
@@ -433,13 +449,13 @@ async def test_backoff_delays_match_schedule_each_sweep(fake_redis):
         if depth == 0:
             break  # exhausted/dropped
         # Advance just past the due time so the single entry is processed this sweep.
-        raw = await fake_redis.lindex(RETRY_QUEUE_KEY, 0)
+        raw = await _head(fake_redis)
         due = json.loads(raw)["next_retry_at"]
         clock = due + 1
         await drain_retry_queue(fake_redis, t, now=clock)
         if await queue.depth() == 0:
             break
-        nxt = json.loads(await fake_redis.lindex(RETRY_QUEUE_KEY, 0))
+        nxt = json.loads(await _head(fake_redis))
         effective_delays.append(nxt["next_retry_at"] - clock)
 
     # WH3 FIXED: enqueue sets the first wait to BACKOFF[0] (60) and the drain indexes the NEXT
@@ -464,12 +480,12 @@ async def test_backoff_caps_at_last_entry(fake_redis):
     for _ in range(len(BACKOFF_SCHEDULE) + 2):
         if await queue.depth() == 0:
             break
-        raw = await fake_redis.lindex(RETRY_QUEUE_KEY, 0)
+        raw = await _head(fake_redis)
         due = json.loads(raw)["next_retry_at"]
         clock = due + 1
         await drain_retry_queue(fake_redis, t, now=clock)
         if await queue.depth() > 0:
-            nxt = json.loads(await fake_redis.lindex(RETRY_QUEUE_KEY, 0))
+            nxt = json.loads(await _head(fake_redis))
             last_requeue_delay = nxt["next_retry_at"] - clock
     # The largest delay ever applied is the cap, never exceeded.
     assert last_requeue_delay is None or last_requeue_delay <= float(BACKOFF_SCHEDULE[-1])
@@ -492,7 +508,7 @@ async def test_exhausted_schedule_drops_entry(fake_redis):
     for _ in range(len(BACKOFF_SCHEDULE) + 5):
         if await queue.depth() == 0:
             break
-        raw = await fake_redis.lindex(RETRY_QUEUE_KEY, 0)
+        raw = await _head(fake_redis)
         due = json.loads(raw)["next_retry_at"]
         clock = due + 1
         await drain_retry_queue(fake_redis, t, now=clock)
@@ -519,16 +535,16 @@ async def test_total_delivery_attempts_is_bounded(fake_redis):
     # next_retry_at, so fix up the entry's clock to our deterministic base for the sweeps.
     await sink.deliver(URL, build_envelope("meeting.completed", {"m": 1}), SECRET,
                        events_config=SUBSCRIBED)
-    raw = json.loads(await fake_redis.lindex(RETRY_QUEUE_KEY, 0))
+    raw = json.loads(await _head(fake_redis))
     raw["created_at"] = base
     raw["next_retry_at"] = base + BACKOFF_SCHEDULE[0]
-    await fake_redis.lset(RETRY_QUEUE_KEY, 0, json.dumps(raw))
+    await _rewrite_head(fake_redis, raw)
 
     clock = base
     for _ in range(len(BACKOFF_SCHEDULE) + 3):
         if await queue.depth() == 0:
             break
-        cur = await fake_redis.lindex(RETRY_QUEUE_KEY, 0)
+        cur = await _head(fake_redis)
         if cur is None:
             break
         clock = json.loads(cur)["next_retry_at"] + 1
@@ -567,12 +583,12 @@ async def test_dead_letter_on_permanent_failure(fake_redis, capsys):
     for _ in range(len(BACKOFF_SCHEDULE) + 2):
         if await queue.depth() == 0:
             break
-        cur = await fake_redis.lindex(RETRY_QUEUE_KEY, 0)
+        cur = await _head(fake_redis)
         clock = json.loads(cur)["next_retry_at"] + 1
         await drain_retry_queue(fake_redis, t, now=clock)
 
     # The permanently-failed envelope lands in the dead-letter queue (not silently dropped).
-    assert await fake_redis.llen(RETRY_QUEUE_KEY) == 0, "retry queue must be drained"
+    assert await fake_redis.zcard(RETRY_DUE_KEY) == 0, "retry queue must be drained"
     dlq_depth = await fake_redis.llen(DEAD_LETTER_KEY)
     assert dlq_depth == 1, (
         "expected the permanently-failed envelope to land in a dead-letter queue "
@@ -633,10 +649,10 @@ async def test_transport_exception_text_is_never_logged_or_dead_lettered(
         now=base,
         label="meeting:8",
     )
-    raw = json.loads(await fake_redis.lindex(RETRY_QUEUE_KEY, 0))
+    raw = json.loads(await _head(fake_redis))
     raw["attempt"] = len(BACKOFF_SCHEDULE) - 1
     raw["next_retry_at"] = base
-    await fake_redis.lset(RETRY_QUEUE_KEY, 0, json.dumps(raw))
+    await _rewrite_head(fake_redis, raw)
 
     transport = ScriptedTransport(script=[RuntimeError(secret_text)])
     await drain_retry_queue(fake_redis, transport, now=base + 1)
@@ -681,16 +697,16 @@ async def test_recover_after_n_failures_delivers_once_then_stops(fake_redis):
     assert res.status == "queued"
 
     # Normalize the entry's clock to base for deterministic sweeps.
-    raw = json.loads(await fake_redis.lindex(RETRY_QUEUE_KEY, 0))
+    raw = json.loads(await _head(fake_redis))
     raw["created_at"] = base
     raw["next_retry_at"] = base + BACKOFF_SCHEDULE[0]
-    await fake_redis.lset(RETRY_QUEUE_KEY, 0, json.dumps(raw))
+    await _rewrite_head(fake_redis, raw)
 
     clock = base
     for _ in range(len(BACKOFF_SCHEDULE) + 2):
         if await queue.depth() == 0:
             break
-        cur = await fake_redis.lindex(RETRY_QUEUE_KEY, 0)
+        cur = await _head(fake_redis)
         clock = json.loads(cur)["next_retry_at"] + 1
         await drain_retry_queue(fake_redis, t, now=clock)
 
@@ -711,9 +727,9 @@ async def test_at_least_once_redelivered_body_still_verifies(fake_redis):
     base = 80_000_000_000.0
     await sink.deliver(URL, build_envelope("meeting.completed", {"m": 1}), SECRET,
                        events_config=SUBSCRIBED)
-    raw = json.loads(await fake_redis.lindex(RETRY_QUEUE_KEY, 0))
+    raw = json.loads(await _head(fake_redis))
     raw["next_retry_at"] = base
-    await fake_redis.lset(RETRY_QUEUE_KEY, 0, json.dumps(raw))
+    await _rewrite_head(fake_redis, raw)
     await drain_retry_queue(fake_redis, t, now=base + 1)
     assert await queue.depth() == 0
     redelivered = t.received[-1]
@@ -727,7 +743,7 @@ async def test_at_least_once_redelivered_body_still_verifies(fake_redis):
 #
 # The old drain LPOPped every entry into a process-local list and RPUSHed it back only at
 # the END of the sweep — a crash mid-sweep lost every popped entry. The fix moves each entry
-# atomically into a Redis PROCESSING_KEY list (RPOPLPUSH) while in-flight, so a crash leaves it
+# into a Redis PROCESSING_KEY list (copied before it leaves the queue) while in-flight, so a crash leaves it
 # recoverable; the next tick reclaims processing entries older than the lease. These tests pin
 # that no entry is EVER held only in process memory, and that redelivery is bounded by the lease
 # (so a live delivery is never reclaimed out from under itself).
@@ -762,7 +778,7 @@ async def test_crash_mid_sweep_entry_survives_in_processing_and_redelivers(fake_
     with pytest.raises(asyncio.CancelledError):
         await drain_retry_queue(fake_redis, crash, now=due + 1)
     assert crash.calls == 1
-    assert await fake_redis.llen(RETRY_QUEUE_KEY) == 0, "the entry was claimed OUT of the queue"
+    assert await fake_redis.zcard(RETRY_DUE_KEY) == 0, "the entry was claimed OUT of the queue"
     assert await fake_redis.llen(PROCESSING_KEY) == 1, (
         "the in-flight entry SURVIVES in the processing list (base sha would have lost it)"
     )
@@ -777,7 +793,7 @@ async def test_crash_mid_sweep_entry_survives_in_processing_and_redelivers(fake_
     await drain_retry_queue(fake_redis, healthy, now=due + 1 + DEFAULT_LEASE_SECONDS + 1)
     assert healthy.calls == 1, "the orphaned entry is reclaimed + redelivered past the lease"
     assert await fake_redis.llen(PROCESSING_KEY) == 0, "delivered → removed from processing"
-    assert await fake_redis.llen(RETRY_QUEUE_KEY) == 0, "delivered → not re-queued"
+    assert await fake_redis.zcard(RETRY_DUE_KEY) == 0, "delivered → not re-queued"
     # Redelivery is at-least-once; #519's deterministic event_id lets the receiver dedupe it, and
     # the redelivered body still verifies under a fresh timestamp.
     redelivered = healthy.received[-1]
@@ -802,7 +818,7 @@ async def test_reclaim_recovers_unstamped_processing_entry(fake_redis):
     await drain_retry_queue(fake_redis, healthy, now=base + BACKOFF_SCHEDULE[0] + 1)
     assert healthy.calls == 1, "an unstamped processing entry is reclaimed and delivered"
     assert await fake_redis.llen(PROCESSING_KEY) == 0
-    assert await fake_redis.llen(RETRY_QUEUE_KEY) == 0
+    assert await fake_redis.zcard(RETRY_DUE_KEY) == 0
 
 
 async def test_normal_sweep_never_leaks_into_processing(fake_redis):
@@ -817,13 +833,13 @@ async def test_normal_sweep_never_leaks_into_processing(fake_redis):
     await drain_retry_queue(fake_redis, ScriptedTransport(default_code=500),
                             now=base + BACKOFF_SCHEDULE[0] + 1)
     assert await fake_redis.llen(PROCESSING_KEY) == 0, "a resolved reschedule leaves processing empty"
-    assert await fake_redis.llen(RETRY_QUEUE_KEY) == 1, "the rescheduled entry is back in the queue"
+    assert await fake_redis.zcard(RETRY_DUE_KEY) == 1, "the rescheduled entry is back in the queue"
 
     # A succeeding sweep drops it → both lists empty.
-    nxt = json.loads(await fake_redis.lindex(RETRY_QUEUE_KEY, 0))["next_retry_at"]
+    nxt = json.loads(await _head(fake_redis))["next_retry_at"]
     await drain_retry_queue(fake_redis, ScriptedTransport(default_code=200), now=nxt + 1)
     assert await fake_redis.llen(PROCESSING_KEY) == 0
-    assert await fake_redis.llen(RETRY_QUEUE_KEY) == 0, "delivered → drained, nothing stranded"
+    assert await fake_redis.zcard(RETRY_DUE_KEY) == 0, "delivered → drained, nothing stranded"
 
 
 async def test_dead_letter_leaves_processing_empty(fake_redis):
@@ -837,8 +853,100 @@ async def test_dead_letter_leaves_processing_empty(fake_redis):
     for _ in range(len(BACKOFF_SCHEDULE) + 2):
         if await queue.depth() == 0:
             break
-        cur = await fake_redis.lindex(RETRY_QUEUE_KEY, 0)
+        cur = await _head(fake_redis)
         await drain_retry_queue(fake_redis, t, now=json.loads(cur)["next_retry_at"] + 1)
-    assert await fake_redis.llen(RETRY_QUEUE_KEY) == 0
+    assert await fake_redis.zcard(RETRY_DUE_KEY) == 0
     assert await fake_redis.llen(PROCESSING_KEY) == 0, "dead-lettered entry not stranded in processing"
     assert await fake_redis.llen(DEAD_LETTER_KEY) == 1, "it landed in the dead-letter list"
+
+
+# ════════════════════════════════════════════════════════════════════════════════════
+# (i) the due index: a tick touches only due entries, delivers them concurrently under a
+#     global + per-host cap, and folds in the pre-ZSET retry list
+# ════════════════════════════════════════════════════════════════════════════════════
+
+
+class GatedTransport:
+    """Holds every delivery until released, tracking peak in-flight overall and per host."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.in_flight: Dict[str, int] = {}
+        self.peak = 0
+        self.peak_host: Dict[str, int] = {}
+
+    async def __call__(self, url: str, body: bytes, headers: Dict[str, str]):
+        host = url.split("/")[2]
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.peak = max(self.peak, sum(self.in_flight.values()))
+        self.peak_host[host] = max(self.peak_host.get(host, 0), self.in_flight[host])
+        await self.release.wait()
+        self.in_flight[host] -= 1
+        return _Resp(200)
+
+
+async def test_tick_touches_only_due_entries(fake_redis):
+    queue = RetryQueue(fake_redis)
+    base = 94_000_000_000.0
+    await queue.enqueue(url=URL, envelope={"m": "due"}, webhook_secret=SECRET, now=base)
+    for i in range(50):
+        await queue.enqueue(url=URL, envelope={"m": i}, webhook_secret=SECRET, now=base + 3600)
+    future = set(await fake_redis.zrange(RETRY_DUE_KEY, 1, -1))
+
+    t = ScriptedTransport(default_code=200)
+    processed = await drain_retry_queue(fake_redis, t, now=base + BACKOFF_SCHEDULE[0] + 1)
+    assert processed == 1 and t.calls == 1
+    assert json.loads(t.received[0]["body"]) == {"m": "due"}
+    # the 50 not-yet-due members were never claimed or rewritten
+    assert set(await fake_redis.zrange(RETRY_DUE_KEY, 0, -1)) == future
+    assert await fake_redis.llen(PROCESSING_KEY) == 0
+
+
+async def test_due_entries_deliver_concurrently_under_global_and_per_host_caps(fake_redis):
+    queue = RetryQueue(fake_redis)
+    base = 95_000_000_000.0
+    for host in ("a.example.com", "b.example.com", "c.example.com"):
+        for i in range(6):
+            await queue.enqueue(url=f"https://{host}/hook", envelope={"m": i},
+                                webhook_secret=SECRET, now=base)
+
+    t = GatedTransport()
+    sweep = asyncio.create_task(drain_retry_queue(
+        fake_redis, t, now=base + BACKOFF_SCHEDULE[0] + 1, concurrency=5, per_host=2,
+    ))
+    for _ in range(50):
+        await asyncio.sleep(0)
+    assert t.peak == 5, "the global cap is filled, not serialized"
+    assert max(t.peak_host.values()) == 2, "no host gets more than its per-host cap"
+    t.release.set()
+    assert await sweep == 18
+    assert t.peak == 5 and max(t.peak_host.values()) == 2
+    assert await queue.depth() == 0 and await fake_redis.llen(PROCESSING_KEY) == 0
+
+
+async def test_legacy_list_entries_migrate_into_the_due_index(fake_redis):
+    base = 96_000_000_000.0
+    legacy = [
+        {"url": URL, "payload": {"m": 1}, "webhook_secret": SECRET, "label": "",
+         "attempt": 0, "next_retry_at": base + 60, "created_at": base},
+        {"url": URL, "payload": {"m": 2}, "webhook_secret": SECRET, "label": "",
+         "attempt": 1, "next_retry_at": base + 7200, "created_at": base},
+    ]
+    for entry in legacy:
+        await fake_redis.rpush(RETRY_QUEUE_KEY, json.dumps(entry))  # as a pre-ZSET replica wrote it
+    queue = RetryQueue(fake_redis)
+    assert await queue.depth() == 2, "depth counts a not-yet-migrated list"
+
+    assert await migrate_legacy_queue(fake_redis) == 2
+    assert await fake_redis.llen(RETRY_QUEUE_KEY) == 0
+    assert await fake_redis.zrange(RETRY_DUE_KEY, 0, -1, withscores=True) == [
+        (json.dumps(legacy[0]), base + 60), (json.dumps(legacy[1]), base + 7200),
+    ]
+    assert await migrate_legacy_queue(fake_redis) == 0
+
+    # a replica still on the list mid-rollout: the next tick folds its entry in and delivers it
+    await fake_redis.rpush(RETRY_QUEUE_KEY, json.dumps(dict(legacy[0], payload={"m": 3})))
+    t = ScriptedTransport(default_code=200)
+    assert await drain_retry_queue(fake_redis, t, now=base + 61) == 2
+    assert sorted(json.loads(r["body"])["m"] for r in t.received) == [1, 3]
+    assert await queue.depth() == 1
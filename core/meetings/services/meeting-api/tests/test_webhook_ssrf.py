@@ -3,16 +3,23 @@
 Asserts: localhost / loopback / link-local (incl. cloud metadata) / private CIDRs /
 internal Docker hostnames / non-http schemes are BLOCKED; public targets pass; a
 WebhookSink delivery to a blocked URL returns `blocked` and never touches the transport.
+Async resolution runs off the event loop through a bounded, coalescing, TTL-cached resolver.
 """
 from __future__ import annotations
 
+import asyncio
+import threading
+
 import pytest
 
+from meeting_api.obs import metrics_snapshot
 from meeting_api.webhooks import (
+    CachingResolver,
     SSRFError,
     WebhookSink,
     build_envelope,
     validate_webhook_url,
+    validate_webhook_url_async,
 )
 
 # Resolver stubs so the guard is deterministic + offline.
@@ -79,3 +86,96 @@ async def test_sink_blocks_ssrf_without_touching_transport(receiver):
     result = await sink.deliver("http://localhost/hook", env, "s", events_config={"meeting.completed": True})
     assert result.status == "blocked"
     assert receiver.received == []
+
+
+# ── the async, cached resolver ─────────────────────────────────────────────────────────────────
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _SlowDNS:
+    """A blocking lookup that holds until released, counting calls and peak concurrency."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.release = threading.Event()
+        self.calls: list = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, host):
+        with self._lock:
+            self.calls.append(host)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        self.release.wait(5)
+        with self._lock:
+            self.active -= 1
+        return list(self.answers.get(host, []))
+
+
+async def test_async_resolution_is_off_loop_coalesced_and_bounded():
+    dns = _SlowDNS({f"h{i}.example.com": ["93.184.216.34"] for i in range(4)})
+    resolver = CachingResolver(dns, max_concurrency=2)
+    same = [asyncio.create_task(resolver.resolve("h0.example.com")) for _ in range(5)]
+    others = [asyncio.create_task(resolver.resolve(f"h{i}.example.com")) for i in range(1, 4)]
+
+    ticks = 0
+    while ticks < 20:                      # the loop keeps running while DNS is stuck
+        await asyncio.sleep(0.005)
+        ticks += 1
+    assert dns.peak == 2, "lookups are capped at the pool size"
+    dns.release.set()
+    assert await asyncio.gather(*same) == [["93.184.216.34"]] * 5
+    await asyncio.gather(*others)
+    assert dns.calls.count("h0.example.com") == 1, "concurrent misses on one host share a lookup"
+    resolver.close()
+
+
+async def test_cached_answers_expire_and_failures_are_cached_briefly():
+    answers = {"hooks.example.com": ["93.184.216.34"]}
+    calls: list = []
+
+    def lookup(host):
+        calls.append(host)
+        return list(answers.get(host, []))
+
+    clock = _Clock()
+    resolver = CachingResolver(lookup, ttl_s=30, negative_ttl_s=5, clock=clock, metrics="dns_test")
+    url = "https://hooks.example.com/h"
+    assert (await validate_webhook_url_async(url, resolver=resolver)).pinned_ips == ["93.184.216.34"]
+    await validate_webhook_url_async(url, resolver=resolver)
+    assert calls == ["hooks.example.com"]
+
+    # a rebind after expiry is re-resolved and re-validated — the cache never outlives its TTL
+    answers["hooks.example.com"] = ["10.0.0.7"]
+    clock.now = 31
+    with pytest.raises(SSRFError):
+        await validate_webhook_url_async(url, resolver=resolver)
+
+    for _ in range(3):
+        with pytest.raises(SSRFError):
+            await validate_webhook_url_async("https://nope.invalid/h", resolver=resolver)
+    assert calls.count("nope.invalid") == 1
+    clock.now = 37
+    with pytest.raises(SSRFError):
+        await validate_webhook_url_async("https://nope.invalid/h", resolver=resolver)
+    assert calls.count("nope.invalid") == 2
+
+    snap = metrics_snapshot()
+    assert snap["dns_test.miss"] == 4 and snap["dns_test.hit"] == 1 and snap["dns_test.negative_hit"] == 2
+    assert snap["dns_test.lookup_s"]["count"] == 4
+
+
+async def test_plain_callable_resolvers_still_work_async():
+    with pytest.raises(SSRFError):
+        await validate_webhook_url_async("https://evil.example.com/hook", resolver=_LOOPBACK)
+    out = await validate_webhook_url_async("https://hooks.example.com/h", resolver=_PUBLIC)
+    assert out.pinned_ips == ["93.184.216.34"]
@@ -0,0 +1,152 @@
+"""Benchmark — scheduler API cost with 100k scheduled jobs: the parent's job-JSON ZSET vs the indexed layout.
+
+Seeds ``--jobs`` pending jobs (execute_at spread over a day, ``--due`` of them already due) twice:
+
+  * ``legacy``  — the parent layout: ZSET ``scheduler:jobs`` whose member IS the job JSON; get/cancel
+    scan ``ZRANGE 0 -1`` and decode every job to find one id (reproduced inline here — the scheduler
+    itself only keeps ``migrate_legacy_layout`` for it);
+  * ``indexed`` — ``runtime_kernel.scheduler.Scheduler``: ZSET of ids + per-job hash, so get/cancel are
+    key lookups and ``tick()`` takes a bounded ``ZRANGEBYSCORE … LIMIT`` batch.
+
+and times ``get`` / ``cancel`` of random jobs, ``list(pending, 50)`` and one ``tick()`` (each job
+dispatched to a no-op and recorded completed — the legacy tick takes every due job, the indexed one
+a TICK_BATCH; compare ``tick_ms / tick_jobs``). fakeredis by default (in-process, so it measures the
+work, not the network); ``--redis-url`` points it at a scratch redis (its db is FLUSHED). Run from
+the service root:
+
+    python benchmarks/bench_scheduler_index.py [--jobs 100000] [--due 1000] [--ops 20] [--redis-url URL]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from runtime_kernel.clock import FakeClock  # noqa: E402
+from runtime_kernel.scheduler import (  # noqa: E402
+    JOBS_KEY, LEGACY_EXECUTING_KEY, LEGACY_HISTORY_KEY, LEGACY_JOBS_KEY, Scheduler, _encode, _job_key,
+)
+
+NOW = 1_000_000.0
+
+
+def _jobs(n: int, due: int) -> list[dict]:
+    rng = random.Random(7)
+    return [{
+        "job_id": f"job_{i:016x}", "status": "pending", "created_at": NOW,
+        "execute_at": NOW - rng.uniform(1, 3600) if i < due else NOW + rng.uniform(1, 86400),
+        "request": {"method": "POST", "url": "http://agent-api/invocations", "headers": {},
+                    "body": {"routine": f"r{i}", "subject": "u1"}, "timeout": 30},
+        "retry": {"max_attempts": 3, "backoff": [30, 120, 300], "attempt": 0},
+        "metadata": {"source": "workspace_routine"}, "cron": None, "idempotency_key": None,
+    } for i in range(n)]
+
+
+def _seed(r, jobs: list[dict], layout: str) -> None:
+    for i in range(0, len(jobs), 5000):
+        pipe = r.pipeline(transaction=False)
+        for job in jobs[i:i + 5000]:
+            if layout == "legacy":
+                pipe.zadd(LEGACY_JOBS_KEY, {json.dumps(job): job["execute_at"]})
+            else:
+                pipe.hset(_job_key(job["job_id"]), mapping=_encode(job))
+                pipe.zadd(JOBS_KEY, {job["job_id"]: job["execute_at"]})
+        pipe.execute()
+
+
+# ── the parent's lookups, verbatim in shape ──
+def _legacy_get(r, job_id):
+    for raw in r.zrange(LEGACY_JOBS_KEY, 0, -1):
+        job = json.loads(raw)
+        if job.get("job_id") == job_id:
+            return job
+    return None
+
+
+def _legacy_cancel(r, job_id):
+    for raw in r.zrange(LEGACY_JOBS_KEY, 0, -1):
+        job = json.loads(raw)
+        if job.get("job_id") == job_id:
+            return job if r.zrem(LEGACY_JOBS_KEY, raw) else None
+    return None
+
+
+def _legacy_list(r, limit):
+    jobs = [json.loads(raw) for raw in r.zrange(LEGACY_JOBS_KEY, 0, -1)]
+    jobs.sort(key=lambda j: j.get("execute_at", 0))
+    return jobs[:limit]
+
+
+def _legacy_tick(r):
+    due = r.zrangebyscore(LEGACY_JOBS_KEY, "-inf", NOW)  # unbounded: every due job at once
+    for raw in due:
+        job = json.loads(raw)
+        if not r.zrem(LEGACY_JOBS_KEY, raw):
+            continue
+        job["status"] = "executing"
+        r.hset(LEGACY_EXECUTING_KEY, job["job_id"], json.dumps(job))
+        job["status"], job["result"] = "completed", {"status_code": 200}
+        r.hdel(LEGACY_EXECUTING_KEY, job["job_id"])
+        r.hset(LEGACY_HISTORY_KEY, job["job_id"], json.dumps(job))
+    return len(due)
+
+
+def _timed(fn, reps=1, out=None) -> float:
+    started = time.perf_counter()
+    for _ in range(reps):
+        result = fn()
+    if out is not None:
+        out.append(result)
+    return round((time.perf_counter() - started) / reps * 1000, 3)
+
+
+def _run(r, layout: str, jobs: list[dict], ops: int) -> dict:
+    r.flushdb()
+    _seed(r, jobs, layout)
+    rng = random.Random(11)
+    ids = [j["job_id"] for j in jobs]
+    sched = Scheduler(r, dispatch=lambda req: {"status_code": 200}, clock=FakeClock(start=NOW))
+    if layout == "legacy":
+        get = lambda: _legacy_get(r, rng.choice(ids))  # noqa: E731
+        cancel = lambda: _legacy_cancel(r, ids.pop(rng.randrange(len(ids))))  # noqa: E731
+        lst = lambda: _legacy_list(r, 50)  # noqa: E731
+        tick = lambda: _legacy_tick(r)  # noqa: E731
+    else:
+        get = lambda: sched.get(rng.choice(ids))  # noqa: E731
+        cancel = lambda: sched.cancel(ids.pop(rng.randrange(len(ids))))  # noqa: E731
+        lst = lambda: sched.list(status="pending", limit=50)  # noqa: E731
+        tick = sched.tick
+    fired: list = []
+    row = {"layout": layout, "jobs": len(jobs), "get_ms": _timed(get, ops),
+           "cancel_ms": _timed(cancel, ops), "list_pending_ms": _timed(lst, max(1, ops // 4)),
+           "tick_ms": _timed(tick, out=fired)}
+    row["tick_jobs"] = fired[0]
+    return row
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--jobs", type=int, default=100_000)
+    ap.add_argument("--due", type=int, default=1000)
+    ap.add_argument("--ops", type=int, default=20)
+    ap.add_argument("--redis-url", default=None)
+    args = ap.parse_args()
+    if args.redis_url:
+        import redis
+        r = redis.Redis.from_url(args.redis_url, decode_responses=True)
+    else:
+        import fakeredis
+        r = fakeredis.FakeStrictRedis(decode_responses=True)
+    jobs = _jobs(args.jobs, args.due)
+    for layout in ("legacy", "indexed"):
+        print(json.dumps(_run(r, layout, jobs, args.ops)))
+    r.flushdb()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark — `Runtime.create` latency (quota check on) as workload records pile up: SCAN vs indexed RedisStore.
+
+``Runtime.create`` calls ``store.count_for_owner`` on every spawn once an ``owner_quota`` is set. The
+parent's RedisStore answered it by SCANning every ``runtime:workload:*`` key and GET + pydantic-
+validating each record, so spawn latency grew with every record ever kept. This seeds ``--records``
+historical workloads (mostly stopped, spread over ``--owners`` owners) and times ``--creates`` spawns
+for one owner against:
+
+  * ``scan``    — the parent's SCAN + GET count_for_owner / list (reproduced inline as a subclass);
+  * ``indexed`` — ``runtime_kernel.store.RedisStore``: count_for_owner is one SCARD of the owner's
+    active set, list() one SMEMBERS + pipelined MGET.
+
+at each size in ``--sizes``. The backend is a no-op fake, so the numbers are the store's. fakeredis
+by default; ``--redis-url`` points it at a scratch redis (its db is FLUSHED). Run from the service root:
+
+    python benchmarks/bench_store_quota.py [--sizes 0,10000,50000] [--creates 200] [--stores scan,indexed] [--redis-url URL]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from runtime_kernel.backend import WorkloadHandle  # noqa: E402
+from runtime_kernel.kernel import Runtime  # noqa: E402
+from runtime_kernel.models import BackendKind, RuntimeState, WorkloadSpec, WorkloadStatus  # noqa: E402
+from runtime_kernel.store import RedisStore, WorkloadRecord, _is_active  # noqa: E402
+
+
+class _NoopBackend:
+    name = "process"
+
+    def start(self, workload_id, runnable, env):
+        return WorkloadHandle(workload_id, None)
+
+    def exit_code(self, h):
+        return None
+
+    def terminate(self, h):
+        pass
+
+    def kill(self, h):
+        pass
+
+    def cleanup(self, h):
+        pass
+
+
+class _ScanStore(RedisStore):
+    """The parent's read path: SCAN the keyspace, GET + validate every record."""
+
+    def count_for_owner(self, owner: str) -> int:
+        count = 0
+        for key in self._r.scan_iter(match=f"{self._prefix}*"):
+            raw = self._r.get(key)
+            if raw is None:
+                continue
+            record = WorkloadRecord.from_json(self._s(raw))
+            if record.owner == owner and _is_active(record):
+                count += 1
+        return count
+
+
+def _seed(r, n: int, owners: int) -> None:
+    for i in range(0, n, 5000):
+        pipe = r.pipeline(transaction=False)
+        for j in range(i, min(n, i + 5000)):
+            owner = f"user{j % owners}"
+            state = RuntimeState.running if j % 50 == 0 else RuntimeState.stopped
+            spec = WorkloadSpec(workloadId=f"hist-{j}", profile="test", env={"VEXA_OWNER": owner})
+            status = WorkloadStatus(workloadId=f"hist-{j}", profile="test", state=state,
+                                    backend=BackendKind.process)
+            pipe.set(f"{RedisStore.KEY_PREFIX}hist-{j}",
+                     WorkloadRecord(spec=spec, status=status, owner=owner).to_json())
+        pipe.execute()
+
+
+def _run(r, kind: str, size: int, creates: int, owners: int) -> dict:
+    r.flushdb()
+    _seed(r, size, owners)
+    store = (_ScanStore if kind == "scan" else RedisStore)(r)  # indexes the seeded keyspace once
+    rt = Runtime(backend=_NoopBackend(), profiles={"test": ["true"]}, store=store,
+                 owner_quota=creates + size)
+    samples = []
+    for i in range(creates):
+        spec = WorkloadSpec(workloadId=f"new-{i}", profile="test", env={"VEXA_OWNER": "user0"})
+        started = time.perf_counter()
+        rt.create(spec)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {"store": kind, "records": size, "creates": creates,
+            "create_p50_ms": round(statistics.median(samples), 3),
+            "create_p99_ms": round(samples[int(len(samples) * 0.99) - 1], 3),
+            "active_for_owner": store.count_for_owner("user0")}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="0,10000,50000")
+    ap.add_argument("--creates", type=int, default=200)
+    ap.add_argument("--owners", type=int, default=500)
+    ap.add_argument("--stores", default="scan,indexed",
+                    help="which stores to run (fakeredis SCAN is itself O(n) per page — at 50k records"
+                         " one scan-store spawn takes minutes there)")
+    ap.add_argument("--redis-url", default=None)
+    args = ap.parse_args()
+    if args.redis_url:
+        import redis
+        r = redis.Redis.from_url(args.redis_url, decode_responses=True)
+    else:
+        import fakeredis
+        r = fakeredis.FakeStrictRedis(decode_responses=True)
+    for size in (int(x) for x in args.sizes.split(",")):
+        for kind in args.stores.split(","):
+            # The SCAN path re-reads every record per spawn: cap its spawns so the run finishes.
+            creates = args.creates if kind == "indexed" or size == 0 else max(5, args.creates // 40)
+            print(json.dumps(_run(r, kind, size, creates, args.owners)))
+    r.flushdb()
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ from .store import (
 )
 from .clock import Clock, SystemClock, FakeClock
 from .enforcement import Enforcer
+from .reaper import StopReaper
 from .scheduler import Scheduler, DispatchError
 from .callbacks import (
     CallbackQueue,
@@ -29,7 +30,7 @@ __all__ = [
     "RuntimeState", "StopReason", "BackendKind",
     "WorkloadStore", "WorkloadRecord", "InMemoryStore", "RedisStore", "default_owner",
     "Clock", "SystemClock", "FakeClock",
-    "Enforcer",
+    "Enforcer", "StopReaper",
     "Scheduler", "DispatchError",
     "CallbackQueue", "InMemoryPendingStore", "RedisPendingStore",
 ]
@@ -15,7 +15,6 @@ import json
 import logging
 import os
 import threading
-import time
 import urllib.error
 import urllib.request
 
@@ -70,26 +69,46 @@ def _build_scheduler():
     return Scheduler(client, dispatch=_http_dispatch)
 
 
-def _start_ticker(scheduler) -> None:
+def _start_ticker(scheduler):
     """Run the scheduler's tick() loop in a daemon thread (a real deployment loops tick on an
-    interval; the eval calls tick() explicitly under a FakeClock). Recovers orphans on startup."""
+    interval; the eval calls tick() explicitly under a FakeClock). Migrates a legacy-layout keyspace,
+    then recovers orphans on startup. A tick that filled its batch is followed at once, not after
+    the interval, so a backlog drains at full speed. Returns the shutdown hook: it stops the loop,
+    lets the current tick settle, then closes the scheduler's dispatch pool."""
+    from .scheduler import TICK_BATCH
+
     interval = float(os.getenv("SCHED_TICK_SEC", "5"))
     try:
+        scheduler.migrate_legacy_layout()
         recovered = scheduler.recover_orphans()
         if recovered:
             logger.info("scheduler recovered %d orphaned job(s)", recovered)
     except Exception as e:  # noqa: BLE001 — never let startup recovery crash the boot
         logger.warning("scheduler orphan recovery failed: %s", e)
 
+    stopping = threading.Event()
+
     def _loop() -> None:
-        while True:
+        while not stopping.is_set():
+            processed = 0
             try:
-                scheduler.tick()
+                processed = scheduler.tick()
             except Exception as e:  # noqa: BLE001 — a bad tick must not kill the loop
                 logger.warning("scheduler tick error: %s", e)
-            time.sleep(interval)
+            if processed < TICK_BATCH:
+                stopping.wait(interval)
+
+    ticker = threading.Thread(target=_loop, name="scheduler-tick", daemon=True)
+    ticker.start()
+
+    def _stop() -> None:
+        stopping.set()
+        # An in-flight tick finishes its dispatches (each bounded by its request timeout); one still
+        # running past a lease is reclaimed by another replica anyway.
+        ticker.join(timeout=scheduler.lease)
+        scheduler.close()
 
-    threading.Thread(target=_loop, name="scheduler-tick", daemon=True).start()
+    return _stop
 
 
 def _build_backend():
@@ -112,6 +131,22 @@ def _build_backend():
     return DockerBackend()
 
 
+def _warm_pool_sizes() -> dict[str, int]:
+    """``RUNTIME_WARM_POOL`` as ``{profile: size}`` — ``"meeting-bot=2,agent=1"``; empty ⇒ no pool."""
+    sizes: dict[str, int] = {}
+    for part in os.getenv("RUNTIME_WARM_POOL", "").split(","):
+        name, _, raw = part.strip().partition("=")
+        try:
+            size = int(raw)
+        except ValueError:
+            if name:
+                logger.warning("RUNTIME_WARM_POOL entry %r ignored (want profile=size)", part.strip())
+            continue
+        if name and size > 0:
+            sizes[name] = size
+    return sizes
+
+
 def _kernel_grace_sec() -> float:
     """The kernel's stop-poll window, derived from the SAME env the backends' SIGTERM grace reads
     (RUNTIME_STOP_GRACE_SEC, default 30) plus a small margin. Without this wiring the kernel kept
@@ -133,6 +168,7 @@ def build_production_app():
     from .config_preflight import preflight
     from .kernel import Runtime
     from .profiles import apply_command_overrides, default_registry, worker_image_for
+    from .reaper import StopReaper
 
     # config.v1 boot preflight (ADR-0026): validate the declaration against the env — the runtime has
     # no required-explicit keys today, so this logs the capability tri-states (scheduler · bot_spawn ·
@@ -160,12 +196,33 @@ def build_production_app():
         os.environ["AGENT_WORKER_IMAGE"] = target
 
     scheduler = _build_scheduler()
-    if scheduler is not None:
-        _start_ticker(scheduler)
+    stop_ticker = _start_ticker(scheduler) if scheduler is not None else None
     # apply_command_overrides is a no-op unless BOT_COMMAND / AGENT_WORKER_COMMAND are set (the
     # process-backend / `lite` case) — docker/k8s keep the image entrypoints unchanged.
     profiles = apply_command_overrides(default_registry())
-    runtime = Runtime(backend=backend, profiles=profiles, grace_sec=_kernel_grace_sec())
+    # Stops hand off to ONE reaper thread (SIGTERM → grace → SIGKILL for every in-flight stop), so a
+    # stop request returns `stopping` at once instead of holding a worker for the grace window.
+    reaper = (
+        StopReaper(backend, grace_sec=_kernel_grace_sec())
+        if os.getenv("RUNTIME_ASYNC_STOP", "1") != "0"
+        else None
+    )
+    runtime = Runtime(
+        backend=backend, profiles=profiles, grace_sec=_kernel_grace_sec(), reaper=reaper,
+    )
+    # Docker: an opt-in warm pool per profile (RUNTIME_WARM_POOL="meeting-bot=2") so a spawn claims
+    # a pre-created idle container instead of paying create + start on the join path.
+    pool_sizes = _warm_pool_sizes()
+    if pool_sizes and hasattr(backend, "enable_warm_pool"):
+        backend.enable_warm_pool(
+            {name: (profiles.get(name).runnable, size) for name, size in pool_sizes.items()
+             if name in profiles.names()},
+            idle_sec=float(os.getenv("RUNTIME_WARM_POOL_IDLE_SEC", "900")),
+        )
+    # Docker: follow the daemon's /events so workload exits are pushed (store + callbacks) and
+    # GET /workloads answers from the exit-state cache instead of one inspect per workload.
+    if hasattr(backend, "watch_events") and os.getenv("RUNTIME_DOCKER_EVENTS", "1") != "0":
+        backend.watch_events(on_exit=runtime.observe_exit)
     # Re-adopt the workloads this runtime spawned that are STILL on the substrate (containers/pods
     # survive a runtime recreate untouched): without this, the fresh in-memory registry 404s over a
     # live bot, and the control plane misreads that 404 as "bot gone" — the orphaned-live-bot
@@ -179,7 +236,10 @@ def build_production_app():
             )
     except Exception as e:  # noqa: BLE001 — adoption is a boot aid; it must never block the boot
         logger.warning("workload re-adoption failed: %s", e)
-    return create_app(runtime, scheduler=scheduler)
+    app = create_app(runtime, scheduler=scheduler)
+    if stop_ticker is not None:
+        app.on_event("shutdown")(stop_ticker)
+    return app
 
 
 def main() -> None:
@@ -17,7 +17,7 @@ from pydantic import BaseModel
 from .callbacks import CallbackQueue
 from .kernel import QuotaExceeded, Runtime, StartFailed
 from .models import RuntimeEvent, StopReason, WorkloadSpec
-from .obs import TraceMiddleware, log_event
+from .obs import TraceMiddleware, log_event, metrics_snapshot
 from .scheduler import Scheduler
 
 # A health probe returns True when its dependency is reachable. Probes must never raise.
@@ -102,6 +102,11 @@ def create_app(
                 "capabilities": capability_health()}
         return JSONResponse(body, status_code=200 if healthy else 503)
 
+    @app.get("/metrics")
+    def metrics():
+        """The process-local metrics registry (stop-reaper depth, stop-latency histograms)."""
+        return metrics_snapshot()
+
     @app.post("/workloads", status_code=201)
     def create(spec: WorkloadSpec):
         try:
@@ -187,6 +192,11 @@ def create_app(
     def list_jobs(status: Optional[str] = None, limit: int = 50):
         return _require_scheduler().list(status=status, limit=limit)
 
+    @app.get("/schedule/metrics")
+    def scheduler_metrics():
+        """Tick counters, in-flight dispatches and per-tick lag (now − execute_at)."""
+        return _require_scheduler().metrics()
+
     @app.delete("/schedule/{job_id}")
     def cancel_job(job_id: str):
         cancelled = _require_scheduler().cancel(job_id)
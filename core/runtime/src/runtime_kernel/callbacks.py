@@ -4,18 +4,28 @@ making exit-callback delivery eventually-complete across consumer outages. We re
 a small queue + sweep so the kernel's API doesn't fire-once-and-forget.
 
   • enqueue(url, event)  — record a pending delivery.
-  • sweep()              — try every pending delivery once; drop the ones the receiver acked (2xx/3xx),
-                          KEEP the ones that failed so the next sweep retries them.
+  • sweep()              — try every DUE pending delivery once; drop the ones the receiver acked
+                          (2xx/3xx), KEEP the ones that failed so a later sweep retries them.
 
-The transport is injectable: production posts with httpx; the eval supplies a fake receiver. The
-backing store is a PendingStore Protocol (in-memory by default; a Redis adapter mirrors 0.11's
-`runtime:callback:*` keys)."""
+A failed delivery is rescheduled with exponential backoff (``next_at`` on the record, jittered,
+capped at ``backoff_max``), so a receiver that is down is not hammered on every sweep. A sweep reads
+the store ONCE (the Redis adapter batches it with MGET), posts the due deliveries concurrently through
+a bounded pool, and writes the failures back in one ``put_many``.
+
+The transport is injectable: production posts with one keep-alive httpx client; the eval supplies a
+fake receiver. The backing store is a PendingStore Protocol (in-memory by default; a Redis adapter
+mirrors 0.11's `runtime:callback:*` keys)."""
 from __future__ import annotations
 
 import json
 import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional, Protocol
 
+from .clock import Clock, SystemClock
+
 logger = logging.getLogger("runtime_kernel.callbacks")
 
 
@@ -25,6 +35,7 @@ Poster = Callable[[str, dict, dict], int]
 
 class PendingStore(Protocol):
     def put(self, key: str, value: dict) -> None: ...
+    def put_many(self, items: dict[str, dict]) -> None: ...
     def get_all(self) -> dict[str, dict]: ...
     def delete(self, key: str) -> None: ...
 
@@ -36,6 +47,9 @@ class InMemoryPendingStore:
     def put(self, key: str, value: dict) -> None:
         self._d[key] = value
 
+    def put_many(self, items: dict[str, dict]) -> None:
+        self._d.update(items)
+
     def get_all(self) -> dict[str, dict]:
         return dict(self._d)
 
@@ -47,6 +61,7 @@ class RedisPendingStore:
     """Mirrors 0.11's `runtime:callback:*` pending-callback keys."""
 
     PREFIX = "runtime:callback:"
+    MGET_CHUNK = 500
 
     def __init__(self, redis, ttl: int = 3600) -> None:
         self._r = redis
@@ -59,24 +74,51 @@ class RedisPendingStore:
     def put(self, key: str, value: dict) -> None:
         self._r.set(f"{self.PREFIX}{key}", json.dumps(value), ex=self._ttl)
 
+    def put_many(self, items: dict[str, dict]) -> None:
+        if not items:
+            return
+        pipe = self._r.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(f"{self.PREFIX}{key}", json.dumps(value), ex=self._ttl)
+        pipe.execute()
+
     def get_all(self) -> dict[str, dict]:
+        keys = [self._s(k) for k in self._r.scan_iter(match=f"{self.PREFIX}*", count=self.MGET_CHUNK)]
         out: dict[str, dict] = {}
-        for raw_key in self._r.scan_iter(match=f"{self.PREFIX}*"):
-            k = self._s(raw_key)
-            raw = self._r.get(k)
-            if raw is None:
-                continue
-            out[k[len(self.PREFIX):]] = json.loads(self._s(raw))
+        for i in range(0, len(keys), self.MGET_CHUNK):
+            chunk = keys[i:i + self.MGET_CHUNK]
+            for k, raw in zip(chunk, self._r.mget(chunk)):
+                if raw is not None:  # expired between SCAN and MGET
+                    out[k[len(self.PREFIX):]] = json.loads(self._s(raw))
         return out
 
     def delete(self, key: str) -> None:
         self._r.delete(f"{self.PREFIX}{key}")
 
 
-def _http_poster(url: str, payload: dict, headers: dict) -> int:
-    import httpx
+class _HttpPoster:
+    """The production poster: ONE keep-alive httpx client (thread-safe) shared by every delivery, so
+    a sweep to the same receiver reuses its connections instead of a TCP/TLS handshake per POST."""
+
+    def __init__(self, max_connections: int) -> None:
+        self._max_connections = max_connections
+        self._client = None
+        self._lock = threading.Lock()
 
-    return httpx.post(url, json=payload, headers=headers, timeout=10.0).status_code
+    def __call__(self, url: str, payload: dict, headers: dict) -> int:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import httpx
+
+                    self._client = httpx.Client(
+                        timeout=10.0,
+                        limits=httpx.Limits(
+                            max_connections=self._max_connections,
+                            max_keepalive_connections=self._max_connections,
+                        ),
+                    )
+        return self._client.post(url, json=payload, headers=headers).status_code
 
 
 class CallbackQueue:
@@ -85,32 +127,44 @@ class CallbackQueue:
         poster: Optional[Poster] = None,
         store: Optional[PendingStore] = None,
         max_attempts: int = 0,
+        clock: Optional[Clock] = None,
+        concurrency: int = 8,
+        backoff_base: float = 1.0,
+        backoff_max: float = 300.0,
     ) -> None:
-        self.poster = poster or _http_poster
+        self.concurrency = max(1, concurrency)
+        self.poster = poster or _HttpPoster(self.concurrency)
         self.store = store or InMemoryPendingStore()
         # 0 ⇒ retry forever (until acked or TTL expiry, matching 0.11's durable stance).
         self.max_attempts = max_attempts
+        self.clock: Clock = clock or SystemClock()
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
         self._seq = 0
+        self._pool: Optional[ThreadPoolExecutor] = None
 
     def enqueue(self, url: str, event: dict, headers: Optional[dict] = None) -> str:
         self._seq += 1
         key = f"cb-{self._seq}"
-        self.store.put(key, {"url": url, "headers": headers or {}, "event": event, "attempts": 0})
+        rec = {"url": url, "headers": headers or {}, "event": event, "attempts": 0}
+        self.store.put(key, rec)
         # Best-effort immediate attempt; whatever doesn't ack stays queued for the sweep.
-        self._attempt(key)
+        retry = self._deliver(key, rec)
+        if retry is not None:
+            self.store.put(key, retry)
         return key
 
-    def _attempt(self, key: str) -> bool:
-        rec = self.store.get_all().get(key)
-        if rec is None:
-            return True
+    def _deliver(self, key: str, rec: dict) -> Optional[dict]:
+        """POST one delivery. Returns None when it is settled (acked, or dropped at the attempt cap —
+        its key is deleted), else the record to keep, rescheduled with backoff."""
+        rec = dict(rec)
         rec["attempts"] = rec.get("attempts", 0) + 1
         try:
             code = self.poster(rec["url"], rec["event"], rec.get("headers") or {})
             if code < 400:
                 self.store.delete(key)
                 logger.info("callback %s delivered (attempt %d) -> %s", key, rec["attempts"], code)
-                return True
+                return None
             logger.warning("callback %s got %d (attempt %d)", key, code, rec["attempts"])
         except Exception as e:  # noqa: BLE001 — transport failures are retryable
             logger.warning("callback %s delivery failed (attempt %d): %s", key, rec["attempts"], e)
@@ -119,15 +173,37 @@ class CallbackQueue:
         if self.max_attempts and rec["attempts"] >= self.max_attempts:
             logger.error("callback %s exhausted %d attempts; dropping", key, self.max_attempts)
             self.store.delete(key)
-            return False
-        self.store.put(key, rec)
-        return False
+            return None
+        rec["next_at"] = self.clock.now() + self._backoff(rec["attempts"])
+        return rec
+
+    def _backoff(self, attempts: int) -> float:
+        """Exponential in the attempt count, capped, with "equal jitter" (half fixed, half random)
+        so callbacks that failed together do not retry in lockstep."""
+        # The exponent is bounded: a retry-forever delivery's attempt count grows without limit.
+        delay = min(self.backoff_max, self.backoff_base * (2 ** min(attempts - 1, 32)))
+        return delay / 2 + random.uniform(0, delay / 2)
 
     def sweep(self) -> int:
-        """Retry every still-pending delivery once. Returns how many remain pending afterward."""
-        for key in list(self.store.get_all()):
-            self._attempt(key)
-        return self.pending_count()
+        """Retry every DUE pending delivery once, concurrently. Returns how many remain pending."""
+        pending = self.store.get_all()
+        now = self.clock.now()
+        due = [(k, rec) for k, rec in pending.items() if rec.get("next_at", 0) <= now]
+        if not due:
+            return len(pending)
+        if len(due) == 1 or self.concurrency == 1:
+            results = [self._deliver(k, rec) for k, rec in due]
+        else:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.concurrency, thread_name_prefix="callback")
+            results = list(self._pool.map(lambda item: self._deliver(*item), due))
+        retries = {k: rec for (k, _), rec in zip(due, results) if rec is not None}
+        self.store.put_many(retries)
+        return len(pending) - len(due) + len(retries)
 
     def pending_count(self) -> int:
         return len(self.store.get_all())
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
@@ -8,23 +8,57 @@ kernel's lifecycle is identical regardless of substrate.
 Host config (how the spawned container runs) comes from the runtime service's env, not the workload
 env: `DOCKER_NETWORK` puts the bot on the same compose network as redis/meeting-api (without it the
 bot can't reach the stack), and `DOCKER_SHM_SIZE` gives chromium a real `/dev/shm`.
+
+Exit state is EVENT-DRIVEN once ``watch_events`` runs (the production boot calls it): a
+``ContainerEventWatcher`` follows the daemon's ``/events`` stream for managed containers, so
+``exit_code`` answers from its cache instead of inspecting, and a container's death is pushed to the
+kernel as it happens (``docker_events.py``). Without a live stream it inspects, as before.
+
+An opt-in WARM POOL (``enable_warm_pool``, ``warm_pool.py``) keeps idle pre-created containers per
+profile: each runs a bootstrap shell that waits for a handshake file, so ``start`` claims one by
+renaming it to the workload's container name and dropping the per-workload env into it, and the
+bootstrap then execs the image's real entrypoint. Container labels are immutable, so a claimed
+container keeps its ``runtime.pool`` label and is recognised by NAME in discovery and events.
 """
 from __future__ import annotations
 
+import io
 import logging
 import os
+import re
+import shlex
+import tarfile
+import time
+import uuid
 from typing import Any, Optional
 from urllib.parse import quote
 
 import requests_unixsocket
 
 from .backend import WorkloadHandle
+from .docker_events import (
+    MANAGED_LABEL,
+    MISS,
+    WORKLOAD_ID_LABEL,
+    ContainerEventWatcher,
+    EventsSource,
+    ExitHandler,
+    docker_events_source,
+)
 from .mounts import workspace_binds
+from .obs import START_LATENCY_BUCKETS_S, histogram
 from .profiles import Runnable
+from .warm_pool import WarmPool
 
-MANAGED_LABEL = "runtime.managed"
-WORKLOAD_ID_LABEL = "runtime.workload_id"
 _COMPOSE_LABEL = "com.docker.compose.project"
+POOL_LABEL = "runtime.pool"
+# A warm slot's PID 1 until it is claimed: wait for the handshake marker (written after the env file
+# in the same archive), load the env, exec the image's real entrypoint ("$@").
+_POOL_BOOTSTRAP = (
+    'while [ ! -e /tmp/.vexa-ready ]; do sleep 0.05; done; '
+    'set -a; . /tmp/.vexa-env; set +a; rm -f /tmp/.vexa-env /tmp/.vexa-ready; exec "$@"'
+)
+_ENV_KEY = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
 logger = logging.getLogger("runtime_kernel.docker_backend")
 
@@ -112,6 +146,17 @@ def _shm_bytes() -> Optional[int]:
         return None
 
 
+def _exit_of(inspect_body: Optional[dict]) -> Optional[int]:
+    """The exit code an inspect shows — None while running, or when the container is unknown."""
+    if inspect_body is None:
+        return None
+    state = inspect_body.get("State", {})
+    if state.get("Running"):
+        return None
+    code = state.get("ExitCode")
+    return int(code) if code is not None else None
+
+
 class DockerBackend:
     name = "docker"
 
@@ -119,6 +164,83 @@ class DockerBackend:
         self._prefix = name_prefix
         self._url = _socket_url()
         self._session = requests_unixsocket.Session()
+        self.events: Optional[ContainerEventWatcher] = None
+        self.pool: Optional[WarmPool] = None
+        self._argv_cache: dict[str, tuple[list[str], list[str]]] = {}
+
+    def watch_events(
+        self, on_exit: Optional[ExitHandler] = None, source: Optional[EventsSource] = None
+    ) -> ContainerEventWatcher:
+        """Start following the daemon's container events (idempotent): ``exit_code`` then reads the
+        watcher's cache, and ``on_exit(workload_id, exit_code)`` fires as each managed container
+        dies. ``source`` defaults to the daemon's ``/events`` stream on a DEDICATED session (the
+        stream holds its connection open)."""
+        if self.events is None:
+            if source is None:
+                session = requests_unixsocket.Session()
+                source = docker_events_source(
+                    lambda method, path, **kw: session.request(method, f"{self._url}{path}", **kw)
+                )
+            self.events = ContainerEventWatcher(
+                source, on_exit=on_exit, resolve=self._event_workload_id
+            ).start()
+        elif on_exit is not None:
+            self.events.on_exit = on_exit
+        return self.events
+
+    def _event_workload_id(self, attrs: dict) -> Optional[str]:
+        """An event's workload: its label, or — for a claimed warm slot — its container name."""
+        wid = attrs.get(WORKLOAD_ID_LABEL)
+        if wid:
+            return wid
+        if attrs.get(POOL_LABEL):
+            return self._claimed_workload_id(attrs.get("name") or "")
+        return None
+
+    def _claimed_workload_id(self, name: str) -> Optional[str]:
+        leaf = name.lstrip("/")
+        if not leaf.startswith(self._prefix) or leaf[len(self._prefix):].startswith("pool-"):
+            return None  # not ours, or an unclaimed slot
+        return _workload_id_from_leaf(leaf[len(self._prefix):])
+
+    # ── warm pool ─────────────────────────────────────────────────────────────
+    def enable_warm_pool(
+        self, profiles: dict[str, tuple[Runnable, int]], idle_sec: float = 900.0
+    ) -> WarmPool:
+        """Keep ``size`` idle containers per ``{profile: (runnable, size)}`` for ``start`` to claim.
+        Unclaimed slots a previous runtime process left behind are removed first."""
+        if self.pool is None:
+            self._sweep_pool_slots()
+            self.pool = WarmPool(_DockerPoolSubstrate(self), profiles, idle_sec=idle_sec).start()
+        return self.pool
+
+    def _sweep_pool_slots(self) -> None:
+        import json as _json
+
+        spec: dict[str, list[str]] = {"label": [POOL_LABEL]}
+        network = _stack_network()
+        if network:
+            spec["network"] = [network]
+        try:
+            r = self._req("GET", f"/containers/json?all=1&filters={quote(_json.dumps(spec), safe='')}")
+            for c in r.json() if r.status_code == 200 else []:
+                if any(n.lstrip("/").startswith(f"{self._prefix}pool-") for n in c.get("Names") or []):
+                    self._req("DELETE", f"/containers/{c['Id']}?force=true")
+        except Exception as e:  # noqa: BLE001 — a leftover slot is idle waste, not a boot failure
+            logger.warning("stale warm slot sweep failed: %s", e)
+
+    def _launch_argv(self, runnable: Runnable) -> list[str]:
+        """The argv the image would run for this Runnable (entrypoint + command, or the image Cmd)
+        — what a warm slot's bootstrap execs once claimed."""
+        image = runnable.image or ""
+        if image not in self._argv_cache:
+            r = self._req("GET", f"/images/{image}/json")
+            if r.status_code != 200:
+                raise RuntimeError(f"docker image {image} not present ({r.status_code})")
+            config = (r.json() or {}).get("Config") or {}
+            self._argv_cache[image] = (list(config.get("Entrypoint") or []), list(config.get("Cmd") or []))
+        entrypoint, image_cmd = self._argv_cache[image]
+        return entrypoint + (list(runnable.command) if runnable.command else image_cmd)
 
     def _cname(self, workload_id: str) -> str:
         leaf, _labels = _worker_naming(workload_id)
@@ -177,9 +299,55 @@ class DockerBackend:
     def start(self, workload_id: str, runnable: Runnable, env: dict[str, str]) -> WorkloadHandle:
         if not runnable.image:
             raise ValueError("docker backend requires an image")
+        t0 = time.monotonic()
+        pool = self.pool
+        if pool is not None and pool.pooled(runnable):
+            # A warm slot was created without this dispatch's mounts, and mounts cannot be added to
+            # an existing container: a spawn that needs any takes the cold path.
+            if workspace_binds(env):
+                pool.miss(runnable)
+                h = None
+            else:
+                h = pool.claim(runnable, workload_id, env)
+            if h is not None:
+                if self.events is not None:
+                    self.events.note_started(workload_id)
+                histogram("start_latency_warm_s", START_LATENCY_BUCKETS_S).observe(time.monotonic() - t0)
+                return h
+        h = self._start_cold(workload_id, runnable, env)
+        histogram("start_latency_cold_s", START_LATENCY_BUCKETS_S).observe(time.monotonic() - t0)
+        return h
+
+    def _start_cold(self, workload_id: str, runnable: Runnable, env: dict[str, str]) -> WorkloadHandle:
         name = self._cname(workload_id)
         _leaf, worker_labels = _worker_naming(workload_id)
+        payload: dict[str, Any] = {
+            "Image": runnable.image,
+            "Env": [f"{k}={v}" for k, v in self._spawn_env(env).items()],
+            "Labels": {MANAGED_LABEL: "true", WORKLOAD_ID_LABEL: workload_id, **worker_labels},
+            "HostConfig": self._host_config(env),
+        }
+        if runnable.command:
+            payload["Cmd"] = list(runnable.command)
 
+        r = self._req("POST", f"/containers/create?name={name}", json=payload)
+        if r.status_code == 409:  # stale container with this name — replace it
+            self._req("DELETE", f"/containers/{name}?force=true")
+            r = self._req("POST", f"/containers/create?name={name}", json=payload)
+        if r.status_code not in (200, 201):
+            raise RuntimeError(f"docker create {name} failed ({r.status_code}): {r.text.strip()}")
+        cid = r.json().get("Id", name)
+
+        s = self._req("POST", f"/containers/{cid}/start")
+        if s.status_code not in (204, 304):
+            raise RuntimeError(f"docker start {name} failed ({s.status_code}): {s.text.strip()}")
+        if self.events is not None:
+            self.events.note_started(workload_id)
+        return WorkloadHandle(id=workload_id, impl=name)
+
+    def _host_config(self, env: dict[str, str]) -> dict[str, Any]:
+        """How a workload container runs: the stack network, chromium's /dev/shm, and the binds —
+        this dispatch's workspace mounts plus the runtime-brokered credential/dev mounts."""
         host_config: dict[str, Any] = {}
         network = os.getenv("DOCKER_NETWORK")
         if network:
@@ -221,7 +389,10 @@ class DockerBackend:
             binds.append(f"{dev_src}:/app/src/agent_api:ro")
         if binds:
             host_config["Binds"] = binds
+        return host_config
 
+    def _spawn_env(self, env: dict[str, str]) -> dict[str, str]:
+        """The workload env plus the provider env the runtime brokers into every worker."""
         spawn_env = dict(env)
         for key in (
             # llm-module dials (provider-agnostic): completion endpoint/credential/model + the
@@ -245,28 +416,7 @@ class DockerBackend:
             value = os.getenv(key)
             if value and key not in spawn_env:
                 spawn_env[key] = value
-
-        payload: dict[str, Any] = {
-            "Image": runnable.image,
-            "Env": [f"{k}={v}" for k, v in spawn_env.items()],
-            "Labels": {MANAGED_LABEL: "true", WORKLOAD_ID_LABEL: workload_id, **worker_labels},
-            "HostConfig": host_config,
-        }
-        if runnable.command:
-            payload["Cmd"] = list(runnable.command)
-
-        r = self._req("POST", f"/containers/create?name={name}", json=payload)
-        if r.status_code == 409:  # stale container with this name — replace it
-            self._req("DELETE", f"/containers/{name}?force=true")
-            r = self._req("POST", f"/containers/create?name={name}", json=payload)
-        if r.status_code not in (200, 201):
-            raise RuntimeError(f"docker create {name} failed ({r.status_code}): {r.text.strip()}")
-        cid = r.json().get("Id", name)
-
-        s = self._req("POST", f"/containers/{cid}/start")
-        if s.status_code not in (204, 304):
-            raise RuntimeError(f"docker start {name} failed ({s.status_code}): {s.text.strip()}")
-        return WorkloadHandle(id=workload_id, impl=name)
+        return spawn_env
 
     def find(self, workload_id: str) -> Optional[WorkloadHandle]:
         """Re-derive a live handle for a workload whose in-process handle was lost (restart): the
@@ -325,6 +475,8 @@ class DockerBackend:
                         continue
                     for raw in c.get("Names") or []:
                         leaf = raw.lstrip("/")
+                        if POOL_LABEL in labels and self._claimed_workload_id(leaf) is None:
+                            break  # an unclaimed warm slot is not a workload
                         if leaf.startswith(self._prefix):
                             wid = _workload_id_from_leaf(leaf[len(self._prefix):])
                             found.setdefault(wid, self._adoptable(wid, c))
@@ -346,17 +498,29 @@ class DockerBackend:
         }
 
     def exit_code(self, h: WorkloadHandle) -> Optional[int]:
-        return self._exit_from_inspect(h._impl)  # type: ignore[attr-defined]
+        watcher = self.events
+        if watcher is None:
+            return self._exit_from_inspect(h._impl)  # type: ignore[attr-defined]
+        cached = watcher.lookup(h.id)
+        if cached is not MISS:
+            return cached
+        # Not followed yet (adopted, or the stream just reconnected): inspect once, then events
+        # keep it current — but only a MANAGED container's events reach the watcher.
+        since = watcher.checkpoint()
+        body = self._inspect(h._impl)  # type: ignore[attr-defined]
+        code = _exit_of(body)
+        if body is not None and ((body.get("Config") or {}).get("Labels") or {}).get(MANAGED_LABEL):
+            watcher.remember(h.id, code, since)
+        return code
 
     def _exit_from_inspect(self, name: str) -> Optional[int]:
+        return _exit_of(self._inspect(name))
+
+    def _inspect(self, name: str) -> Optional[dict]:
         r = self._req("GET", f"/containers/{name}/json")
         if r.status_code != 200:
             return None  # gone/unknown → still-resolving
-        state = r.json().get("State", {})
-        if state.get("Running"):
-            return None
-        code = state.get("ExitCode")
-        return int(code) if code is not None else None
+        return r.json() or {}
 
     def terminate(self, h: WorkloadHandle) -> None:
         # SIGTERM + a real grace window (RUNTIME_STOP_GRACE_SEC, default 30): a live meeting bot
@@ -365,6 +529,11 @@ class DockerBackend:
         grace = _stop_grace_sec()
         self._req("POST", f"/containers/{h._impl}/stop?t={grace}", timeout=grace + 30)  # type: ignore[attr-defined]
 
+    def terminate_nowait(self, h: WorkloadHandle) -> None:
+        # The stop reaper's SIGTERM: `/stop` blocks for the whole grace window, which would hold the
+        # reaper's single thread; the reaper runs the grace → SIGKILL escalation itself.
+        self._req("POST", f"/containers/{h._impl}/kill?signal=SIGTERM")  # type: ignore[attr-defined]
+
     def kill(self, h: WorkloadHandle) -> None:
         self._req("POST", f"/containers/{h._impl}/kill")  # type: ignore[attr-defined]
 
@@ -376,3 +545,68 @@ class DockerBackend:
             raise RuntimeError(
                 f"docker delete {h._impl} failed ({r.status_code}): {r.text.strip()[:200]}"
             )
+
+
+class _DockerPoolSubstrate:
+    """The warm pool's ``PoolSubstrate`` over the socket API. A slot is a started container named
+    ``{prefix}pool-{profile}-{rand}`` whose PID 1 is ``_POOL_BOOTSTRAP``; slot ids are container ids."""
+
+    def __init__(self, backend: DockerBackend) -> None:
+        self.backend = backend
+
+    def provision(self, profile: str, runnable: Runnable) -> str:
+        be = self.backend
+        name = f"{be._prefix}pool-{profile}-{uuid.uuid4().hex[:8]}"
+        payload: dict[str, Any] = {
+            "Image": runnable.image,
+            "Entrypoint": ["/bin/sh", "-c", _POOL_BOOTSTRAP, "vexa-warm"],
+            "Cmd": be._launch_argv(runnable),
+            "Labels": {MANAGED_LABEL: "true", POOL_LABEL: profile},
+            "HostConfig": be._host_config({}),
+        }
+        r = be._req("POST", f"/containers/create?name={name}", json=payload)
+        if r.status_code not in (200, 201):
+            raise RuntimeError(f"docker create {name} failed ({r.status_code}): {r.text.strip()}")
+        cid = r.json().get("Id", name)
+        s = be._req("POST", f"/containers/{cid}/start")
+        if s.status_code not in (204, 304):
+            be._req("DELETE", f"/containers/{cid}?force=true")
+            raise RuntimeError(f"docker start {name} failed ({s.status_code}): {s.text.strip()}")
+        return cid
+
+    def hand_off(self, slot: str, workload_id: str, env: dict[str, str]) -> WorkloadHandle:
+        be = self.backend
+        spawn_env = be._spawn_env(env)
+        bad = [k for k in spawn_env if not _ENV_KEY.match(k)]
+        if bad:
+            raise ValueError(f"env keys not exportable by the bootstrap shell: {bad}")
+        # Identity first, so the container's events already carry the workload's name.
+        name = be._cname(workload_id)
+        r = be._req("POST", f"/containers/{slot}/rename?name={name}")
+        if r.status_code == 409:  # stale container with this name — replace it (as a cold start does)
+            be._req("DELETE", f"/containers/{name}?force=true")
+            r = be._req("POST", f"/containers/{slot}/rename?name={name}")
+        if r.status_code not in (200, 204):
+            raise RuntimeError(f"docker rename {slot} → {name} failed ({r.status_code}): {r.text.strip()}")
+        r = be._req("PUT", f"/containers/{slot}/archive?path=/tmp", data=_handoff_archive(spawn_env),
+                    headers={"Content-Type": "application/x-tar"})
+        if r.status_code != 200:
+            raise RuntimeError(f"docker hand-off to {name} failed ({r.status_code}): {r.text.strip()}")
+        return WorkloadHandle(id=workload_id, impl=name)
+
+    def discard(self, slot: str) -> None:
+        self.backend._req("DELETE", f"/containers/{slot}?force=true")
+
+
+def _handoff_archive(env: dict[str, str]) -> bytes:
+    """The handshake tar extracted into a slot's /tmp: the env file, THEN the marker the bootstrap
+    waits for (members extract in order, so the env is complete when the marker appears)."""
+    body = "".join(f"{k}={shlex.quote(v)}\n" for k, v in env.items()).encode()
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        for member, data in ((".vexa-env", body), (".vexa-ready", b"")):
+            info = tarfile.TarInfo(member)
+            info.size = len(data)
+            info.mode = 0o600
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
@@ -0,0 +1,264 @@
+"""Docker ``/events`` subscriber — event-driven workload exit state for the ``DockerBackend``.
+
+``Runtime.get`` reflects a self-exited workload by asking the backend for its exit code, and
+``Runtime.list`` does that per record: on the Docker backend each ask was a
+``GET /containers/{name}/json`` inspect, so ``GET /workloads`` cost one daemon round trip per running
+workload. ``ContainerEventWatcher`` replaces the polling with the daemon's own event stream:
+
+  • ONE long-lived ``GET /events`` filtered to container start/die/destroy events carrying the
+    ``runtime.managed`` label (every container ``DockerBackend.start`` spawns has it);
+  • an in-memory EXIT-STATE CACHE keyed by workload id — running, or exited with a code — that
+    ``DockerBackend.exit_code`` answers from, so reads never inspect while the stream is live;
+  • an ``on_exit(workload_id, exit_code)`` PUSH (``Runtime.observe_exit``) the moment a container
+    dies, so the store and the RuntimeEvent callbacks see ``stopped`` without anyone polling.
+
+The cache is only authoritative while the stream is connected: a cut stream may have missed a die,
+so on disconnect the cache is dropped and reads fall back to inspects until the watcher reconnects
+(with backoff). A workload first seen while live (e.g. adopted after a restart) is inspected once and
+then followed by events. An inspect that raced a newer event never overwrites it.
+
+Event sources are injectable — ``docker_events_source`` streams the real daemon, ``FakeDockerEvents``
+feeds scripted events so the flow is testable without a daemon.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, Optional
+from urllib.parse import quote
+
+logger = logging.getLogger("runtime_kernel.docker_events")
+
+MANAGED_LABEL = "runtime.managed"
+WORKLOAD_ID_LABEL = "runtime.workload_id"
+_ACTIONS = ("start", "die", "destroy")
+_BACKOFF_MAX_S = 30.0
+
+# Opens one event stream: returns once the daemon has accepted the subscription, then yields
+# decoded event dicts until the stream ends (or raises on a broken connection).
+EventsSource = Callable[[], Iterable[dict]]
+ExitHandler = Callable[[str, int], None]
+# Maps an event's Actor.Attributes to its workload id (None ⇒ not a workload container).
+WorkloadResolver = Callable[[dict], Optional[str]]
+
+# ``ContainerEventWatcher.lookup``'s answer when the cache cannot vouch for a workload (the
+# caller inspects instead).
+MISS = object()
+_RUNNING = None  # cached state of a container that is up; an int is an exit code
+
+
+def docker_events_source(request: Callable[..., Any]) -> EventsSource:
+    """The real source over a ``DockerBackend._req``-shaped ``request(method, path, **kw)``."""
+    filters = quote(json.dumps({
+        "type": ["container"], "label": [f"{MANAGED_LABEL}=true"], "event": list(_ACTIONS),
+    }), safe="")
+
+    def open_stream() -> Iterator[dict]:
+        # No read timeout: the stream is idle whenever no managed container changes state.
+        r = request("GET", f"/events?filters={filters}", stream=True, timeout=(5, None))
+        if r.status_code != 200:
+            r.close()
+            raise RuntimeError(f"docker events subscribe failed ({r.status_code})")
+
+        def lines() -> Iterator[dict]:
+            try:
+                for line in r.iter_lines():
+                    if line:
+                        yield json.loads(line)
+            finally:
+                r.close()
+        return lines()
+
+    return open_stream
+
+
+class ContainerEventWatcher:
+    """Follows an ``EventsSource`` on a daemon thread and keeps the workload exit-state cache."""
+
+    def __init__(
+        self,
+        source: EventsSource,
+        on_exit: Optional[ExitHandler] = None,
+        resolve: Optional[WorkloadResolver] = None,
+    ) -> None:
+        self._source = source
+        self.on_exit = on_exit
+        self._resolve = resolve or (lambda attrs: attrs.get(WORKLOAD_ID_LABEL))
+        self._lock = threading.Lock()
+        self._states: dict[str, Optional[int]] = {}
+        # Per workload, the sequence number of the last event applied (see remember()). An entry
+        # lives exactly as long as the workload's cached state: a destroy or a cut stream drops
+        # both. ``_floor_seq`` is the sequence of the last such drop — an inspect begun before it
+        # may predate an event whose entry is gone, so its answer is not cached.
+        self._event_seq: dict[str, int] = {}
+        self._seq = 0
+        self._floor_seq = 0
+        self._live = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.events_seen = 0
+        self.reconnects = 0
+
+    @property
+    def live(self) -> bool:
+        return self._live.is_set()
+
+    def wait_live(self, timeout: float) -> bool:
+        return self._live.wait(timeout)
+
+    def start(self) -> "ContainerEventWatcher":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="docker-events", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    # ── the cache ────────────────────────────────────────────────────────────
+    def lookup(self, workload_id: str):
+        """The cached state — ``None`` running, an int exit code — or ``MISS`` when unknown or
+        the stream is down (the caller inspects)."""
+        if not self._live.is_set():
+            return MISS
+        with self._lock:
+            return self._states.get(workload_id, MISS)
+
+    def checkpoint(self) -> int:
+        """Take before an inspect; hand to ``remember`` with its result."""
+        with self._lock:
+            return self._seq
+
+    def remember(self, workload_id: str, exit_code: Optional[int], since: int) -> None:
+        """Cache an inspected state — unless the stream is down, an event for the workload landed
+        after ``since`` (the event is newer than the inspect), or an entry was dropped since."""
+        with self._lock:
+            if (self._live.is_set() and since >= self._floor_seq
+                    and self._event_seq.get(workload_id, -1) <= since):
+                self._states[workload_id] = exit_code
+
+    def note_started(self, workload_id: str) -> None:
+        """The backend just started the container (its own start event may still be in flight)."""
+        with self._lock:
+            if self._live.is_set():
+                self._states[workload_id] = _RUNNING
+
+    def metrics(self) -> dict:
+        with self._lock:
+            exited = sum(1 for s in self._states.values() if s is not None)
+            return {"live": self.live, "cached": len(self._states), "exited": exited,
+                    "sequenced": len(self._event_seq),
+                    "events_seen": self.events_seen, "reconnects": self.reconnects}
+
+    # ── the stream ───────────────────────────────────────────────────────────
+    def _run(self) -> None:
+        backoff = 0.5
+        while not self._stopped.is_set():
+            try:
+                stream = iter(self._source())
+                with self._lock:
+                    self._floor_seq = self._seq
+                    self._live.set()
+                backoff = 0.5
+                for event in stream:
+                    if self._stopped.is_set():
+                        return
+                    self._apply(event)
+            except Exception as e:  # noqa: BLE001 — the watcher outlives a daemon hiccup
+                logger.warning("docker events stream failed: %s", e)
+            finally:
+                # Anything may have happened while we were not listening: reads inspect again.
+                with self._lock:
+                    self._live.clear()
+                    self._states.clear()
+                    self._event_seq.clear()
+            if self._stopped.wait(backoff):
+                return
+            self.reconnects += 1
+            backoff = min(backoff * 2, _BACKOFF_MAX_S)
+
+    def _apply(self, event: dict) -> None:
+        action = event.get("Action") or event.get("status")
+        attrs = (event.get("Actor") or {}).get("Attributes") or {}
+        workload_id = self._resolve(attrs)
+        if not workload_id or action not in _ACTIONS:
+            return
+        exit_code: Optional[int] = None
+        with self._lock:
+            self.events_seen += 1
+            self._seq += 1
+            self._event_seq[workload_id] = self._seq
+            if action == "start":
+                self._states[workload_id] = _RUNNING
+            elif action == "die":
+                try:
+                    exit_code = int(attrs.get("exitCode", -1))
+                except (TypeError, ValueError):
+                    exit_code = -1
+                self._states[workload_id] = exit_code
+            else:  # destroy — the container is gone; its record is the kernel's business now
+                self._states.pop(workload_id, None)
+                self._event_seq.pop(workload_id, None)
+                self._floor_seq = self._seq
+        if exit_code is not None and self.on_exit is not None:
+            try:
+                self.on_exit(workload_id, exit_code)
+            except Exception as e:  # noqa: BLE001 — a failed push must not kill the stream
+                logger.warning("workload exit push for %s failed: %s", workload_id, e)
+
+
+class FakeDockerEvents:
+    """A scripted ``EventsSource`` for evals: ``emit()`` an event (or ``die()``/``start()`` one),
+    ``cut()`` the current stream to exercise the reconnect path, ``drain()`` to wait until the
+    watcher has consumed everything emitted so far."""
+
+    def __init__(self) -> None:
+        self._q: "queue.Queue[Any]" = queue.Queue()
+        self.subscriptions = 0
+
+    def __call__(self) -> Iterator[dict]:
+        self.subscriptions += 1
+        return self._stream()
+
+    def _stream(self) -> Iterator[dict]:
+        while True:
+            item = self._q.get()
+            try:
+                if item is None:
+                    return
+                if isinstance(item, threading.Event):
+                    item.set()
+                    continue
+                yield item
+            finally:
+                self._q.task_done()
+
+    def emit(self, event: dict) -> None:
+        self._q.put(event)
+
+    def start(self, workload_id: str) -> None:
+        self.emit(_event("start", workload_id))
+
+    def die(self, workload_id: str, exit_code: int) -> None:
+        self.emit(_event("die", workload_id, exitCode=str(exit_code)))
+
+    def destroy(self, workload_id: str) -> None:
+        self.emit(_event("destroy", workload_id))
+
+    def cut(self) -> None:
+        self._q.put(None)
+
+    def drain(self, timeout: float = 5.0) -> bool:
+        """Block until every event emitted so far was applied (the watcher is past them)."""
+        marker = threading.Event()
+        self._q.put(marker)
+        return marker.wait(timeout)
+
+
+def _event(action: str, workload_id: str, **attrs: str) -> dict:
+    return {
+        "Type": "container", "Action": action,
+        "Actor": {"Attributes": {MANAGED_LABEL: "true", WORKLOAD_ID_LABEL: workload_id, **attrs}},
+    }
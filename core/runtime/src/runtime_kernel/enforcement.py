@@ -56,10 +56,8 @@ class Enforcer:
         """One enforcement tick. Stop every running workload past a limit; return their ids."""
         now = self.clock.now()
         stopped: list[str] = []
-        for record in self.runtime.store.list():
+        for record in self.runtime.store.list_by_state(RuntimeState.running.value):
             status = record.status
-            if status.state is not RuntimeState.running:
-                continue
             wid = status.workloadId
             track = self._tracked.get(wid)
             if track is None:
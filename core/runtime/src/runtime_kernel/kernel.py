@@ -8,9 +8,14 @@ serializable, so they live in a process-local map keyed by workloadId; on a fres
 simply absent, and the reloaded statuses describe what was running before the restart.
 
 Quotas (O-RT-2): create() rejects the N+1th active workload for an owner via the store's
-count_for_owner."""
+count_for_owner.
+
+Stops are NON-BLOCKING when a ``StopReaper`` is wired (the production boot does): stop() records
+``stopping`` and returns, and the reaper's thread runs the SIGTERM → grace → SIGKILL escalation for
+every in-flight stop, recording ``stopped`` when each ends. Without one, stop() escalates inline."""
 from __future__ import annotations
 
+import threading
 import time
 from datetime import datetime, timezone
 from typing import Callable, Optional
@@ -20,6 +25,7 @@ from .clock import Clock, SystemClock
 from .models import RuntimeEvent, RuntimeState, StopReason, WorkloadSpec, WorkloadStatus
 from .process_backend import ProcessBackend
 from .profiles import ProfileRegistry, Runnable, default_registry
+from .reaper import StopReaper
 from .store import (
     InMemoryStore,
     OwnerResolver,
@@ -67,6 +73,7 @@ class Runtime:
         clock: Optional[Clock] = None,
         owner_resolver: OwnerResolver = default_owner,
         owner_quota: Optional[int] = None,
+        reaper: Optional[StopReaper] = None,
     ) -> None:
         self.backend: Backend = backend or ProcessBackend()
         # `profiles` accepts a ProfileRegistry, a plain {name: Runnable|command} dict (legacy/tests),
@@ -78,8 +85,13 @@ class Runtime:
         self.clock: Clock = clock or SystemClock()
         self.owner_resolver = owner_resolver
         self.owner_quota = owner_quota
+        self.reaper = reaper
         # Live, non-serializable backend handles. Empty on a fresh process (post-restart).
         self._handles: dict[str, WorkloadHandle] = {}
+        # Serializes every read-check-write of a record's state: a pushed exit (the events
+        # thread), the reaper's finish and a request's stop/get/destroy each re-read the record
+        # and transition it under this lock. Never held across a backend call that may block.
+        self._transition_lock = threading.RLock()
 
     def _emit(self, workload_id: str, state: RuntimeState, **kw) -> RuntimeEvent:
         ev = RuntimeEvent(workloadId=workload_id, state=state, at=_now(), **kw)
@@ -229,26 +241,46 @@ class Runtime:
         if status.state == RuntimeState.running and handle is not None:
             code = self.backend.exit_code(handle)
             if code is not None:
-                status.state = RuntimeState.stopped
-                status.exitCode = code
-                status.stoppedAt = _now()
-                status.stopReason = StopReason.completed if code == 0 else StopReason.failed
-                self._persist(record.spec, status)
-                self._emit(workload_id, RuntimeState.stopped, exitCode=code, stopReason=status.stopReason)
+                self.observe_exit(workload_id, code)
+                return self._record(workload_id).status
         return status
 
+    def observe_exit(self, workload_id: str, exit_code: int) -> None:
+        """A backend PUSHED a workload's exit (the Docker events watcher): record it as ``get``
+        would have on its next poll. Ignored unless the record is still running — a kernel stop
+        owns its own transition."""
+        with self._transition_lock:
+            record = self.store.get(workload_id)
+            if record is not None and record.status.state == RuntimeState.running:
+                self._reflect_exit(record, exit_code)
+
+    def _reflect_exit(self, record: WorkloadRecord, code: int) -> None:
+        status = record.status
+        status.state = RuntimeState.stopped
+        status.exitCode = code
+        status.stoppedAt = _now()
+        status.stopReason = StopReason.completed if code == 0 else StopReason.failed
+        self._persist(record.spec, status)
+        self._emit(record.spec.workloadId, RuntimeState.stopped, exitCode=code, stopReason=status.stopReason)
+
     def list(self) -> list[WorkloadStatus]:
         return [self.get(r.spec.workloadId) for r in self.store.list()]
 
     def stop(self, workload_id: str, reason: StopReason = StopReason.stopped) -> WorkloadStatus:
-        record = self._record(workload_id)
-        status = record.status
-        if status.state in (RuntimeState.stopped, RuntimeState.destroyed):
-            return status
-        status.state = RuntimeState.stopping
-        self._persist(record.spec, status)
-        self._emit(workload_id, RuntimeState.stopping)
+        with self._transition_lock:
+            record = self._record(workload_id)
+            status = record.status
+            if status.state in (RuntimeState.stopped, RuntimeState.destroyed):
+                return status
+            if self.reaper is not None and self.reaper.pending(workload_id):
+                return status                                       # already being stopped
+            status.state = RuntimeState.stopping
+            self._persist(record.spec, status)
+            self._emit(workload_id, RuntimeState.stopping)
         h = self._handle_for(workload_id)                           # re-derives post-restart handles
+        if h is not None and self.reaper is not None:
+            self.reaper.submit(workload_id, h, lambda code: self._finish_stop(workload_id, reason, code))
+            return status
         if h is not None:
             self.backend.terminate(h)                               # graceful SIGTERM + grace window
             deadline = time.time() + self.grace_sec
@@ -259,24 +291,38 @@ class Runtime:
             code = self.backend.exit_code(h)
         else:
             code = None                                             # no live handle (post-restart stop)
-        status.state = RuntimeState.stopped
-        status.exitCode = code
-        status.stoppedAt = _now()
-        status.stopReason = reason
-        self._persist(record.spec, status)
-        self._emit(workload_id, RuntimeState.stopped, exitCode=code, stopReason=reason)
-        return status
+        return self._finish_stop(workload_id, reason, code)
+
+    def _finish_stop(self, workload_id: str, reason: StopReason, code: Optional[int]) -> WorkloadStatus:
+        with self._transition_lock:
+            record = self._record(workload_id)
+            status = record.status
+            if status.state != RuntimeState.stopping:
+                return status                                       # destroyed/reaped meanwhile
+            status.state = RuntimeState.stopped
+            status.exitCode = code
+            status.stoppedAt = _now()
+            status.stopReason = reason
+            self._persist(record.spec, status)
+            self._emit(workload_id, RuntimeState.stopped, exitCode=code, stopReason=reason)
+            return status
 
     def destroy(self, workload_id: str) -> WorkloadStatus:
         record = self._record(workload_id)
         h = self._handle_for(workload_id)                           # re-derives post-restart handles
         if h is not None:
             self.backend.cleanup(h)   # raises on an unconfirmed reclaim — destroyed is never a lie
-        status = record.status
-        status.state = RuntimeState.destroyed
-        self._persist(record.spec, status)
-        self._emit(workload_id, RuntimeState.destroyed)
-        return status
+        # A stop still in the reaper is over now: record its `stopped` first (legal sequence).
+        pending = self.reaper.cancel(workload_id) if self.reaper is not None else None
+        if pending is not None:
+            pending(None)
+        with self._transition_lock:
+            record = self._record(workload_id)
+            status = record.status
+            status.state = RuntimeState.destroyed
+            self._persist(record.spec, status)
+            self._emit(workload_id, RuntimeState.destroyed)
+            return status
 
 
 def _coerce_registry(profiles) -> ProfileRegistry:
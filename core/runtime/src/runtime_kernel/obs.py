@@ -11,15 +11,22 @@ line conforming to ``logevent.v1``, and ``TraceMiddleware`` that reads/sets ``X-
 share the caller's trace_id. The runtime is downstream of meeting-api/agent-api on the
 workload-spawn path; this threads the trace one more hop toward the bot leg (the remaining
 bot/pipeline hop is owned by the telemetry stream — a follow-on).
+
+Alongside the log lines, a process-local metrics registry (the same shape the collector keeps):
+fixed-bucket ``Histogram``s (cumulative ``le`` buckets + count + sum) through ``histogram(...)``,
+``Gauge``s through ``gauge(...)``, monotonic ``Counter``s through ``counter(...)``, read back as one
+plain dict by ``metrics_snapshot()`` and served at ``GET /metrics``. The stop reaper records its
+queue depth and stop latencies here; the Docker warm pool its claim hits/misses and start latencies.
 """
 from __future__ import annotations
 
 import contextvars
 import json
 import sys
+import threading
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -94,3 +101,132 @@ class TraceMiddleware(BaseHTTPMiddleware):
             return response
         finally:
             _trace_id.reset(token)
+
+
+# ---- Process-local metrics ----------------------------------------------------------------------
+
+# Stop-latency buckets, in seconds: a graceful bot leave takes seconds, the SIGKILL escalation
+# lands just past the grace window (RUNTIME_STOP_GRACE_SEC, default 30, + the kernel margin).
+STOP_LATENCY_BUCKETS_S = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 40.0, 60.0, 120.0)
+# Start-latency buckets (spawn → container running): a warm-pool claim is tens of ms, a cold
+# create + start (or an image pull) runs to seconds.
+START_LATENCY_BUCKETS_S = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """A fixed-bucket histogram: cumulative ``le`` bucket counts plus ``count`` and ``sum``.
+    Thread-safe; ``snapshot`` returns plain values so a caller can serialize it as-is."""
+
+    def __init__(self, name: str, buckets: Sequence[float]):
+        self.name = name
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * len(self.buckets)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._count += 1
+            self._sum += value
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self._counts[i] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "count": self._count,
+                "sum": self._sum,
+                "buckets": {str(b): n for b, n in zip(self.buckets, self._counts)},
+            }
+
+
+class Gauge:
+    """A point-in-time value (a queue depth …) that moves both ways. Thread-safe."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+    @property
+    def value(self) -> float:
+        with self._lock:
+            return self._value
+
+
+class Counter:
+    """A monotonic counter (hits, misses, evictions …). Thread-safe like ``Histogram``."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        with self._lock:
+            return self._value
+
+
+_histograms: dict[str, Histogram] = {}
+_gauges: dict[str, Gauge] = {}
+_counters: dict[str, Counter] = {}
+_registry_lock = threading.Lock()
+
+
+def histogram(name: str, buckets: Sequence[float] = STOP_LATENCY_BUCKETS_S) -> Histogram:
+    """The process-wide histogram named ``name`` (created with ``buckets`` on first use)."""
+    with _registry_lock:
+        h = _histograms.get(name)
+        if h is None:
+            h = _histograms[name] = Histogram(name, buckets)
+        return h
+
+
+def gauge(name: str) -> Gauge:
+    """The process-wide gauge named ``name`` (created at 0 on first use)."""
+    with _registry_lock:
+        g = _gauges.get(name)
+        if g is None:
+            g = _gauges[name] = Gauge(name)
+        return g
+
+
+def counter(name: str) -> Counter:
+    """The process-wide counter named ``name`` (created at 0 on first use)."""
+    with _registry_lock:
+        c = _counters.get(name)
+        if c is None:
+            c = _counters[name] = Counter(name)
+        return c
+
+
+def metrics_snapshot() -> dict:
+    """Every registered metric, keyed by name — a histogram as ``{count, sum, buckets}``, a gauge
+    or counter as its plain value."""
+    with _registry_lock:
+        histograms = list(_histograms.items())
+        gauges = list(_gauges.items())
+        counters = list(_counters.items())
+    out: dict = {name: h.snapshot() for name, h in histograms}
+    out.update((name, g.value) for name, g in gauges)
+    out.update((name, c.value) for name, c in counters)
+    return out
+
+
+def reset_metrics() -> None:
+    """Drop every registered metric (tests)."""
+    with _registry_lock:
+        _histograms.clear()
+        _gauges.clear()
+        _counters.clear()
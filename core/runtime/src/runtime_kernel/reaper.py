@@ -0,0 +1,175 @@
+"""The stop reaper — one background thread that carries every in-flight graceful stop.
+
+``Runtime.stop`` used to run the whole escalation in the request thread: SIGTERM, poll
+``exit_code`` every 20ms for up to ``grace_sec``, SIGKILL. Stopping 50 bots at the end of a meeting
+block pinned 50 threadpool workers for the full grace window. With a reaper wired in, ``stop``
+persists + emits ``stopping``, hands the workload here and returns at once; the reaper:
+
+  • sends the SIGTERM (``terminate_nowait`` when the backend has one — Docker's ``/stop`` blocks for
+    the grace window, which would serialize every stop behind one thread);
+  • polls ``exit_code`` for ALL in-flight stops each ``poll_sec`` (one pass, not one loop per stop);
+  • escalates to ``kill`` once a stop outlives ``grace_sec``, then waits up to ``kill_grace_sec`` for
+    the exit code before giving up on it;
+  • calls the stop's ``on_done(exit_code)`` — the kernel persists ``stopped`` and emits its
+    RuntimeEvent through ``on_event`` (and so the CallbackQueue), exactly as the inline path did.
+
+Metrics (``obs.py``): ``stop_reaper_depth`` (in-flight stops), and ``stop_latency_graceful_s`` /
+``stop_latency_killed_s`` (hand-off → exit observed, split by whether the SIGKILL was needed).
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .backend import Backend, WorkloadHandle
+from .obs import gauge, histogram
+
+logger = logging.getLogger("runtime_kernel.reaper")
+
+StopDone = Callable[[Optional[int]], None]
+
+
+@dataclass
+class _Stop:
+    handle: WorkloadHandle
+    on_done: StopDone
+    started: float
+    deadline: float
+    signalled: bool = False
+    killed_at: Optional[float] = None
+    finishing: bool = False
+
+
+class StopReaper:
+    """In-flight stops keyed by workload id, advanced together by one lazily-started thread."""
+
+    def __init__(
+        self,
+        backend: Backend,
+        grace_sec: float,
+        *,
+        kill_grace_sec: float = 5.0,
+        poll_sec: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.backend = backend
+        self.grace_sec = grace_sec
+        self.kill_grace_sec = kill_grace_sec
+        self.poll_sec = poll_sec
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._stops: dict[str, _Stop] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._depth = gauge("stop_reaper_depth")
+        self._graceful = histogram("stop_latency_graceful_s")
+        self._killed = histogram("stop_latency_killed_s")
+
+    # ── the kernel side ──────────────────────────────────────────────────────
+    def submit(self, workload_id: str, handle: WorkloadHandle, on_done: StopDone) -> None:
+        """Take over a stop; ``on_done(exit_code)`` runs on the reaper thread once it is over."""
+        now = self._clock()
+        with self._cond:
+            if workload_id in self._stops:
+                return
+            self._stops[workload_id] = _Stop(handle, on_done, now, now + self.grace_sec)
+            self._depth.set(len(self._stops))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="stop-reaper", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def pending(self, workload_id: str) -> bool:
+        with self._cond:
+            return workload_id in self._stops
+
+    def cancel(self, workload_id: str) -> Optional[StopDone]:
+        """Withdraw an in-flight stop (``destroy`` force-reclaims it); returns its ``on_done``."""
+        with self._cond:
+            stop = self._stops.get(workload_id)
+            if stop is None or stop.finishing:
+                return None                                           # already being recorded
+            del self._stops[workload_id]
+            self._depth.set(len(self._stops))
+            self._cond.notify_all()
+        return stop.on_done
+
+    @property
+    def depth(self) -> int:
+        with self._cond:
+            return len(self._stops)
+
+    def drain(self, timeout: float) -> bool:
+        """Block until no stop is in flight (shutdown / tests)."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._stops:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    # ── the reaper thread ────────────────────────────────────────────────────
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stops and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                batch = list(self._stops.items())
+            for workload_id, stop in batch:
+                self._advance(workload_id, stop)
+            with self._cond:
+                if self._stops and not self._closed:
+                    self._cond.wait(self.poll_sec)
+
+    def _advance(self, workload_id: str, stop: _Stop) -> None:
+        if not stop.signalled:
+            stop.signalled = True
+            try:
+                getattr(self.backend, "terminate_nowait", self.backend.terminate)(stop.handle)
+            except Exception as e:  # noqa: BLE001 — the grace → SIGKILL escalation still runs
+                logger.warning("stop %s: SIGTERM failed: %s", workload_id, e)
+        try:
+            code = self.backend.exit_code(stop.handle)
+        except Exception as e:  # noqa: BLE001 — an unanswered poll is "not exited yet"
+            logger.warning("stop %s: exit poll failed: %s", workload_id, e)
+            code = None
+        now = self._clock()
+        if code is None:
+            if stop.killed_at is None and now >= stop.deadline:
+                stop.killed_at = now
+                try:
+                    self.backend.kill(stop.handle)                    # force after grace
+                except Exception as e:  # noqa: BLE001
+                    logger.warning("stop %s: SIGKILL failed: %s", workload_id, e)
+                return
+            if stop.killed_at is None or now < stop.killed_at + self.kill_grace_sec:
+                return
+        self._finish(workload_id, stop, code, now)
+
+    def _finish(self, workload_id: str, stop: _Stop, code: Optional[int], now: float) -> None:
+        with self._cond:
+            if self._stops.get(workload_id) is not stop:
+                return                                                # cancelled meanwhile
+            stop.finishing = True
+        (self._killed if stop.killed_at is not None else self._graceful).observe(now - stop.started)
+        try:
+            stop.on_done(code)
+        except Exception as e:  # noqa: BLE001 — one failed finish must not stall the others
+            logger.warning("stop %s: recording stopped failed: %s", workload_id, e)
+        finally:
+            with self._cond:
+                del self._stops[workload_id]
+                self._depth.set(len(self._stops))
+                self._cond.notify_all()
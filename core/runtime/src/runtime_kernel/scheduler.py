@@ -3,7 +3,7 @@
 advance time deterministically (fakeredis + FakeClock, no wall clock, no background asyncio task).
 
 Faithful to the parent's real shape and behaviour:
-  • jobs live in a sorted set keyed by execute_at (score), member = job JSON;
+  • jobs are ordered in a sorted set keyed by execute_at (score);
   • idempotency_key dedups (returns the existing job);
   • due jobs fire via an injectable `dispatch(request) -> result`; the real dispatch does HTTP, the
     eval captures the request;
@@ -11,13 +11,42 @@ Faithful to the parent's real shape and behaviour:
   • a `cron`-tagged job re-arms itself (croniter) after a successful run;
   • orphan recovery re-queues jobs that were mid-flight when the process died.
 
-`tick()` is the unit the parent's `_executor_loop` runs each poll: it pulls everything due (per the
-Clock) and processes it. A real deployment loops tick() on an interval; the eval calls it explicitly
-after advancing the FakeClock."""
+Indexed layout (the parent's ZSET member was the whole job JSON, so cancel/get scanned and decoded
+every pending job and each retry re-added a different member):
+  • `scheduler:due`             ZSET  job_id → execute_at, pending jobs only;
+  • `scheduler:job:{job_id}`    HASH  the job, one JSON-encoded value per top-level field;
+  • `scheduler:status:executing` ZSET  job_id → LEASE expiry, for jobs a tick has claimed;
+  • `scheduler:lease`           HASH  job_id → the claiming tick's lease token;
+  • `scheduler:status:{status}` ZSET  job_id → when it ended, per terminal status (completed ·
+    failed · cancelled); terminal jobs expire after HISTORY_TTL.
+cancel/get are key lookups and list(status) reads one index. `migrate_legacy_layout()` moves a
+parent-layout keyspace (`scheduler:jobs` / `scheduler:executing` / `scheduler:history`) over; the
+boot ticker runs it first, and it is a no-op once the legacy keys are gone.
+
+`tick()` is the unit the parent's `_executor_loop` runs each poll. It dispatches CONCURRENTLY on a
+bounded thread pool (SCHED_CONCURRENCY), so one slow target no longer holds up every other due job,
+and it is safe for several runtime replicas to tick the same redis:
+  • CLAIM — a Lua script atomically moves due ids from `scheduler:due` into the executing index with
+    a lease (SCHED_LEASE_SEC); a replica only claims as many jobs as it has free workers, so the
+    others get the rest, and at most TICK_BATCH per tick;
+  • HEARTBEAT — while dispatches run, the ticking thread renews its in-flight leases every third of
+    a lease, so a job that legitimately takes long is not taken from it;
+  • LEASE EXPIRY — every tick first re-queues the jobs whose lease ran out (their replica died or
+    hung). That replaces startup-only orphan recovery; `recover_orphans()` is the same sweep;
+  • SETTLE — a worker re-checks its lease token before dispatching, and records the outcome (retry
+    or terminal) with a compare-and-delete on that token, so a replica whose job was reclaimed
+    neither fires it again nor overwrites the new holder's lease.
+Each tick records its LAG (now − execute_at of the jobs it claimed) in `metrics()` and logs it as a
+`scheduler_tick` event. A real deployment loops tick() on an interval; the eval calls it explicitly
+after advancing the FakeClock (a claimed job's dispatch finishes before tick() returns)."""
 from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from typing import Any, Callable, Optional
 from uuid import uuid4
@@ -25,15 +54,86 @@ from uuid import uuid4
 from croniter import croniter
 
 from .clock import Clock, SystemClock
+from .obs import log_event
 
 logger = logging.getLogger("runtime_kernel.scheduler")
 
-# Redis keys (mirror 0.11).
-JOBS_KEY = "scheduler:jobs"            # sorted set: score=execute_at, member=job JSON
-EXECUTING_KEY = "scheduler:executing"  # hash: job_id -> job JSON (in-flight)
-HISTORY_KEY = "scheduler:history"      # hash: job_id -> job JSON (completed/failed/cancelled)
+# Redis keys (indexed layout — see the module docstring).
+JOBS_KEY = "scheduler:due"               # sorted set: score=execute_at, member=job_id (pending)
+JOB_KEY_PREFIX = "scheduler:job:"        # hash per job: field -> JSON value
+STATUS_KEY_PREFIX = "scheduler:status:"  # sorted set per non-pending status (see below)
+EXECUTING_KEY = f"{STATUS_KEY_PREFIX}executing"  # job_id -> lease expiry
+LEASES_KEY = "scheduler:lease"           # hash: job_id -> lease token of the tick that claimed it
 IDEMPOTENCY_PREFIX = "scheduler:idem:"
 HISTORY_TTL = 86400 * 7
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+# The parent's layout, read only by migrate_legacy_layout().
+LEGACY_JOBS_KEY = "scheduler:jobs"            # sorted set: score=execute_at, member=job JSON
+LEGACY_EXECUTING_KEY = "scheduler:executing"  # hash: job_id -> job JSON (in-flight)
+LEGACY_HISTORY_KEY = "scheduler:history"      # hash: job_id -> job JSON (completed/failed/cancelled)
+
+# Most due jobs one tick() takes on; the rest stay due for the next tick.
+TICK_BATCH = int(os.getenv("SCHED_TICK_BATCH", "500"))
+# Dispatches one tick() runs at once (the worker pool size).
+SCHED_CONCURRENCY = int(os.getenv("SCHED_CONCURRENCY", "8"))
+# How long a claim holds a job before another tick may take it back; renewed while it runs.
+SCHED_LEASE_SEC = float(os.getenv("SCHED_LEASE_SEC", "60"))
+
+# Atomic claim: pop up to ARGV[3] ids due by ARGV[1] into the executing index, leased until
+# ARGV[2] under token ARGV[4].
+_CLAIM_LUA = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[3]))
+for _, id in ipairs(ids) do
+  redis.call('ZREM', KEYS[1], id)
+  redis.call('ZADD', KEYS[2], ARGV[2], id)
+  redis.call('HSET', KEYS[3], id, ARGV[4])
+end
+return ids
+"""
+# Heartbeat: extend to ARGV[1] the leases of ARGV[3..] still held under token ARGV[2] (a reclaimed
+# job is not revived, and another tick's lease on it is not extended).
+_RENEW_LUA = """
+local renewed = 0
+for i = 3, #ARGV do
+  if redis.call('HGET', KEYS[2], ARGV[i]) == ARGV[2] then
+    redis.call('ZADD', KEYS[1], ARGV[1], ARGV[i])
+    renewed = renewed + 1
+  end
+end
+return renewed
+"""
+# Lease expiry: move up to ARGV[2] ids whose lease ended by ARGV[1] back to due, due now.
+_RECLAIM_LUA = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, id in ipairs(ids) do
+  redis.call('ZREM', KEYS[1], id)
+  redis.call('HDEL', KEYS[3], id)
+  redis.call('ZADD', KEYS[2], ARGV[1], id)
+end
+return ids
+"""
+# Compare-and-delete: only while job ARGV[1] is still leased under token ARGV[2], drop the lease and
+# write the field/value pairs ARGV[6..] onto its hash KEYS[3]. ARGV[3] = 'retry' re-queues it in the
+# due set KEYS[4] at score ARGV[4]; 'finish' records it in the status index KEYS[4] at ARGV[4] (now),
+# expires the hash after ARGV[5] seconds and prunes index entries older than that.
+_SETTLE_LUA = """
+if redis.call('HGET', KEYS[2], ARGV[1]) ~= ARGV[2] then
+  return 0
+end
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('ZREM', KEYS[1], ARGV[1])
+for i = 6, #ARGV, 2 do
+  redis.call('HSET', KEYS[3], ARGV[i], ARGV[i + 1])
+end
+redis.call('ZADD', KEYS[4], ARGV[4], ARGV[1])
+if ARGV[3] == 'finish' then
+  local ttl = tonumber(ARGV[5])
+  redis.call('EXPIRE', KEYS[3], ttl)
+  redis.call('ZREMRANGEBYSCORE', KEYS[4], '-inf', tonumber(ARGV[4]) - ttl)
+end
+return 1
+"""
 
 DEFAULT_RETRY = {"max_attempts": 3, "backoff": [30, 120, 300], "attempt": 0}
 
@@ -49,16 +149,49 @@ def _s(v) -> str:
     return v.decode() if isinstance(v, (bytes, bytearray)) else v
 
 
+def _job_key(job_id: str) -> str:
+    return f"{JOB_KEY_PREFIX}{job_id}"
+
+
+def _status_key(status: str) -> str:
+    return f"{STATUS_KEY_PREFIX}{status}"
+
+
+def _encode(job: dict[str, Any]) -> dict[str, str]:
+    return {k: json.dumps(v) for k, v in job.items()}
+
+
+def _decode(fields: dict) -> Optional[dict[str, Any]]:
+    if not fields:
+        return None
+    return {_s(k): json.loads(_s(v)) for k, v in fields.items()}
+
+
 class Scheduler:
     def __init__(
         self,
         redis,
         dispatch: Dispatch,
         clock: Optional[Clock] = None,
+        concurrency: Optional[int] = None,
+        lease: Optional[float] = None,
     ) -> None:
         self._r = redis
         self._dispatch = dispatch
         self.clock: Clock = clock or SystemClock()
+        self.concurrency = max(1, SCHED_CONCURRENCY if concurrency is None else concurrency)
+        self.lease = SCHED_LEASE_SEC if lease is None else lease
+        self._claim_script = redis.register_script(_CLAIM_LUA)
+        self._renew_script = redis.register_script(_RENEW_LUA)
+        self._reclaim_script = redis.register_script(_RECLAIM_LUA)
+        self._settle_script = redis.register_script(_SETTLE_LUA)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._metrics_lock = threading.Lock()
+        self._metrics: dict[str, Any] = {
+            "ticks": 0, "claimed": 0, "completed": 0, "retried": 0, "failed": 0,
+            "reclaimed": 0, "lease_lost": 0, "inflight": 0,
+            "last_tick_lag_max_s": 0.0, "last_tick_lag_avg_s": 0.0, "lag_max_s": 0.0,
+        }
 
     # ── job CRUD ─────────────────────────────────────────────────────────────
     def _make_job(self, spec: dict[str, Any]) -> dict[str, Any]:
@@ -99,59 +232,185 @@ class Scheduler:
         idem_key = job.get("idempotency_key")
         if idem_key:
             redis_key = f"{IDEMPOTENCY_PREFIX}{idem_key}"
-            existing = self._r.get(redis_key)
-            if existing:
-                logger.info("duplicate idempotency_key=%s, returning existing job", idem_key)
-                return json.loads(_s(existing))
-            self._r.set(redis_key, json.dumps(job), ex=HISTORY_TTL)
-        self._r.zadd(JOBS_KEY, {json.dumps(job): job["execute_at"]})
+            if not self._r.set(redis_key, json.dumps(job), ex=HISTORY_TTL, nx=True):
+                existing = self._r.get(redis_key)
+                if existing:
+                    logger.info("duplicate idempotency_key=%s, returning existing job", idem_key)
+                    return json.loads(_s(existing))
+                self._r.set(redis_key, json.dumps(job), ex=HISTORY_TTL)  # expired in between
+        pipe = self._r.pipeline()
+        pipe.hset(_job_key(job["job_id"]), mapping=_encode(job))
+        pipe.zadd(JOBS_KEY, {job["job_id"]: job["execute_at"]})
+        pipe.execute()
         return job
 
     def cancel(self, job_id: str) -> Optional[dict[str, Any]]:
-        for raw in self._r.zrange(JOBS_KEY, 0, -1):
-            job = json.loads(_s(raw))
-            if job.get("job_id") == job_id:
-                if self._r.zrem(JOBS_KEY, raw):
-                    job["status"] = "cancelled"
-                    self._r.hset(HISTORY_KEY, job_id, json.dumps(job))
-                    return job
-        return None
+        # Removing the id from the due set is the claim: a job a tick already took is not cancelled.
+        if not self._r.zrem(JOBS_KEY, job_id):
+            return None
+        job = _decode(self._r.hgetall(_job_key(job_id)))
+        if job is None:
+            return None
+        job["status"] = "cancelled"
+        self._finish(job)
+        return job
 
     def get(self, job_id: str) -> Optional[dict[str, Any]]:
-        for store_key, getter in ((EXECUTING_KEY, self._r.hget), (HISTORY_KEY, self._r.hget)):
-            raw = getter(store_key, job_id)
-            if raw:
-                return json.loads(_s(raw))
-        for raw in self._r.zrange(JOBS_KEY, 0, -1):
-            job = json.loads(_s(raw))
-            if job.get("job_id") == job_id:
-                return job
-        return None
+        return _decode(self._r.hgetall(_job_key(job_id)))
 
     def list(self, status: Optional[str] = None, limit: int = 50) -> list[dict[str, Any]]:
-        results: list[dict[str, Any]] = []
+        ids: list[str] = []
         if status in (None, "pending"):
-            for raw in self._r.zrange(JOBS_KEY, 0, -1):
-                results.append(json.loads(_s(raw)))
+            ids += [_s(i) for i in self._r.zrange(JOBS_KEY, 0, limit - 1)]
         if status in (None, "executing"):
-            for raw in self._r.hgetall(EXECUTING_KEY).values():
-                results.append(json.loads(_s(raw)))
+            ids += [_s(i) for i in self._r.zrange(EXECUTING_KEY, 0, -1)]
+        if status in TERMINAL_STATUSES:
+            # The most recent ``limit`` — older entries may have expired with their hash.
+            ids += [_s(i) for i in self._r.zrevrange(_status_key(status), 0, limit - 1)]
+        results = [job for job in self._load(ids) if job is not None]
         results.sort(key=lambda j: j.get("execute_at", 0))
         return results[:limit]
 
+    def _load(self, job_ids: list[str]) -> list[Optional[dict[str, Any]]]:
+        """Every job's hash in one round trip (None where it has expired or never existed)."""
+        if not job_ids:
+            return []
+        pipe = self._r.pipeline(transaction=False)
+        for job_id in job_ids:
+            pipe.hgetall(_job_key(job_id))
+        return [_decode(fields) for fields in pipe.execute()]
+
+    def _finish(self, job: dict[str, Any], lease: Optional[str] = None) -> bool:
+        """Record a terminal status: the hash keeps the outcome for HISTORY_TTL, the status index
+        holds the id (pruned of entries older than the TTL as it goes). With ``lease`` (a claimed
+        job) it is a compare-and-delete on that token: False, and nothing written, when the lease
+        was reclaimed since."""
+        job_id = job["job_id"]
+        now = self.clock.now()
+        key, index = _job_key(job_id), _status_key(job["status"])
+        if lease is not None:
+            return self._settle(job_id, lease, "finish", index, now, _encode(job))
+        pipe = self._r.pipeline()
+        pipe.zrem(EXECUTING_KEY, job_id)
+        pipe.hset(key, mapping=_encode(job))
+        pipe.expire(key, HISTORY_TTL)
+        pipe.zadd(index, {job_id: now})
+        pipe.zremrangebyscore(index, "-inf", now - HISTORY_TTL)
+        pipe.execute()
+        return True
+
+    def _settle(self, job_id: str, lease: str, mode: str, index: str, score: float,
+                fields: dict[str, str]) -> bool:
+        flat = [part for item in fields.items() for part in item]
+        return bool(self._settle_script(
+            keys=[EXECUTING_KEY, LEASES_KEY, _job_key(job_id), index],
+            args=[job_id, lease, mode, score, HISTORY_TTL, *flat]))
+
+    def _holds(self, job_id: str, lease: str) -> bool:
+        return _s(self._r.hget(LEASES_KEY, job_id)) == lease
+
+    def _lease_lost(self, job_id: str, what: str) -> None:
+        # Reclaimed after a missed heartbeat: the replica now holding it owns the outcome.
+        self._count(lease_lost=1)
+        logger.warning("scheduler job %s: lease lost, %s", job_id, what)
+
+    # ── migration ────────────────────────────────────────────────────────────
+    def migrate_legacy_layout(self, batch: int = 1000) -> int:
+        """Move jobs from the parent's layout (whole-job-JSON ZSET members + JSON hashes) into the
+        indexed one. Idempotent and resumable: each legacy entry is removed only after its job is
+        written, so a crash mid-way re-migrates at most one batch. Returns the number of jobs moved."""
+        moved = 0
+        while True:
+            members = self._r.zrange(LEGACY_JOBS_KEY, 0, batch - 1, withscores=True)
+            if not members:
+                break
+            pipe = self._r.pipeline()
+            for raw, score in members:
+                job = json.loads(_s(raw))
+                job["status"] = "pending"
+                pipe.hset(_job_key(job["job_id"]), mapping=_encode(job))
+                pipe.zadd(JOBS_KEY, {job["job_id"]: score})
+                pipe.zrem(LEGACY_JOBS_KEY, raw)
+            pipe.execute()
+            moved += len(members)
+        for legacy_key, terminal in ((LEGACY_EXECUTING_KEY, False), (LEGACY_HISTORY_KEY, True)):
+            if self._r.type(legacy_key) not in ("hash", b"hash"):
+                continue
+            for job_id, raw in self._r.hgetall(legacy_key).items():
+                job = json.loads(_s(raw))
+                if terminal:
+                    self._finish(job)
+                else:
+                    # Executing under a lease that has already run out: the next sweep re-queues it.
+                    pipe = self._r.pipeline()
+                    pipe.hset(_job_key(job["job_id"]), mapping=_encode(job))
+                    pipe.zadd(EXECUTING_KEY, {job["job_id"]: 0})
+                    pipe.execute()
+                self._r.hdel(legacy_key, _s(job_id))
+                moved += 1
+        if moved:
+            logger.info("migrated %d scheduler job(s) to the indexed layout", moved)
+        return moved
+
     # ── execution ────────────────────────────────────────────────────────────
     def recover_orphans(self) -> int:
-        """Re-queue jobs that were executing when the process died (run on startup)."""
-        executing = self._r.hgetall(EXECUTING_KEY)
-        recovered = 0
-        for job_id, raw in executing.items():
-            job = json.loads(_s(raw))
-            job["status"] = "pending"
-            self._r.zadd(JOBS_KEY, {json.dumps(job): self.clock.now()})
-            self._r.hdel(EXECUTING_KEY, _s(job_id))
-            logger.warning("recovered orphaned job %s", _s(job_id))
-            recovered += 1
-        return recovered
+        """Re-queue jobs whose lease expired — their replica died or hung mid-flight. Every tick
+        runs this sweep; calling it at startup just gets there before the first tick."""
+        return self._reclaim_expired()
+
+    def _reclaim_expired(self, batch: int = 1000) -> int:
+        now = self.clock.now()
+        reclaimed = 0
+        while True:
+            ids = [_s(i) for i in self._reclaim_script(
+                keys=[EXECUTING_KEY, JOBS_KEY, LEASES_KEY], args=[now, batch])]
+            if not ids:
+                break
+            pipe = self._r.pipeline(transaction=False)
+            for job_id in ids:
+                pipe.hset(_job_key(job_id), "status", json.dumps("pending"))
+                logger.warning("recovered orphaned job %s (lease expired)", job_id)
+            pipe.execute()
+            reclaimed += len(ids)
+            if len(ids) < batch:
+                break
+        if reclaimed:
+            self._count(reclaimed=reclaimed)
+        return reclaimed
+
+    def _claim(self, now: float, n: int, lease: str) -> list[dict[str, Any]]:
+        """Atomically lease up to ``n`` due jobs to this tick under token ``lease``; returns them,
+        marked executing."""
+        ids = [_s(i) for i in self._claim_script(
+            keys=[JOBS_KEY, EXECUTING_KEY, LEASES_KEY], args=[now, now + self.lease, n, lease])]
+        if not ids:
+            return []
+        pipe = self._r.pipeline(transaction=False)
+        for job_id in ids:
+            pipe.hset(_job_key(job_id), "status", json.dumps("executing"))
+            pipe.hgetall(_job_key(job_id))
+        replies = pipe.execute()[1::2]
+        jobs = []
+        for job_id, fields in zip(ids, replies):
+            job = _decode(fields)
+            if job is None or "job_id" not in job:  # its hash is gone — drop the dangling id
+                pipe = self._r.pipeline(transaction=False)
+                pipe.delete(_job_key(job_id))
+                pipe.zrem(EXECUTING_KEY, job_id)
+                pipe.hdel(LEASES_KEY, job_id)
+                pipe.execute()
+                continue
+            job["status"] = "executing"
+            jobs.append(job)
+        return jobs
+
+    def _renew(self, job_ids: list[str], lease: str) -> None:
+        renewed = self._renew_script(keys=[EXECUTING_KEY, LEASES_KEY],
+                                     args=[self.clock.now() + self.lease, lease, *job_ids])
+        if renewed < len(job_ids):
+            # Reclaimed elsewhere after a missed heartbeat: the job may run twice (at-least-once).
+            self._count(lease_lost=len(job_ids) - renewed)
+            logger.warning("%d scheduler lease(s) lost while dispatching", len(job_ids) - renewed)
 
     def _reschedule_cron(self, job: dict[str, Any]) -> None:
         cron = job.get("cron")
@@ -169,16 +428,14 @@ class Scheduler:
             }
         )
 
-    def _process(self, raw: str) -> None:
-        job = json.loads(raw)
+    def _process(self, job: dict[str, Any], lease: str) -> None:
+        """Dispatch one claimed job and record the outcome (runs on a pool worker). Neither happens
+        once ``lease`` no longer holds the job."""
         job_id = job["job_id"]
-        # Atomic claim — if another worker took it, skip.
-        if not self._r.zrem(JOBS_KEY, raw):
-            return
-        job["status"] = "executing"
-        self._r.hset(EXECUTING_KEY, job_id, json.dumps(job))
-
         retry = job.get("retry", {})
+        if not self._holds(job_id, lease):
+            self._lease_lost(job_id, "not dispatched")
+            return
         try:
             result = self._dispatch(job["request"])
             job["status"] = "completed"
@@ -192,8 +449,12 @@ class Scheduler:
                 delay = backoff[min(attempt - 1, len(backoff) - 1)]
                 job["retry"]["attempt"] = attempt
                 job["status"] = "pending"
-                self._r.hdel(EXECUTING_KEY, job_id)
-                self._r.zadd(JOBS_KEY, {json.dumps(job): self.clock.now() + delay})
+                # Same member, new score — the retry rewrites two fields, not the whole job.
+                if not self._settle(job_id, lease, "retry", JOBS_KEY, self.clock.now() + delay,
+                                    _encode({"status": "pending", "retry": job["retry"]})):
+                    self._lease_lost(job_id, "retry dropped")
+                    return
+                self._count(retried=1)
                 logger.warning(
                     "job %s attempt %d/%d failed (%s), retry in %ss",
                     job_id, attempt, max_attempts, e, delay,
@@ -204,17 +465,91 @@ class Scheduler:
             job["failed_at"] = self.clock.now()
             logger.error("job %s permanently failed after %d attempts: %s", job_id, max_attempts, e)
 
-        self._r.hdel(EXECUTING_KEY, job_id)
-        self._r.hset(HISTORY_KEY, job_id, json.dumps(job))
+        if not self._finish(job, lease):
+            self._lease_lost(job_id, f"{job['status']} outcome dropped")
+            return
+        self._count(**{job["status"]: 1})
         if job["status"] == "completed":
             self._reschedule_cron(job)
 
-    def tick(self) -> int:
-        """Fire every job due at the current Clock time. Returns the count processed."""
-        now = self.clock.now()
-        due = self._r.zrangebyscore(JOBS_KEY, "-inf", now)
-        processed = 0
-        for raw in due:
-            self._process(_s(raw))
-            processed += 1
-        return processed
+    def tick(self, limit: Optional[int] = None) -> int:
+        """Fire the due jobs — at most ``limit`` (TICK_BATCH) of them, earliest first, ``concurrency``
+        at a time — and return once they have all been processed. Each refill claims against a fresh
+        Clock read, so a late claim's lease (and its due cutoff and lag) is measured from when it was
+        taken, not from the start of the tick. Returns the count processed; a full batch means more
+        may be due."""
+        limit = TICK_BATCH if limit is None else limit
+        self._reclaim_expired()
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.concurrency, thread_name_prefix="scheduler-dispatch")
+        inflight: dict[Future, str] = {}
+        claimed, lags, drained = 0, [], False
+        lease = uuid4().hex  # this tick's claims; settling compares against it
+        heartbeat_at = time.monotonic() + self.lease / 3
+        try:
+            while True:
+                free = min(self.concurrency - len(inflight), limit - claimed)
+                if free > 0 and not drained:
+                    now = self.clock.now()
+                    jobs = self._claim(now, free, lease)
+                    drained = len(jobs) < free  # nothing more due (or another replica has it)
+                    for job in jobs:
+                        lags.append(max(0.0, now - float(job.get("execute_at", now))))
+                        inflight[self._pool.submit(self._process, job, lease)] = job["job_id"]
+                        claimed += 1
+                self._set_inflight(len(inflight))
+                if not inflight:
+                    break
+                done, _ = wait(inflight, timeout=max(0.0, heartbeat_at - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+                for fut in done:
+                    job_id = inflight.pop(fut)
+                    if fut.exception() is not None:  # a redis error recording the outcome
+                        logger.warning("scheduler job %s failed to settle: %s", job_id, fut.exception())
+                if time.monotonic() >= heartbeat_at and inflight:
+                    self._renew(list(inflight.values()), lease)
+                    heartbeat_at = time.monotonic() + self.lease / 3
+        finally:
+            self._set_inflight(0)
+        if claimed:
+            self._record_lag(claimed, lags)
+        return claimed
+
+    def close(self) -> None:
+        """Stop the dispatch pool (waits for in-flight dispatches)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    # ── metrics ──────────────────────────────────────────────────────────────
+    def metrics(self) -> dict[str, Any]:
+        """Counters since start (claimed · completed · retried · failed · reclaimed · lease_lost),
+        in-flight dispatches, the last tick's lag (now − execute_at: max/avg) and the worst lag seen,
+        plus the current due backlog."""
+        with self._metrics_lock:
+            out = dict(self._metrics)
+        out["due"] = self._r.zcount(JOBS_KEY, "-inf", self.clock.now())
+        out["executing"] = self._r.zcard(EXECUTING_KEY)
+        out["concurrency"] = self.concurrency
+        return out
+
+    def _count(self, **deltas: int) -> None:
+        with self._metrics_lock:
+            for name, n in deltas.items():
+                self._metrics[name] = self._metrics.get(name, 0) + n
+
+    def _set_inflight(self, n: int) -> None:
+        with self._metrics_lock:
+            self._metrics["inflight"] = n
+
+    def _record_lag(self, claimed: int, lags: list[float]) -> None:
+        lag_max, lag_avg = max(lags), sum(lags) / len(lags)
+        with self._metrics_lock:
+            self._metrics["ticks"] += 1
+            self._metrics["claimed"] += claimed
+            self._metrics["last_tick_lag_max_s"] = round(lag_max, 3)
+            self._metrics["last_tick_lag_avg_s"] = round(lag_avg, 3)
+            self._metrics["lag_max_s"] = round(max(self._metrics["lag_max_s"], lag_max), 3)
+        log_event("scheduler_tick", audience="system", span="scheduler",
+                  fields={"claimed": claimed, "lag_max_s": round(lag_max, 3),
+                          "lag_avg_s": round(lag_avg, 3)})
@@ -4,8 +4,11 @@ list/query/enforce without re-deriving from the backend, and so state survives a
 Two adapters implement one Protocol:
   • InMemoryStore — the default; a plain dict. Single-process, lost on restart.
   • RedisStore    — serializes (status, spec) as JSON under a key prefix, mirroring 0.11's
-                    `runtime_api/state.py` (KEY_PREFIX, scan-based list, count-for-owner). State
-                    survives a restart: a fresh Runtime built over the same Redis re-reads it.
+                    `runtime_api/state.py` (KEY_PREFIX, count-for-owner). State survives a restart:
+                    a fresh Runtime built over the same Redis re-reads it. Secondary indexes (every
+                    id · each owner's ACTIVE ids · the ids in each state) are maintained atomically
+                    with each write, so a quota check is one SCARD and list() one set read plus
+                    pipelined MGETs — neither SCANs the keyspace, whose size is every record ever kept.
 
 `owner` is the tenancy/quota axis. runtime.v1's spec has no owner field (tenancy is deferred,
 ADR-0003), so the owner is resolved from the spec by an injectable resolver (default: the
@@ -61,6 +64,9 @@ class WorkloadStore(Protocol):
     def get(self, workload_id: str) -> Optional[WorkloadRecord]: ...
     def list(self) -> list[WorkloadRecord]: ...
     def delete(self, workload_id: str) -> None: ...
+    def list_by_state(self, state: str) -> list[WorkloadRecord]:
+        """Every workload whose last-known state is `state` (a RuntimeState value)."""
+        ...
     def count_for_owner(self, owner: str) -> int:
         """Count active (non-terminal) workloads belonging to `owner` — the quota axis."""
         ...
@@ -89,6 +95,9 @@ class InMemoryStore:
     def list(self) -> list[WorkloadRecord]:
         return list(self._records.values())
 
+    def list_by_state(self, state: str) -> list[WorkloadRecord]:
+        return [r for r in self._records.values() if r.status.state.value == state]
+
     def delete(self, workload_id: str) -> None:
         self._records.pop(workload_id, None)
 
@@ -96,28 +105,78 @@ class InMemoryStore:
         return sum(1 for r in self._records.values() if r.owner == owner and _is_active(r))
 
 
+# Atomic index maintenance. KEYS: the record, the id→owner and id→state hashes, the all-ids set.
+# ARGV: id, record JSON (empty = delete), owner, state, active ("1"/"0"), the index key prefix.
+# The previous owner/state come from the hashes, so a record moves between sets in the same step
+# that rewrites it — the indexes can never disagree with the records.
+_INDEX_LUA = """
+local id, prefix = ARGV[1], ARGV[6]
+local old_owner = redis.call('HGET', KEYS[2], id)
+local old_state = redis.call('HGET', KEYS[3], id)
+if old_owner then redis.call('SREM', prefix .. 'owner:' .. old_owner, id) end
+if old_state then redis.call('SREM', prefix .. 'state:' .. old_state, id) end
+if ARGV[2] == '' then
+  redis.call('DEL', KEYS[1])
+  redis.call('HDEL', KEYS[2], id)
+  redis.call('HDEL', KEYS[3], id)
+  redis.call('SREM', KEYS[4], id)
+  return 0
+end
+redis.call('SET', KEYS[1], ARGV[2])
+redis.call('HSET', KEYS[2], id, ARGV[3])
+redis.call('HSET', KEYS[3], id, ARGV[4])
+redis.call('SADD', KEYS[4], id)
+redis.call('SADD', prefix .. 'state:' .. ARGV[4], id)
+if ARGV[5] == '1' then redis.call('SADD', prefix .. 'owner:' .. ARGV[3], id) end
+return 1
+"""
+
+
 class RedisStore:
-    """Redis-backed store — JSON under `{prefix}{workloadId}`, scan-based list (mirrors 0.11
-    state.py). Accepts any redis-py-compatible client (real redis, or fakeredis in evals).
+    """Redis-backed store — JSON under `{prefix}{workloadId}` (mirrors 0.11 state.py), plus the
+    secondary indexes under `{index_prefix}`:
+
+      • `all`            SET  every workload id;
+      • `owner:{owner}`  SET  the owner's ACTIVE (non-terminal) workload ids — count_for_owner = SCARD;
+      • `state:{state}`  SET  the ids whose last-known state is `state`;
+      • `owners` / `states`  HASH  id → owner / state, so a rewrite knows which sets to leave.
+
+    Every set/delete runs as one Lua script. A keyspace written before the indexes existed is
+    indexed once (a single SCAN) when the store is constructed, marked by `{index_prefix}version`.
+    Accepts any redis-py-compatible client (real redis, or fakeredis in evals).
 
     decode_responses is assumed True (str keys/values); we tolerate bytes defensively so a caller
     that forgot the flag still works."""
 
     KEY_PREFIX = "runtime:workload:"
+    INDEX_VERSION = "1"
+    MGET_CHUNK = 500
 
     def __init__(self, redis, prefix: str = KEY_PREFIX) -> None:
         self._r = redis
         self._prefix = prefix
+        # Outside `{prefix}*`, so neither a workload id nor a legacy SCAN can collide with it.
+        self._idx = f"{prefix.rstrip(':')}-idx:"
+        self._index = redis.register_script(_INDEX_LUA)
+        if self._s(self._r.get(f"{self._idx}version") or "") != self.INDEX_VERSION:
+            self.reindex()
 
     def _key(self, workload_id: str) -> str:
         return f"{self._prefix}{workload_id}"
 
+    def _index_keys(self, workload_id: str) -> list[str]:
+        return [self._key(workload_id), f"{self._idx}owners", f"{self._idx}states", f"{self._idx}all"]
+
     @staticmethod
     def _s(v) -> str:
         return v.decode() if isinstance(v, (bytes, bytearray)) else v
 
+    def _index_args(self, record: WorkloadRecord) -> list[str]:
+        return [record.spec.workloadId, record.to_json(), record.owner, record.status.state.value,
+                "1" if _is_active(record) else "0", self._idx]
+
     def set(self, record: WorkloadRecord) -> None:
-        self._r.set(self._key(record.spec.workloadId), record.to_json())
+        self._index(keys=self._index_keys(record.spec.workloadId), args=self._index_args(record))
 
     def get(self, workload_id: str) -> Optional[WorkloadRecord]:
         raw = self._r.get(self._key(workload_id))
@@ -126,27 +185,48 @@ class RedisStore:
         return WorkloadRecord.from_json(self._s(raw))
 
     def list(self) -> list[WorkloadRecord]:
-        records: list[WorkloadRecord] = []
-        for key in self._r.scan_iter(match=f"{self._prefix}*"):
-            raw = self._r.get(key)
-            if raw is None:
-                continue
-            records.append(WorkloadRecord.from_json(self._s(raw)))
-        return records
+        return self._load(self._r.smembers(f"{self._idx}all"))
+
+    def list_by_state(self, state: str) -> list[WorkloadRecord]:
+        return self._load(self._r.smembers(f"{self._idx}state:{state}"))
 
     def delete(self, workload_id: str) -> None:
-        self._r.delete(self._key(workload_id))
+        self._index(keys=self._index_keys(workload_id), args=[workload_id, "", "", "", "0", self._idx])
 
     def count_for_owner(self, owner: str) -> int:
+        return int(self._r.scard(f"{self._idx}owner:{owner}"))
+
+    def reindex(self) -> int:
+        """Rebuild the indexes from the records themselves (one SCAN) — the upgrade path for a
+        keyspace written without them, and a repair tool. Returns the number of records indexed."""
+        stale = list(self._r.scan_iter(match=f"{self._idx}*", count=self.MGET_CHUNK))
+        if stale:
+            self._r.delete(*stale)
+        keys = list(self._r.scan_iter(match=f"{self._prefix}*", count=self.MGET_CHUNK))
         count = 0
-        for key in self._r.scan_iter(match=f"{self._prefix}*"):
-            raw = self._r.get(key)
-            if raw is None:
-                continue
-            record = WorkloadRecord.from_json(self._s(raw))
-            if record.owner == owner and _is_active(record):
+        for i in range(0, len(keys), self.MGET_CHUNK):
+            pipe = self._r.pipeline(transaction=False)
+            for raw in self._r.mget(keys[i:i + self.MGET_CHUNK]):
+                if raw is None:
+                    continue
+                record = WorkloadRecord.from_json(self._s(raw))
+                self._index(keys=self._index_keys(record.spec.workloadId),
+                            args=self._index_args(record), client=pipe)
                 count += 1
+            pipe.execute()
+        self._r.set(f"{self._idx}version", self.INDEX_VERSION)
         return count
 
+    def _load(self, ids) -> list[WorkloadRecord]:
+        """The records for ``ids``, fetched with MGET in pipelined chunks (one round trip)."""
+        ids = sorted(self._s(i) for i in ids)
+        pipe = self._r.pipeline(transaction=False)
+        for i in range(0, len(ids), self.MGET_CHUNK):
+            pipe.mget([self._key(wid) for wid in ids[i:i + self.MGET_CHUNK]])
+        records: list[WorkloadRecord] = []
+        for chunk in pipe.execute() if ids else ():
+            records.extend(WorkloadRecord.from_json(self._s(raw)) for raw in chunk if raw is not None)
+        return records
+
 
 OwnerResolver = Callable[[WorkloadSpec], str]
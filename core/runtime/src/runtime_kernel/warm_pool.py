@@ -0,0 +1,252 @@
+"""Warm pool — pre-provisioned idle workloads that a spawn CLAIMS instead of creating from cold.
+
+Every cold ``DockerBackend.start`` pays create + start (plus the 409 delete-and-retry) before the
+bot even begins booting; the user sees it as join latency after "send bot". An opt-in pool keeps
+``size`` workloads per pooled profile provisioned and idling in a bootstrap that waits for a
+HANDSHAKE. A spawn whose Runnable matches a pooled profile:
+
+  • takes the oldest ready slot and ``hand_off``\\ s it the workload (the substrate delivers the
+    per-workload env and gives it the workload's identity; the bootstrap then execs the real
+    entrypoint);
+  • falls back to the cold path on an empty pool or a failed hand-off — a claim is an
+    optimisation, never a new way to fail a spawn;
+
+and a refill thread tops every pool back up to ``size``, evicting slots idle past ``idle_sec`` (a
+long-idle slot may predate an image update or a config change).
+
+The pool is substrate-agnostic: ``PoolSubstrate`` is the three calls it needs
+(``provision``/``hand_off``/``discard``). ``DockerBackend`` implements it over the socket API;
+``FakePoolSubstrate`` makes the pool logic testable without a daemon.
+
+Metrics (``obs.py``): ``warm_pool_hits`` / ``warm_pool_misses`` (claims of a pooled profile),
+``warm_pool_evicted``, ``warm_pool_provision_failed``, and the ``warm_pool_ready`` gauge.
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional, Protocol
+
+from .backend import WorkloadHandle
+from .obs import counter, gauge
+from .profiles import Runnable
+
+logger = logging.getLogger("runtime_kernel.warm_pool")
+
+PoolKey = tuple[Optional[str], tuple[str, ...]]
+
+
+def pool_key(runnable: Runnable) -> PoolKey:
+    """The identity a spawn is matched to a pool by: image + command."""
+    return runnable.image, tuple(runnable.command or ())
+
+
+class PoolSubstrate(Protocol):
+    def provision(self, profile: str, runnable: Runnable) -> str:
+        """Create + start one idle slot for ``profile``; returns its slot id."""
+        ...
+
+    def hand_off(self, slot: str, workload_id: str, env: dict[str, str]) -> WorkloadHandle:
+        """Turn an idle slot into ``workload_id`` running with ``env`` (raises when it cannot)."""
+        ...
+
+    def discard(self, slot: str) -> None:
+        """Remove an unclaimed slot."""
+        ...
+
+
+@dataclass
+class _Slot:
+    id: str
+    ready_at: float
+
+
+@dataclass
+class _Pool:
+    profile: str
+    runnable: Runnable
+    size: int
+    ready: deque
+    hits: int = 0
+    misses: int = 0
+
+
+class WarmPool:
+    """Per-profile FIFO queues of ready slots, claimed by spawns and refilled by one thread."""
+
+    def __init__(
+        self,
+        substrate: PoolSubstrate,
+        profiles: dict[str, tuple[Runnable, int]],
+        *,
+        idle_sec: float = 900.0,
+        refill_sec: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.substrate = substrate
+        self.idle_sec = idle_sec
+        self.refill_sec = refill_sec
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pools: dict[PoolKey, _Pool] = {
+            pool_key(runnable): _Pool(profile, runnable, max(0, size), deque())
+            for profile, (runnable, size) in profiles.items()
+        }
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._hits = counter("warm_pool_hits")
+        self._misses = counter("warm_pool_misses")
+        self._evicted = counter("warm_pool_evicted")
+        self._provision_failed = counter("warm_pool_provision_failed")
+        self._ready = gauge("warm_pool_ready")
+
+    def pooled(self, runnable: Runnable) -> bool:
+        return pool_key(runnable) in self._pools
+
+    def claim(self, runnable: Runnable, workload_id: str, env: dict[str, str]) -> Optional[WorkloadHandle]:
+        """Hand a ready slot of ``runnable``'s pool to ``workload_id``; ``None`` ⇒ take the cold path."""
+        pool = self._pools.get(pool_key(runnable))
+        if pool is None:
+            return None
+        with self._lock:
+            slot = pool.ready.popleft() if pool.ready else None
+            self._publish_ready()
+        self._wake.set()                                  # replenish behind the claim
+        if slot is not None:
+            try:
+                handle = self.substrate.hand_off(slot.id, workload_id, env)
+            except Exception as e:  # noqa: BLE001 — a failed claim is a miss, never a failed spawn
+                logger.warning("warm slot %s hand-off to %s failed: %s", slot.id, workload_id, e)
+                self._discard(slot)
+            else:
+                with self._lock:
+                    pool.hits += 1
+                self._hits.inc()
+                return handle
+        with self._lock:
+            pool.misses += 1
+        self._misses.inc()
+        return None
+
+    def miss(self, runnable: Runnable) -> None:
+        """Count a pooled spawn that could not use a slot at all (e.g. it needs per-workload mounts)."""
+        pool = self._pools.get(pool_key(runnable))
+        if pool is not None:
+            with self._lock:
+                pool.misses += 1
+            self._misses.inc()
+
+    # ── replenishment ────────────────────────────────────────────────────────
+    def refill(self) -> int:
+        """One pass: evict slots idle past ``idle_sec``, then top every pool up to its size.
+        Returns how many slots were provisioned."""
+        now = self._clock()
+        stale: list[_Slot] = []
+        with self._lock:
+            for pool in self._pools.values():
+                while pool.ready and now - pool.ready[0].ready_at >= self.idle_sec:
+                    stale.append(pool.ready.popleft())
+            self._publish_ready()
+        for slot in stale:
+            self._evicted.inc()
+            self._discard(slot)
+        provisioned = 0
+        for pool in self._pools.values():
+            while not self._closed.is_set():
+                with self._lock:
+                    if len(pool.ready) >= pool.size:
+                        break
+                try:
+                    slot_id = self.substrate.provision(pool.profile, pool.runnable)
+                except Exception as e:  # noqa: BLE001 — retried next pass; spawns go cold meanwhile
+                    self._provision_failed.inc()
+                    logger.warning("warm slot provision for %s failed: %s", pool.profile, e)
+                    break
+                provisioned += 1
+                with self._lock:
+                    pool.ready.append(_Slot(slot_id, self._clock()))
+                    self._publish_ready()
+        return provisioned
+
+    def start(self) -> "WarmPool":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="warm-pool", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop refilling and discard every unclaimed slot."""
+        self._closed.set()
+        self._wake.set()
+        with self._lock:
+            slots = [s for pool in self._pools.values() for s in pool.ready]
+            for pool in self._pools.values():
+                pool.ready.clear()
+            self._publish_ready()
+        for slot in slots:
+            self._discard(slot)
+
+    def _run(self) -> None:
+        while not self._closed.is_set():
+            try:
+                self.refill()
+            except Exception as e:  # noqa: BLE001 — the refill loop outlives one bad pass
+                logger.warning("warm pool refill failed: %s", e)
+            self._wake.wait(self.refill_sec)
+            self._wake.clear()
+
+    def _discard(self, slot: _Slot) -> None:
+        try:
+            self.substrate.discard(slot.id)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("warm slot %s discard failed: %s", slot.id, e)
+
+    def _publish_ready(self) -> None:
+        self._ready.set(sum(len(p.ready) for p in self._pools.values()))
+
+    def metrics(self) -> dict:
+        with self._lock:
+            out = {}
+            for pool in self._pools.values():
+                claims = pool.hits + pool.misses
+                out[pool.profile] = {
+                    "size": pool.size, "ready": len(pool.ready), "hits": pool.hits,
+                    "misses": pool.misses, "hit_rate": pool.hits / claims if claims else None,
+                }
+            return out
+
+
+class FakePoolSubstrate:
+    """An in-memory ``PoolSubstrate``: records provisions, hand-offs (with their env) and discards;
+    ``fail_provision`` / ``fail_hand_off`` script failures."""
+
+    def __init__(self) -> None:
+        self._ids = itertools.count(1)
+        self.idle: dict[str, str] = {}                    # slot → profile
+        self.handed: dict[str, tuple[str, dict]] = {}     # workload id → (slot, env)
+        self.discarded: list[str] = []
+        self.fail_provision = False
+        self.fail_hand_off = False
+
+    def provision(self, profile: str, runnable: Runnable) -> str:
+        if self.fail_provision:
+            raise RuntimeError("provision failed")
+        slot = f"{profile}-slot-{next(self._ids)}"
+        self.idle[slot] = profile
+        return slot
+
+    def hand_off(self, slot: str, workload_id: str, env: dict[str, str]) -> WorkloadHandle:
+        if self.fail_hand_off:
+            raise RuntimeError("hand-off failed")
+        self.idle.pop(slot)
+        self.handed[workload_id] = (slot, dict(env))
+        return WorkloadHandle(id=workload_id, impl=slot)
+
+    def discard(self, slot: str) -> None:
+        self.idle.pop(slot, None)
+        self.discarded.append(slot)
@@ -82,3 +82,32 @@ def test_production_runtime_gets_the_env_grace(monkeypatch):
     monkeypatch.delenv("AGENT_IMAGE", raising=False)        # no worker-image ensure
     app = build_production_app()
     assert app.state.runtime.grace_sec == 47.0
+
+
+def test_production_app_with_a_scheduler_boots_and_stops_its_ticker(monkeypatch):
+    """With REDIS_URL set the app carries a ticker; building it must not crash, and the shutdown hook
+    must stop the ticker loop and close the scheduler."""
+    import fakeredis
+    import redis as redis_lib
+    from fastapi.testclient import TestClient
+
+    from runtime_kernel import __main__ as main_mod
+
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis_lib, "from_url",
+                        lambda *a, **kw: fakeredis.FakeRedis(server=server, decode_responses=True))
+    monkeypatch.setenv("RUNTIME_BACKEND", "process")
+    monkeypatch.setenv("REDIS_URL", "redis://fake:6379/0")
+    monkeypatch.setenv("SCHED_TICK_SEC", "0.05")
+    monkeypatch.delenv("AGENT_IMAGE", raising=False)
+    closed = []
+    from runtime_kernel.scheduler import Scheduler
+
+    real_close = Scheduler.close
+    monkeypatch.setattr(Scheduler, "close", lambda self: (closed.append(self), real_close(self)))
+
+    app = main_mod.build_production_app()
+    assert app.state.scheduler is not None
+    with TestClient(app):
+        pass
+    assert closed == [app.state.scheduler]
@@ -1,5 +1,6 @@
 """O-RT-2 retry-callback eval — durable RuntimeEvent delivery. A receiver that 500s twice then 200s is
-retried (across sweeps) until it acks. Replaces the old fire-once POST.
+retried (across sweeps) until it acks. Replaces the old fire-once POST. Retries back off, so the
+evals drive a FakeClock past each delivery's next attempt.
 
 Two layers:
   • CallbackQueue directly — a fake poster returns 500, 500, 200; the event stays queued until acked.
@@ -9,7 +10,7 @@ Two layers:
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 
-from runtime_kernel import CallbackQueue, Runtime
+from runtime_kernel import CallbackQueue, FakeClock, Runtime
 from runtime_kernel.api import create_app
 
 
@@ -21,14 +22,19 @@ def test_queue_retries_until_ack():
         posted.append((url, payload))
         return next(codes)
 
-    q = CallbackQueue(poster=poster)
+    clock = FakeClock()
+    q = CallbackQueue(poster=poster, clock=clock)
     q.enqueue("http://receiver/cb", {"workloadId": "w1", "state": "stopped"})
 
     # First attempt (in enqueue) got 500 → still pending.
     assert q.pending_count() == 1
+    # Not due yet (backoff) → no POST.
+    assert q.sweep() == 1 and len(posted) == 1
     # Sweep → 500 again → still pending.
+    clock.advance(q.backoff_max)
     assert q.sweep() == 1
     # Sweep → 200 → drained.
+    clock.advance(q.backoff_max)
     assert q.sweep() == 0
     assert len(posted) == 3
     assert q.pending_count() == 0
@@ -38,9 +44,11 @@ def test_queue_gives_up_at_max_attempts():
     def always_500(url, payload, headers):
         return 500
 
-    q = CallbackQueue(poster=always_500, max_attempts=2)
+    clock = FakeClock()
+    q = CallbackQueue(poster=always_500, max_attempts=2, clock=clock)
     q.enqueue("http://receiver/cb", {"workloadId": "w1"})  # attempt 1 → 500
     assert q.pending_count() == 1
+    clock.advance(q.backoff_max)
     assert q.sweep() == 0  # attempt 2 → 500 → cap reached → dropped
     assert q.pending_count() == 0
 
@@ -66,7 +74,8 @@ def test_api_delivers_lifecycle_event_durably():
     def poster(url, payload, headers):
         return receiver_client.post("/runtime/callback", json=payload).status_code
 
-    queue = CallbackQueue(poster=poster)
+    clock = FakeClock()
+    queue = CallbackQueue(poster=poster, clock=clock)
     rt = Runtime(profiles={"test": ["sleep", "30"]}, grace_sec=2.0)
     app = create_app(rt, callback_queue=queue)
     client = TestClient(app)
@@ -84,9 +93,83 @@ def test_api_delivers_lifecycle_event_durably():
 
     # Sweep until the receiver starts acking (3rd call onward → 200) and the queue drains.
     for _ in range(10):
+        clock.advance(queue.backoff_max)
         if queue.sweep() == 0:
             break
     assert queue.pending_count() == 0
     assert len(state["received"]) >= 1  # the lifecycle event was durably delivered
 
     client.post("/workloads/w1/stop")  # cleanup child process
+
+
+def test_failing_endpoint_backs_off_instead_of_being_hammered():
+    posted = []
+    clock = FakeClock()
+    q = CallbackQueue(poster=lambda u, p, h: posted.append(u) or 503, clock=clock,
+                      backoff_base=10.0, backoff_max=80.0)
+    key = q.enqueue("http://down/cb", {"workloadId": "w1"})      # attempt 1 → next in 5–10s
+    for _ in range(5):
+        q.sweep()                                               # not due: no POST
+    assert len(posted) == 1
+
+    delays = []
+    for _ in range(5):
+        due_at = q.store.get_all()[key]["next_at"]
+        delays.append(due_at - clock.now())
+        clock.set(due_at)
+        q.sweep()
+    assert len(posted) == 6
+    # equal jitter around 10·2^(n-1), capped at 80
+    for n, delay in enumerate(delays, start=1):
+        cap = min(80.0, 10.0 * 2 ** (n - 1))
+        assert cap / 2 <= delay <= cap
+
+
+def test_sweep_posts_due_deliveries_concurrently_and_reads_the_store_once():
+    import threading
+
+    from runtime_kernel import InMemoryPendingStore
+
+    class CountingStore(InMemoryPendingStore):
+        reads = 0
+
+        def get_all(self):
+            CountingStore.reads += 1
+            return super().get_all()
+
+    barrier = threading.Barrier(4, timeout=5)
+    ready = threading.Event()
+
+    def poster(url, payload, headers):
+        if not ready.is_set():
+            return 500                                          # the inline attempts fail
+        barrier.wait()                                          # only passes if 4 POSTs overlap
+        return 200
+
+    clock = FakeClock()
+    store = CountingStore()
+    q = CallbackQueue(poster=poster, store=store, clock=clock, concurrency=4)
+    for i in range(8):
+        q.enqueue(f"http://receiver/{i}", {"workloadId": f"w{i}"})
+    ready.set()
+    clock.advance(q.backoff_max)
+    CountingStore.reads = 0
+    assert q.sweep() == 0
+    assert CountingStore.reads == 1
+
+
+def test_redis_pending_store_batched_access():
+    import fakeredis
+
+    from runtime_kernel import RedisPendingStore
+
+    store = RedisPendingStore(fakeredis.FakeRedis())
+    store.put_many({f"cb-{i}": {"url": f"u{i}", "event": {}, "attempts": i} for i in range(1200)})
+    all_ = store.get_all()
+    assert len(all_) == 1200 and all_["cb-1199"]["attempts"] == 1199
+    assert all_["cb-7"] == {"url": "u7", "event": {}, "attempts": 7}
+
+    codes = {}
+    q = CallbackQueue(poster=lambda u, p, h: codes.setdefault(u, 200), store=store)
+    assert q.sweep() == 0 and len(codes) == 1200
+    assert store.get_all() == {}
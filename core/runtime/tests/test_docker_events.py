@@ -0,0 +1,167 @@
+"""Event-driven Docker exit state — pure unit tests over a FAKE socket + ``FakeDockerEvents``.
+
+Proves the ``/events`` subscriber replaces per-read inspects:
+  • while the stream is live, GET/list answer from the exit-state cache (zero inspects);
+  • a container ``die`` is PUSHED — the store flips to ``stopped`` and ``on_event`` fires — with no
+    read at all;
+  • a cut stream drops the cache, so reads fall back to inspects until it reconnects;
+  • an inspect that raced a newer event never overwrites the event's state.
+"""
+from __future__ import annotations
+
+import json
+import time
+
+from runtime_kernel import Runtime
+from runtime_kernel.docker_backend import DockerBackend
+from runtime_kernel.docker_events import MISS, ContainerEventWatcher, FakeDockerEvents
+from runtime_kernel.models import RuntimeState, StopReason, WorkloadSpec
+from runtime_kernel.profiles import Runnable
+from runtime_kernel.store import InMemoryStore
+
+
+class _Resp:
+    def __init__(self, status_code: int, body=None):
+        self.status_code = status_code
+        self._body = body if body is not None else {}
+        self.text = json.dumps(self._body)
+
+    def json(self):
+        return self._body
+
+
+class FakeDaemon:
+    """create/start/inspect over a container table; counts the inspects a read costs."""
+
+    def __init__(self):
+        self.containers: dict[str, dict] = {}
+        self.inspects = 0
+
+    def request(self, method: str, url: str, **kw):
+        path = url[url.index("/containers"):] if "/containers" in url else url
+        if method == "POST" and path.startswith("/containers/create"):
+            name = path.split("name=", 1)[1]
+            self.containers[name] = {"labels": kw["json"]["Labels"], "running": False, "exit": None}
+            return _Resp(201, {"Id": name})
+        if method == "POST" and path.endswith("/start"):
+            self.containers[path.split("/")[2]]["running"] = True
+            return _Resp(204)
+        if method == "GET" and path.endswith("/json"):
+            self.inspects += 1
+            c = self.containers.get(path.split("/")[2])
+            if c is None:
+                return _Resp(404, {"message": "no such container"})
+            return _Resp(200, {
+                "State": {"Running": c["running"], "ExitCode": c["exit"] or 0},
+                "Config": {"Labels": c["labels"]},
+            })
+        return _Resp(500, {"message": f"unhandled {method} {path}"})
+
+    def exit(self, name: str, code: int) -> None:
+        self.containers[name].update(running=False, exit=code)
+
+
+def _runtime(events: FakeDockerEvents):
+    be = DockerBackend()
+    daemon = FakeDaemon()
+    be._session = daemon
+    seen = []
+    rt = Runtime(
+        backend=be, store=InMemoryStore(),
+        profiles={"p": Runnable(image="alpine", command=["sleep", "30"])},
+        on_event=seen.append,
+    )
+    be.watch_events(on_exit=rt.observe_exit, source=events)
+    assert be.events.wait_live(5)
+    return rt, be, daemon, seen
+
+
+def test_reads_answer_from_the_cache_while_the_stream_is_live():
+    events = FakeDockerEvents()
+    rt, be, daemon, _ = _runtime(events)
+    for i in range(3):
+        rt.create(WorkloadSpec(workloadId=f"w{i}", profile="p", env={}))
+    events.start("w0")
+    assert events.drain()
+
+    assert [s.state for s in rt.list()] == [RuntimeState.running] * 3
+    assert rt.get("w1").state is RuntimeState.running
+    assert daemon.inspects == 0
+
+
+def test_a_die_event_pushes_stopped_into_the_store_and_callbacks():
+    events = FakeDockerEvents()
+    rt, be, daemon, seen = _runtime(events)
+    rt.create(WorkloadSpec(workloadId="w1", profile="p", env={}))
+    daemon.exit("vexa-w1", 3)
+    events.die("w1", 3)
+    assert events.drain()
+
+    record = rt.store.get("w1")            # no GET needed: the exit was pushed
+    assert record.status.state is RuntimeState.stopped
+    assert record.status.exitCode == 3
+    assert record.status.stopReason is StopReason.failed
+    stopped = [e for e in seen if e.state is RuntimeState.stopped]
+    assert len(stopped) == 1 and stopped[0].exitCode == 3
+
+    assert rt.get("w1").state is RuntimeState.stopped
+    events.die("w1", 3)                    # a duplicate event is not a second transition
+    assert events.drain()
+    assert len([e for e in seen if e.state is RuntimeState.stopped]) == 1
+    assert daemon.inspects == 0
+
+
+def test_a_cut_stream_falls_back_to_inspect_until_it_reconnects():
+    events = FakeDockerEvents()
+    rt, be, daemon, _ = _runtime(events)
+    rt.create(WorkloadSpec(workloadId="w1", profile="p", env={}))
+    events.cut()
+    deadline = time.time() + 5
+    while be.events.live and time.time() < deadline:
+        time.sleep(0.01)
+    assert not be.events.live
+
+    assert rt.get("w1").state is RuntimeState.running
+    assert daemon.inspects == 1            # not followed: every read inspects
+
+    assert be.events.wait_live(5)          # reconnected (after backoff)
+    assert events.subscriptions == 2
+    rt.get("w1")                           # first read after reconnect inspects once …
+    rt.get("w1")                           # … then the cache answers
+    assert daemon.inspects == 2
+
+
+def test_an_inspect_never_overwrites_a_newer_event():
+    events = FakeDockerEvents()
+    watcher = ContainerEventWatcher(events).start()
+    assert watcher.wait_live(5)
+    since = watcher.checkpoint()           # an inspect starts: the container looks running …
+    events.die("w1", 0)                    # … and dies before the inspect's answer lands
+    assert events.drain()
+    watcher.remember("w1", None, since)
+    assert watcher.lookup("w1") == 0
+    watcher.stop()
+    events.cut()
+
+
+def test_a_destroy_drops_the_workloads_sequence_entry():
+    """The per-workload event sequence lives as long as its cached state — a destroyed container
+    leaves nothing behind, and an inspect that raced the destroy is not cached."""
+    events = FakeDockerEvents()
+    watcher = ContainerEventWatcher(events).start()
+    assert watcher.wait_live(5)
+    for i in range(50):
+        events.start(f"w{i}")
+        events.die(f"w{i}", 0)
+    assert events.drain()
+    assert watcher.metrics()["sequenced"] == 50
+    since = watcher.checkpoint()           # an inspect of w0 starts …
+    for i in range(50):
+        events.destroy(f"w{i}")
+    assert events.drain()
+    assert (watcher.metrics()["sequenced"], watcher.metrics()["cached"]) == (0, 0)
+    watcher.remember("w0", None, since)    # … and lands after w0 was destroyed
+    assert watcher.lookup("w0") is MISS
+    watcher.stop()
+    events.cut()
+
@@ -46,6 +46,10 @@ def test_schedule_register_list_and_fire():
     assert captured[0]["url"] == "http://agent-api:8100/invocations"
     assert captured[0]["body"]["subject"] == "u_jane"
 
+    metrics = client.get("/schedule/metrics").json()
+    assert metrics["claimed"] == metrics["completed"] == 1
+    assert metrics["due"] == 0 and "last_tick_lag_max_s" in metrics
+
 
 def test_schedule_bad_spec_is_400():
     client, _ = _client(lambda req: {"status_code": 202}, FakeClock(start=0.0))
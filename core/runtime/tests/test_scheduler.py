@@ -155,18 +155,68 @@ def test_orphan_recovery_requeues_inflight_jobs():
 
     # Simulate a job that was mid-flight when the process died: it sits in EXECUTING, not in JOBS.
     import json
-    from runtime_kernel.scheduler import EXECUTING_KEY
+    from runtime_kernel.scheduler import EXECUTING_KEY, JOB_KEY_PREFIX
     orphan = {"job_id": "job_orphan", "execute_at": 100.0, "status": "executing",
               "request": {"url": "http://svc/o"}, "retry": {"max_attempts": 3, "backoff": [1], "attempt": 0}}
-    redis.hset(EXECUTING_KEY, "job_orphan", json.dumps(orphan))
+    redis.hset(f"{JOB_KEY_PREFIX}job_orphan", mapping={k: json.dumps(v) for k, v in orphan.items()})
+    redis.zadd(EXECUTING_KEY, {"job_orphan": 100.0})
 
     assert sched.recover_orphans() == 1
     # Re-queued into JOBS at ~now, due immediately → tick fires it.
-    assert redis.hlen(EXECUTING_KEY) == 0
+    assert redis.zcard(EXECUTING_KEY) == 0
     assert sched.tick() == 1
     assert sched.get("job_orphan")["status"] == "completed"
 
 
+def test_legacy_layout_migrates_to_indexed_keys():
+    """A keyspace written by the parent layout (job-JSON ZSET members, JSON hashes) is moved over:
+    pending jobs keep their execute_at, in-flight ones are recoverable, history stays readable."""
+    import json
+    from runtime_kernel.scheduler import (
+        LEGACY_EXECUTING_KEY, LEGACY_HISTORY_KEY, LEGACY_JOBS_KEY,
+    )
+    redis = fakeredis.FakeStrictRedis(decode_responses=True)
+    clock = FakeClock(start=0.0)
+    captured = []
+    sched = Scheduler(redis, dispatch=lambda req: captured.append(req) or {"status_code": 200}, clock=clock)
+
+    def legacy(job_id, status, **extra):
+        return {"job_id": job_id, "execute_at": 50.0, "status": status, "request": {"url": f"http://svc/{job_id}"},
+                "retry": {"max_attempts": 3, "backoff": [1], "attempt": 0}, **extra}
+
+    redis.zadd(LEGACY_JOBS_KEY, {json.dumps(legacy("job_p", "pending")): 50.0})
+    redis.hset(LEGACY_EXECUTING_KEY, "job_x", json.dumps(legacy("job_x", "executing")))
+    redis.hset(LEGACY_HISTORY_KEY, "job_c", json.dumps(legacy("job_c", "completed", result={"status_code": 200})))
+
+    assert sched.migrate_legacy_layout() == 3
+    assert not redis.exists(LEGACY_JOBS_KEY, LEGACY_EXECUTING_KEY, LEGACY_HISTORY_KEY)
+    assert sched.migrate_legacy_layout() == 0  # idempotent
+
+    assert [j["job_id"] for j in sched.list(status="pending")] == ["job_p"]
+    assert sched.get("job_c")["status"] == "completed"
+    assert [j["job_id"] for j in sched.list(status="completed")] == ["job_c"]
+    assert sched.recover_orphans() == 1
+
+    clock.set(50.0)
+    assert sched.tick() == 2
+    assert sorted(r["url"] for r in captured) == ["http://svc/job_p", "http://svc/job_x"]
+
+
+def test_tick_takes_a_bounded_batch_earliest_first():
+    captured = []
+    clock = FakeClock(start=0.0)
+    sched = _scheduler(lambda req: captured.append(req["url"]) or {"status_code": 200}, clock)
+    for i in range(5):
+        sched.schedule({"execute_at": float(10 - i), "request": {"url": f"http://svc/{i}"}})
+
+    clock.set(100.0)
+    assert sched.tick(limit=2) == 2
+    assert captured == ["http://svc/4", "http://svc/3"]
+    assert len(sched.list(status="pending")) == 3
+    assert sched.tick(limit=10) == 3
+    assert [j["status"] for j in sched.list(status="completed", limit=10)] == ["completed"] * 5
+
+
 def test_cancel_removes_job_so_it_never_fires():
     """cancel() pulls a pending job out of the sorted set and records it cancelled, so advancing
     the clock past execute_at fires nothing. (Parity with the meeting-api scheduler twin, which
@@ -192,3 +242,198 @@ def test_cancel_removes_job_so_it_never_fires():
     # Cancelling an unknown / already-cancelled job is a None no-op.
     assert sched.cancel("job_does_not_exist") is None
     assert sched.cancel(jid) is None
+
+
+def test_tick_dispatches_due_jobs_concurrently():
+    """One slow target no longer holds up the others: both dispatches must be in flight at once
+    to pass the barrier (a serial tick would time it out)."""
+    import threading
+    barrier = threading.Barrier(2, timeout=5)
+
+    def rendezvous(req):
+        barrier.wait()
+        return {"status_code": 200}
+
+    clock = FakeClock(start=0.0)
+    sched = Scheduler(fakeredis.FakeStrictRedis(decode_responses=True), dispatch=rendezvous,
+                      clock=clock, concurrency=2)
+    a = sched.schedule({"execute_at": 0.0, "request": {"url": "http://svc/a"}})
+    b = sched.schedule({"execute_at": 0.0, "request": {"url": "http://svc/b"}})
+    assert sched.tick() == 2
+    assert sched.get(a["job_id"])["status"] == sched.get(b["job_id"])["status"] == "completed"
+    sched.close()
+
+
+def test_replicas_claim_disjoint_jobs():
+    """Two replicas on one redis: the Lua claim leases each due job to exactly one of them."""
+    redis = fakeredis.FakeStrictRedis(decode_responses=True)
+    clock = FakeClock(start=0.0)
+    fired = {"a": [], "b": []}
+    replica_b = Scheduler(redis, dispatch=lambda req: fired["b"].append(req["url"]) or {}, clock=clock,
+                          concurrency=1)
+
+    def dispatch_a(req):
+        fired["a"].append(req["url"])
+        replica_b.tick()  # B ticks while A's claim is still in flight
+        return {}
+
+    replica_a = Scheduler(redis, dispatch=dispatch_a, clock=clock, concurrency=1)
+    for i in range(2):
+        replica_a.schedule({"execute_at": float(i), "request": {"url": f"http://svc/{i}"}})
+    clock.set(10.0)
+    assert replica_a.tick(limit=1) == 1
+    assert fired == {"a": ["http://svc/0"], "b": ["http://svc/1"]}
+    replica_a.close(); replica_b.close()
+
+
+def test_expired_lease_is_requeued_by_any_tick():
+    """A replica that claimed a job and died: once the lease runs out, another replica's tick
+    re-queues and fires it — no startup-only recovery needed."""
+    redis = fakeredis.FakeStrictRedis(decode_responses=True)
+    clock = FakeClock(start=0.0)
+    dead = Scheduler(redis, dispatch=lambda req: {}, clock=clock, lease=30)
+    job = dead.schedule({"execute_at": 0.0, "request": {"url": "http://svc/orphan"}})
+    assert [j["job_id"] for j in dead._claim(clock.now(), 10, "dead-tick")] == [job["job_id"]]  # …then it dies
+
+    captured = []
+    live = Scheduler(redis, dispatch=lambda req: captured.append(req) or {}, clock=clock, lease=30)
+    clock.set(29.0)
+    assert live.tick() == 0  # still leased
+    clock.set(31.0)
+    assert live.tick() == 1
+    assert captured and live.get(job["job_id"])["status"] == "completed"
+    assert live.metrics()["reclaimed"] == 1
+    live.close()
+
+
+def test_reclaimed_job_settles_only_under_the_new_lease():
+    """A dispatch that outlives its lease: another replica reclaims and re-runs the job, and the
+    late outcome of the first is dropped instead of clearing the second's lease."""
+    import threading
+    from runtime_kernel.scheduler import EXECUTING_KEY, LEASES_KEY
+    redis = fakeredis.FakeStrictRedis(decode_responses=True)
+    clock = FakeClock(start=0.0)
+    b_started, b_release = threading.Event(), threading.Event()
+    fired = []
+
+    def dispatch_b(req):
+        fired.append("b")
+        b_started.set()
+        b_release.wait(5)
+        return {"by": "b"}
+
+    replica_b = Scheduler(redis, dispatch=dispatch_b, clock=clock, lease=30)
+    ticking = threading.Thread(target=replica_b.tick)
+
+    def dispatch_a(req):
+        fired.append("a")
+        clock.set(40.0)      # the lease ran out mid-dispatch…
+        ticking.start()      # …so B reclaims the job and runs it again
+        b_started.wait(5)
+        return {"by": "a"}
+
+    replica_a = Scheduler(redis, dispatch=dispatch_a, clock=clock, lease=30)
+    job = replica_a.schedule({"execute_at": 0.0, "request": {"url": "http://svc/slow"}})
+    assert replica_a.tick() == 1
+    # A's outcome was dropped: B still holds the job, and it is not marked completed yet.
+    assert redis.zscore(EXECUTING_KEY, job["job_id"]) == 70.0
+    assert redis.hget(LEASES_KEY, job["job_id"]) is not None
+    assert replica_a.get(job["job_id"])["status"] == "executing"
+    assert (replica_a.metrics()["lease_lost"], replica_a.metrics()["completed"]) == (1, 0)
+
+    b_release.set()
+    ticking.join(5)
+    done = replica_b.get(job["job_id"])
+    assert (done["status"], done["result"]) == ("completed", {"by": "b"})
+    assert fired == ["a", "b"]
+    assert redis.hget(LEASES_KEY, job["job_id"]) is None and redis.zcard(EXECUTING_KEY) == 0
+    replica_a.close(); replica_b.close()
+
+
+def test_a_claim_whose_lease_was_lost_is_not_dispatched():
+    redis = fakeredis.FakeStrictRedis(decode_responses=True)
+    clock = FakeClock(start=0.0)
+    fired = []
+    stale = Scheduler(redis, dispatch=lambda req: fired.append("stale") or {}, clock=clock, lease=30)
+    job = stale.schedule({"execute_at": 0.0, "request": {"url": "http://svc/x"}})
+    [claimed] = stale._claim(clock.now(), 10, "stale-tick")
+
+    clock.set(31.0)
+    live = Scheduler(redis, dispatch=lambda req: fired.append("live") or {}, clock=clock, lease=30)
+    assert live.tick() == 1
+    stale._process(claimed, "stale-tick")  # its worker only gets to it now
+    assert fired == ["live"]
+    assert stale.metrics()["lease_lost"] == 1
+    assert live.get(job["job_id"])["status"] == "completed"
+    live.close()
+
+
+def test_heartbeat_renews_the_lease_of_a_long_dispatch():
+    import time
+    from runtime_kernel.scheduler import EXECUTING_KEY
+    redis = fakeredis.FakeStrictRedis(decode_responses=True)
+    clock = FakeClock(start=0.0)
+    seen = []
+
+    def slow(req):
+        clock.advance(100.0)   # well past the original lease…
+        time.sleep(0.3)        # …while the ticking thread heartbeats (every lease/3 = 0.1s)
+        seen.append(redis.zscore(EXECUTING_KEY, job["job_id"]))
+        return {}
+
+    sched = Scheduler(redis, dispatch=slow, clock=clock, lease=0.3)
+    job = sched.schedule({"execute_at": 0.0, "request": {"url": "http://svc/slow"}})
+    assert sched.tick() == 1
+    assert seen == [100.3]  # renewed to now + lease, not left at 0.3
+    assert sched.get(job["job_id"])["status"] == "completed"
+    sched.close()
+
+
+def test_tick_reports_lag_behind_execute_at():
+    clock = FakeClock(start=0.0)
+    sched = _scheduler(lambda req: {"status_code": 200}, clock)
+    sched.schedule({"execute_at": 100.0, "request": {"url": "http://svc/late"}})
+    sched.schedule({"execute_at": 120.0, "request": {"url": "http://svc/later"}})
+    clock.set(130.0)
+    assert sched.tick() == 2
+    m = sched.metrics()
+    assert m["last_tick_lag_max_s"] == 30.0 and m["last_tick_lag_avg_s"] == 20.0
+    assert (m["claimed"], m["completed"], m["due"], m["executing"]) == (2, 2, 0, 0)
+    sched.close()
+
+
+def test_a_refill_claim_leases_from_the_clock_at_claim_time():
+    """A slot that frees late in a tick claims against a fresh clock read: its lease runs from
+    then (not from the tick's start, where it would already be expired), jobs that fell due
+    meanwhile are picked up, and the lag is measured at claim time."""
+    from runtime_kernel.scheduler import EXECUTING_KEY
+    redis = fakeredis.FakeStrictRedis(decode_responses=True)
+    clock = FakeClock(start=10.0)
+    leases = {}
+
+    def dispatch(req):
+        url = req["url"]
+        leases[url] = redis.zscore(EXECUTING_KEY, jobs[url])
+        clock.advance(50.0)   # each dispatch runs well past the 30s lease
+        return {}
+
+    sched = Scheduler(redis, dispatch=dispatch, clock=clock, lease=30, concurrency=1)
+    jobs = {url: sched.schedule({"execute_at": at, "request": {"url": url}})["job_id"]
+            for url, at in (("http://svc/a", 0.0), ("http://svc/b", 5.0), ("http://svc/c", 70.0))}
+    assert sched.tick() == 3
+    assert leases == {"http://svc/a": 40.0, "http://svc/b": 90.0, "http://svc/c": 140.0}
+    assert sched.metrics()["last_tick_lag_max_s"] == 55.0   # b: claimed at 60, due at 5
+    assert sched.metrics()["reclaimed"] == 0
+    sched.close()
+
+
+def test_shutdown_hook_stops_the_ticker_and_closes_the_pool(monkeypatch):
+    import threading
+    from runtime_kernel.__main__ import _start_ticker
+    monkeypatch.setenv("SCHED_TICK_SEC", "60")
+    sched = _scheduler(lambda req: {}, FakeClock(start=0.0))
+    stop = _start_ticker(sched)
+    assert any(t.name == "scheduler-tick" for t in threading.enumerate())
+    stop()  # returns at once: the idle wait is interruptible
+    assert not any(t.name == "scheduler-tick" for t in threading.enumerate())
+    assert sched._pool is None
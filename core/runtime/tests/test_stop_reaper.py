@@ -0,0 +1,159 @@
+"""Non-blocking stop — ``Runtime.stop`` hands the SIGTERM → grace → SIGKILL escalation to ONE reaper
+thread and returns ``stopping`` at once; the reaper records ``stopped`` (and emits its RuntimeEvent)
+when each stop ends. A fake backend stands in for the substrate so timing is under test control."""
+from __future__ import annotations
+
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from runtime_kernel import Runtime, StopReaper
+from runtime_kernel.api import create_app
+from runtime_kernel.backend import WorkloadHandle
+from runtime_kernel.models import RuntimeState, StopReason, WorkloadSpec
+from runtime_kernel.obs import metrics_snapshot, reset_metrics
+
+
+class SlowBackend:
+    """Workloads exit ``exit_after`` seconds after SIGTERM — or only on SIGKILL when ``stubborn``."""
+
+    name = "process"
+
+    def __init__(self, exit_after: float = 0.05, stubborn: bool = False):
+        self.exit_after = exit_after
+        self.stubborn = stubborn
+        self.terminated: dict[str, float] = {}
+        self.killed: set[str] = set()
+        self.signal_threads: set[str] = set()
+
+    def start(self, workload_id, runnable, env, **kw):
+        return WorkloadHandle(id=workload_id, impl=workload_id)
+
+    def terminate(self, h):
+        self.signal_threads.add(threading.current_thread().name)
+        self.terminated[h.id] = time.monotonic()
+
+    def kill(self, h):
+        self.killed.add(h.id)
+
+    def exit_code(self, h):
+        if h.id in self.killed:
+            return 137
+        t = self.terminated.get(h.id)
+        if t is not None and not self.stubborn and time.monotonic() - t >= self.exit_after:
+            return 0
+        return None
+
+    def cleanup(self, h):
+        pass
+
+
+def _runtime(backend, grace=5.0):
+    reset_metrics()
+    events = []
+    reaper = StopReaper(backend, grace_sec=grace, kill_grace_sec=0.2, poll_sec=0.01)
+    rt = Runtime(backend=backend, profiles={"p": ["true"]}, on_event=events.append, reaper=reaper)
+    return rt, reaper, events
+
+
+def test_stop_returns_stopping_and_one_thread_reaps_every_stop():
+    backend = SlowBackend(exit_after=0.2)
+    rt, reaper, events = _runtime(backend)
+    for i in range(50):
+        rt.create(WorkloadSpec(workloadId=f"w{i}", profile="p", env={}))
+
+    t0 = time.monotonic()
+    statuses = [rt.stop(f"w{i}") for i in range(50)]
+    assert time.monotonic() - t0 < 0.2                        # nobody waited out the exit
+    assert {s.state for s in statuses} == {RuntimeState.stopping}
+    assert rt.stop("w0").state is RuntimeState.stopping       # a repeat stop is a no-op
+
+    assert reaper.drain(5)
+    assert backend.signal_threads == {"stop-reaper"}
+    for i in range(50):
+        s = rt.get(f"w{i}")
+        assert s.state is RuntimeState.stopped and s.exitCode == 0 and s.stopReason is StopReason.stopped
+    stopped = [e for e in events if e.state is RuntimeState.stopped]
+    assert len(stopped) == 50
+    assert not backend.killed
+
+    snap = metrics_snapshot()
+    assert snap["stop_reaper_depth"] == 0
+    assert snap["stop_latency_graceful_s"]["count"] == 50
+    assert snap["stop_latency_killed_s"]["count"] == 0
+
+
+def test_grace_expiry_escalates_to_sigkill():
+    backend = SlowBackend(stubborn=True)
+    rt, reaper, events = _runtime(backend, grace=0.1)
+    rt.create(WorkloadSpec(workloadId="w1", profile="p", env={}))
+    rt.stop("w1", StopReason.idle_timeout)
+    assert metrics_snapshot()["stop_reaper_depth"] == 1
+
+    assert reaper.drain(5)
+    assert backend.killed == {"w1"}
+    s = rt.get("w1")
+    assert s.state is RuntimeState.stopped and s.exitCode == 137 and s.stopReason is StopReason.idle_timeout
+    assert metrics_snapshot()["stop_latency_killed_s"]["count"] == 1
+
+
+def test_destroy_mid_stop_records_stopped_before_destroyed():
+    backend = SlowBackend(stubborn=True)
+    rt, reaper, events = _runtime(backend, grace=30.0)
+    rt.create(WorkloadSpec(workloadId="w1", profile="p", env={}))
+    rt.stop("w1")
+    rt.destroy("w1")
+
+    assert reaper.depth == 0
+    assert [e.state.value for e in events] == ["starting", "running", "stopping", "stopped", "destroyed"]
+    assert rt.get("w1").state is RuntimeState.destroyed
+
+
+def test_metrics_endpoint_serves_the_reaper_metrics():
+    backend = SlowBackend()
+    rt, reaper, _ = _runtime(backend)
+    client = TestClient(create_app(rt))
+    client.post("/workloads", json={"workloadId": "w1", "profile": "p", "env": {}})
+    assert client.post("/workloads/w1/stop", json={}).json()["state"] == "stopping"
+    assert reaper.drain(5)
+
+    body = client.get("/metrics").json()
+    assert body["stop_reaper_depth"] == 0
+    assert body["stop_latency_graceful_s"]["count"] == 1
+    assert client.get("/workloads/w1").json()["state"] == "stopped"
+
+
+def test_a_pushed_exit_and_a_stop_never_interleave():
+    """The events thread's exit push reads, checks and writes the record under the kernel's
+    transition lock: a stop arriving mid-push waits, then finds the workload already stopped."""
+    backend = SlowBackend()
+    rt, reaper, events = _runtime(backend)
+    rt.create(WorkloadSpec(workloadId="w1", profile="p", env={}))
+    entered, release = threading.Event(), threading.Event()
+    store_get = rt.store.get
+
+    def gated_get(workload_id):
+        record = store_get(workload_id)
+        if threading.current_thread().name == "docker-events":
+            entered.set()
+            release.wait(5)
+        return record
+
+    rt.store.get = gated_get
+    pusher = threading.Thread(target=rt.observe_exit, args=("w1", 3), name="docker-events")
+    pusher.start()
+    assert entered.wait(5)                 # the push has read the record (still running) …
+    result = []
+    stopper = threading.Thread(target=lambda: result.append(rt.stop("w1")))
+    stopper.start()
+    stopper.join(0.2)
+    assert stopper.is_alive()              # … so the stop waits for it
+    release.set()
+    pusher.join(5)
+    stopper.join(5)
+
+    assert result[0].state is RuntimeState.stopped and result[0].exitCode == 3
+    states = [e.state for e in events if e.workloadId == "w1"]
+    assert RuntimeState.stopping not in states and states.count(RuntimeState.stopped) == 1
+    reaper.close()
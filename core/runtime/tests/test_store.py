@@ -85,6 +85,53 @@ def test_count_for_owner_counts_only_active(store):
     assert store.count_for_owner("nobody") == 0
 
 
+def test_count_and_state_follow_rewrites(store):
+    store.set(_record("a", owner="alice", state=RuntimeState.starting))
+    store.set(_record("a", owner="alice", state=RuntimeState.running))
+    assert store.count_for_owner("alice") == 1
+    assert [r.spec.workloadId for r in store.list_by_state("running")] == ["a"]
+    assert store.list_by_state("starting") == []
+
+    store.set(_record("a", owner="alice", state=RuntimeState.stopped))  # frees the quota slot
+    assert store.count_for_owner("alice") == 0
+    assert store.list_by_state("running") == []
+    store.set(_record("b", owner="alice"))
+    store.delete("b")
+    assert store.count_for_owner("alice") == 0
+
+
+# ── RedisStore indexes — quota checks and list() never SCAN ──────────────────
+
+def test_redis_store_reads_by_index_not_scan():
+    redis = fakeredis.FakeStrictRedis(decode_responses=True)
+    store = RedisStore(redis)
+    for i in range(30):
+        store.set(_record(f"w{i}", owner="alice" if i % 2 else "bob",
+                          state=RuntimeState.running if i < 20 else RuntimeState.stopped))
+
+    def no_scan(*a, **k):
+        raise AssertionError("keyspace SCAN on the read path")
+
+    redis.scan_iter = no_scan
+    assert store.count_for_owner("alice") == 10
+    assert len(store.list()) == 30
+    assert len(store.list_by_state("stopped")) == 10
+
+
+def test_redis_store_indexes_a_pre_index_keyspace_once():
+    """Records written before the indexes existed (plain JSON keys) are indexed on construction."""
+    redis = fakeredis.FakeStrictRedis(decode_responses=True)
+    for wid, owner, state in (("a", "alice", RuntimeState.running), ("b", "alice", RuntimeState.stopped),
+                              ("c", "bob", RuntimeState.starting)):
+        redis.set(f"{RedisStore.KEY_PREFIX}{wid}", _record(wid, owner=owner, state=state).to_json())
+
+    store = RedisStore(redis)
+    assert (store.count_for_owner("alice"), store.count_for_owner("bob")) == (1, 1)
+    assert {r.spec.workloadId for r in store.list()} == {"a", "b", "c"}
+    assert store.reindex() == 3  # a repair pass is idempotent
+    assert store.count_for_owner("alice") == 1
+
+
 # ── restart test — Redis persistence survives a fresh Runtime ────────────────
 
 def test_redis_restart_persists_workloads():
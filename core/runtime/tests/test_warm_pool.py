@@ -0,0 +1,182 @@
+"""Warm pool — the pool logic over ``FakePoolSubstrate`` (no daemon), then the Docker substrate's
+claim path over a fake socket: a spawn renames a pre-created slot to the workload's name and drops
+its env in through the handshake archive; a spawn with per-workload mounts stays cold."""
+from __future__ import annotations
+
+import io
+import json
+import shlex
+import tarfile
+
+from runtime_kernel import Runtime
+from runtime_kernel.docker_backend import POOL_LABEL, DockerBackend, _DockerPoolSubstrate
+from runtime_kernel.models import RuntimeState, WorkloadSpec
+from runtime_kernel.obs import metrics_snapshot, reset_metrics
+from runtime_kernel.profiles import Runnable
+from runtime_kernel.warm_pool import FakePoolSubstrate, WarmPool
+
+BOT = Runnable(image="bot:dev", command=None)
+AGENT = Runnable(image="worker:dev", command=["python", "-m", "worker"])
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _pool(size=2, **kw):
+    reset_metrics()
+    sub = FakePoolSubstrate()
+    return WarmPool(sub, {"meeting-bot": (BOT, size)}, **kw), sub
+
+
+def test_claims_hit_until_the_pool_is_empty_and_refill_tops_it_up():
+    pool, sub = _pool(size=2)
+    assert pool.refill() == 2 and len(sub.idle) == 2
+
+    h = pool.claim(BOT, "w1", {"VEXA_BOT_CONFIG": "{}"})
+    assert h.id == "w1" and sub.handed["w1"][1] == {"VEXA_BOT_CONFIG": "{}"}
+    assert pool.claim(BOT, "w2", {}) is not None
+    assert pool.claim(BOT, "w3", {}) is None              # empty → the caller goes cold
+    assert pool.claim(AGENT, "a1", {}) is None            # not a pooled profile: not counted
+
+    assert pool.metrics()["meeting-bot"] == {
+        "size": 2, "ready": 0, "hits": 2, "misses": 1, "hit_rate": 2 / 3,
+    }
+    assert pool.refill() == 2
+    snap = metrics_snapshot()
+    assert snap["warm_pool_hits"] == 2 and snap["warm_pool_misses"] == 1
+    assert snap["warm_pool_ready"] == 2
+
+
+def test_idle_slots_are_evicted_and_replaced():
+    clock = Clock()
+    pool, sub = _pool(size=1, idle_sec=60, clock=clock)
+    pool.refill()
+    first = next(iter(sub.idle))
+    clock.now = 30
+    assert pool.refill() == 0                              # still fresh
+    clock.now = 61
+    assert pool.refill() == 1
+    assert sub.discarded == [first] and first not in sub.idle and len(sub.idle) == 1
+    assert metrics_snapshot()["warm_pool_evicted"] == 1
+
+
+def test_a_failed_hand_off_is_a_miss_and_the_slot_is_discarded():
+    pool, sub = _pool(size=1)
+    pool.refill()
+    sub.fail_hand_off = True
+    assert pool.claim(BOT, "w1", {}) is None
+    assert len(sub.discarded) == 1
+    assert pool.metrics()["meeting-bot"]["misses"] == 1
+
+    sub.fail_provision = True
+    assert pool.refill() == 0
+    assert metrics_snapshot()["warm_pool_provision_failed"] == 1
+
+
+# ── the Docker substrate over a fake socket ─────────────────────────────────────────────────────
+class _Resp:
+    def __init__(self, status_code: int, body=None):
+        self.status_code = status_code
+        self._body = body if body is not None else {}
+        self.text = json.dumps(self._body)
+
+    def json(self):
+        return self._body
+
+
+class FakeDaemon:
+    def __init__(self):
+        self.containers: dict[str, dict] = {}             # id → {name, payload}
+        self.archives: dict[str, bytes] = {}
+        self.calls: list[tuple[str, str]] = []
+
+    def _by_ref(self, ref):
+        for cid, c in self.containers.items():
+            if ref in (cid, c["name"]):
+                return cid
+        return None
+
+    def request(self, method, url, **kw):
+        path = url[url.index("/", url.index("sock") + 4):] if "sock" in url else url
+        self.calls.append((method, path))
+        if method == "GET" and path.startswith("/images/"):
+            return _Resp(200, {"Config": {"Entrypoint": ["/app/entrypoint.sh"], "Cmd": None}})
+        if method == "POST" and path.startswith("/containers/create"):
+            name = path.split("name=", 1)[1]
+            cid = f"id{len(self.containers) + 1}"
+            self.containers[cid] = {"name": name, "payload": kw["json"]}
+            return _Resp(201, {"Id": cid})
+        parts = path.split("?")[0].split("/")
+        cid = self._by_ref(parts[2]) if len(parts) > 2 else None
+        if method == "POST" and path.endswith("/start"):
+            return _Resp(204)
+        if method == "POST" and "/rename" in path:
+            self.containers[cid]["name"] = path.split("name=", 1)[1]
+            return _Resp(204)
+        if method == "PUT" and "/archive" in path:
+            self.archives[cid] = kw["data"]
+            return _Resp(200)
+        if method == "DELETE":
+            self.containers.pop(cid, None)
+            return _Resp(204)
+        return _Resp(500, {"message": f"unhandled {method} {path}"})
+
+
+def _docker():
+    reset_metrics()
+    be = DockerBackend()
+    daemon = FakeDaemon()
+    be._session = daemon
+    return be, daemon
+
+
+def _archive_env(data: bytes) -> str:
+    with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        assert tar.getnames() == [".vexa-env", ".vexa-ready"]   # env lands before the marker
+        return tar.extractfile(".vexa-env").read().decode()
+
+
+def test_docker_spawn_claims_a_warm_container():
+    be, daemon = _docker()
+    pool = WarmPool(_DockerPoolSubstrate(be), {"meeting-bot": (BOT, 1)})
+    be.pool = pool
+    pool.refill()
+    (slot_id, slot), = daemon.containers.items()
+    slot_name = slot["name"]
+    assert slot_name.startswith("vexa-pool-meeting-bot-")
+    assert slot["payload"]["Labels"] == {"runtime.managed": "true", POOL_LABEL: "meeting-bot"}
+    assert slot["payload"]["Entrypoint"][:2] == ["/bin/sh", "-c"]
+    assert slot["payload"]["Cmd"] == ["/app/entrypoint.sh"]   # the image's own entrypoint, exec'd
+
+    rt = Runtime(backend=be, profiles={"meeting-bot": BOT})
+    config = "{'a': 1}"                                     # needs shell quoting in the env file
+    rt.create(WorkloadSpec(workloadId="mtg-1", profile="meeting-bot", env={"VEXA_BOT_CONFIG": config}))
+
+    assert daemon.containers[slot_id]["name"] == "vexa-mtg-1"
+    assert f"VEXA_BOT_CONFIG={shlex.quote(config)}\n" in _archive_env(daemon.archives[slot_id])
+    assert not any(p.startswith("/containers/create?name=vexa-mtg-1") for _, p in daemon.calls)
+    assert rt.store.get("mtg-1").status.state is RuntimeState.running
+    snap = metrics_snapshot()
+    assert snap["start_latency_warm_s"]["count"] == 1 and "start_latency_cold_s" not in snap
+
+    # events and discovery know a claimed slot by its name (its labels cannot change)
+    assert be._event_workload_id({POOL_LABEL: "meeting-bot", "name": "vexa-mtg-1"}) == "mtg-1"
+    assert be._event_workload_id({POOL_LABEL: "meeting-bot", "name": slot_name}) is None
+
+
+def test_docker_spawn_with_mounts_takes_the_cold_path():
+    be, daemon = _docker()
+    pool = WarmPool(_DockerPoolSubstrate(be), {"meeting-bot": (BOT, 1)})
+    be.pool = pool
+    pool.refill()
+
+    be.start("mtg-2", BOT, {"VEXA_WORKSPACE_PATH": "/data/ws"})
+    assert ("POST", "/containers/create?name=vexa-mtg-2") in daemon.calls
+    assert pool.metrics()["meeting-bot"] == {"size": 1, "ready": 1, "hits": 0, "misses": 1, "hit_rate": 0.0}
+    assert metrics_snapshot()["start_latency_cold_s"]["count"] == 1
+